@@ -1,25 +1,186 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from typing import AsyncIterable, Iterable, Optional, Union
+
+import numpy as np
 import torch
 from lattice_cryptography import RingLWE, params
 
+# A ciphertext is (c0, c1), each ``dim`` complex128 values, i.e. 4 * dim
+# float64 components laid out back to back.
+COMPONENT_BYTES = 8
+COMPONENTS_PER_COEFF = 2
+# float64 represents every integer below 2**53 exactly
+EXACT_FLOAT_LIMIT = 2 ** 53
+
+
+def _reduce_shard(parts: list[bytes], modulus: float, reduce_every: int) -> np.ndarray:
+    """Sum one shard of several ciphertexts modulo ``modulus`` (process-pool worker)"""
+    acc = np.zeros(len(parts[0]) // COMPONENT_BYTES, dtype=np.float64)
+    pending = 0
+    for part in parts:
+        acc += np.frombuffer(part, dtype=np.float64)
+        pending += 1
+        if pending >= reduce_every:
+            np.remainder(acc, modulus, out=acc)
+            pending = 0
+    np.remainder(acc, modulus, out=acc)
+    return acc
+
+
 class HomomorphicAggregator:
-    def __init__(self, model_dim, security_param=params.LWE_128):
+    """Streaming RLWE ciphertext aggregator
+
+    Ciphertexts are read through zero-copy ``memoryview`` slices and added
+    chunk by chunk into a single float64 accumulator, so memory stays at one
+    accumulator plus one chunk no matter how many clients contribute. The
+    modular reduction is deferred until another addition could exceed the
+    exactly representable float64 range. With ``num_workers > 1`` the model
+    dimension is sharded across a process pool.
+    """
+
+    def __init__(
+        self,
+        model_dim,
+        security_param=params.LWE_128,
+        chunk_size: int = 1 << 16,
+        num_workers: int = 1,
+        batch_size: int = 32,
+    ):
         self.rlwe = RingLWE(security_param)
         self.public_key, self.private_key = self.rlwe.keygen()
         self.dim = model_dim
-        
-    def aggregate(self, encrypted_updates: list[bytes]) -> torch.Tensor:
-        summed_c0 = torch.zeros(self.dim, dtype=torch.complex128)
-        summed_c1 = torch.zeros(self.dim, dtype=torch.complex128)
-        
-        for ct in encrypted_updates:
-            c0, c1 = self._deserialize_ciphertext(ct)
-            summed_c0 = (summed_c0 + c0) % self.rlwe.modulus
-            summed_c1 = (summed_c1 + c1) % self.rlwe.modulus
-            
-        return self.rlwe.decrypt((summed_c0, summed_c1), self.private_key)
-    
+        self.chunk_size = max(1, chunk_size)
+        self.num_workers = max(1, num_workers)
+        self.batch_size = max(1, batch_size)
+
+        self.modulus = float(self.rlwe.modulus)
+        # Reduced components are < q, so k additions stay exact while (k + 1) * q <= 2**53
+        self.reduce_every = max(1, int(EXACT_FLOAT_LIMIT // self.modulus) - 1)
+
+        self._components = 2 * model_dim * COMPONENTS_PER_COEFF
+        self.reset()
+
+    @property
+    def ciphertext_bytes(self) -> int:
+        return self._components * COMPONENT_BYTES
+
+    def reset(self):
+        """Start a new aggregation round"""
+        self._acc = np.zeros(self._components, dtype=np.float64)
+        self._pending = 0
+        self.count = 0
+
+    def _view(self, ct: Union[bytes, bytearray, memoryview]) -> memoryview:
+        view = memoryview(ct).cast("B")
+        if len(view) != self.ciphertext_bytes:
+            raise ValueError(
+                f"Ciphertext has {len(view)} bytes, expected {self.ciphertext_bytes}"
+            )
+        return view
+
+    def _reduce(self):
+        np.remainder(self._acc, self.modulus, out=self._acc)
+        self._pending = 0
+
+    def add(self, ct: Union[bytes, bytearray, memoryview]):
+        """Accumulate one serialized ciphertext"""
+        view = self._view(ct)
+        if self._pending >= self.reduce_every:
+            self._reduce()
+
+        for start in range(0, self._components, self.chunk_size):
+            end = min(start + self.chunk_size, self._components)
+            chunk = np.frombuffer(
+                view[start * COMPONENT_BYTES:end * COMPONENT_BYTES],
+                dtype=np.float64,
+            )
+            self._acc[start:end] += chunk
+
+        self._pending += 1
+        self.count += 1
+
+    def _add_sharded(self, executor: ProcessPoolExecutor, batch: list):
+        """Reduce a batch of ciphertexts with one task per model shard"""
+        shard = -(-self._components // self.num_workers)
+        views = [self._view(ct) for ct in batch]
+        futures = []
+        for start in range(0, self._components, shard):
+            end = min(start + shard, self._components)
+            parts = [
+                bytes(view[start * COMPONENT_BYTES:end * COMPONENT_BYTES])
+                for view in views
+            ]
+            futures.append(
+                (start, end, executor.submit(_reduce_shard, parts, self.modulus, self.reduce_every))
+            )
+
+        if self._pending >= self.reduce_every:
+            self._reduce()
+        for start, end, future in futures:
+            self._acc[start:end] += future.result()
+        self._pending += 1
+        self.count += len(batch)
+
+    def result(self) -> tuple[torch.Tensor, torch.Tensor]:
+        """Fully reduced ``(c0, c1)`` sums of everything added so far"""
+        self._reduce()
+        summed = torch.from_numpy(self._acc.copy()).view(torch.complex128)
+        return summed[:self.dim], summed[self.dim:]
+
+    def aggregate(self, encrypted_updates: Iterable[bytes]) -> torch.Tensor:
+        """Aggregate and decrypt ciphertexts from any iterable, consumed lazily"""
+        self.reset()
+        if self.num_workers == 1:
+            for ct in encrypted_updates:
+                self.add(ct)
+        else:
+            with ProcessPoolExecutor(max_workers=self.num_workers) as executor:
+                batch = []
+                for ct in encrypted_updates:
+                    batch.append(ct)
+                    if len(batch) >= self.batch_size:
+                        self._add_sharded(executor, batch)
+                        batch = []
+                if batch:
+                    self._add_sharded(executor, batch)
+
+        return self.rlwe.decrypt(self.result(), self.private_key)
+
+    async def aggregate_stream(
+        self,
+        updates: Union[asyncio.Queue, AsyncIterable[bytes]],
+        expected: Optional[int] = None,
+    ) -> torch.Tensor:
+        """Aggregate ciphertexts as they arrive from an asyncio queue or async iterator
+
+        A queue is drained until it yields ``None`` or ``expected`` ciphertexts
+        have been added. Accumulation runs off the event loop.
+        """
+        self.reset()
+
+        async def stream():
+            if isinstance(updates, asyncio.Queue):
+                while expected is None or self.count < expected:
+                    ct = await updates.get()
+                    if ct is None:
+                        return
+                    yield ct
+            else:
+                async for ct in updates:
+                    yield ct
+
+        async for ct in stream():
+            await asyncio.to_thread(self.add, ct)
+
+        return await asyncio.to_thread(
+            self.rlwe.decrypt, self.result(), self.private_key
+        )
+
     def _deserialize_ciphertext(self, data: bytes) -> tuple[torch.Tensor, torch.Tensor]:
+        view = self._view(data)
+        half = len(view) // 2
         return (
-            torch.frombuffer(data[:self.dim*8], dtype=torch.complex128),
-            torch.frombuffer(data[self.dim*8:], dtype=torch.complex128)
-        )
\ No newline at end of file
+            torch.frombuffer(view[:half], dtype=torch.complex128),
+            torch.frombuffer(view[half:], dtype=torch.complex128)
+        )
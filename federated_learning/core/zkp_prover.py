@@ -7,42 +7,181 @@ from cryptography.hazmat.primitives.asymmetric import x25519, ec
 from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 
 class MerkleTree:
-    """Custom Merkle Tree implementation replacing merkletools"""
+    """Custom Merkle Tree implementation replacing merkletools
+
+    Levels are stored flat (``levels[0]`` are the leaves, ``levels[-1]`` is
+    ``[root]``) and hashed once. An odd node at the end of a level is
+    promoted unchanged. Proofs are O(log n) lookups and appends only rehash
+    the path from the new leaf to the root.
+    """
     def __init__(self, data):
         self.leaves = [self.hash(item) for item in data]
-        self.tree = self.build_tree(self.leaves)
+        self.levels = [self.leaves]
+        self.build_tree()
     
     @staticmethod
     def hash(data):
         return hashlib.sha3_256(data).digest()
     
-    def build_tree(self, nodes):
-        if len(nodes) == 1:
-            return nodes
-        new_level = []
-        for i in range(0, len(nodes)-1, 2):
-            new_level.append(self.hash(nodes[i] + nodes[i+1]))
-        if len(nodes) % 2 == 1:
-            new_level.append(nodes[-1])
-        return self.build_tree(new_level)
+    def _parent(self, level, index):
+        nodes = self.levels[level]
+        if 2 * index + 1 < len(nodes):
+            return self.hash(nodes[2 * index] + nodes[2 * index + 1])
+        return nodes[2 * index]
+    
+    def build_tree(self):
+        self.levels = [self.leaves]
+        while len(self.levels[-1]) > 1:
+            level = len(self.levels) - 1
+            width = (len(self.levels[level]) + 1) // 2
+            self.levels.append([self._parent(level, i) for i in range(width)])
+        return self.levels[-1]
+    
+    @property
+    def tree(self):
+        """Top level of the tree, i.e. ``[root]`` (empty for an empty tree)"""
+        return self.levels[-1]
+    
+    @property
+    def root(self):
+        return self.tree[0] if self.tree else None
+    
+    def append(self, item):
+        """Add a leaf and rehash only its path to the root; returns its index"""
+        self.leaves.append(self.hash(item))
+        index = len(self.leaves) - 1
+        
+        level, current = 0, index
+        while len(self.levels[level]) > 1:
+            if level + 1 == len(self.levels):
+                self.levels.append([])
+            parent = current // 2
+            parent_hash = self._parent(level, parent)
+            upper = self.levels[level + 1]
+            if parent < len(upper):
+                upper[parent] = parent_hash
+            else:
+                upper.append(parent_hash)
+            level, current = level + 1, parent
+        
+        return index
     
     def get_proof(self, index):
+        if not 0 <= index < len(self.leaves):
+            raise IndexError(f"Leaf index {index} out of range")
+        
         proof = []
         current_index = index
-        current_level = self.leaves.copy()
-        
-        while len(current_level) > 1:
+        for nodes in self.levels[:-1]:
             if current_index % 2 == 1:
-                sibling = current_level[current_index - 1]
-                proof.append(('left', sibling))
-            else:
-                if current_index + 1 < len(current_level):
-                    sibling = current_level[current_index + 1]
-                    proof.append(('right', sibling))
-            current_index = current_index // 2
-            current_level = self.build_tree(current_level)
+                proof.append(('left', nodes[current_index - 1]))
+            elif current_index + 1 < len(nodes):
+                proof.append(('right', nodes[current_index + 1]))
+            current_index //= 2
             
         return proof
+    
+    def get_multiproof(self, indices):
+        """Proof for several leaves at once, skipping siblings the verifier can derive"""
+        indices = sorted(set(indices))
+        if not indices:
+            raise ValueError("At least one leaf index is required")
+        if indices[0] < 0 or indices[-1] >= len(self.leaves):
+            raise IndexError("Leaf index out of range")
+        
+        proof = []
+        known = indices
+        for nodes in self.levels[:-1]:
+            known_set = set(known)
+            for i in known:
+                sibling_index = i ^ 1
+                if sibling_index not in known_set and sibling_index < len(nodes):
+                    proof.append(nodes[sibling_index])
+            known = sorted({i // 2 for i in known})
+        
+        return {'indices': indices, 'leaf_count': len(self.leaves), 'proof': proof}
+    
+    @classmethod
+    def verify_proof(cls, proof, leaf_hash, root):
+        current = leaf_hash
+        for side, sibling in proof:
+            current = cls.hash(sibling + current) if side == 'left' else cls.hash(current + sibling)
+        return current == root
+    
+    @classmethod
+    def verify_proofs(cls, items, root, leaf_count):
+        """Batch-verify ``(proof, leaf_hash, index)`` items against one root
+
+        Each proof must climb from leaf ``index`` of a tree with
+        ``leaf_count`` leaves, with sides matching the index and no step
+        skipped or left over. Nodes of already verified paths are
+        remembered by (level, position), so proofs sharing upper levels
+        stop as soon as they reach a verified node at the same position.
+        """
+        verified = {}
+        results = []
+        for proof, leaf_hash, index in items:
+            valid = False
+            if 0 <= index < leaf_count:
+                steps = iter(proof)
+                current = leaf_hash
+                path = []
+                level, position, width = 0, index, leaf_count
+                while True:
+                    if width == 1:
+                        valid = current == root and next(steps, None) is None
+                        break
+                    if verified.get((level, position)) == current:
+                        valid = True
+                        break
+                    path.append((level, position, current))
+                    if position % 2 == 1 or position + 1 < width:
+                        step = next(steps, None)
+                        expected = 'left' if position % 2 == 1 else 'right'
+                        if step is None or step[0] != expected:
+                            break
+                        sibling = step[1]
+                        current = cls.hash(sibling + current) if expected == 'left' else cls.hash(current + sibling)
+                    # Otherwise the last odd node is promoted unchanged
+                    level, position, width = level + 1, position // 2, (width + 1) // 2
+            if valid:
+                verified.update(((level, i), h) for level, i, h in path)
+            results.append(valid)
+        return results
+    
+    @classmethod
+    def verify_multiproof(cls, leaves, multiproof, root):
+        """Verify ``get_multiproof`` output for a ``{index: leaf_hash}`` mapping"""
+        if sorted(leaves) != multiproof['indices']:
+            return False
+        
+        nodes = dict(leaves)
+        width = multiproof['leaf_count']
+        proof = iter(multiproof['proof'])
+        try:
+            while width > 1:
+                parents = {}
+                for i in sorted(nodes):
+                    if i // 2 in parents:
+                        continue
+                    sibling_index = i ^ 1
+                    if sibling_index in nodes:
+                        sibling = nodes[sibling_index]
+                    elif sibling_index < width:
+                        sibling = next(proof)
+                    else:
+                        parents[i // 2] = nodes[i]
+                        continue
+                    left, right = (nodes[i], sibling) if i % 2 == 0 else (sibling, nodes[i])
+                    parents[i // 2] = cls.hash(left + right)
+                nodes = parents
+                width = (width + 1) // 2
+        except StopIteration:
+            return False
+        
+        if next(proof, None) is not None:
+            return False
+        return list(nodes.values()) == [root]
 
 class ZKProverStub:
     """Stub implementation for ZK proofs using cryptography primitives"""
@@ -0,0 +1,101 @@
+import hashlib
+import random
+
+import pytest
+
+from federated_learning.utils.crypto_utils import MerkleTree, QuantumSafeCrypto
+
+SIZES = range(1, 41)
+
+
+def items(n):
+    return [f"item-{i}".encode() for i in range(n)]
+
+
+def sha3(data):
+    return hashlib.sha3_256(data).digest()
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_single_proofs(n):
+    tree = MerkleTree(items(n))
+    root = tree.get_root()
+    for index, leaf in enumerate(tree.leaves):
+        proof = tree.get_proof(index)
+        assert QuantumSafeCrypto.verify_merkle_proof(proof, leaf, root, index)
+        assert not QuantumSafeCrypto.verify_merkle_proof(
+            proof, sha3(b"forged"), root, index
+        )
+        if n > 1:
+            proof[0] = sha3(b"junk")
+            assert not QuantumSafeCrypto.verify_merkle_proof(
+                proof, leaf, root, index
+            )
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_append_matches_rebuild(n):
+    tree = MerkleTree([])
+    for i, item in enumerate(items(n)):
+        assert tree.append(item) == i
+        rebuilt = MerkleTree(items(i + 1))
+        assert tree.levels == rebuilt.levels
+        assert tree.get_root() == rebuilt.get_root()
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_multiproofs(n):
+    tree = MerkleTree(items(n))
+    root = tree.get_root()
+    rng = random.Random(n)
+    for _ in range(5):
+        indices = rng.sample(range(n), rng.randint(1, n))
+        leaves = {i: tree.leaves[i] for i in indices}
+        multiproof = tree.get_multiproof(indices)
+        verify = QuantumSafeCrypto.verify_merkle_multiproof
+        assert verify(leaves, multiproof, root)
+
+        forged = dict(leaves)
+        forged[indices[0]] = sha3(b"forged")
+        assert not verify(forged, multiproof, root)
+        if multiproof["proof"]:
+            extended = dict(multiproof, proof=multiproof["proof"] + [root])
+            assert not verify(leaves, extended, root)
+            truncated = dict(multiproof, proof=multiproof["proof"][:-1])
+            assert not verify(leaves, truncated, root)
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_batch_verification(n):
+    tree = MerkleTree(items(n))
+    root = tree.get_root()
+    batch = [
+        (tree.get_proof(i), leaf, i) for i, leaf in enumerate(tree.leaves)
+    ]
+    verify = QuantumSafeCrypto.verify_merkle_proofs
+    assert verify(batch, root, leaf_count=n) == [True] * n
+
+    # Forged entries after valid ones must not ride on verified nodes
+    forged = [
+        (tree.get_proof(i), sha3(b"forged"), i) for i in range(n)
+    ]
+    assert verify(batch + forged, root, leaf_count=n) == (
+        [True] * n + [False] * n
+    )
+
+
+@pytest.mark.parametrize("n", range(3, 41))
+def test_batch_rejects_interior_node_claims(n):
+    tree = MerkleTree(items(n))
+    root = tree.get_root()
+    batch = [
+        (tree.get_proof(i), leaf, i) for i, leaf in enumerate(tree.leaves)
+    ]
+    # An interior node with the genuine proof of its own position
+    interior = tree.levels[1][0]
+    suffix = tree.get_proof(0)[1:]
+    claims = [(suffix, interior, 0), (suffix, interior, 1)]
+    results = QuantumSafeCrypto.verify_merkle_proofs(
+        batch + claims, root, leaf_count=n
+    )
+    assert results == [True] * n + [False, False]
@@ -0,0 +1,149 @@
+import asyncio
+import random
+
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("lattice_cryptography")
+
+from federated_learning.core import secure_aggregation  # noqa: E402
+from federated_learning.core.secure_aggregation import (  # noqa: E402
+    HomomorphicAggregator,
+    _reduce_shard,
+)
+
+# Large enough that only a few additions fit below 2**53 before reducing
+MODULUS = 2 ** 51
+MODEL_DIM = 5
+
+
+class StubRingLWE:
+    """RingLWE stand-in: fixed modulus, decrypt returns the ciphertext sum."""
+
+    modulus = MODULUS
+
+    def __init__(self, security_param):
+        pass
+
+    def keygen(self):
+        return "public", "private"
+
+    def decrypt(self, ciphertext, private_key):
+        return ciphertext
+
+
+@pytest.fixture(autouse=True)
+def stub_rlwe(monkeypatch):
+    monkeypatch.setattr(secure_aggregation, "RingLWE", StubRingLWE)
+
+
+def ciphertexts(count, components=4 * MODEL_DIM, seed=0):
+    rng = random.Random(seed)
+    values = [
+        [rng.randrange(MODULUS - 1000, MODULUS) for _ in range(components)]
+        for _ in range(count)
+    ]
+    return values, [np.array(v, dtype=np.float64).tobytes() for v in values]
+
+
+def naive_sum(values):
+    return [sum(column) % MODULUS for column in zip(*values)]
+
+
+def as_ints(result):
+    c0, c1 = result
+    flat = torch.cat([c0, c1]).view(torch.float64).numpy()
+    return [int(x) for x in flat]
+
+
+def test_reduce_every_keeps_sums_exact():
+    aggregator = HomomorphicAggregator(MODEL_DIM)
+    assert aggregator.reduce_every == 3
+    assert 4 * MODULUS <= 2 ** 53
+
+    values, cts = ciphertexts(10)
+    pending = []
+    for ct in cts:
+        aggregator.add(ct)
+        pending.append(aggregator._pending)
+    # Reduced right before the addition that could leave the exact range
+    assert pending == [1, 2, 3, 1, 2, 3, 1, 2, 3, 1]
+    assert as_ints(aggregator.result()) == naive_sum(values)
+
+    for count in (3, 4):
+        aggregator.reset()
+        for ct in cts[:count]:
+            aggregator.add(ct)
+        assert as_ints(aggregator.result()) == naive_sum(values[:count])
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1 << 16])
+def test_chunked_sum_matches_naive(chunk_size):
+    values, cts = ciphertexts(9, seed=chunk_size)
+    aggregator = HomomorphicAggregator(MODEL_DIM, chunk_size=chunk_size)
+    assert as_ints(aggregator.aggregate(iter(cts))) == naive_sum(values)
+    assert aggregator.count == 9
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 4])
+def test_sharded_sum_matches_naive(batch_size):
+    values, cts = ciphertexts(11, seed=batch_size)
+    aggregator = HomomorphicAggregator(
+        MODEL_DIM, num_workers=3, batch_size=batch_size
+    )
+    assert as_ints(aggregator.aggregate(cts)) == naive_sum(values)
+    assert aggregator.count == 11
+
+
+def test_reduce_shard_matches_naive():
+    values, cts = ciphertexts(8)
+    shard = _reduce_shard(cts, float(MODULUS), reduce_every=3)
+    assert [int(x) for x in shard] == naive_sum(values)
+
+
+def test_streamed_sum_matches_naive():
+    values, cts = ciphertexts(7)
+
+    async def from_queue():
+        queue = asyncio.Queue()
+        for ct in cts:
+            queue.put_nowait(ct)
+        queue.put_nowait(None)
+        return await HomomorphicAggregator(MODEL_DIM).aggregate_stream(queue)
+
+    async def from_expected_count():
+        queue = asyncio.Queue()
+        for ct in cts:
+            queue.put_nowait(ct)
+        return await HomomorphicAggregator(MODEL_DIM).aggregate_stream(
+            queue, expected=4
+        )
+
+    async def from_iterator():
+        async def updates():
+            for ct in cts:
+                yield ct
+
+        return await HomomorphicAggregator(MODEL_DIM).aggregate_stream(
+            updates()
+        )
+
+    assert as_ints(asyncio.run(from_queue())) == naive_sum(values)
+    assert as_ints(asyncio.run(from_expected_count())) == naive_sum(
+        values[:4]
+    )
+    assert as_ints(asyncio.run(from_iterator())) == naive_sum(values)
+
+
+def test_mismatched_ciphertext_length_raises():
+    aggregator = HomomorphicAggregator(MODEL_DIM)
+    _, cts = ciphertexts(1)
+    with pytest.raises(ValueError):
+        aggregator.add(cts[0][:-8])
+    with pytest.raises(ValueError):
+        aggregator.aggregate([cts[0], cts[0] + b"\0" * 8])
+    with pytest.raises(ValueError):
+        HomomorphicAggregator(MODEL_DIM, num_workers=2).aggregate(
+            [cts[0][:-8]]
+        )
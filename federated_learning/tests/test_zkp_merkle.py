@@ -0,0 +1,91 @@
+import hashlib
+import random
+
+import pytest
+
+pytest.importorskip("torch")
+
+from federated_learning.core.zkp_prover import MerkleTree  # noqa: E402
+
+SIZES = range(1, 41)
+
+
+def items(n):
+    return [f"item-{i}".encode() for i in range(n)]
+
+
+def sha3(data):
+    return hashlib.sha3_256(data).digest()
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_single_proofs(n):
+    tree = MerkleTree(items(n))
+    for index, leaf in enumerate(tree.leaves):
+        proof = tree.get_proof(index)
+        assert MerkleTree.verify_proof(proof, leaf, tree.root)
+        assert not MerkleTree.verify_proof(proof, sha3(b"forged"), tree.root)
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_append_matches_rebuild(n):
+    tree = MerkleTree([])
+    for i, item in enumerate(items(n)):
+        assert tree.append(item) == i
+        rebuilt = MerkleTree(items(i + 1))
+        assert tree.levels == rebuilt.levels
+        assert tree.root == rebuilt.root
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_multiproofs(n):
+    tree = MerkleTree(items(n))
+    rng = random.Random(n)
+    for _ in range(5):
+        indices = rng.sample(range(n), rng.randint(1, n))
+        leaves = {i: tree.leaves[i] for i in indices}
+        multiproof = tree.get_multiproof(indices)
+        assert MerkleTree.verify_multiproof(leaves, multiproof, tree.root)
+
+        forged = dict(leaves)
+        forged[indices[0]] = sha3(b"forged")
+        assert not MerkleTree.verify_multiproof(forged, multiproof, tree.root)
+        if multiproof["proof"]:
+            truncated = dict(multiproof, proof=multiproof["proof"][:-1])
+            assert not MerkleTree.verify_multiproof(
+                leaves, truncated, tree.root
+            )
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_batch_verification(n):
+    tree = MerkleTree(items(n))
+    batch = [
+        (tree.get_proof(i), leaf, i) for i, leaf in enumerate(tree.leaves)
+    ]
+    assert MerkleTree.verify_proofs(batch, tree.root, n) == [True] * n
+
+    forged = [
+        (tree.get_proof(i), sha3(b"forged"), i) for i in range(n)
+    ]
+    assert MerkleTree.verify_proofs(batch + forged, tree.root, n) == (
+        [True] * n + [False] * n
+    )
+
+
+@pytest.mark.parametrize("n", range(3, 41))
+def test_batch_rejects_interior_node_claims(n):
+    tree = MerkleTree(items(n))
+    batch = [
+        (tree.get_proof(i), leaf, i) for i, leaf in enumerate(tree.leaves)
+    ]
+    interior = tree.levels[1][0]
+    claims = [
+        # Interior hash with a junk proof, after its path was verified
+        ([("right", sha3(b"junk"))], interior, 0),
+        # Interior hash with the genuine proof of its own position
+        (tree.get_proof(0)[1:], interior, 0),
+        (tree.get_proof(0)[1:], interior, 1),
+    ]
+    results = MerkleTree.verify_proofs(batch + claims, tree.root, n)
+    assert results == [True] * n + [False, False, False]
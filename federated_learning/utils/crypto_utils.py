@@ -9,41 +9,113 @@ from cryptography.hazmat.primitives.serialization import (
 )
 
 class MerkleTree:
-    """Quantum-resistant Merkle tree implementation using SHA3-256"""
+    """Quantum-resistant Merkle tree implementation using SHA3-256
+
+    All levels are kept in a flat list (``levels[0]`` are the leaves,
+    ``levels[-1]`` is ``[root]``) and hashed once. An odd node at the end of
+    a level is paired with itself. Proofs are O(log n) sibling lookups and
+    appending a leaf only rehashes the path from that leaf to the root.
+    """
     def __init__(self, data_items):
         self.leaves = [self._hash(item) for item in data_items]
-        self.tree = self._build_tree(self.leaves)
+        self.levels = [self.leaves]
+        self._build_levels()
     
     @staticmethod
     def _hash(data):
         return hashlib.sha3_256(data).digest()
     
-    def _build_tree(self, nodes):
-        if len(nodes) == 1:
-            return nodes
-        new_level = []
-        for i in range(0, len(nodes), 2):
-            combined = nodes[i] + (nodes[i+1] if i+1 < len(nodes) else nodes[i])
-            new_level.append(self._hash(combined))
-        return self._build_tree(new_level)
+    def _parent(self, level, index):
+        nodes = self.levels[level]
+        left = nodes[2 * index]
+        right = nodes[2 * index + 1] if 2 * index + 1 < len(nodes) else left
+        return self._hash(left + right)
+    
+    def _build_levels(self):
+        self.levels = [self.leaves]
+        while len(self.levels[-1]) > 1:
+            level = len(self.levels) - 1
+            width = (len(self.levels[level]) + 1) // 2
+            self.levels.append([self._parent(level, i) for i in range(width)])
+    
+    @property
+    def tree(self):
+        """Top level of the tree, i.e. ``[root]`` (empty for an empty tree)"""
+        return self.levels[-1]
+    
+    def __len__(self):
+        return len(self.leaves)
     
     def get_root(self):
         return self.tree[0] if self.tree else None
     
+    def append(self, data_item):
+        """Add a leaf and rehash only its path to the root; returns its index"""
+        self.leaves.append(self._hash(data_item))
+        index = len(self.leaves) - 1
+        
+        level, current = 0, index
+        while len(self.levels[level]) > 1:
+            if level + 1 == len(self.levels):
+                self.levels.append([])
+            parent = current // 2
+            parent_hash = self._parent(level, parent)
+            upper = self.levels[level + 1]
+            if parent < len(upper):
+                upper[parent] = parent_hash
+            else:
+                upper.append(parent_hash)
+            level, current = level + 1, parent
+        
+        return index
+    
+    def extend(self, data_items):
+        """Append several leaves; returns their indices"""
+        return [self.append(item) for item in data_items]
+    
     def get_proof(self, index):
+        """Sibling hashes from leaf ``index`` up to (excluding) the root"""
+        if not 0 <= index < len(self.leaves):
+            raise IndexError(f"Leaf index {index} out of range")
+        
         proof = []
         current_index = index
-        current_level = self.leaves.copy()
-        
-        while len(current_level) > 1:
-            sibling_index = current_index + 1 if current_index % 2 == 0 else current_index - 1
-            if sibling_index < len(current_level):
-                proof.append(current_level[sibling_index])
-            
-            current_index = current_index // 2
-            current_level = self._build_tree(current_level)
-            
+        for nodes in self.levels[:-1]:
+            sibling_index = current_index ^ 1
+            # The last odd node is paired with itself
+            proof.append(nodes[sibling_index] if sibling_index < len(nodes) else nodes[current_index])
+            current_index //= 2
         return proof
+    
+    def get_multiproof(self, indices):
+        """Shared proof for several leaves, omitting siblings that are derivable
+
+        Returns a dict with the sorted leaf ``indices``, the ``leaf_count`` of
+        the tree and the ``proof`` hashes in the order the verifier consumes them.
+        """
+        indices = sorted(set(indices))
+        if not indices:
+            raise ValueError("At least one leaf index is required")
+        if indices[0] < 0 or indices[-1] >= len(self.leaves):
+            raise IndexError("Leaf index out of range")
+        
+        proof = []
+        known = indices
+        for nodes in self.levels[:-1]:
+            known_set = set(known)
+            for i in known:
+                sibling_index = i ^ 1
+                if sibling_index in known_set:
+                    continue
+                if sibling_index < len(nodes):
+                    proof.append(nodes[sibling_index])
+            known = sorted({i // 2 for i in known})
+        
+        return {
+            'indices': indices,
+            'leaf_count': len(self.leaves),
+            'proof': proof
+        }
 
 class QuantumSafeCrypto:
     @staticmethod
@@ -139,9 +211,103 @@ class QuantumSafeCrypto:
         }
 
     @staticmethod
-    def verify_merkle_proof(proof, target_hash, root_hash):
-        """Verify Merkle proof against root hash"""
+    def verify_merkle_proof(proof, target_hash, root_hash, index=None):
+        """Verify Merkle proof against root hash
+
+        With ``index`` the leaf position decides whether each sibling sits on
+        the left or the right; without it every sibling is appended on the
+        right, as in earlier versions.
+        """
         current_hash = target_hash
         for sibling in proof:
-            current_hash = hashlib.sha3_256(current_hash + sibling).digest()
-        return current_hash == root_hash
\ No newline at end of file
+            if index is not None and index % 2 == 1:
+                current_hash = hashlib.sha3_256(sibling + current_hash).digest()
+            else:
+                current_hash = hashlib.sha3_256(current_hash + sibling).digest()
+            if index is not None:
+                index //= 2
+        return current_hash == root_hash
+
+    @staticmethod
+    def verify_merkle_proofs(items, root_hash, leaf_count=None):
+        """Batch-verify ``(proof, target_hash, index)`` items against one root
+
+        Nodes already proven to lead to the root are remembered by position,
+        so proofs that share upper levels stop hashing as soon as they reach
+        a verified node. With ``leaf_count`` every index must be a leaf of
+        the tree and every proof must span its full height, which rejects
+        interior nodes presented as leaves.
+        """
+        height = None
+        if leaf_count is not None:
+            height, width = 0, leaf_count
+            while width > 1:
+                height, width = height + 1, (width + 1) // 2
+        
+        verified = {}
+        results = []
+        for proof, target_hash, index in items:
+            if height is not None and not (
+                0 <= index < leaf_count and len(proof) == height
+            ):
+                results.append(False)
+                continue
+            current_hash = target_hash
+            path = []
+            valid = None
+            for level, sibling in enumerate(proof):
+                if verified.get((level, index)) == current_hash:
+                    valid = True
+                    break
+                path.append((level, index, current_hash))
+                if index % 2 == 1:
+                    current_hash = hashlib.sha3_256(sibling + current_hash).digest()
+                else:
+                    current_hash = hashlib.sha3_256(current_hash + sibling).digest()
+                index //= 2
+            if valid is None:
+                valid = index == 0 and current_hash == root_hash
+            if valid:
+                verified.update(((level, i), h) for level, i, h in path)
+            results.append(valid)
+        return results
+
+    @staticmethod
+    def verify_merkle_multiproof(leaves, multiproof, root_hash):
+        """Verify a ``MerkleTree.get_multiproof`` result
+
+        Args:
+            leaves: Mapping of leaf index to leaf hash for ``multiproof['indices']``
+            multiproof: The dict returned by ``get_multiproof``
+            root_hash: Expected Merkle root
+        """
+        if sorted(leaves) != multiproof['indices']:
+            return False
+        
+        nodes = dict(leaves)
+        width = multiproof['leaf_count']
+        proof = iter(multiproof['proof'])
+        try:
+            while width > 1:
+                parents = {}
+                for i in sorted(nodes):
+                    if i // 2 in parents:
+                        continue
+                    sibling_index = i ^ 1
+                    if sibling_index in nodes:
+                        sibling = nodes[sibling_index]
+                    elif sibling_index < width:
+                        sibling = next(proof)
+                    else:
+                        sibling = nodes[i]
+                    left, right = (nodes[i], sibling) if i % 2 == 0 else (sibling, nodes[i])
+                    parents[i // 2] = hashlib.sha3_256(left + right).digest()
+                nodes = parents
+                width = (width + 1) // 2
+        except StopIteration:
+            return False
+        
+        # Every proof hash must have been consumed
+        if next(proof, None) is not None:
+            return False
+        return list(nodes.values()) == [root_hash]
\ No newline at end of file
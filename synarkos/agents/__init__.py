@@ -1,16 +1,37 @@
-from synarkos.agents.agent_judge import AgentJudge
-from synarkos.agents.consistency_agent import SelfConsistencyAgent
-from synarkos.agents.create_agents_from_yaml import (
-    create_agents_from_yaml,
-)
-from synarkos.agents.flexion_agent import ReflexionAgent
-from synarkos.agents.gkp_agent import GKPAgent
-from synarkos.agents.i_agent import IterativeReflectiveExpansion
-from synarkos.agents.reasoning_agents import (
-    ReasoningAgentRouter,
-    agent_types,
-)
-from synarkos.agents.reasoning_duo import ReasoningDuo
+from typing import TYPE_CHECKING
+
+from synarkos.utils.lazy_loader import attach_lazy_exports
+
+if TYPE_CHECKING:
+    from synarkos.agents.agent_judge import AgentJudge
+    from synarkos.agents.consistency_agent import SelfConsistencyAgent
+    from synarkos.agents.create_agents_from_yaml import (
+        create_agents_from_yaml,
+    )
+    from synarkos.agents.flexion_agent import ReflexionAgent
+    from synarkos.agents.gkp_agent import GKPAgent
+    from synarkos.agents.i_agent import IterativeReflectiveExpansion
+    from synarkos.agents.reasoning_agents import (
+        ReasoningAgentRouter,
+        agent_types,
+    )
+    from synarkos.agents.reasoning_duo import ReasoningDuo
+
+# Exports are imported from their submodules on first access, so
+# importing the package does not pull in every dependency.
+_LAZY_EXPORTS = {
+    "AgentJudge": "agent_judge",
+    "SelfConsistencyAgent": "consistency_agent",
+    "create_agents_from_yaml": "create_agents_from_yaml",
+    "ReflexionAgent": "flexion_agent",
+    "GKPAgent": "gkp_agent",
+    "IterativeReflectiveExpansion": "i_agent",
+    "ReasoningAgentRouter": "reasoning_agents",
+    "agent_types": "reasoning_agents",
+    "ReasoningDuo": "reasoning_duo",
+}
+
+__getattr__, __dir__ = attach_lazy_exports(__name__, _LAZY_EXPORTS)
 
 __all__ = [
     "create_agents_from_yaml",
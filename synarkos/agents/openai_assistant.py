@@ -2,13 +2,17 @@ import json
 import os
 import subprocess
 import sys
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from loguru import logger
 
 from synarkos.structs.agent import Agent
+from synarkos.utils.execution_service import get_execution_service
+
+# Run statuses after which a run will not make further progress
+RUN_FAILED_STATUSES = ("failed", "expired", "cancelled", "incomplete")
 
 
 def check_openai_package():
@@ -38,6 +42,38 @@ def check_openai_package():
             ) from e
 
 
+_shared_clients: Dict[Tuple[Optional[str], Optional[str]], Any] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def get_openai_client(
+    api_key: Optional[str] = None, base_url: Optional[str] = None
+) -> Any:
+    """
+    Return a process-wide OpenAI client for an API key and base URL.
+
+    Assistants sharing a client share its connection pool, so concurrent
+    runs reuse connections instead of opening a pool per assistant.
+
+    Args:
+        api_key (Optional[str]): API key; defaults to ``OPENAI_API_KEY``.
+        base_url (Optional[str]): API base URL; defaults to the OpenAI
+            API, or ``OPENAI_BASE_URL`` when set.
+
+    Returns:
+        openai.OpenAI: The shared client.
+    """
+    api_key = api_key or os.getenv("OPENAI_API_KEY")
+    key = (api_key, base_url)
+    with _shared_clients_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            openai = check_openai_package()
+            client = openai.OpenAI(api_key=api_key, base_url=base_url)
+            _shared_clients[key] = client
+        return client
+
+
 class OpenAIAssistant(Agent):
     """
     OpenAI Assistant wrapper for the synarkos framework.
@@ -63,6 +99,13 @@ class OpenAIAssistant(Agent):
         file_ids: Optional[List[str]] = None,
         metadata: Optional[Dict[str, Any]] = None,
         functions: Optional[List[Dict[str, Any]]] = None,
+        client: Optional[Any] = None,
+        base_url: Optional[str] = None,
+        stream_runs: bool = True,
+        poll_interval: float = 0.05,
+        max_poll_interval: float = 2.0,
+        poll_backoff: float = 2.0,
+        run_timeout: Optional[float] = None,
         *args,
         **kwargs,
     ):
@@ -76,6 +119,16 @@ class OpenAIAssistant(Agent):
             file_ids: List of file IDs to attach
             metadata: Additional metadata
             functions: List of custom functions to make available
+            client: OpenAI client to use; defaults to the shared client
+                for ``OPENAI_API_KEY`` and ``base_url``
+            base_url: API base URL of the default client
+            stream_runs: Consume run events as they arrive instead of
+                polling the run status
+            poll_interval: First delay in seconds when polling a run
+            max_poll_interval: Upper bound of the polling delay
+            poll_backoff: Factor the polling delay grows by per check
+            run_timeout: Seconds to wait for a polled run before failing;
+                None waits indefinitely
         """
         self.name = name
         self.description = description
@@ -85,6 +138,11 @@ class OpenAIAssistant(Agent):
         self.file_ids = file_ids
         self.metadata = metadata
         self.functions = functions
+        self.stream_runs = stream_runs
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.poll_backoff = poll_backoff
+        self.run_timeout = run_timeout
 
         super().__init__(*args, **kwargs)
 
@@ -97,10 +155,7 @@ class OpenAIAssistant(Agent):
                 )
 
         # Create the OpenAI Assistant
-        openai = check_openai_package()
-        self.client = openai.OpenAI(
-            api_key=os.getenv("OPENAI_API_KEY")
-        )
+        self.client = client or get_openai_client(base_url=base_url)
         self.assistant = self.client.beta.assistants.create(
             name=name,
             instructions=instructions,
@@ -143,6 +198,42 @@ class OpenAIAssistant(Agent):
             assistant_id=self.assistant.id, tools=self.tools
         )
 
+    def _execute_tool_calls(self, run) -> List[Dict[str, str]]:
+        """Run the function calls a run requires and collect their outputs.
+
+        Args:
+            run: A run with status ``requires_action``
+
+        Returns:
+            Tool outputs to submit back to the run
+        """
+        tool_calls = (
+            run.required_action.submit_tool_outputs.tool_calls
+        )
+        tool_outputs = []
+
+        for tool_call in tool_calls:
+            if tool_call.type == "function":
+                # Get function details
+                function_name = tool_call.function.name
+                function_args = json.loads(
+                    tool_call.function.arguments
+                )
+
+                # Call function if available
+                if function_name in self.available_functions:
+                    function_response = self.available_functions[
+                        function_name
+                    ](**function_args)
+                    tool_outputs.append(
+                        {
+                            "tool_call_id": tool_call.id,
+                            "output": str(function_response),
+                        }
+                    )
+
+        return tool_outputs
+
     def _handle_tool_calls(self, run, thread_id: str) -> None:
         """Handle any required tool calls during a run.
 
@@ -161,36 +252,11 @@ class OpenAIAssistant(Agent):
             Exception: If there are errors executing the tool calls
         """
         while run.status == "requires_action":
-            tool_calls = (
-                run.required_action.submit_tool_outputs.tool_calls
-            )
-            tool_outputs = []
-
-            for tool_call in tool_calls:
-                if tool_call.type == "function":
-                    # Get function details
-                    function_name = tool_call.function.name
-                    function_args = json.loads(
-                        tool_call.function.arguments
-                    )
-
-                    # Call function if available
-                    if function_name in self.available_functions:
-                        function_response = self.available_functions[
-                            function_name
-                        ](**function_args)
-                        tool_outputs.append(
-                            {
-                                "tool_call_id": tool_call.id,
-                                "output": str(function_response),
-                            }
-                        )
-
             # Submit outputs back to the run
             run = self.client.beta.threads.runs.submit_tool_outputs(
                 thread_id=thread_id,
                 run_id=run.id,
-                tool_outputs=tool_outputs,
+                tool_outputs=self._execute_tool_calls(run),
             )
 
             # Wait for processing
@@ -201,9 +267,11 @@ class OpenAIAssistant(Agent):
     def _wait_for_run(self, run) -> Any:
         """Wait for a run to complete and handle any required actions.
 
-        This method polls the OpenAI API to check the status of a run until it completes
-        or fails. It handles intermediate states like required actions and implements
-        exponential backoff.
+        This method polls the OpenAI API to check the status of a run until it
+        completes or fails. The first check is immediate; the delay between
+        checks then starts at ``poll_interval`` and grows by ``poll_backoff``
+        up to ``max_poll_interval``, and restarts after tool outputs are
+        submitted.
 
         Args:
             run: The run object to monitor
@@ -212,28 +280,90 @@ class OpenAIAssistant(Agent):
             The completed run object
 
         Raises:
-            Exception: If the run fails or expires
+            Exception: If the run fails, expires or exceeds ``run_timeout``
         """
+        thread_id = run.thread_id
+        interval = self.poll_interval
+        deadline = (
+            None
+            if self.run_timeout is None
+            else time.monotonic() + self.run_timeout
+        )
+
         while True:
             run = self.client.beta.threads.runs.retrieve(
-                thread_id=run.thread_id, run_id=run.id
+                thread_id=thread_id, run_id=run.id
             )
 
             if run.status == "completed":
                 break
             elif run.status == "requires_action":
-                run = self._handle_tool_calls(run, run.thread_id)
-                if run.status == "completed":
-                    break
-            elif run.status in ["failed", "expired"]:
+                run = (
+                    self.client.beta.threads.runs.submit_tool_outputs(
+                        thread_id=thread_id,
+                        run_id=run.id,
+                        tool_outputs=self._execute_tool_calls(run),
+                    )
+                )
+                interval = self.poll_interval
+                continue
+            elif run.status in RUN_FAILED_STATUSES:
                 raise Exception(
                     f"Run failed with status: {run.status}"
                 )
 
-            time.sleep(3)  # Wait 3 seconds before checking again
+            if deadline is not None and time.monotonic() >= deadline:
+                raise Exception(
+                    f"Run timed out with status: {run.status}"
+                )
+            time.sleep(interval)
+            interval = min(
+                interval * self.poll_backoff, self.max_poll_interval
+            )
 
         return run
 
+    def _stream_run(self, thread_id: str) -> Any:
+        """Create a run and consume its events until it finishes.
+
+        Tool calls are answered as soon as the run asks for them, with the
+        outputs submitted on a new event stream.
+
+        Args:
+            thread_id: ID of the conversation thread
+
+        Returns:
+            The completed run object
+
+        Raises:
+            Exception: If the run fails or expires
+        """
+        runs = self.client.beta.threads.runs
+        manager = runs.stream(
+            thread_id=thread_id,
+            assistant_id=self.assistant.id,
+            instructions=self.instructions,
+        )
+
+        while True:
+            with manager as stream:
+                stream.until_done()
+                run = stream.current_run
+
+            if run is None:
+                raise Exception("Run stream ended without a run")
+            if run.status != "requires_action":
+                break
+            manager = runs.submit_tool_outputs_stream(
+                thread_id=thread_id,
+                run_id=run.id,
+                tool_outputs=self._execute_tool_calls(run),
+            )
+
+        if run.status != "completed":
+            raise Exception(f"Run failed with status: {run.status}")
+        return run
+
     def _ensure_thread(self):
         """Ensure a thread exists for the conversation.
 
@@ -243,11 +373,18 @@ class OpenAIAssistant(Agent):
 
         Side Effects:
             Sets self.thread if it doesn't exist
+
+        Returns:
+            The created thread
         """
         self.thread = self.client.beta.threads.create()
+        return self.thread
 
     def add_message(
-        self, content: str, file_ids: Optional[List[str]] = None
+        self,
+        content: str,
+        file_ids: Optional[List[str]] = None,
+        thread_id: Optional[str] = None,
     ) -> None:
         """Add a message to the thread.
 
@@ -258,23 +395,27 @@ class OpenAIAssistant(Agent):
             content: The text content of the message to add
             file_ids: Optional list of file IDs to attach to the message. These must be
                      files that have been previously uploaded to OpenAI.
+            thread_id: Thread to add the message to; defaults to a new thread
 
         Side Effects:
-            Creates a new thread if none exists
+            Creates a new thread if none is given
             Adds the message to the thread in OpenAI's system
         """
-        self._ensure_thread()
+        if thread_id is None:
+            thread_id = self._ensure_thread().id
         self.client.beta.threads.messages.create(
-            thread_id=self.thread.id,
+            thread_id=thread_id,
             role="user",
             content=content,
             # file_ids=file_ids or [],
         )
 
-    def _get_response(self) -> str:
+    def _get_response(self, thread_id: Optional[str] = None) -> str:
         """Get the latest assistant response from the thread."""
         messages = self.client.beta.threads.messages.list(
-            thread_id=self.thread.id, order="desc", limit=1
+            thread_id=thread_id or self.thread.id,
+            order="desc",
+            limit=1,
         )
 
         if not messages.data:
@@ -294,24 +435,28 @@ class OpenAIAssistant(Agent):
         Returns:
             The assistant's response as a string
         """
-        self._ensure_thread()
+        # Keep the thread local so concurrent runs don't share it
+        thread_id = self._ensure_thread().id
 
         # Add the user message
-        self.add_message(task)
+        self.add_message(task, thread_id=thread_id)
 
-        # Create and run the assistant
-        run = self.client.beta.threads.runs.create(
-            thread_id=self.thread.id,
-            assistant_id=self.assistant.id,
-            instructions=self.instructions,
-        )
+        if self.stream_runs:
+            run = self._stream_run(thread_id)
+        else:
+            # Create and run the assistant
+            run = self.client.beta.threads.runs.create(
+                thread_id=thread_id,
+                assistant_id=self.assistant.id,
+                instructions=self.instructions,
+            )
 
-        # Wait for completion
-        run = self._wait_for_run(run)
+            # Wait for completion
+            run = self._wait_for_run(run)
 
         # Only get and return the response if run completed successfully
         if run.status == "completed":
-            return self._get_response()
+            return self._get_response(thread_id)
         return ""
 
     def call(self, task: str, *args, **kwargs) -> str:
@@ -327,10 +472,17 @@ class OpenAIAssistant(Agent):
     def run_concurrently(
         self, tasks: List[str], *args, **kwargs
     ) -> List[Any]:
-        """Run a batch of tasks concurrently using the OpenAI Assistant."""
-        with ThreadPoolExecutor(
-            max_workers=os.cpu_count()
-        ) as executor:
-            return list(
-                executor.map(self.run, tasks, *args, **kwargs)
+        """Run a batch of tasks concurrently using the OpenAI Assistant.
+
+        Tasks run on the shared execution service under the model's
+        concurrency limit, each on its own thread, and share this
+        assistant's client and connection pool.
+        """
+        service = get_execution_service()
+        futures = [
+            service.submit_model(
+                self.model, self.run, task, *args, **kwargs
             )
+            for task in tasks
+        ]
+        return [future.result() for future in futures]
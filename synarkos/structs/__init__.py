@@ -1,105 +1,219 @@
-from synarkos.structs.agent import Agent
-from synarkos.structs.agent_loader import AgentLoader
-from synarkos.structs.agent_rearrange import AgentRearrange, rearrange
-from synarkos.structs.aop import AOP
-from synarkos.structs.auto_swarm_builder import AutoSwarmBuilder
-from synarkos.structs.base_structure import BaseStructure
-from synarkos.structs.base_swarm import BaseSwarm
-from synarkos.structs.batch_agent_execution import batch_agent_execution
-from synarkos.structs.batched_grid_workflow import BatchedGridWorkflow
-from synarkos.structs.concurrent_workflow import ConcurrentWorkflow
-from synarkos.structs.conversation import Conversation
-from synarkos.structs.council_as_judge import CouncilAsAJudge
-from synarkos.structs.cron_job import CronJob
-from synarkos.structs.graph_workflow import (
-    Edge,
-    GraphWorkflow,
-    Node,
-    NodeType,
-)
-from synarkos.structs.groupchat import (
-    GroupChat,
-    expertise_based,
-)
-from synarkos.structs.heavy_swarm import HeavySwarm
-from synarkos.structs.hiearchical_swarm import HierarchicalSwarm
-from synarkos.structs.hybrid_hiearchical_peer_swarm import (
-    HybridHierarchicalClusterSwarm,
-)
-from synarkos.structs.interactive_groupchat import (
-    InteractiveGroupChat,
-    priority_speaker,
-    random_dynamic_speaker,
-    random_speaker,
-    round_robin_speaker,
-)
-from synarkos.structs.ma_blocks import (
-    aggregate,
-    find_agent_by_name,
-    run_agent,
-)
-from synarkos.structs.majority_voting import (
-    MajorityVoting,
-)
-from synarkos.structs.malt import MALT
-from synarkos.structs.mixture_of_agents import MixtureOfAgents
-from synarkos.structs.model_router import ModelRouter
-from synarkos.structs.multi_agent_exec import (
-    batched_grid_agent_execution,
-    get_agents_info,
-    get_synarkos_info,
-    run_agent_async,
-    run_agents_concurrently,
-    run_agents_concurrently_async,
-    run_agents_concurrently_multiprocess,
-    run_agents_concurrently_uvloop,
-    run_agents_with_different_tasks,
-    run_agents_with_tasks_uvloop,
-    run_single_agent,
-)
-from synarkos.structs.multi_agent_router import MultiAgentRouter
-from synarkos.structs.round_robin import RoundRobinSwarm
-from synarkos.structs.self_moa_seq import SelfMoASeq
-from synarkos.structs.sequential_workflow import SequentialWorkflow
-from synarkos.structs.social_algorithms import SocialAlgorithms
-from synarkos.structs.spreadsheet_swarm import SpreadSheetSwarm
-from synarkos.structs.stopping_conditions import (
-    check_cancelled,
-    check_complete,
-    check_done,
-    check_end,
-    check_error,
-    check_exit,
-    check_failure,
-    check_finished,
-    check_stopped,
-    check_success,
-)
-from synarkos.structs.swarm_rearrange import SwarmRearrange
-from synarkos.structs.swarm_router import (
-    SwarmRouter,
-    SwarmType,
-)
-from synarkos.structs.swarming_architectures import (
-    broadcast,
-    circular_swarm,
-    exponential_swarm,
-    fibonacci_swarm,
-    geometric_swarm,
-    grid_swarm,
-    harmonic_swarm,
-    linear_swarm,
-    log_swarm,
-    mesh_swarm,
-    one_to_one,
-    one_to_three,
-    power_swarm,
-    prime_swarm,
-    pyramid_swarm,
-    sigmoid_swarm,
-    staircase_swarm,
-    star_swarm,
-)
+from typing import TYPE_CHECKING
+
+from synarkos.utils.lazy_loader import attach_lazy_exports
+
+if TYPE_CHECKING:
+    from synarkos.structs.agent import Agent
+    from synarkos.structs.agent_loader import AgentLoader
+    from synarkos.structs.agent_rearrange import (
+        AgentRearrange,
+        rearrange,
+    )
+    from synarkos.structs.agent_template import AgentTemplate
+    from synarkos.structs.aop import AOP
+    from synarkos.structs.auto_swarm_builder import AutoSwarmBuilder
+    from synarkos.structs.base_structure import BaseStructure
+    from synarkos.structs.base_swarm import BaseSwarm
+    from synarkos.structs.batch_agent_execution import (
+        batch_agent_execution,
+    )
+    from synarkos.structs.batched_grid_workflow import (
+        BatchedGridWorkflow,
+    )
+    from synarkos.structs.context_handoff import (
+        ContextHandoff,
+        HandoffConfig,
+    )
+    from synarkos.structs.concurrent_workflow import (
+        ConcurrentWorkflow,
+    )
+    from synarkos.structs.conversation import Conversation
+    from synarkos.structs.council_as_judge import CouncilAsAJudge
+    from synarkos.structs.cron_job import CronJob
+    from synarkos.structs.graph_workflow import (
+        Edge,
+        GraphWorkflow,
+        Node,
+        NodeType,
+    )
+    from synarkos.structs.groupchat import (
+        GroupChat,
+        expertise_based,
+    )
+    from synarkos.structs.heavy_swarm import HeavySwarm
+    from synarkos.structs.hiearchical_swarm import HierarchicalSwarm
+    from synarkos.structs.hybrid_hiearchical_peer_swarm import (
+        HybridHierarchicalClusterSwarm,
+    )
+    from synarkos.structs.interactive_groupchat import (
+        InteractiveGroupChat,
+        priority_speaker,
+        random_dynamic_speaker,
+        random_speaker,
+        round_robin_speaker,
+    )
+    from synarkos.structs.ma_blocks import (
+        aggregate,
+        find_agent_by_name,
+        run_agent,
+    )
+    from synarkos.structs.majority_voting import (
+        MajorityVoting,
+    )
+    from synarkos.structs.malt import MALT
+    from synarkos.structs.mixture_of_agents import MixtureOfAgents
+    from synarkos.structs.model_router import ModelRouter
+    from synarkos.structs.multi_agent_exec import (
+        batched_grid_agent_execution,
+        get_agents_info,
+        get_synarkos_info,
+        run_agent_async,
+        run_agents_concurrently,
+        run_agents_concurrently_async,
+        run_agents_concurrently_multiprocess,
+        run_agents_concurrently_uvloop,
+        run_agents_with_different_tasks,
+        run_agents_with_tasks_uvloop,
+        run_single_agent,
+    )
+    from synarkos.structs.multi_agent_router import MultiAgentRouter
+    from synarkos.structs.round_robin import RoundRobinSwarm
+    from synarkos.structs.self_moa_seq import SelfMoASeq
+    from synarkos.structs.sequential_workflow import (
+        SequentialWorkflow,
+    )
+    from synarkos.structs.social_algorithms import SocialAlgorithms
+    from synarkos.structs.spreadsheet_swarm import SpreadSheetSwarm
+    from synarkos.structs.stopping_conditions import (
+        check_cancelled,
+        check_complete,
+        check_done,
+        check_end,
+        check_error,
+        check_exit,
+        check_failure,
+        check_finished,
+        check_stopped,
+        check_success,
+    )
+    from synarkos.structs.swarm_rearrange import SwarmRearrange
+    from synarkos.structs.swarm_router import (
+        SwarmRouter,
+        SwarmType,
+    )
+    from synarkos.structs.swarming_architectures import (
+        broadcast,
+        circular_swarm,
+        exponential_swarm,
+        fibonacci_swarm,
+        geometric_swarm,
+        grid_swarm,
+        harmonic_swarm,
+        linear_swarm,
+        log_swarm,
+        mesh_swarm,
+        one_to_one,
+        one_to_three,
+        power_swarm,
+        prime_swarm,
+        pyramid_swarm,
+        sigmoid_swarm,
+        staircase_swarm,
+        star_swarm,
+    )
+
+# Exports are imported from their submodules on first access, so
+# importing the package does not pull in every dependency.
+_LAZY_EXPORTS = {
+    "Agent": "agent",
+    "AgentLoader": "agent_loader",
+    "AgentRearrange": "agent_rearrange",
+    "rearrange": "agent_rearrange",
+    "AgentTemplate": "agent_template",
+    "AOP": "aop",
+    "AutoSwarmBuilder": "auto_swarm_builder",
+    "BaseStructure": "base_structure",
+    "BaseSwarm": "base_swarm",
+    "batch_agent_execution": "batch_agent_execution",
+    "BatchedGridWorkflow": "batched_grid_workflow",
+    "ConcurrentWorkflow": "concurrent_workflow",
+    "ContextHandoff": "context_handoff",
+    "HandoffConfig": "context_handoff",
+    "Conversation": "conversation",
+    "CouncilAsAJudge": "council_as_judge",
+    "CronJob": "cron_job",
+    "Edge": "graph_workflow",
+    "GraphWorkflow": "graph_workflow",
+    "Node": "graph_workflow",
+    "NodeType": "graph_workflow",
+    "GroupChat": "groupchat",
+    "expertise_based": "groupchat",
+    "HeavySwarm": "heavy_swarm",
+    "HierarchicalSwarm": "hiearchical_swarm",
+    "HybridHierarchicalClusterSwarm": "hybrid_hiearchical_peer_swarm",
+    "InteractiveGroupChat": "interactive_groupchat",
+    "priority_speaker": "interactive_groupchat",
+    "random_dynamic_speaker": "interactive_groupchat",
+    "random_speaker": "interactive_groupchat",
+    "round_robin_speaker": "interactive_groupchat",
+    "aggregate": "ma_blocks",
+    "find_agent_by_name": "ma_blocks",
+    "run_agent": "ma_blocks",
+    "MajorityVoting": "majority_voting",
+    "MALT": "malt",
+    "MixtureOfAgents": "mixture_of_agents",
+    "ModelRouter": "model_router",
+    "batched_grid_agent_execution": "multi_agent_exec",
+    "get_agents_info": "multi_agent_exec",
+    "get_synarkos_info": "multi_agent_exec",
+    "run_agent_async": "multi_agent_exec",
+    "run_agents_concurrently": "multi_agent_exec",
+    "run_agents_concurrently_async": "multi_agent_exec",
+    "run_agents_concurrently_multiprocess": "multi_agent_exec",
+    "run_agents_concurrently_uvloop": "multi_agent_exec",
+    "run_agents_with_different_tasks": "multi_agent_exec",
+    "run_agents_with_tasks_uvloop": "multi_agent_exec",
+    "run_single_agent": "multi_agent_exec",
+    "MultiAgentRouter": "multi_agent_router",
+    "RoundRobinSwarm": "round_robin",
+    "SelfMoASeq": "self_moa_seq",
+    "SequentialWorkflow": "sequential_workflow",
+    "SocialAlgorithms": "social_algorithms",
+    "SpreadSheetSwarm": "spreadsheet_swarm",
+    "check_cancelled": "stopping_conditions",
+    "check_complete": "stopping_conditions",
+    "check_done": "stopping_conditions",
+    "check_end": "stopping_conditions",
+    "check_error": "stopping_conditions",
+    "check_exit": "stopping_conditions",
+    "check_failure": "stopping_conditions",
+    "check_finished": "stopping_conditions",
+    "check_stopped": "stopping_conditions",
+    "check_success": "stopping_conditions",
+    "SwarmRearrange": "swarm_rearrange",
+    "SwarmRouter": "swarm_router",
+    "SwarmType": "swarm_router",
+    "broadcast": "swarming_architectures",
+    "circular_swarm": "swarming_architectures",
+    "exponential_swarm": "swarming_architectures",
+    "fibonacci_swarm": "swarming_architectures",
+    "geometric_swarm": "swarming_architectures",
+    "grid_swarm": "swarming_architectures",
+    "harmonic_swarm": "swarming_architectures",
+    "linear_swarm": "swarming_architectures",
+    "log_swarm": "swarming_architectures",
+    "mesh_swarm": "swarming_architectures",
+    "one_to_one": "swarming_architectures",
+    "one_to_three": "swarming_architectures",
+    "power_swarm": "swarming_architectures",
+    "prime_swarm": "swarming_architectures",
+    "pyramid_swarm": "swarming_architectures",
+    "sigmoid_swarm": "swarming_architectures",
+    "staircase_swarm": "swarming_architectures",
+    "star_swarm": "swarming_architectures",
+}
+
+__getattr__, __dir__ = attach_lazy_exports(__name__, _LAZY_EXPORTS)
 
 __all__ = [
     "Agent",
@@ -112,8 +226,11 @@ __all__ = [
     "MajorityVoting",
     "AgentRearrange",
     "rearrange",
+    "AgentTemplate",
     "RoundRobinSwarm",
     "SequentialWorkflow",
+    "ContextHandoff",
+    "HandoffConfig",
     "MixtureOfAgents",
     "GraphWorkflow",
     "Node",
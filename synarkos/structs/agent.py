@@ -69,14 +69,17 @@ from synarkos.structs.safe_loading import (
     SafeLoaderUtils,
     SafeStateManager,
 )
+from synarkos.structs.state_checkpoint import StateCheckpoint
 from synarkos.structs.transforms import (
     MessageTransforms,
     TransformConfig,
     handle_transforms,
 )
 from synarkos.telemetry.main import log_agent_data
+from synarkos.telemetry.tracing import traced
 from synarkos.tools.base_tool import BaseTool
 from synarkos.tools.mcp_client_tools import (
+    execute_multiple_tools_on_multiple_mcp_servers,
     execute_multiple_tools_on_multiple_mcp_servers_sync,
     execute_tool_call_simple,
     get_mcp_tools_sync,
@@ -97,8 +100,8 @@ from synarkos.utils.index import (
     exists,
     format_data_structure,
 )
-from synarkos.utils.litellm_tokenizer import count_tokens
 from synarkos.utils.litellm_wrapper import LiteLLM
+from synarkos.utils.llm_response_cache import LLMResponseCache
 from synarkos.utils.output_types import OutputType
 from synarkos.utils.pdf_to_text import pdf_to_text
 
@@ -114,6 +117,11 @@ def parse_done_token(response: str) -> bool:
     return "<DONE>" in response
 
 
+# Trace span attributes of agent methods
+def _span_attrs(agent: "Agent", *args, **kwargs) -> dict:
+    return {"agent": agent.agent_name}
+
+
 # Agent ID generator
 def agent_id():
     """Generate an agent id"""
@@ -266,6 +274,9 @@ class Agent:
         artifacts_output_path (str): The artifacts output path
         artifacts_file_extension (str): The artifacts file extension (.pdf, .md, .txt, )
         scheduled_run_date (datetime): The date and time to schedule the task
+        response_cache (Union[bool, LLMResponseCache]): Serve identical LLM requests from a cache; True uses the process-wide cache
+        state_format (str): State file format: 'json' rewrites the full state on every save, 'jsonl' appends only changed fields and new messages to an incremental checkpoint
+        checkpoint_compact_interval (int): Incremental saves between compactions of a 'jsonl' checkpoint
 
     Methods:
         run: Run the agent
@@ -466,6 +477,11 @@ class Agent:
         handoffs: Optional[Union[Sequence[Callable], Any]] = None,
         capabilities: Optional[List[str]] = None,
         mode: Literal["interactive", "fast", "standard"] = "standard",
+        response_cache: Optional[
+            Union[bool, LLMResponseCache]
+        ] = None,
+        state_format: Literal["json", "jsonl"] = "json",
+        checkpoint_compact_interval: int = 50,
         *args,
         **kwargs,
     ):
@@ -617,6 +633,10 @@ class Agent:
         self.handoffs = handoffs
         self.capabilities = capabilities
         self.mode = mode
+        self.response_cache = response_cache
+        self.state_format = state_format
+        self.checkpoint_compact_interval = checkpoint_compact_interval
+        self._checkpoint: Optional[StateCheckpoint] = None
 
         # Initialize transforms
         if transforms is None:
@@ -815,6 +835,9 @@ class Agent:
                 "reasoning_enabled": self.reasoning_enabled,
             }
 
+            if self.response_cache:
+                common_args["response_cache"] = self.response_cache
+
             # Initialize tools_list_dictionary, if applicable
             tools_list = []
 
@@ -1115,6 +1138,7 @@ class Agent:
             title=f"Agent {self.agent_name} Dashboard",
         )
 
+    @traced("agent.rag", _span_attrs)
     def handle_rag_query(self, query: str):
         """
         Handle RAG query
@@ -1152,6 +1176,7 @@ class Agent:
             raise e
 
     # Main function
+    @traced("agent.run", _span_attrs)
     def _run(
         self,
         task: Optional[Union[str, Any]] = None,
@@ -1212,8 +1237,7 @@ class Agent:
 
             # Autosave
             if self.autosave:
-                log_agent_data(self.to_dict())
-                self.save()
+                self._autosave_state()
 
             while (
                 self.max_loops == "auto"
@@ -1228,45 +1252,7 @@ class Agent:
                 ):
                     self.handle_rag_query(task)
 
-                if (
-                    isinstance(self.max_loops, int)
-                    and self.max_loops >= 2
-                ):
-                    if self.reasoning_prompt_on is True:
-                        self.short_memory.add(
-                            role=self.agent_name,
-                            content=f"Current Internal Reasoning Loop: {loop_count}/{self.max_loops}",
-                        )
-
-                # If it is the final loop, then add the final loop message
-                if (
-                    loop_count >= 2
-                    and isinstance(self.max_loops, int)
-                    and loop_count == self.max_loops
-                ):
-                    if self.reasoning_prompt_on is True:
-                        self.short_memory.add(
-                            role=self.agent_name,
-                            content=f"🎉 Final Internal Reasoning Loop: {loop_count}/{self.max_loops} Prepare your comprehensive response.",
-                        )
-
-                # Dynamic temperature
-                if self.dynamic_temperature_enabled is True:
-                    self.dynamic_temperature()
-
-                # Task prompt with optional transforms
-                if self.transforms is not None:
-                    task_prompt = handle_transforms(
-                        transforms=self.transforms,
-                        short_memory=self.short_memory,
-                        model_name=self.model_name,
-                    )
-
-                else:
-                    # Use original method if no transforms
-                    task_prompt = (
-                        self.short_memory.return_history_as_string()
-                    )
+                task_prompt = self._prepare_loop_prompt(loop_count)
 
                 # Parameters
                 attempt = 0
@@ -1292,36 +1278,10 @@ class Agent:
                                 **kwargs,
                             )
 
-                        # If streaming is enabled, then don't print the response
-
-                        # Parse the response from the agent with the output type
-                        if exists(self.tools_list_dictionary):
-                            if isinstance(response, BaseModel):
-                                response = response.model_dump()
-
-                        # Parse the response from the agent with the output type
-                        response = self.parse_llm_output(response)
-
-                        self.short_memory.add(
-                            role=self.agent_name,
-                            content=response,
+                        response = self._record_llm_response(
+                            response, loop_count
                         )
 
-                        # Print
-                        if self.print_on is True:
-                            if isinstance(response, list):
-                                self.pretty_print(
-                                    # f"Structured Output - Attempting Function Call Execution [{time.strftime('%H:%M:%S')}] \n\n Output: {format_data_structure(response)} ",
-                                    f"[Structured Output] [Time: {time.strftime('%H:%M:%S')}] \n\n {json.dumps(response, indent=4)}",
-                                    loop_count,
-                                )
-                            elif self.streaming_on:
-                                pass
-                            else:
-                                self.pretty_print(
-                                    response, loop_count
-                                )
-
                         # Check and execute callable tools
                         if exists(self.tools):
                             self.tool_execution_retry(
@@ -1329,11 +1289,7 @@ class Agent:
                             )
 
                         # Handle MCP tools
-                        if (
-                            exists(self.mcp_url)
-                            or exists(self.mcp_config)
-                            or exists(self.mcp_urls)
-                        ):
+                        if self._uses_mcp():
                             # Only handle MCP tools if response is not None
                             if response is not None:
                                 self.mcp_tool_handling(
@@ -1357,8 +1313,7 @@ class Agent:
                     ) as e:
 
                         if self.autosave is True:
-                            log_agent_data(self.to_dict())
-                            self.save()
+                            self._autosave_state()
 
                         logger.error(
                             f"Attempt {attempt+1}/{self.retry_attempts}: Error generating response in loop {loop_count} for agent '{self.agent_name}': {str(e)} | Traceback: {traceback.format_exc()}"
@@ -1368,8 +1323,7 @@ class Agent:
                 if not success:
 
                     if self.autosave is True:
-                        log_agent_data(self.to_dict())
-                        self.save()
+                        self._autosave_state()
 
                     logger.error(
                         "Failed to generate a valid response after"
@@ -1378,23 +1332,7 @@ class Agent:
                     break  # Exit the loop if all retry attempts fail
 
                 # Check stopping conditions
-                if (
-                    self.stopping_condition is not None
-                    and self._check_stopping_condition(response)
-                ):
-                    logger.info(
-                        f"Agent '{self.agent_name}' stopping condition met. "
-                        f"Loop: {loop_count}, Response length: {len(str(response)) if response else 0}"
-                    )
-                    break
-                elif (
-                    self.stopping_func is not None
-                    and self.stopping_func(response)
-                ):
-                    logger.info(
-                        f"Agent '{self.agent_name}' stopping function condition met. "
-                        f"Loop: {loop_count}, Response length: {len(str(response)) if response else 0}"
-                    )
+                if self._stopping_condition_met(response, loop_count):
                     break
 
                 if self.interactive:
@@ -1424,9 +1362,7 @@ class Agent:
                     time.sleep(self.loop_interval)
 
             if self.autosave is True:
-                log_agent_data(self.to_dict())
-
-                self.save()
+                self._autosave_state()
 
             # Output formatting based on output_type
             return history_output_formatter(
@@ -1439,6 +1375,300 @@ class Agent:
         except KeyboardInterrupt as error:
             self._handle_run_error(error)
 
+    async def _arun(
+        self,
+        task: Optional[Union[str, Any]] = None,
+        img: Optional[str] = None,
+        streaming_callback: Optional[Callable[[str], None]] = None,
+        *args,
+        **kwargs,
+    ) -> Any:
+        """
+        Execute the agent's main loop for a given task on the event loop.
+
+        Mirrors _run, but LLM calls, MCP tool calls, retries and loop sleeps are
+        awaited instead of blocking a thread. Synchronous work that may block
+        (RAG queries, planning, callable tools, autosave) is offloaded with
+        asyncio.to_thread.
+
+        Args:
+            task (Optional[Union[str, Any]]): The task or prompt for the agent to process.
+            img (Optional[str]): Optional image path or data to be processed by the agent.
+            streaming_callback (Optional[Callable[[str], None]]): Optional callback for streaming output.
+            *args: Additional positional arguments for extensibility.
+            **kwargs: Additional keyword arguments for extensibility.
+
+        Returns:
+            Any: The agent's output formatted according to output_type.
+        """
+        try:
+            self.check_if_no_prompt_then_autogenerate(task)
+
+            self.check_model_supports_utilities(img=img)
+
+            self.short_memory.add(role=self.user_name, content=task)
+
+            # Handle RAG query only once
+            if (
+                self.long_term_memory is not None
+                and self.rag_every_loop is False
+            ):
+                await asyncio.to_thread(self.handle_rag_query, task)
+
+            if self.plan_enabled is True:
+                await asyncio.to_thread(self.plan, task)
+
+            loop_count = 0
+            response = None
+
+            if self.autosave:
+                await asyncio.to_thread(self._autosave_state)
+
+            while (
+                self.max_loops == "auto"
+                or loop_count < self.max_loops
+            ):
+                loop_count += 1
+
+                # Handle RAG query every loop
+                if (
+                    self.long_term_memory is not None
+                    and self.rag_every_loop is True
+                ):
+                    await asyncio.to_thread(
+                        self.handle_rag_query, task
+                    )
+
+                task_prompt = self._prepare_loop_prompt(loop_count)
+
+                attempt = 0
+                success = False
+                while attempt < self.retry_attempts and not success:
+                    try:
+                        response = await self.acall_llm(
+                            task=task_prompt,
+                            img=img,
+                            current_loop=loop_count,
+                            streaming_callback=streaming_callback,
+                            *args,
+                            **kwargs,
+                        )
+
+                        response = self._record_llm_response(
+                            response, loop_count
+                        )
+
+                        # Check and execute callable tools
+                        if exists(self.tools):
+                            await self.atool_execution_retry(
+                                response, loop_count
+                            )
+
+                        # Handle MCP tools
+                        if self._uses_mcp():
+                            if response is not None:
+                                await self.amcp_tool_handling(
+                                    response=response,
+                                    current_loop=loop_count,
+                                )
+                            else:
+                                logger.warning(
+                                    f"LLM returned None response in loop {loop_count}, skipping MCP tool handling"
+                                )
+
+                        success = True
+
+                    except (
+                        BadRequestError,
+                        InternalServerError,
+                        AuthenticationError,
+                        Exception,
+                    ) as e:
+
+                        if self.autosave is True:
+                            await asyncio.to_thread(
+                                self._autosave_state
+                            )
+
+                        logger.error(
+                            f"Attempt {attempt+1}/{self.retry_attempts}: Error generating response in loop {loop_count} for agent '{self.agent_name}': {str(e)} | Traceback: {traceback.format_exc()}"
+                        )
+                        attempt += 1
+
+                if not success:
+
+                    if self.autosave is True:
+                        await asyncio.to_thread(self._autosave_state)
+
+                    logger.error(
+                        "Failed to generate a valid response after"
+                        " retry attempts."
+                    )
+                    break
+
+                if self._stopping_condition_met(response, loop_count):
+                    break
+
+                if self.interactive:
+                    user_input = await asyncio.to_thread(
+                        input, "You: "
+                    )
+
+                    # User-defined exit command
+                    if (
+                        user_input.lower()
+                        == self.custom_exit_command.lower()
+                    ):
+                        self.pretty_print(
+                            "Exiting as per user request.",
+                            loop_count=loop_count,
+                        )
+                        break
+
+                    self.short_memory.add(
+                        role=self.user_name, content=user_input
+                    )
+
+                if self.loop_interval:
+                    logger.info(
+                        f"Sleeping for {self.loop_interval} seconds"
+                    )
+                    await asyncio.sleep(self.loop_interval)
+
+            if self.autosave is True:
+                await asyncio.to_thread(self._autosave_state)
+
+            # Output formatting based on output_type
+            return history_output_formatter(
+                self.short_memory, type=self.output_type
+            )
+
+        except Exception as error:
+            self._handle_run_error(error)
+
+    @traced("agent.prompt", _span_attrs)
+    def _prepare_loop_prompt(self, loop_count: int) -> str:
+        """
+        Add the per-loop reasoning messages and build the prompt for the next LLM call.
+
+        Args:
+            loop_count (int): The current loop number.
+
+        Returns:
+            str: The task prompt built from the short memory.
+        """
+        if isinstance(self.max_loops, int) and self.max_loops >= 2:
+            if self.reasoning_prompt_on is True:
+                self.short_memory.add(
+                    role=self.agent_name,
+                    content=f"Current Internal Reasoning Loop: {loop_count}/{self.max_loops}",
+                )
+
+        # If it is the final loop, then add the final loop message
+        if (
+            loop_count >= 2
+            and isinstance(self.max_loops, int)
+            and loop_count == self.max_loops
+        ):
+            if self.reasoning_prompt_on is True:
+                self.short_memory.add(
+                    role=self.agent_name,
+                    content=f"🎉 Final Internal Reasoning Loop: {loop_count}/{self.max_loops} Prepare your comprehensive response.",
+                )
+
+        # Dynamic temperature
+        if self.dynamic_temperature_enabled is True:
+            self.dynamic_temperature()
+
+        # Task prompt with optional transforms
+        if self.transforms is not None:
+            return handle_transforms(
+                transforms=self.transforms,
+                short_memory=self.short_memory,
+                model_name=self.model_name,
+            )
+
+        # Use original method if no transforms
+        return self.short_memory.return_history_as_string()
+
+    @traced("agent.memory", _span_attrs)
+    def _record_llm_response(self, response: Any, loop_count: int):
+        """
+        Parse an LLM response, add it to the short memory and print it.
+
+        Args:
+            response (Any): The raw response returned by the LLM.
+            loop_count (int): The current loop number.
+
+        Returns:
+            Any: The parsed response.
+        """
+        # Parse the response from the agent with the output type
+        if exists(self.tools_list_dictionary):
+            if isinstance(response, BaseModel):
+                response = response.model_dump()
+
+        # Parse the response from the agent with the output type
+        response = self.parse_llm_output(response)
+
+        self.short_memory.add(
+            role=self.agent_name,
+            content=response,
+        )
+
+        # Print
+        if self.print_on is True:
+            if isinstance(response, list):
+                self.pretty_print(
+                    f"[Structured Output] [Time: {time.strftime('%H:%M:%S')}] \n\n {json.dumps(response, indent=4)}",
+                    loop_count,
+                )
+            elif self.streaming_on:
+                # Streamed output has already been displayed
+                pass
+            else:
+                self.pretty_print(response, loop_count)
+
+        return response
+
+    def _stopping_condition_met(
+        self, response: Any, loop_count: int
+    ) -> bool:
+        """Check the configured stopping condition and stopping function."""
+        if (
+            self.stopping_condition is not None
+            and self._check_stopping_condition(response)
+        ):
+            logger.info(
+                f"Agent '{self.agent_name}' stopping condition met. "
+                f"Loop: {loop_count}, Response length: {len(str(response)) if response else 0}"
+            )
+            return True
+        elif (
+            self.stopping_func is not None
+            and self.stopping_func(response)
+        ):
+            logger.info(
+                f"Agent '{self.agent_name}' stopping function condition met. "
+                f"Loop: {loop_count}, Response length: {len(str(response)) if response else 0}"
+            )
+            return True
+        return False
+
+    def _uses_mcp(self) -> bool:
+        """Return True if any MCP server is configured."""
+        return (
+            exists(self.mcp_url)
+            or exists(self.mcp_config)
+            or exists(self.mcp_urls)
+        )
+
+    @traced("agent.autosave", _span_attrs)
+    def _autosave_state(self):
+        """Log agent telemetry and save the agent state."""
+        log_agent_data(self.to_dict())
+        self.save()
+
     def _handle_run_error(self, error: any):
         if self.autosave is True:
             self.save()
@@ -1463,23 +1693,30 @@ class Agent:
 
     async def arun(
         self,
-        task: Optional[str] = None,
+        task: Optional[Union[str, Any]] = None,
         img: Optional[str] = None,
+        imgs: Optional[List[str]] = None,
+        correct_answer: Optional[str] = None,
+        streaming_callback: Optional[Callable[[str], None]] = None,
+        n: int = 1,
         *args,
         **kwargs,
     ) -> Any:
         """
         Asynchronously runs the agent with the specified parameters.
 
+        The main loop runs natively on the event loop (see _arun), so many agents
+        can be driven concurrently without a thread per request. Multi-image,
+        continuous-answer and handoff modes still run the synchronous path in a
+        worker thread.
+
         Args:
-            task (Optional[str]): The task to be performed. Defaults to None.
+            task (Optional[Union[str, Any]]): The task to be performed. Defaults to None.
             img (Optional[str]): The image to be processed. Defaults to None.
-            is_last (bool): Indicates if this is the last task. Defaults to False.
-            device (str): The device to use for execution. Defaults to "cpu".
-            device_id (int): The ID of the GPU to use if device is set to "gpu". Defaults to 1.
-            all_cores (bool): If True, uses all available CPU cores. Defaults to True.
-            do_not_use_cluster_ops (bool): If True, does not use cluster operations. Defaults to True.
-            all_gpus (bool): If True, uses all available GPUs. Defaults to False.
+            imgs (Optional[List[str]]): The list of images to be processed. Defaults to None.
+            correct_answer (Optional[str]): The correct answer for continuous run mode. Defaults to None.
+            streaming_callback (Optional[Callable[[str], None]]): Callback function to receive streaming tokens in real-time. Defaults to None.
+            n (int): Number of times to run the task. Defaults to 1.
             *args: Additional positional arguments.
             **kwargs: Additional keyword arguments.
 
@@ -1487,20 +1724,57 @@ class Agent:
             Any: The result of the asynchronous operation.
 
         Raises:
-            Exception: If an error occurs during the asynchronous operation.
+            Exception: If an error occurs and no fallback model succeeds.
         """
+        if not isinstance(task, str):
+            task = format_data_structure(task)
+
         try:
-            return await asyncio.to_thread(
-                self.run,
+            if (
+                exists(imgs)
+                or exists(correct_answer)
+                or exists(self.handoffs)
+            ):
+                return await asyncio.to_thread(
+                    self.run,
+                    task=task,
+                    img=img,
+                    imgs=imgs,
+                    correct_answer=correct_answer,
+                    streaming_callback=streaming_callback,
+                    *args,
+                    **kwargs,
+                )
+            elif n > 1:
+                return [await self.arun(task=task) for _ in range(n)]
+
+            return await self._arun(
                 task=task,
                 img=img,
+                streaming_callback=streaming_callback,
                 *args,
                 **kwargs,
             )
+
         except Exception as error:
-            await self._handle_run_error(
-                error
-            )  # Ensure this is also async if needed
+            # Try fallback models if available
+            while self.is_fallback_available() and (
+                self.switch_to_next_model()
+            ):
+                try:
+                    return await self._arun(
+                        task=task,
+                        img=img,
+                        streaming_callback=streaming_callback,
+                        *args,
+                        **kwargs,
+                    )
+                except Exception as fallback_error:
+                    logger.error(
+                        f"Agent Name: {self.agent_name} Fallback model '{self.get_current_model()}' also failed: {fallback_error}"
+                    )
+
+            self._handle_run_error(error)
 
     def __call__(
         self,
@@ -1550,6 +1824,7 @@ class Agent:
             role=self.agent_name, content=message
         )
 
+    @traced("agent.plan", _span_attrs)
     def plan(self, task: str, *args, **kwargs) -> None:
         """
         Create a strategic plan for executing the given task.
@@ -1710,11 +1985,56 @@ class Agent:
                 f"The model '{self.model_name}' may not be supported. Please use a supported model, or override the model name with the 'llm' parameter, which should be a class with a 'run(task: str)' method or a '__call__' method."
             )
 
+    def _state_checkpoint(self, full_path: str) -> StateCheckpoint:
+        """Return the incremental checkpoint writing to ``full_path``."""
+        if (
+            self._checkpoint is None
+            or self._checkpoint.filepath != full_path
+        ):
+            self._checkpoint = StateCheckpoint(
+                full_path,
+                compact_interval=self.checkpoint_compact_interval,
+            )
+        return self._checkpoint
+
+    def _state_file_path(self, file_path: str = None) -> str:
+        """
+        Resolve the state file path used by save, with the extension of
+        ``state_format``, inside the workspace directory.
+
+        Args:
+            file_path (str, optional): Custom path. If None, uses
+                ``saved_state_path`` or ``{agent_name}_state``.
+
+        Returns:
+            str: The full state file path.
+        """
+        # Determine the save path
+        resolved_path = (
+            file_path
+            or self.saved_state_path
+            or f"{self.agent_name}_state.json"
+        )
+
+        # Ensure path has the extension of the state format
+        extension = ".jsonl" if self.state_format == "jsonl" else ".json"
+        if resolved_path.endswith(".json") and extension == ".jsonl":
+            resolved_path = resolved_path[: -len(".json")]
+        if not resolved_path.endswith(extension):
+            resolved_path += extension
+
+        # Create full path including workspace directory
+        return os.path.join(self.workspace_dir, resolved_path)
+
     def save(self, file_path: str = None) -> None:
         """
         Save the agent state to a file using SafeStateManager with atomic writing
         and backup functionality. Automatically handles complex objects and class instances.
 
+        With ``state_format="jsonl"`` the state is written to an incremental
+        ``.jsonl`` checkpoint instead: only fields changed since the last save
+        and new conversation messages are appended.
+
         Args:
             file_path (str, optional): Custom path to save the state.
                                     If None, uses configured paths.
@@ -1724,21 +2044,18 @@ class Agent:
             Exception: For other unexpected errors
         """
         try:
-            # Determine the save path
-            resolved_path = (
-                file_path
-                or self.saved_state_path
-                or f"{self.agent_name}_state.json"
-            )
+            full_path = self._state_file_path(file_path)
 
-            # Ensure path has .json extension
-            if not resolved_path.endswith(".json"):
-                resolved_path += ".json"
+            if self.state_format == "jsonl":
+                # Checkpoint records are appended or atomically
+                # compacted, so no temp file or backup is needed
+                self._state_checkpoint(full_path).save(self)
+                logger.info(
+                    f"Successfully checkpointed agent state to: {full_path}"
+                )
+                self._save_additional_components(full_path)
+                return
 
-            # Create full path including workspace directory
-            full_path = os.path.join(
-                self.workspace_dir, resolved_path
-            )
             backup_path = full_path + ".backup"
             temp_path = full_path + ".temp"
 
@@ -1884,6 +2201,9 @@ class Agent:
         Load agent state from a file using SafeStateManager.
         Automatically preserves class instances and complex objects.
 
+        With ``state_format="jsonl"`` and no path given, the checkpoint
+        written by ``save()`` is replayed.
+
         Args:
             file_path (str, optional): Path to load state from.
                                     If None, uses default path from agent config.
@@ -1897,6 +2217,12 @@ class Agent:
             resolved_path = (
                 file_path
                 or self.load_state_path
+                or (
+                    # The checkpoint path save() writes to
+                    self._state_file_path()
+                    if self.state_format == "jsonl"
+                    else None
+                )
                 or (
                     f"{self.saved_state_path}.json"
                     if self.saved_state_path
@@ -1912,8 +2238,12 @@ class Agent:
                 )
             )
 
-            # Load state using SafeStateManager
-            SafeStateManager.load_state(self, resolved_path)
+            if resolved_path.endswith(".jsonl"):
+                # Replay an incremental checkpoint; later saves append to it
+                self._state_checkpoint(resolved_path).load(self)
+            else:
+                # Load state using SafeStateManager
+                SafeStateManager.load_state(self, resolved_path)
 
             # Reinitialize any necessary runtime components
             self._reinitialize_after_load()
@@ -2329,9 +2659,7 @@ class Agent:
     def check_available_tokens(self):
         # Log the amount of tokens left in the memory and in the task
         if self.tokenizer is not None:
-            tokens_used = count_tokens(
-                self.short_memory.return_history_as_string()
-            )
+            tokens_used = self.short_memory.get_total_tokens()
             logger.info(
                 f"Tokens available: {self.context_length - tokens_used}"
             )
@@ -2340,9 +2668,7 @@ class Agent:
 
     def tokens_checks(self):
         # Check the tokens available
-        tokens_used = count_tokens(
-            self.short_memory.return_history_as_string()
-        )
+        tokens_used = self.short_memory.get_total_tokens()
         out = self.check_available_tokens()
 
         logger.info(
@@ -2503,6 +2829,7 @@ class Agent:
 
         return None
 
+    @traced("agent.call_llm", _span_attrs)
     def call_llm(
         self,
         task: str,
@@ -2642,6 +2969,90 @@ class Agent:
             )
             raise e
 
+    async def acall_llm(
+        self,
+        task: str,
+        img: Optional[str] = None,
+        current_loop: int = 0,
+        streaming_callback: Optional[Callable[[str], None]] = None,
+        *args,
+        **kwargs,
+    ) -> str:
+        """
+        Asynchronously call the `llm` object for the given task.
+
+        Uses the LLM's native arun/astream when available and otherwise falls
+        back to running call_llm in a worker thread.
+
+        Args:
+            task (str): The task to be performed by the `llm` object.
+            img (str, optional): Path or URL to an image file.
+            current_loop (int): The current loop number, used for display.
+            streaming_callback (Optional[Callable[[str], None]]): Callback function to receive streaming tokens in real-time.
+            *args: Variable length argument list.
+            **kwargs: Arbitrary keyword arguments.
+
+        Returns:
+            str: The result of the method call on the `llm` object.
+        """
+        # Filter out is_last from kwargs if present
+        if "is_last" in kwargs:
+            del kwargs["is_last"]
+
+        if not hasattr(self.llm, "arun"):
+            return await asyncio.to_thread(
+                self.call_llm,
+                task,
+                img,
+                current_loop,
+                streaming_callback,
+                *args,
+                **kwargs,
+            )
+
+        try:
+            if self.streaming_on and hasattr(self.llm, "astream"):
+                chunks = []
+                async for content in self.llm.astream(
+                    task, img, *args, **kwargs
+                ):
+                    chunks.append(content)
+                    if streaming_callback is not None:
+                        streaming_callback(content)
+                complete_response = "".join(chunks)
+
+                if (
+                    self.print_on is True
+                    and streaming_callback is None
+                ):
+                    self.pretty_print(
+                        complete_response, current_loop
+                    )
+
+                return complete_response
+
+            llm_args = {
+                "task": task,
+            }
+
+            if img is not None:
+                llm_args["img"] = img
+
+            return await self.llm.arun(**llm_args, **kwargs)
+
+        except (
+            AgentLLMError,
+            BadRequestError,
+            InternalServerError,
+            AuthenticationError,
+            Exception,
+        ) as e:
+            logger.error(
+                f"Error calling LLM with model '{self.get_current_model()}': {e}. "
+                f"Task: {task}, Args: {args}, Kwargs: {kwargs} Traceback: {traceback.format_exc()}"
+            )
+            raise e
+
     def handle_sop_ops(self):
         # If the user inputs a list of strings for the sop then join them and set the sop
         if exists(self.sop_list):
@@ -3015,6 +3426,7 @@ class Agent:
         """
         return self.role
 
+    @traced("agent.print", _span_attrs)
     def pretty_print(self, response: str, loop_count: int):
         """Print the response in a formatted panel"""
         # Handle None response
@@ -3101,6 +3513,7 @@ class Agent:
                 content=response,
             )
 
+    @traced("agent.mcp_tools", _span_attrs)
     def mcp_tool_handling(
         self, response: any, current_loop: Optional[int] = 0
     ):
@@ -3128,30 +3541,12 @@ class Agent:
                     urls=self.mcp_urls,
                     output_type="json",
                 )
-                # tool_response = format_data_structure(tool_response)
-
-                # print(f"Multiple MCP Tool Response: {tool_response}")
             else:
                 raise AgentMCPConnectionError(
                     "mcp_url must be either a string URL or MCPConnection object"
                 )
 
-            # Get the text content from the tool response
-            # execute_tool_call_simple returns a string directly, not an object with content attribute
-            text_content = f"MCP Tool Response: \n\n {json.dumps(tool_response, indent=2)}"
-
-            if self.print_on is True:
-                formatter.print_panel(
-                    content=text_content,
-                    title="MCP Tool Response: 🛠️",
-                    style="green",
-                )
-
-            # Add to the memory
-            self.short_memory.add(
-                role="Tool Executor",
-                content=text_content,
-            )
+            self._record_mcp_tool_response(tool_response)
 
             # Create a temporary LLM instance without tools for the follow-up call
             try:
@@ -3167,17 +3562,84 @@ class Agent:
                 # Fallback: provide a default summary
                 summary = "I successfully executed the MCP tool and retrieved the information above."
 
-            if self.print_on is True:
-                self.pretty_print(summary, loop_count=current_loop)
+            self._record_mcp_summary(summary, current_loop)
+        except AgentMCPToolError as e:
+            logger.error(f"Error in MCP tool: {e}")
+            raise e
 
-            # Add to the memory
-            self.short_memory.add(
-                role=self.agent_name, content=summary
-            )
+    async def amcp_tool_handling(
+        self, response: any, current_loop: Optional[int] = 0
+    ):
+        """Async counterpart of mcp_tool_handling that awaits the MCP calls directly."""
+        try:
+            if exists(self.mcp_url):
+                tool_response = await execute_tool_call_simple(
+                    response=response,
+                    server_path=self.mcp_url,
+                )
+            elif exists(self.mcp_config):
+                tool_response = await execute_tool_call_simple(
+                    response=response,
+                    connection=self.mcp_config,
+                )
+            elif exists(self.mcp_urls):
+                tool_response = await execute_multiple_tools_on_multiple_mcp_servers(
+                    responses=response,
+                    urls=self.mcp_urls,
+                    output_type="json",
+                )
+            else:
+                raise AgentMCPConnectionError(
+                    "mcp_url must be either a string URL or MCPConnection object"
+                )
+
+            self._record_mcp_tool_response(tool_response)
+
+            try:
+                temp_llm = self.temp_llm_instance_for_tool_summary()
+
+                summary = await temp_llm.arun(
+                    task=self.short_memory.get_str()
+                )
+            except Exception as e:
+                logger.error(
+                    f"Error calling LLM after MCP tool execution: {e}"
+                )
+                # Fallback: provide a default summary
+                summary = "I successfully executed the MCP tool and retrieved the information above."
+
+            self._record_mcp_summary(summary, current_loop)
         except AgentMCPToolError as e:
             logger.error(f"Error in MCP tool: {e}")
             raise e
 
+    def _record_mcp_tool_response(self, tool_response: Any):
+        """Add an MCP tool response to the short memory and print it."""
+        # Get the text content from the tool response
+        # execute_tool_call_simple returns a string directly, not an object with content attribute
+        text_content = f"MCP Tool Response: \n\n {json.dumps(tool_response, indent=2)}"
+
+        if self.print_on is True:
+            formatter.print_panel(
+                content=text_content,
+                title="MCP Tool Response: 🛠️",
+                style="green",
+            )
+
+        # Add to the memory
+        self.short_memory.add(
+            role="Tool Executor",
+            content=text_content,
+        )
+
+    def _record_mcp_summary(self, summary: str, current_loop: int):
+        """Add the post-MCP summary to the short memory and print it."""
+        if self.print_on is True:
+            self.pretty_print(summary, loop_count=current_loop)
+
+        # Add to the memory
+        self.short_memory.add(role=self.agent_name, content=summary)
+
     def temp_llm_instance_for_tool_summary(self):
         return LiteLLM(
             model_name=self.model_name,
@@ -3283,6 +3745,7 @@ class Agent:
         available_models = self.get_available_models()
         return len(available_models) > 1
 
+    @traced("agent.execute_tools", _span_attrs)
     def execute_tools(self, response: any, loop_count: int):
         # Handle None response gracefully
         if response is None:
@@ -3306,6 +3769,59 @@ class Agent:
                 logger.error(f"Error executing tools: {e}")
                 raise e
 
+        self._record_tool_output(output, loop_count)
+
+        # Now run the LLM again without tools - create a temporary LLM instance
+        # instead of modifying the cached one
+        # Create a temporary LLM instance without tools for the follow-up call
+        if self.tool_call_summary is True:
+            temp_llm = self.temp_llm_instance_for_tool_summary()
+
+            tool_response = temp_llm.run(
+                self._tool_summary_prompt(output)
+            )
+
+            self._record_tool_summary(tool_response, loop_count)
+
+    async def aexecute_tools(self, response: any, loop_count: int):
+        """Async counterpart of execute_tools; callable tools run in a worker thread."""
+        # Handle None response gracefully
+        if response is None:
+            logger.warning(
+                f"Cannot execute tools with None response in loop {loop_count}. "
+                "This may indicate the LLM did not return a valid response."
+            )
+            return
+
+        try:
+            output = await asyncio.to_thread(
+                self.tool_struct.execute_function_calls_from_api_response,
+                response,
+            )
+        except Exception as e:
+            # Retry the tool call
+            output = await asyncio.to_thread(
+                self.tool_struct.execute_function_calls_from_api_response,
+                response,
+            )
+
+            if output is None:
+                logger.error(f"Error executing tools: {e}")
+                raise e
+
+        self._record_tool_output(output, loop_count)
+
+        if self.tool_call_summary is True:
+            temp_llm = self.temp_llm_instance_for_tool_summary()
+
+            tool_response = await temp_llm.arun(
+                self._tool_summary_prompt(output)
+            )
+
+            self._record_tool_summary(tool_response, loop_count)
+
+    def _record_tool_output(self, output: Any, loop_count: int):
+        """Add a tool execution output to the short memory and print it."""
         self.short_memory.add(
             role="Tool Executor",
             content=format_data_structure(output),
@@ -3324,14 +3840,8 @@ class Agent:
                     loop_count,
                 )
 
-        # Now run the LLM again without tools - create a temporary LLM instance
-        # instead of modifying the cached one
-        # Create a temporary LLM instance without tools for the follow-up call
-        if self.tool_call_summary is True:
-            temp_llm = self.temp_llm_instance_for_tool_summary()
-
-            tool_response = temp_llm.run(
-                f"""
+    def _tool_summary_prompt(self, output: Any) -> str:
+        return f"""
                 Please analyze and summarize the following tool execution output in a clear and concise way. 
                 Focus on the key information and insights that would be most relevant to the user's original request.
                 If there are any errors or issues, highlight them prominently.
@@ -3339,18 +3849,21 @@ class Agent:
                 Tool Output:
                 {output}
                 """
-            )
 
-            self.short_memory.add(
-                role=self.agent_name,
-                content=tool_response,
-            )
+    def _record_tool_summary(
+        self, tool_response: str, loop_count: int
+    ):
+        """Add the tool summary to the short memory and print it."""
+        self.short_memory.add(
+            role=self.agent_name,
+            content=tool_response,
+        )
 
-            if self.print_on is True:
-                self.pretty_print(
-                    tool_response,
-                    loop_count,
-                )
+        if self.print_on is True:
+            self.pretty_print(
+                tool_response,
+                loop_count,
+            )
 
     def list_output_types(self):
         return OutputType
@@ -3486,6 +3999,7 @@ class Agent:
             f"Failed to find correct answer '{correct_answer}' after {max_attempts} attempts"
         )
 
+    @traced("agent.tools", _span_attrs)
     def tool_execution_retry(self, response: any, loop_count: int):
         """
         Execute tools with retry logic for handling failures.
@@ -3529,3 +4043,25 @@ class Agent:
                 f"Full traceback: {traceback.format_exc()}. "
                 f"Attempting to retry tool execution with 3 attempts"
             )
+
+    async def atool_execution_retry(
+        self, response: any, loop_count: int
+    ):
+        """Async counterpart of tool_execution_retry."""
+        try:
+            if response is not None:
+                await self.aexecute_tools(
+                    response=response,
+                    loop_count=loop_count,
+                )
+            else:
+                logger.warning(
+                    f"Agent '{self.agent_name}' received None response from LLM in loop {loop_count}. "
+                    f"This may indicate an issue with the model or prompt. Skipping tool execution."
+                )
+        except AgentToolExecutionError as e:
+            logger.error(
+                f"Agent '{self.agent_name}' encountered error during tool execution in loop {loop_count}: {str(e)}. "
+                f"Full traceback: {traceback.format_exc()}. "
+                f"Attempting to retry tool execution with 3 attempts"
+            )
@@ -3,6 +3,11 @@ from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable, Dict, List, Optional, Union
 
 from synarkos.structs.agent import Agent
+from synarkos.structs.context_handoff import (
+    CONTEXT_MODES,
+    ContextHandoff,
+    HandoffConfig,
+)
 from synarkos.structs.conversation import Conversation
 from synarkos.structs.multi_agent_exec import run_agents_concurrently
 from synarkos.structs.agent_group_id import agent_group_id
@@ -58,6 +63,9 @@ class AgentRearrange:
         team_awareness (bool): Whether agents are aware of team structure
         time_enabled (bool): Whether to track timestamps
         message_id_on (bool): Whether to include message IDs
+        context_mode (str): "full" passes the joined history to each agent,
+            "delta" a bounded handoff of task, summary and predecessor outputs
+        handoff (Optional[ContextHandoff]): Handoff state in "delta" mode
         conversation (Conversation): Conversation history management
 
     Example:
@@ -103,6 +111,8 @@ class AgentRearrange:
         team_awareness: bool = False,
         time_enabled: bool = False,
         message_id_on: bool = False,
+        context_mode: str = "full",
+        handoff_config: Optional[HandoffConfig] = None,
     ):
         """
         Initialize the AgentRearrange system.
@@ -143,10 +153,18 @@ class AgentRearrange:
                 Defaults to False.
             message_id_on (bool): Whether to include message IDs in conversations.
                 Defaults to False.
+            context_mode (str): What each agent receives as its task. "full"
+                passes the whole conversation; "delta" passes the original
+                task, a rolling summary of earlier steps and the outputs of
+                the previous step, which keeps prompts bounded on long chains.
+                Defaults to "full".
+            handoff_config (HandoffConfig, optional): Size limits of the
+                "delta" handoff. Defaults to None.
 
         Raises:
             ValueError: If agents list is None or empty, max_loops is 0,
-                flow is None or empty, or output_type is None or empty.
+                flow is None or empty, output_type is None or empty, or
+                context_mode is unknown.
 
         Note:
             The agents parameter is converted to a dictionary mapping agent names
@@ -166,6 +184,7 @@ class AgentRearrange:
         self.autosave = autosave
         self.time_enabled = time_enabled
         self.message_id_on = message_id_on
+        self.context_mode = context_mode
 
         self.conversation = Conversation(
             name=f"{self.name}-Conversation",
@@ -177,6 +196,7 @@ class AgentRearrange:
         if rules:
             self.conversation.add("user", rules)
 
+        sequential_info = None
         if team_awareness is True:
             # agents_info = get_agents_info(agents=self.agents, team_name=self.name)
 
@@ -190,6 +210,17 @@ class AgentRearrange:
 
         self.reliability_check()
 
+        # In delta mode the rules and flow info are repeated in every
+        # handoff instead of being read back from the conversation
+        self.handoff = (
+            ContextHandoff(
+                config=handoff_config,
+                instructions=[rules, sequential_info],
+            )
+            if self.context_mode == "delta"
+            else None
+        )
+
     def reliability_check(self):
         """
         Validates the configuration parameters to ensure the system can run properly.
@@ -203,6 +234,7 @@ class AgentRearrange:
                 - max_loops is 0
                 - flow is None or empty string
                 - output_type is None or empty string
+                - context_mode is not "full" or "delta"
 
         Note:
             This method is called automatically during initialization to ensure
@@ -220,6 +252,11 @@ class AgentRearrange:
         if self.output_type is None or self.output_type == "":
             raise ValueError("output_type cannot be None or empty")
 
+        if self.context_mode not in CONTEXT_MODES:
+            raise ValueError(
+                f"context_mode must be one of {CONTEXT_MODES}, got {self.context_mode!r}"
+            )
+
     def set_custom_flow(self, flow: str):
         """
         Sets a custom flow pattern for agent execution.
@@ -503,20 +540,31 @@ class AgentRearrange:
             self.agents[agent_name] for agent_name in agent_names
         ]
 
-        # Run agents concurrently
+        # One prompt for the whole step, shared by every agent
+        prompt = (
+            self.handoff.build()
+            if self.handoff is not None
+            else self.conversation.get_str()
+        )
+
+        # Run agents concurrently; results are keyed by agent name
+        # because they complete in any order
         results = run_agents_concurrently(
             agents=agents_to_run,
-            task=self.conversation.get_str(),
+            task=prompt,
+            return_agent_output_dict=True,
         )
 
         # Process results and update conversation
         response_dict = {}
-        for i, agent_name in enumerate(agent_names):
-            result = results[i]
+        for agent_name in agent_names:
+            result = results[agent_name]
 
             # print(f"Result: {result}")
 
             self.conversation.add(agent_name, result)
+            if self.handoff is not None:
+                self.handoff.record(agent_name, result)
             response_dict[agent_name] = result
             logger.debug(f"Agent {agent_name} output: {result}")
 
@@ -568,8 +616,13 @@ class AgentRearrange:
                 f"Added sequential awareness for {agent_name}: {awareness_info}"
             )
 
+        if self.handoff is not None:
+            prompt = self.handoff.build(notes=awareness_info)
+        else:
+            prompt = self.conversation.get_str()
+
         current_task = agent.run(
-            task=self.conversation.get_str(),
+            task=prompt,
             img=img,
             *args,
             **kwargs,
@@ -577,6 +630,8 @@ class AgentRearrange:
         current_task = any_to_str(current_task)
 
         self.conversation.add(agent.agent_name, current_task)
+        if self.handoff is not None:
+            self.handoff.record(agent.agent_name, current_task)
 
         return current_task
 
@@ -625,6 +680,8 @@ class AgentRearrange:
         """
         try:
             self.conversation.add("User", task)
+            if self.handoff is not None:
+                self.handoff.start(task)
 
             if not self.validate_flow():
                 logger.error("Flow validation failed")
@@ -685,6 +742,9 @@ class AgentRearrange:
                         )
                         response_dict[agent_name] = result
 
+                    if self.handoff is not None:
+                        self.handoff.end_step()
+
                 loop_count += 1
 
             logger.info("Task execution completed")
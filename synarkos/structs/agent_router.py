@@ -1,10 +1,14 @@
-import math
-from typing import Any, Callable, List, Optional, Union
+from typing import Any, Callable, List, Optional, Tuple, Union
 
-from litellm import embedding
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from synarkos.structs.omni_agent_types import AgentType
+from synarkos.utils.embedding_cache import get_embedding_cache
+from synarkos.utils.embedding_index import (
+    EmbeddingIndex,
+    cosine_similarity,
+    embed_texts,
+)
 from synarkos.utils.loguru_logger import initialize_logger
 
 logger = initialize_logger(log_folder="agent_router")
@@ -14,6 +18,10 @@ class AgentRouter:
     """
     Initialize the AgentRouter using LiteLLM embeddings for agent matching.
 
+    Agent embeddings are kept in an ``EmbeddingIndex`` (a normalized NumPy
+    matrix), so routing a task costs one embedding call plus a single
+    matrix-vector product regardless of how many agents are registered.
+
     Args:
         embedding_model (str): The embedding model to use for generating embeddings.
             Examples: 'text-embedding-ada-002', 'text-embedding-3-small', 'text-embedding-3-large',
@@ -23,6 +31,10 @@ class AgentRouter:
             will use environment variables.
         api_base (str, optional): Custom API base URL for the embedding service.
         agents (List[AgentType], optional): List of agents to initialize the router with.
+        embedding_batch_size (int): Maximum number of texts embedded per API call.
+        cache_embeddings (bool): Reuse embeddings from the persistent on-disk cache.
+            Off by default; the cache is never evicted.
+        embedding_cache_dir (str, optional): Directory of the embedding cache.
     """
 
     def __init__(
@@ -32,19 +44,33 @@ class AgentRouter:
         api_key: Optional[str] = None,
         api_base: Optional[str] = None,
         agents: Optional[List[AgentType]] = None,
+        embedding_batch_size: int = 256,
+        cache_embeddings: bool = False,
+        embedding_cache_dir: Optional[str] = None,
     ):
         self.embedding_model = embedding_model
         self.n_agents = n_agents
         self.api_key = api_key
         self.api_base = api_base
+        self.embedding_batch_size = embedding_batch_size
+        self.embedding_cache = (
+            get_embedding_cache(embedding_cache_dir)
+            if cache_embeddings
+            else None
+        )
         self.agents: List[AgentType] = []
-        self.agent_embeddings: List[List[float]] = []
+        self.embedding_index = EmbeddingIndex()
         self.agent_metadata: List[dict] = []
 
         # Add agents if provided during initialization
         if agents:
             self.add_agents(agents)
 
+    @property
+    def agent_embeddings(self) -> List[List[float]]:
+        """Normalized embeddings of the registered agents, in order."""
+        return self.embedding_index.vectors.tolist()
+
     def _generate_embedding(self, text: str) -> List[float]:
         """
         Generate embedding for the given text using the specified model.
@@ -55,43 +81,29 @@ class AgentRouter:
         Returns:
             List[float]: The embedding vector as a list of floats.
         """
-        try:
-            # Prepare parameters for the embedding call
-            params = {"model": self.embedding_model, "input": [text]}
-
-            if self.api_key:
-                params["api_key"] = self.api_key
-            if self.api_base:
-                params["api_base"] = self.api_base
-
-            response = embedding(**params)
-
-            # Handle different response structures from litellm
-            if hasattr(response, "data") and response.data:
-                if hasattr(response.data[0], "embedding"):
-                    embedding_vector = response.data[0].embedding
-                elif (
-                    isinstance(response.data[0], dict)
-                    and "embedding" in response.data[0]
-                ):
-                    embedding_vector = response.data[0]["embedding"]
-                else:
-                    logger.error(
-                        f"Unexpected response structure: {response.data[0]}"
-                    )
-                    raise ValueError(
-                        f"Unexpected embedding response structure: {type(response.data[0])}"
-                    )
-            else:
-                logger.error(
-                    f"Unexpected response structure: {response}"
-                )
-                raise ValueError(
-                    f"Unexpected embedding response structure: {type(response)}"
-                )
-
-            return embedding_vector
+        return self._generate_embeddings([text])[0]
 
+    def _generate_embeddings(
+        self, texts: List[str]
+    ) -> List[List[float]]:
+        """
+        Generate embeddings for several texts in batched API calls.
+
+        Args:
+            texts (List[str]): The texts to generate embeddings for.
+
+        Returns:
+            List[List[float]]: One embedding vector per text.
+        """
+        try:
+            return embed_texts(
+                texts,
+                model=self.embedding_model,
+                api_key=self.api_key,
+                api_base=self.api_base,
+                batch_size=self.embedding_batch_size,
+                cache=self.embedding_cache,
+            )
         except Exception as e:
             logger.error(f"Error generating embedding: {str(e)}")
             raise
@@ -109,21 +121,13 @@ class AgentRouter:
         Returns:
             float: Cosine similarity between the vectors.
         """
-        if len(vec1) != len(vec2):
-            raise ValueError("Vectors must have the same length")
-
-        # Calculate dot product
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
+        return cosine_similarity(vec1, vec2)
 
-        # Calculate magnitudes
-        magnitude1 = math.sqrt(sum(a * a for a in vec1))
-        magnitude2 = math.sqrt(sum(a * a for a in vec2))
-
-        # Avoid division by zero
-        if magnitude1 == 0 or magnitude2 == 0:
-            return 0.0
-
-        return dot_product / (magnitude1 * magnitude2)
+    @staticmethod
+    def _agent_text(agent: AgentType) -> str:
+        return (
+            f"{agent.name} {agent.description} {agent.system_prompt}"
+        )
 
     @retry(
         stop=stop_after_attempt(3),
@@ -140,14 +144,14 @@ class AgentRouter:
             Exception: If there's an error adding the agent to the router.
         """
         try:
-            agent_text = f"{agent.name} {agent.description} {agent.system_prompt}"
+            agent_text = self._agent_text(agent)
 
             # Generate embedding for the agent
             agent_embedding = self._generate_embedding(agent_text)
 
             # Store agent and its embedding
+            self.embedding_index.add(agent_embedding)
             self.agents.append(agent)
-            self.agent_embeddings.append(agent_embedding)
             self.agent_metadata.append(
                 {"name": agent.name, "text": agent_text}
             )
@@ -161,17 +165,46 @@ class AgentRouter:
             )
             raise
 
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=4, max=10),
+    )
     def add_agents(
         self, agents: List[Union[AgentType, Callable, Any]]
     ) -> None:
         """
         Add multiple agents to the vector database.
 
+        Embeddings for all agents are requested in batches rather than one
+        API call per agent.
+
         Args:
             agents (List[Union[Agent, Callable, Any]]): List of agents to add.
         """
-        for agent in agents:
-            self.add_agent(agent)
+        if not agents:
+            return
+
+        try:
+            agent_texts = [
+                self._agent_text(agent) for agent in agents
+            ]
+            agent_embeddings = self._generate_embeddings(agent_texts)
+
+            self.embedding_index.add_batch(agent_embeddings)
+            self.agents.extend(agents)
+            self.agent_metadata.extend(
+                {"name": agent.name, "text": text}
+                for agent, text in zip(agents, agent_texts)
+            )
+
+            logger.info(
+                f"Added {len(agents)} agents to the embedding-based router."
+            )
+        except Exception as e:
+            logger.error(
+                f"Error adding {len(agents)} agents to the router: {str(e)}"
+            )
+            raise
 
     def update_agent_history(self, agent_name: str) -> None:
         """
@@ -180,53 +213,70 @@ class AgentRouter:
         Args:
             agent_name (str): The name of the agent to update.
         """
-        agent = next(
-            (a for a in self.agents if a.name == agent_name), None
+        agent_index = next(
+            (
+                i
+                for i, a in enumerate(self.agents)
+                if a.name == agent_name
+            ),
+            None,
         )
-        if agent:
-            history = agent.short_memory.return_history_as_string()
-            history_text = " ".join(history)
-            updated_text = f"{agent.name} {agent.description} {agent.system_prompt} {history_text}"
-
-            # Find the agent's index
-            agent_index = next(
-                (
-                    i
-                    for i, a in enumerate(self.agents)
-                    if a.name == agent_name
-                ),
-                None,
-            )
-
-            if agent_index is not None:
-                # Generate new embedding with updated text
-                updated_embedding = self._generate_embedding(
-                    updated_text
-                )
-
-                # Update the stored data
-                self.agent_embeddings[agent_index] = updated_embedding
-                self.agent_metadata[agent_index] = {
-                    "name": agent_name,
-                    "text": updated_text,
-                }
-
-                logger.info(
-                    f"Updated agent {agent_name} with interaction history."
-                )
-            else:
-                logger.warning(
-                    f"Agent {agent_name} not found in the agents list."
-                )
-        else:
+        if agent_index is None:
             logger.warning(
                 f"Agent {agent_name} not found in the router."
             )
+            return
+
+        agent = self.agents[agent_index]
+        history = agent.short_memory.return_history_as_string()
+        history_text = " ".join(history)
+        updated_text = f"{self._agent_text(agent)} {history_text}"
+
+        # Generate new embedding with updated text
+        updated_embedding = self._generate_embedding(updated_text)
+
+        # Update the stored data
+        self.embedding_index.update(agent_index, updated_embedding)
+        self.agent_metadata[agent_index] = {
+            "name": agent_name,
+            "text": updated_text,
+        }
+
+        logger.info(
+            f"Updated agent {agent_name} with interaction history."
+        )
 
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10),
     )
+    def find_top_agents(
+        self, task: str, k: Optional[int] = None
+    ) -> List[Tuple[AgentType, float]]:
+        """
+        Find the ``k`` agents most similar to a task.
+
+        Args:
+            task (str): The task description.
+            k (int, optional): Number of agents to return. Defaults to ``n_agents``.
+
+        Returns:
+            List[Tuple[Agent, float]]: Agents with their cosine similarity,
+            best match first.
+        """
+        if not self.agents or not len(self.embedding_index):
+            logger.warning("No agents available in the router.")
+            return []
+
+        task_embedding = self._generate_embedding(task)
+        matches = self.embedding_index.search(
+            task_embedding, k=k or self.n_agents
+        )
+        return [
+            (self.agents[position], score)
+            for position, score in matches
+        ]
+
     def find_best_agent(
         self, task: str, *args, **kwargs
     ) -> Optional[AgentType]:
@@ -245,38 +295,15 @@ class AgentRouter:
             Exception: If there's an error finding the best agent.
         """
         try:
-            if not self.agents or not self.agent_embeddings:
-                logger.warning("No agents available in the router.")
+            matches = self.find_top_agents(task, k=1)
+            if not matches:
                 return None
 
-            # Generate embedding for the task
-            task_embedding = self._generate_embedding(task)
-
-            # Calculate cosine similarities
-            similarities = []
-            for agent_embedding in self.agent_embeddings:
-                similarity = self._cosine_similarity(
-                    task_embedding, agent_embedding
-                )
-                similarities.append(similarity)
-
-            # Find the best matching agent(s)
-            if similarities:
-                # Get index of the best similarity
-                best_index = similarities.index(max(similarities))
-                best_agent = self.agents[best_index]
-                best_similarity = similarities[best_index]
-
-                logger.info(
-                    f"Found best matching agent: {best_agent.name} (similarity: {best_similarity:.4f})"
-                )
-                return best_agent
-            else:
-                logger.warning(
-                    "No matching agent found for the given task."
-                )
-
-            return None
+            best_agent, best_similarity = matches[0]
+            logger.info(
+                f"Found best matching agent: {best_agent.name} (similarity: {best_similarity:.4f})"
+            )
+            return best_agent
         except Exception as e:
             logger.error(f"Error finding best agent: {str(e)}")
             raise
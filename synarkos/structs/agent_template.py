@@ -0,0 +1,161 @@
+import copy
+import threading
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Any, Iterator, List, Optional
+
+from synarkos.structs.agent import Agent
+
+
+class AgentTemplate:
+    """
+    A frozen, prevalidated ``Agent`` configuration that hands out cheap
+    per-run instances.
+
+    Building an ``Agent`` validates its configuration, creates the LiteLLM
+    client, compiles tool schemas and sets up its memory, which is wasted
+    work when a swarm needs the same director or judge on every loop. A
+    template builds one prototype agent up front. ``spawn`` then returns a
+    shallow copy that shares the prototype's LLM client, tools and system
+    prompt but has its own memory, restored from the prototype's initial
+    messages. ``lease`` reuses idle instances, resetting them on return.
+
+    Instances share the LLM client, so attributes an agent sets on it per
+    call (such as dynamic temperature) are shared as well.
+
+    Attributes:
+        config (MappingProxyType): Read-only keyword arguments of the prototype.
+        prototype (Agent): The agent instances are copied from.
+        max_idle (int): Maximum number of idle instances kept for reuse.
+
+    Example:
+        >>> judge = AgentTemplate(
+        ...     agent_name="Judge",
+        ...     system_prompt="Score the answer from 1 to 10.",
+        ...     model_name="gpt-4o-mini",
+        ...     max_loops=1,
+        ... )
+        >>> with judge.lease() as agent:
+        ...     score = agent.run("Answer: 42")
+    """
+
+    def __init__(self, max_idle: int = 8, **agent_kwargs: Any):
+        """
+        Build the prototype agent.
+
+        Args:
+            max_idle (int): Maximum number of idle instances kept for reuse.
+            **agent_kwargs (Any): Keyword arguments for ``Agent``.
+        """
+        self.config = MappingProxyType(dict(agent_kwargs))
+        self.max_idle = max_idle
+        self._bind(Agent(**agent_kwargs))
+
+    @classmethod
+    def from_agent(
+        cls, agent: Agent, max_idle: int = 8
+    ) -> "AgentTemplate":
+        """
+        Use an already configured agent as the prototype.
+
+        Args:
+            agent (Agent): The prototype; its current memory becomes the
+                initial memory of every instance.
+            max_idle (int): Maximum number of idle instances kept for reuse.
+
+        Returns:
+            AgentTemplate: The template.
+        """
+        template = cls.__new__(cls)
+        template.config = MappingProxyType({})
+        template.max_idle = max_idle
+        template._bind(agent)
+        return template
+
+    def _bind(self, prototype: Agent) -> None:
+        self.prototype = prototype
+        self._initial_messages = copy.deepcopy(
+            prototype.short_memory.conversation_history
+        )
+        self._idle: List[Agent] = []
+        self._lock = threading.Lock()
+
+    def spawn(self) -> Agent:
+        """
+        Create an instance sharing the prototype's LLM client and tools.
+
+        Returns:
+            Agent: A fresh instance with the initial memory.
+        """
+        agent = copy.copy(self.prototype)
+        agent.short_memory = self.prototype.short_memory.fork()
+        agent.short_memory.restore(self._initial_messages)
+        agent.feedback = []
+        agent.model_attempts = {}
+        return agent
+
+    def reset(self, agent: Agent) -> Agent:
+        """
+        Restore an instance to its initial state.
+
+        Args:
+            agent (Agent): An instance created by this template.
+
+        Returns:
+            Agent: The same instance.
+        """
+        agent.short_memory.restore(self._initial_messages)
+        agent.feedback = []
+        agent.model_attempts = {}
+        agent.current_model_index = 0
+        return agent
+
+    def acquire(self) -> Agent:
+        """Take an idle instance, or spawn one if none is idle."""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return self.spawn()
+
+    def release(self, agent: Agent) -> None:
+        """
+        Reset an instance and keep it for reuse.
+
+        Args:
+            agent (Agent): An instance taken with ``acquire``.
+        """
+        self.reset(agent)
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(agent)
+
+    @contextmanager
+    def lease(self) -> Iterator[Agent]:
+        """
+        Borrow an instance for the duration of a ``with`` block.
+
+        Yields:
+            Agent: An instance with the initial memory.
+        """
+        agent = self.acquire()
+        try:
+            yield agent
+        finally:
+            self.release(agent)
+
+    def run(
+        self, task: Optional[str] = None, *args: Any, **kwargs: Any
+    ) -> Any:
+        """
+        Run a task on a leased instance.
+
+        Args:
+            task (Optional[str]): The task.
+            *args: Additional positional arguments for ``Agent.run``.
+            **kwargs: Additional keyword arguments for ``Agent.run``.
+
+        Returns:
+            Any: The agent's output.
+        """
+        with self.lease() as agent:
+            return agent.run(task, *args, **kwargs)
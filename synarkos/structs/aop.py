@@ -1,10 +1,14 @@
 import asyncio
+import heapq
+import itertools
 import socket
 import sys
 import threading
 import time
 import traceback
 from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Literal, Optional
@@ -56,6 +60,7 @@ class Task:
         error: Error message if task failed
         retry_count: Number of times task has been retried
         max_retries: Maximum number of retries allowed
+        future: Resolved with the task once it reaches a final state
     """
 
     task_id: str = field(default_factory=lambda: str(uuid4()))
@@ -70,6 +75,9 @@ class Task:
     error: Optional[str] = None
     retry_count: int = 0
     max_retries: int = 3
+    future: Future = field(
+        default_factory=Future, repr=False, compare=False
+    )
 
 
 @dataclass
@@ -105,6 +113,12 @@ class TaskQueue:
     2. Process tasks in background workers
     3. Handle task retries and error management
     4. Provide queue statistics and monitoring
+
+    Pending tasks are kept in a binary heap ordered by priority and
+    insertion order, so enqueueing is O(log n) and tasks of equal
+    priority run first-in, first-out. Idle workers block on a condition
+    variable instead of polling, and every task carries a future that is
+    resolved as soon as the task reaches a final state.
     """
 
     def __init__(
@@ -137,9 +151,13 @@ class TaskQueue:
         self.retry_delay = retry_delay
         self.verbose = verbose
 
-        # Queue management
-        self._queue = deque()
+        # Queue management: heap of (-priority, sequence, task).
+        # Cancelled tasks are dropped lazily when they reach the top.
+        self._queue = []
+        self._sequence = itertools.count()
+        self._pending_count = 0
         self._lock = threading.RLock()
+        self._work_available = threading.Condition(self._lock)
         self._status = QueueStatus.STOPPED
         self._workers = []
         self._stop_event = threading.Event()
@@ -190,7 +208,7 @@ class TaskQueue:
             raise ValueError("Task cannot be empty")
 
         with self._lock:
-            if len(self._queue) >= self.max_queue_size:
+            if self._pending_count >= self.max_queue_size:
                 raise ValueError(
                     f"Queue is full (max size: {self.max_queue_size})"
                 )
@@ -204,21 +222,9 @@ class TaskQueue:
                 max_retries=max_retries,
             )
 
-            # Insert task based on priority (higher priority first)
-            inserted = False
-            for i, existing_task in enumerate(self._queue):
-                if task_obj.priority > existing_task.priority:
-                    self._queue.insert(i, task_obj)
-                    inserted = True
-                    break
-
-            if not inserted:
-                self._queue.append(task_obj)
-
             self._tasks[task_obj.task_id] = task_obj
+            self._push(task_obj)
             self._stats.total_tasks += 1
-            self._stats.pending_tasks += 1
-            self._stats.queue_size = len(self._queue)
 
             if self.verbose:
                 logger.debug(
@@ -240,6 +246,52 @@ class TaskQueue:
         with self._lock:
             return self._tasks.get(task_id)
 
+    def wait_for_task(
+        self, task_id: str, timeout: Optional[float] = None
+    ) -> Optional[Task]:
+        """
+        Block until a task reaches a final state.
+
+        Args:
+            task_id: The task ID
+            timeout: Maximum time to wait in seconds (None waits forever)
+
+        Returns:
+            Task object or None if not found
+
+        Raises:
+            TimeoutError: If the task is not finished within the timeout
+        """
+        task = self.get_task(task_id)
+        if task is None:
+            return None
+        return task.future.result(timeout=timeout)
+
+    async def await_task(
+        self, task_id: str, timeout: Optional[float] = None
+    ) -> Optional[Task]:
+        """
+        Await a task from an asyncio event loop without blocking it.
+
+        Args:
+            task_id: The task ID
+            timeout: Maximum time to wait in seconds (None waits forever)
+
+        Returns:
+            Task object or None if not found
+
+        Raises:
+            asyncio.TimeoutError: If the task is not finished within the timeout
+        """
+        task = self.get_task(task_id)
+        if task is None:
+            return None
+        # Shield so a timed-out waiter does not cancel the shared future.
+        return await asyncio.wait_for(
+            asyncio.shield(asyncio.wrap_future(task.future)),
+            timeout,
+        )
+
     def cancel_task(self, task_id: str) -> bool:
         """
         Cancel a task.
@@ -262,19 +314,25 @@ class TaskQueue:
             ]:
                 return False
 
-            # Remove from queue if still pending
+            # The heap entry is discarded lazily by the workers
             if task.status == TaskStatus.PENDING:
-                try:
-                    self._queue.remove(task)
-                    self._stats.pending_tasks -= 1
-                    self._stats.queue_size = len(self._queue)
-                except ValueError:
-                    pass  # Task not in queue
+                self._pending_count -= 1
+                self._stats.pending_tasks = self._pending_count
+                self._stats.queue_size = self._pending_count
 
             # Mark as cancelled
-            task.status = TaskStatus.CANCELLED
+            self._finish(task, TaskStatus.CANCELLED)
             self._processing_tasks.discard(task_id)
 
+            # Rebuild the heap once stale entries dominate it
+            if len(self._queue) > 2 * self._pending_count + 64:
+                self._queue = [
+                    entry
+                    for entry in self._queue
+                    if entry[2].status == TaskStatus.PENDING
+                ]
+                heapq.heapify(self._queue)
+
             if self.verbose:
                 logger.debug(
                     f"Cancelled task '{task_id}' for agent '{self.agent_name}'"
@@ -315,15 +373,15 @@ class TaskQueue:
 
             self._status = QueueStatus.STOPPED
             self._stop_event.set()
+            self._work_available.notify_all()
+            workers = list(self._workers)
+            self._workers.clear()
 
-            # Wait for workers to finish
-            for worker in self._workers:
-                worker.join(timeout=5.0)
+        # Join outside the lock so waking workers can reacquire it
+        for worker in workers:
+            worker.join(timeout=5.0)
 
-            self._workers.clear()
-            logger.info(
-                f"Stopped workers for agent '{self.agent_name}'"
-            )
+        logger.info(f"Stopped workers for agent '{self.agent_name}'")
 
     def pause_workers(self) -> None:
         """Pause the workers (they will finish current tasks but not start new ones)."""
@@ -339,6 +397,7 @@ class TaskQueue:
         with self._lock:
             if self._status == QueueStatus.PAUSED:
                 self._status = QueueStatus.RUNNING
+                self._work_available.notify_all()
                 logger.info(
                     f"Resumed workers for agent '{self.agent_name}'"
                 )
@@ -351,15 +410,17 @@ class TaskQueue:
             int: Number of tasks cleared
         """
         with self._lock:
-            cleared_count = len(self._queue)
-            self._queue.clear()
-            self._stats.pending_tasks = 0
-            self._stats.queue_size = 0
+            cleared_count = self._pending_count
 
             # Mark all pending tasks as cancelled
-            for task in self._tasks.values():
+            for _, _, task in self._queue:
                 if task.status == TaskStatus.PENDING:
-                    task.status = TaskStatus.CANCELLED
+                    self._finish(task, TaskStatus.CANCELLED)
+
+            self._queue.clear()
+            self._pending_count = 0
+            self._stats.pending_tasks = 0
+            self._stats.queue_size = 0
 
             if self.verbose:
                 logger.debug(
@@ -372,15 +433,9 @@ class TaskQueue:
         """Get current queue statistics."""
         with self._lock:
             # Update current stats
-            self._stats.pending_tasks = len(
-                [
-                    t
-                    for t in self._tasks.values()
-                    if t.status == TaskStatus.PENDING
-                ]
-            )
+            self._stats.pending_tasks = self._pending_count
             self._stats.processing_tasks = len(self._processing_tasks)
-            self._stats.queue_size = len(self._queue)
+            self._stats.queue_size = self._pending_count
 
             # Calculate average processing time
             if self._processing_times:
@@ -402,24 +457,61 @@ class TaskQueue:
         """Get current queue status."""
         return self._status
 
+    def _push(self, task: Task) -> None:
+        """Push a pending task onto the heap and wake one worker.
+
+        Must be called with the lock held.
+        """
+        task.status = TaskStatus.PENDING
+        heapq.heappush(
+            self._queue, (-task.priority, next(self._sequence), task)
+        )
+        self._pending_count += 1
+        self._stats.pending_tasks = self._pending_count
+        self._stats.queue_size = self._pending_count
+        self._work_available.notify()
+
+    def _pop(self) -> Optional[Task]:
+        """Pop the highest-priority pending task, skipping cancelled entries.
+
+        Must be called with the lock held.
+        """
+        while self._queue:
+            _, _, task = heapq.heappop(self._queue)
+            if task.status == TaskStatus.PENDING:
+                self._pending_count -= 1
+                self._stats.pending_tasks = self._pending_count
+                self._stats.queue_size = self._pending_count
+                return task
+        return None
+
+    def _finish(self, task: Task, status: TaskStatus) -> None:
+        """Move a task to a final state and resolve its future."""
+        task.status = status
+        if not task.future.done():
+            task.future.set_result(task)
+
     def _worker_loop(self) -> None:
         """Main worker loop for processing tasks."""
         while not self._stop_event.is_set():
             try:
-                # Check if we should process tasks
-                with self._lock:
-                    if (
+                with self._work_available:
+                    # Sleep until there is work, or we are told to stop
+                    while not self._stop_event.is_set() and (
                         self._status != QueueStatus.RUNNING
-                        or not self._queue
+                        or not self._pending_count
                     ):
-                        self._stop_event.wait(0.1)
-                        continue
+                        self._work_available.wait()
+
+                    if self._stop_event.is_set():
+                        return
 
                     # Get next task
-                    task = self._queue.popleft()
+                    task = self._pop()
+                    if task is None:
+                        continue
                     self._processing_tasks.add(task.task_id)
                     task.status = TaskStatus.PROCESSING
-                    self._stats.pending_tasks -= 1
                     self._stats.processing_tasks += 1
 
                 # Process the task
@@ -456,18 +548,18 @@ class TaskQueue:
                 correct_answer=task.correct_answer,
             )
 
-            # Update task with result
-            task.result = result
-            task.status = TaskStatus.COMPLETED
-
             # Update statistics
             processing_time = time.time() - start_time
             self._processing_times.append(processing_time)
 
             with self._lock:
+                # Update task with result
+                task.result = result
                 self._stats.completed_tasks += 1
                 self._stats.processing_tasks -= 1
                 self._processing_tasks.discard(task.task_id)
+                if task.status != TaskStatus.CANCELLED:
+                    self._finish(task, TaskStatus.COMPLETED)
 
             if self.verbose:
                 logger.debug(
@@ -496,24 +588,24 @@ class TaskQueue:
                 time.sleep(self.retry_delay)
 
                 with self._lock:
-                    if self._status == QueueStatus.RUNNING:
-                        task.status = TaskStatus.PENDING
-                        self._queue.append(
-                            task
-                        )  # Add to end of queue
-                        self._stats.pending_tasks += 1
-                        self._stats.queue_size = len(self._queue)
+                    self._stats.processing_tasks -= 1
+                    self._processing_tasks.discard(task.task_id)
+                    if task.status == TaskStatus.CANCELLED:
+                        pass
+                    elif self._status == QueueStatus.RUNNING:
+                        # Queued behind tasks of the same priority
+                        self._push(task)
                     else:
-                        task.status = TaskStatus.FAILED
+                        self._finish(task, TaskStatus.FAILED)
                         self._stats.failed_tasks += 1
             else:
                 # Max retries exceeded
-                task.status = TaskStatus.FAILED
-
                 with self._lock:
                     self._stats.failed_tasks += 1
                     self._stats.processing_tasks -= 1
                     self._processing_tasks.discard(task.task_id)
+                    if task.status != TaskStatus.CANCELLED:
+                        self._finish(task, TaskStatus.FAILED)
 
                 if self.verbose:
                     logger.error(
@@ -1173,47 +1265,45 @@ class AOP:
         Returns:
             Dict containing the task result
         """
-        start_time = time.time()
-
-        while time.time() - start_time < timeout:
-            task = self.task_queues[tool_name].get_task(task_id)
-            if not task:
-                return {
-                    "result": "",
-                    "success": False,
-                    "error": f"Task '{task_id}' not found",
-                }
+        task = self.task_queues[tool_name].get_task(task_id)
+        if not task:
+            return {
+                "result": "",
+                "success": False,
+                "error": f"Task '{task_id}' not found",
+            }
 
-            if task.status == TaskStatus.COMPLETED:
-                return {
-                    "result": task.result or "",
-                    "success": True,
-                    "error": None,
-                    "task_id": task_id,
-                }
-            elif task.status == TaskStatus.FAILED:
-                return {
-                    "result": "",
-                    "success": False,
-                    "error": task.error or "Task failed",
-                    "task_id": task_id,
-                }
-            elif task.status == TaskStatus.CANCELLED:
-                return {
-                    "result": "",
-                    "success": False,
-                    "error": "Task was cancelled",
-                    "task_id": task_id,
-                }
+        # Block on the task's future; the worker resolves it the
+        # moment the task finishes, fails or is cancelled.
+        try:
+            task.future.result(timeout=timeout)
+        except FutureTimeoutError:
+            return {
+                "result": "",
+                "success": False,
+                "error": f"Task '{task_id}' timed out after {timeout} seconds",
+                "task_id": task_id,
+            }
 
-            # Wait a bit before checking again
-            time.sleep(0.1)
+        if task.status == TaskStatus.COMPLETED:
+            return {
+                "result": task.result or "",
+                "success": True,
+                "error": None,
+                "task_id": task_id,
+            }
+        elif task.status == TaskStatus.FAILED:
+            return {
+                "result": "",
+                "success": False,
+                "error": task.error or "Task failed",
+                "task_id": task_id,
+            }
 
-        # Timeout reached
         return {
             "result": "",
             "success": False,
-            "error": f"Task '{task_id}' timed out after {timeout} seconds",
+            "error": "Task was cancelled",
             "task_id": task_id,
         }
 
@@ -5,8 +5,12 @@ from typing import Callable, List, Optional, Union
 from synarkos.structs.agent import Agent
 from synarkos.structs.conversation import Conversation
 from synarkos.structs.agent_group_id import agent_group_id
+from synarkos.telemetry.tracing import traced
+from synarkos.utils.execution_service import (
+    get_execution_service,
+    model_key,
+)
 from synarkos.utils.formatter import formatter
-from synarkos.utils.get_cpu_cores import get_cpu_cores
 from synarkos.utils.history_output_formatter import (
     history_output_formatter,
 )
@@ -21,7 +25,7 @@ class ConcurrentWorkflow:
 
     This class provides a framework for executing multiple agents concurrently on the same task,
     with optional dashboard monitoring, streaming callbacks, and various output formatting options.
-    It uses ThreadPoolExecutor to manage concurrent execution and provides real-time status
+    It uses the shared ExecutionService to manage concurrent execution and provides real-time status
     tracking for each agent.
 
     Attributes:
@@ -236,7 +240,6 @@ class ConcurrentWorkflow:
             if self.show_dashboard:
                 self.display_agent_dashboard()
 
-            max_workers = int(get_cpu_cores() * 0.95)
             futures = []
             results = []
 
@@ -318,28 +321,31 @@ class ConcurrentWorkflow:
 
                     raise
 
-            with concurrent.futures.ThreadPoolExecutor(
-                max_workers=max_workers
-            ) as executor:
-                futures = [
-                    executor.submit(
-                        run_agent_with_status, agent, task, img, imgs
-                    )
-                    for agent in self.agents
-                ]
-                concurrent.futures.wait(futures)
+            executor = get_execution_service()
+            futures = [
+                executor.submit_model(
+                    model_key(agent),
+                    run_agent_with_status,
+                    agent,
+                    task,
+                    img,
+                    imgs,
+                )
+                for agent in self.agents
+            ]
+            concurrent.futures.wait(futures)
 
-                for future, agent in zip(futures, self.agents):
-                    try:
-                        output = future.result()
-                        results.append((agent.agent_name, output))
-                    except Exception as e:
-                        logger.error(
-                            f"Agent {agent.agent_name} failed: {str(e)}"
-                        )
-                        results.append(
-                            (agent.agent_name, f"Error: {str(e)}")
-                        )
+            for future, agent in zip(futures, self.agents):
+                try:
+                    output = future.result()
+                    results.append((agent.agent_name, output))
+                except Exception as e:
+                    logger.error(
+                        f"Agent {agent.agent_name} failed: {str(e)}"
+                    )
+                    results.append(
+                        (agent.agent_name, f"Error: {str(e)}")
+                    )
 
             for agent_name, output in results:
                 self.conversation.add(role=agent_name, content=output)
@@ -369,7 +375,7 @@ class ConcurrentWorkflow:
         """
         Execute agents concurrently without dashboard.
 
-        Internal method that runs all agents concurrently using ThreadPoolExecutor
+        Internal method that runs all agents concurrently on the shared ExecutionService
         without displaying the dashboard. This is the core execution logic used when
         dashboard mode is disabled.
 
@@ -384,31 +390,28 @@ class ConcurrentWorkflow:
         """
         self.conversation.add(role="User", content=task)
 
-        max_workers = int(get_cpu_cores() * 0.95)
-
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=max_workers
-        ) as executor:
-            future_to_agent = {
-                executor.submit(
-                    self._run_agent_with_streaming,
-                    agent,
-                    task,
-                    img,
-                    imgs,
-                    streaming_callback,
-                ): agent
-                for agent in self.agents
-            }
-
-            for future in concurrent.futures.as_completed(
-                future_to_agent
-            ):
-                agent = future_to_agent[future]
-                output = future.result()
-                self.conversation.add(
-                    role=agent.agent_name, content=output
-                )
+        executor = get_execution_service()
+        future_to_agent = {
+            executor.submit_model(
+                model_key(agent),
+                self._run_agent_with_streaming,
+                agent,
+                task,
+                img,
+                imgs,
+                streaming_callback,
+            ): agent
+            for agent in self.agents
+        }
+
+        for future in concurrent.futures.as_completed(
+            future_to_agent
+        ):
+            agent = future_to_agent[future]
+            output = future.result()
+            self.conversation.add(
+                role=agent.agent_name, content=output
+            )
 
         return history_output_formatter(
             conversation=self.conversation, type=self.output_type
@@ -515,6 +518,7 @@ class ConcurrentWorkflow:
         except Exception as e:
             logger.error(f"Cleanup failed: {str(e)}")
 
+    @traced("concurrent_workflow.run")
     def run(
         self,
         task: str,
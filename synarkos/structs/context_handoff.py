@@ -0,0 +1,176 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+CONTEXT_MODES = ("full", "delta")
+
+
+@dataclass
+class HandoffConfig:
+    """Bounds of the prompt handed to each agent in ``delta`` mode."""
+
+    max_output_chars: int = 4000
+    summary_entry_chars: int = 280
+    max_summary_chars: int = 2000
+    summarizer: Optional[Callable[[str], str]] = None
+
+
+def clip_middle(text: str, max_chars: int) -> str:
+    """
+    Shorten text by cutting its middle, keeping the head and the tail.
+
+    Args:
+        text (str): Text to shorten.
+        max_chars (int): Maximum length of the result, marker excluded.
+
+    Returns:
+        str: ``text`` itself when short enough, otherwise its head and
+        tail around an omission marker.
+    """
+    if len(text) <= max_chars:
+        return text
+    head = max_chars // 2
+    tail = max_chars - head
+    omitted = len(text) - max_chars
+    return (
+        f"{text[:head]}\n[... {omitted} characters omitted ...]\n"
+        f"{text[-tail:] if tail else ''}"
+    )
+
+
+class ContextHandoff:
+    """
+    Bounded, structured context passed between the steps of a flow.
+
+    In ``full`` mode every agent receives the joined conversation, so an
+    N-agent chain sends O(N^2) tokens and every agent's ``short_memory``
+    stores another copy of the history. A handoff instead gives each step
+    the original task, a rolling summary of earlier steps and the outputs
+    of the step right before it, each clipped to the limits of
+    ``HandoffConfig``. Outputs stay in the shared ``Conversation``; the
+    handoff only keeps references to them plus one short summary line per
+    output, computed once when the output leaves the predecessor window.
+
+    Attributes:
+        config (HandoffConfig): Size limits and optional summarizer.
+        task (Optional[str]): The original task of the run.
+        instructions (List[str]): Standing rules repeated in every prompt.
+    """
+
+    def __init__(
+        self,
+        config: Optional[HandoffConfig] = None,
+        instructions: Optional[List[str]] = None,
+    ):
+        self.config = config or HandoffConfig()
+        self.instructions = [i for i in instructions or [] if i]
+        self.task: Optional[str] = None
+        self._summary: List[Tuple[str, str]] = []
+        self._previous: List[Tuple[str, str]] = []
+        self._step: List[Tuple[str, str]] = []
+
+    def start(self, task: Optional[str]) -> None:
+        """
+        Reset the handoff for a new run.
+
+        Args:
+            task (Optional[str]): The original task.
+        """
+        self.task = task
+        self._summary = []
+        self._previous = []
+        self._step = []
+
+    def record(self, agent_name: str, output: Any) -> None:
+        """
+        Record an agent's output for the current step.
+
+        Args:
+            agent_name (str): Name of the agent.
+            output (Any): The agent's output, as stored in the conversation.
+        """
+        self._step.append((agent_name, str(output)))
+
+    def end_step(self) -> None:
+        """
+        Close the current step: its outputs become the predecessor outputs
+        of the next step, and the outputs they replace move to the summary.
+        """
+        if not self._step:
+            return
+        for agent_name, output in self._previous:
+            self._summary.append(
+                (agent_name, self._summarize(output))
+            )
+        self._previous = self._step
+        self._step = []
+
+    def _summarize(self, output: str) -> str:
+        limit = self.config.summary_entry_chars
+        if self.config.summarizer is not None:
+            output = str(self.config.summarizer(output))
+        line = " ".join(output.split())
+        if len(line) > limit:
+            line = line[: max(0, limit - 3)].rstrip() + "..."
+        return line
+
+    def _summary_lines(self) -> List[str]:
+        # Newest entries are kept; older ones are counted, not repeated
+        lines = []
+        size = 0
+        for agent_name, line in reversed(self._summary):
+            entry = f"- {agent_name}: {line}"
+            if size + len(entry) > self.config.max_summary_chars:
+                break
+            lines.append(entry)
+            size += len(entry) + 1
+        omitted = len(self._summary) - len(lines)
+        lines.reverse()
+        if omitted:
+            lines.insert(0, f"- ({omitted} earlier outputs omitted)")
+        return lines
+
+    def build(self, notes: Optional[str] = None) -> str:
+        """
+        Build the prompt for the next step.
+
+        Args:
+            notes (Optional[str]): Step-specific notes, such as the
+                sequential awareness of the agent.
+
+        Returns:
+            str: The prompt, built once and shared by every agent of the
+            step.
+        """
+        sections = [f"Task:\n{self.task}"]
+
+        instructions = list(self.instructions)
+        if notes:
+            instructions.append(notes)
+        if instructions:
+            sections.append(
+                "Instructions:\n" + "\n".join(instructions)
+            )
+
+        summary = self._summary_lines()
+        if summary:
+            sections.append(
+                "Summary of earlier steps:\n" + "\n".join(summary)
+            )
+
+        for agent_name, output in self._previous:
+            sections.append(
+                f"Output of {agent_name}:\n"
+                + clip_middle(output, self.config.max_output_chars)
+            )
+
+        return "\n\n".join(sections)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Sizes and limits of the handoff, for telemetry."""
+        return {
+            "max_output_chars": self.config.max_output_chars,
+            "summary_entry_chars": self.config.summary_entry_chars,
+            "max_summary_chars": self.config.max_summary_chars,
+            "summarized_outputs": len(self._summary),
+            "previous_outputs": [name for name, _ in self._previous],
+        }
@@ -1,4 +1,5 @@
-import concurrent.futures
+import bisect
+import copy
 import datetime
 import json
 import os
@@ -15,14 +16,28 @@ from typing import (
 
 import yaml
 
+from synarkos.structs.conversation_journal import (
+    ConversationJournal,
+)
 from synarkos.utils.any_to_str import any_to_str
-from synarkos.utils.litellm_tokenizer import count_tokens
+from synarkos.utils.litellm_tokenizer import (
+    count_tokens,
+    count_tokens_batch,
+    truncate_to_token_limit,
+)
 
 if TYPE_CHECKING:
     from synarkos.structs.agent import Agent
 
 from loguru import logger
 
+# File extension used for each supported export method
+EXPORT_EXTENSIONS = {
+    "json": ".json",
+    "yaml": ".yaml",
+    "jsonl": ".jsonl",
+}
+
 
 def generate_conversation_id():
     """Generate a unique conversation ID."""
@@ -69,6 +84,9 @@ class Conversation:
         save_as_yaml_on (bool): Flag to save conversation history as YAML.
         save_as_json_bool (bool): Flag to save conversation history as JSON.
         token_count (bool): Flag to enable token counting for messages.
+        export_method (str): Persistence format: 'json', 'yaml' or 'jsonl'. With
+            'jsonl', autosave appends only new messages to a journal file.
+        journal_fsync_interval (int): Number of journaled messages between fsyncs.
         conversation_history (list): List to store the history of messages.
     """
 
@@ -95,6 +113,7 @@ class Conversation:
         dynamic_context_window: bool = True,
         caching: bool = True,
         output_metadata: bool = False,
+        journal_fsync_interval: int = 32,
     ):
 
         # Initialize all attributes first
@@ -119,11 +138,24 @@ class Conversation:
         self.dynamic_context_window = dynamic_context_window
         self.caching = caching
         self.output_metadata = output_metadata
+        self.journal_fsync_interval = journal_fsync_interval
 
         if self.name is None:
             self.name = id
 
         self.conversation_history = []
+        self._journal: Optional[ConversationJournal] = None
+
+        # Per-message token counts and their running prefix sums, filled
+        # incrementally so each message is tokenized only once
+        self._message_tokens: List[int] = []
+        self._token_prefix: List[int] = [0]
+        self._token_history_id: Optional[int] = None
+        self._token_index_dirty = False
+
+        # Bumped on every non-append change, so incremental checkpoints
+        # know when appending new messages is not enough
+        self._history_revision = 0
 
         self.setup_file_path()
         self.setup()
@@ -131,17 +163,15 @@ class Conversation:
     def setup_file_path(self):
         """Set up the file path for saving the conversation and load existing data if available."""
         # Validate export method
-        if self.export_method not in ["json", "yaml"]:
+        if self.export_method not in EXPORT_EXTENSIONS:
             raise ValueError(
-                f"Invalid export_method: {self.export_method}. Must be 'json' or 'yaml'"
+                f"Invalid export_method: {self.export_method}. Must be 'json', 'yaml' or 'jsonl'"
             )
 
         # Set default save filepath if not provided
         if not self.save_filepath:
             # Ensure extension matches export method
-            extension = (
-                ".json" if self.export_method == "json" else ".yaml"
-            )
+            extension = EXPORT_EXTENSIONS[self.export_method]
             self.save_filepath = (
                 f"conversation_{self.name}{extension}"
             )
@@ -151,9 +181,7 @@ class Conversation:
         else:
             # Validate that provided filepath extension matches export method
             file_ext = os.path.splitext(self.save_filepath)[1].lower()
-            expected_ext = (
-                ".json" if self.export_method == "json" else ".yaml"
-            )
+            expected_ext = EXPORT_EXTENSIONS[self.export_method]
             if file_ext != expected_ext:
                 logger.warning(
                     f"Save filepath extension ({file_ext}) does not match export_method ({self.export_method}). "
@@ -166,6 +194,12 @@ class Conversation:
             "%Y-%m-%d_%H-%M-%S"
         )
 
+        if self.export_method == "jsonl":
+            self._journal = ConversationJournal(
+                self.save_filepath,
+                fsync_interval=self.journal_fsync_interval,
+            )
+
         # Check if file exists and load it
         if os.path.exists(self.save_filepath):
             logger.debug(
@@ -213,6 +247,7 @@ class Conversation:
                 self.conversation_history = saved_data.get(
                     "history", []
                 )
+                self._mark_history_changed()
         else:
             self._initialize_new_conversation()
 
@@ -232,8 +267,64 @@ class Conversation:
 
     def _autosave(self):
         """Automatically save the conversation if autosave is enabled."""
+        if self._journal is not None:
+            # Journaled autosave only appends messages added since the last write
+            return self._journal.write(self.conversation_history)
         return self.export()
 
+    def close(self):
+        """Fsync any journaled messages that are not yet on disk."""
+        if self._journal is not None:
+            self._journal.flush()
+
+    def _mark_history_changed(self):
+        """Record a non-append change to the history.
+
+        The journal is compacted on its next write and the token index is
+        rebuilt on its next use.
+        """
+        self._token_index_dirty = True
+        self._history_revision += 1
+        if self._journal is not None:
+            self._journal.mark_dirty()
+
+    def _sync_token_index(self):
+        """Count tokens for messages added since the last sync and extend the prefix sums."""
+        history = self.conversation_history
+        if (
+            self._token_index_dirty
+            or self._token_history_id != id(history)
+            or len(history) < len(self._message_tokens)
+        ):
+            self._message_tokens = []
+            self._token_prefix = [0]
+            self._token_history_id = id(history)
+            self._token_index_dirty = False
+
+        new_messages = history[len(self._message_tokens) :]
+        if not new_messages:
+            return
+
+        counts = count_tokens_batch(
+            [
+                f"{message['role']}: {message['content']}\n\n"
+                for message in new_messages
+            ],
+            self.tokenizer_model_name,
+        )
+        for tokens in counts:
+            self._message_tokens.append(tokens)
+            self._token_prefix.append(self._token_prefix[-1] + tokens)
+
+    def get_total_tokens(self) -> int:
+        """Return the token count of the full history using the cached per-message counts.
+
+        Returns:
+            int: Total number of tokens in the conversation history.
+        """
+        self._sync_token_index()
+        return self._token_prefix[-1]
+
     def add_in_memory(
         self,
         role: str,
@@ -398,21 +489,15 @@ class Conversation:
                 "Number of roles and contents must match."
             )
 
-        # Now create a formula to get 25% of available cpus
-        max_workers = int(os.cpu_count() * 0.25)
-
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=max_workers
-        ) as executor:
-            futures = [
-                executor.submit(self.add, role, content)
-                for role, content in zip(roles, contents)
-            ]
-            concurrent.futures.wait(futures)
+        # Appending is in-memory work: adding in order on this thread
+        # keeps the history ordered and avoids spinning up a pool
+        for role, content in zip(roles, contents):
+            self.add(role, content)
 
     def delete(self, index: str):
         """Delete a message from the conversation history."""
         self.conversation_history.pop(int(index))
+        self._mark_history_changed()
 
     def update(self, index: str, role, content):
         """Update a message in the conversation history.
@@ -425,6 +510,7 @@ class Conversation:
         if 0 <= int(index) < len(self.conversation_history):
             self.conversation_history[int(index)]["role"] = role
             self.conversation_history[int(index)]["content"] = content
+            self._mark_history_changed()
         else:
             logger.warning(f"Invalid index: {index}")
 
@@ -630,6 +716,42 @@ class Conversation:
             )
             raise  # Re-raise the exception to handle it in the calling method
 
+    def save_as_jsonl(self, force: bool = True):
+        """Write a compacted JSON-lines snapshot of the conversation history.
+
+        Args:
+            force (bool, optional): If True, saves regardless of autosave setting. Defaults to True.
+        """
+        try:
+            # Check if saving is allowed
+            if not self.autosave and not force:
+                logger.warning(
+                    "Autosave is disabled. To save anyway, call save_as_jsonl(force=True) "
+                    "or enable autosave by setting autosave=True when creating the Conversation."
+                )
+                return
+
+            if (
+                self._journal is None
+                or self._journal.filepath != self.save_filepath
+            ):
+                if self._journal is not None:
+                    self._journal.flush()
+                self._journal = ConversationJournal(
+                    self.save_filepath,
+                    fsync_interval=self.journal_fsync_interval,
+                )
+
+            self._journal.compact(self.conversation_history)
+
+            logger.info(f"Conversation saved to {self.save_filepath}")
+
+        except Exception as e:
+            logger.error(
+                f"Failed to save conversation to {self.save_filepath}: {str(e)}\nTraceback: {traceback.format_exc()}"
+            )
+            raise
+
     def export(self, force: bool = True):
         """Export the conversation to a file based on the export method.
 
@@ -638,9 +760,9 @@ class Conversation:
         """
         try:
             # Validate export method
-            if self.export_method not in ["json", "yaml"]:
+            if self.export_method not in EXPORT_EXTENSIONS:
                 raise ValueError(
-                    f"Invalid export_method: {self.export_method}. Must be 'json' or 'yaml'"
+                    f"Invalid export_method: {self.export_method}. Must be 'json', 'yaml' or 'jsonl'"
                 )
 
             # Create directory if it doesn't exist
@@ -650,9 +772,7 @@ class Conversation:
 
             # Ensure filepath extension matches export method
             file_ext = os.path.splitext(self.save_filepath)[1].lower()
-            expected_ext = (
-                ".json" if self.export_method == "json" else ".yaml"
-            )
+            expected_ext = EXPORT_EXTENSIONS[self.export_method]
             if file_ext != expected_ext:
                 base_name = os.path.splitext(self.save_filepath)[0]
                 self.save_filepath = f"{base_name}{expected_ext}"
@@ -664,6 +784,8 @@ class Conversation:
                 self.save_as_json(force=force)
             elif self.export_method == "yaml":
                 self.save_as_yaml(force=force)
+            elif self.export_method == "jsonl":
+                self.save_as_jsonl(force=force)
 
         except Exception as e:
             logger.error(
@@ -693,6 +815,7 @@ class Conversation:
                 self.conversation_history = data.get(
                     "conversation_history", []
                 )
+                self._mark_history_changed()
 
                 logger.info(
                     f"Successfully loaded conversation from {filename}"
@@ -725,6 +848,39 @@ class Conversation:
                 self.conversation_history = data.get(
                     "conversation_history", []
                 )
+                self._mark_history_changed()
+
+                logger.info(
+                    f"Successfully loaded conversation from {filename}"
+                )
+            except Exception as e:
+                logger.error(
+                    f"Failed to load conversation: {str(e)}\nTraceback: {traceback.format_exc()}"
+                )
+                raise
+
+    def load_from_jsonl(self, filename: str):
+        """Rebuild the conversation history from a JSON-lines journal file.
+
+        Args:
+            filename (str): Filename to load from.
+        """
+        if filename is not None and os.path.exists(filename):
+            try:
+                if (
+                    self._journal is not None
+                    and self._journal.filepath == filename
+                ):
+                    journal = self._journal
+                else:
+                    journal = ConversationJournal(filename)
+
+                self.conversation_history = journal.load()
+
+                if journal is self._journal:
+                    self._journal.attach(self.conversation_history)
+                else:
+                    self._mark_history_changed()
 
                 logger.info(
                     f"Successfully loaded conversation from {filename}"
@@ -752,9 +908,11 @@ class Conversation:
                 self.load_from_json(filename)
             elif file_ext == ".yaml" or file_ext == ".yml":
                 self.load_from_yaml(filename)
+            elif file_ext == ".jsonl":
+                self.load_from_jsonl(filename)
             else:
                 raise ValueError(
-                    f"Unsupported file format: {file_ext}. Must be .json, .yaml, or .yml"
+                    f"Unsupported file format: {file_ext}. Must be .json, .jsonl, .yaml, or .yml"
                 )
         except Exception as e:
             logger.error(
@@ -782,65 +940,59 @@ class Conversation:
         Truncate conversation history based on the total token count using tokenizer.
 
         This version is more generic, not dependent on a specific LLM model, and can work with any model that provides a counter.
-        Uses count_tokens function to calculate and truncate by message, ensuring the result is still valid content.
+        Uses the cached per-message token counts to find the cutoff by bisecting message
+        boundaries, so only the message straddling the limit is re-tokenized.
 
         Returns:
             None
         """
 
-        total_tokens = 0
-        truncated_history = []
+        self._sync_token_index()
 
-        for message in self.conversation_history:
-            role = message.get("role")
+        # Number of leading messages that fit entirely in the context
+        fits = (
+            bisect.bisect_right(
+                self._token_prefix, self.context_length
+            )
+            - 1
+        )
+        truncated_history = self.conversation_history[:fits]
+
+        remaining_tokens = (
+            self.context_length - self._token_prefix[fits]
+        )
+        if (
+            fits < len(self.conversation_history)
+            and remaining_tokens > 0
+        ):
+            message = self.conversation_history[fits]
             content = message.get("content")
 
+            # Reserve room for the role prefix and separator counted per message
+            remaining_tokens -= count_tokens(
+                f"{message['role']}: \n\n", self.tokenizer_model_name
+            )
+
             # Convert content to string if it's not already a string
             if not isinstance(content, str):
                 content = str(content)
 
-            # Calculate token count for this message
-            token_count = count_tokens(
-                content, self.tokenizer_model_name
+            # Truncate the first message that does not fit to the remaining space
+            truncated_content = self._binary_search_truncate(
+                content,
+                remaining_tokens,
+                self.tokenizer_model_name,
             )
 
-            # Check if adding this message would exceed the limit
-            if total_tokens + token_count <= self.context_length:
-                # If not exceeding limit, add the full message
-                truncated_history.append(message)
-                total_tokens += token_count
-            else:
-                # Calculate remaining tokens we can include
-                remaining_tokens = self.context_length - total_tokens
-
-                # If no token space left, break the loop
-                if remaining_tokens <= 0:
-                    break
-
-                # If we have space left, we need to truncate this message
-                # Use binary search to find content length that fits remaining token space
-                truncated_content = self._binary_search_truncate(
-                    content,
-                    remaining_tokens,
-                    self.tokenizer_model_name,
-                )
-
-                # Create the truncated message
-                truncated_message = {
-                    "role": role,
-                    "content": truncated_content,
-                }
-
-                # Add any other fields from the original message
-                for key, value in message.items():
-                    if key not in ["role", "content"]:
-                        truncated_message[key] = value
-
+            # Create the truncated message, keeping any other fields
+            if truncated_content:
+                truncated_message = dict(message)
+                truncated_message["content"] = truncated_content
                 truncated_history.append(truncated_message)
-                break
 
         # Update conversation history
         self.conversation_history = truncated_history
+        self._mark_history_changed()
 
     def _binary_search_truncate(
         self, text, target_tokens, model_name
@@ -861,28 +1013,13 @@ class Conversation:
         if not text or target_tokens <= 0:
             return ""
 
-        # If original text token count is already less than or equal to target, return as is
-        original_tokens = count_tokens(text, model_name)
-        if original_tokens <= target_tokens:
+        # Encode once and keep the leading target_tokens tokens
+        best_text = truncate_to_token_limit(
+            text, target_tokens, model_name, keep="start"
+        )
+        if best_text == text:
             return text
 
-        # Binary search
-        left, right = 0, len(text)
-        best_text = ""
-
-        while left <= right:
-            mid = (left + right) // 2
-            truncated = text[:mid]
-            tokens = count_tokens(truncated, model_name)
-
-            if tokens <= target_tokens:
-                # If current truncated text token count is less than or equal to target, try longer text
-                best_text = truncated
-                left = mid + 1
-            else:
-                # Otherwise try shorter text
-                right = mid - 1
-
         # Try to truncate at sentence boundaries if possible
         sentence_delimiters = [".", "!", "?", "\n"]
         for delimiter in sentence_delimiters:
@@ -902,6 +1039,41 @@ class Conversation:
     def clear(self):
         """Clear the conversation history."""
         self.conversation_history = []
+        self._mark_history_changed()
+
+    def restore(
+        self, messages: List[dict], copy_messages: bool = True
+    ):
+        """Replace the history with a copy of ``messages``.
+
+        Args:
+            messages (List[dict]): Messages to restore, e.g. a snapshot of
+                the initial system prompt and rules.
+            copy_messages (bool): Deep-copy the messages; pass False to
+                take ownership of a list nothing else references.
+        """
+        self.conversation_history = (
+            copy.deepcopy(messages) if copy_messages else messages
+        )
+        self._mark_history_changed()
+
+    def fork(self) -> "Conversation":
+        """Copy the conversation without re-running its file setup.
+
+        The copy has its own history and token index, and neither
+        autosaves nor shares this conversation's journal.
+
+        Returns:
+            Conversation: The copy.
+        """
+        forked = copy.copy(self)
+        forked.autosave = False
+        forked._journal = None
+        forked._message_tokens = []
+        forked._token_prefix = [0]
+        forked._token_history_id = None
+        forked.restore(self.conversation_history)
+        return forked
 
     def to_json(self):
         """Convert the conversation history to a JSON string.
@@ -1076,7 +1248,7 @@ class Conversation:
         conv_dir = conversations_dir or get_conversation_dir()
 
         # Try loading by name with different extensions
-        for ext in [".json", ".yaml", ".yml"]:
+        for ext in [".json", ".jsonl", ".yaml", ".yml"]:
             filepath = os.path.join(conv_dir, f"{name}{ext}")
             if os.path.exists(filepath):
                 conversation = cls(
@@ -1177,6 +1349,7 @@ class Conversation:
     def clear_memory(self):
         """Clear the memory of the conversation."""
         self.conversation_history = []
+        self._mark_history_changed()
 
     def _dynamic_auto_chunking_worker(self):
         """
@@ -1185,43 +1358,32 @@ class Conversation:
         Returns:
             str: The chunked conversation history as a string that fits within context_length tokens.
         """
-        all_tokens = self._return_history_as_string_worker()
-
-        total_tokens = count_tokens(
-            all_tokens, self.tokenizer_model_name
-        )
+        self._sync_token_index()
 
+        total_tokens = self._token_prefix[-1]
         if total_tokens <= self.context_length:
-            return all_tokens
-
-        # We need to remove characters from the beginning until we're under the limit
-        # Start by removing a percentage of characters and adjust iteratively
-        target_tokens = self.context_length
-        current_string = all_tokens
-
-        # Binary search approach to find the right cutoff point
-        left, right = 0, len(all_tokens)
-
-        while left < right:
-            mid = (left + right) // 2
-            test_string = all_tokens[mid:]
+            return self._return_history_as_string_worker()
 
-            if not test_string:
-                break
+        # Bisect the prefix sums for the first message boundary whose
+        # suffix fits within the context length
+        start = bisect.bisect_left(
+            self._token_prefix, total_tokens - self.context_length
+        )
 
-            test_tokens = count_tokens(
-                test_string, self.tokenizer_model_name
+        if start >= len(self.conversation_history):
+            # Not even the latest message fits, keep its most recent tokens
+            last_message = self.conversation_history[-1]
+            return truncate_to_token_limit(
+                f"{last_message['role']}: {last_message['content']}",
+                self.context_length,
+                self.tokenizer_model_name,
+                keep="end",
             )
 
-            if test_tokens <= target_tokens:
-                # We can remove more from the beginning
-                right = mid
-                current_string = test_string
-            else:
-                # We need to keep more from the beginning
-                left = mid + 1
-
-        return current_string
+        return "\n\n".join(
+            f"{message['role']}: {message['content']}"
+            for message in self.conversation_history[start:]
+        )
 
     def dynamic_auto_chunking(self):
         """
@@ -0,0 +1,169 @@
+import atexit
+import json
+import os
+import threading
+import weakref
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+# Live journals, fsynced at interpreter exit
+_open_journals = weakref.WeakSet()
+
+
+def _flush_open_journals():
+    for journal in list(_open_journals):
+        try:
+            journal.flush()
+        except Exception as e:
+            logger.warning(
+                f"Failed to flush conversation journal {journal.filepath}: {e}"
+            )
+
+
+atexit.register(_flush_open_journals)
+
+
+class ConversationJournal:
+    """
+    Append-only JSON-lines journal used by ``Conversation`` autosave.
+
+    Every message is written as a single JSON line, so persisting a new
+    message costs O(1) instead of re-serializing the whole history. When the
+    in-memory history is changed in a way that is not a pure append (delete,
+    update, clear, truncation), the next write compacts the journal into a
+    fresh snapshot of the full history using an atomic file replace.
+
+    Records written since the last fsync are synced by ``flush``, which
+    runs when the owning ``Conversation`` is closed and at interpreter
+    exit.
+
+    Attributes:
+        filepath (str): Path of the ``.jsonl`` journal file.
+        fsync_interval (int): Number of appended records between fsyncs.
+    """
+
+    def __init__(self, filepath: str, fsync_interval: int = 32):
+        self.filepath = filepath
+        self.fsync_interval = max(1, int(fsync_interval))
+
+        self._lock = threading.Lock()
+        self._persisted = 0
+        self._history_id: Optional[int] = None
+        self._dirty = False
+        self._unsynced = 0
+        _open_journals.add(self)
+
+    def _ensure_dir(self):
+        journal_dir = os.path.dirname(self.filepath)
+        if journal_dir:
+            os.makedirs(journal_dir, exist_ok=True)
+
+    def mark_dirty(self):
+        """Force the next write to compact the journal."""
+        self._dirty = True
+
+    def write(self, history: List[Dict[str, Any]]):
+        """Persist the given history, appending only unseen messages.
+
+        Args:
+            history (List[Dict[str, Any]]): The current conversation history.
+        """
+        with self._lock:
+            if (
+                self._dirty
+                or self._history_id != id(history)
+                or len(history) < self._persisted
+            ):
+                self._compact(history)
+                return
+
+            new_messages = history[self._persisted :]
+            if not new_messages:
+                return
+
+            self._ensure_dir()
+            with open(self.filepath, "a", encoding="utf-8") as f:
+                for message in new_messages:
+                    f.write(json.dumps(message, default=str) + "\n")
+                self._unsynced += len(new_messages)
+                f.flush()
+
+                if self._unsynced >= self.fsync_interval:
+                    os.fsync(f.fileno())
+                    self._unsynced = 0
+
+            self._persisted = len(history)
+
+    def compact(self, history: List[Dict[str, Any]]):
+        """Rewrite the journal as a snapshot of the full history.
+
+        Args:
+            history (List[Dict[str, Any]]): The current conversation history.
+        """
+        with self._lock:
+            self._compact(history)
+
+    def _compact(self, history: List[Dict[str, Any]]):
+        self._ensure_dir()
+        temp_path = f"{self.filepath}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            for message in history:
+                f.write(json.dumps(message, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.filepath)
+
+        self._persisted = len(history)
+        self._history_id = id(history)
+        self._dirty = False
+        self._unsynced = 0
+        logger.debug(
+            f"Compacted conversation journal {self.filepath} ({len(history)} messages)"
+        )
+
+    def load(self) -> List[Dict[str, Any]]:
+        """Rebuild the message list from the journal file.
+
+        A partially written trailing line (e.g. after a crash) is skipped.
+
+        Returns:
+            List[Dict[str, Any]]: The recovered conversation history.
+        """
+        history = []
+        if not os.path.exists(self.filepath):
+            return history
+
+        with open(self.filepath, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    history.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # Rewrite the file on the next write so new records
+                    # never land after a torn line.
+                    self._dirty = True
+                    logger.warning(
+                        f"Skipping corrupted journal line {line_number} in {self.filepath}"
+                    )
+        return history
+
+    def attach(self, history: List[Dict[str, Any]]):
+        """Mark ``history`` as already persisted, e.g. right after ``load``.
+
+        Args:
+            history (List[Dict[str, Any]]): The history loaded from the journal.
+        """
+        with self._lock:
+            self._persisted = len(history)
+            self._history_id = id(history)
+
+    def flush(self):
+        """Fsync any journal records that were written but not yet synced."""
+        with self._lock:
+            if self._unsynced and os.path.exists(self.filepath):
+                with open(self.filepath, "a", encoding="utf-8") as f:
+                    os.fsync(f.fileno())
+            self._unsynced = 0
@@ -6,6 +6,7 @@ from typing import Dict, Optional, Tuple
 from loguru import logger
 
 from synarkos.structs.agent import Agent
+from synarkos.structs.agent_template import AgentTemplate
 from synarkos.structs.conversation import Conversation
 from synarkos.structs.ma_utils import set_random_models_for_agents
 from synarkos.utils.history_output_formatter import (
@@ -231,8 +232,10 @@ class CouncilAsAJudge:
         description (str): Description of the council's purpose
         model_name (str): Name of the model to use for evaluations
         output_type (str): Type of output to return
-        judge_agents (Dict[str, Agent]): Dictionary of dimension-specific judge agents
-        aggregator_agent (Agent): Agent responsible for aggregating evaluations
+        judge_templates (Dict[str, AgentTemplate]): Templates of the dimension-specific judges
+        judge_agents (Dict[str, Agent]): Prototype judge agent of each dimension
+        aggregator_template (AgentTemplate): Template of the aggregator
+        aggregator_agent (Agent): Prototype of the agent aggregating evaluations
         conversation (Conversation): Conversation history tracker
         max_workers (int): Maximum number of worker threads for parallel execution
     """
@@ -279,8 +282,15 @@ class CouncilAsAJudge:
 
         self.reliability_check()
 
-        self.judge_agents = self._create_judges()
-        self.aggregator_agent = self._create_aggregator()
+        # Judges are built once; every evaluation leases an instance
+        # with fresh memory instead of growing the same agent's history
+        self.judge_templates = self._create_judges()
+        self.judge_agents = {
+            dim: template.prototype
+            for dim, template in self.judge_templates.items()
+        }
+        self.aggregator_template = self._create_aggregator()
+        self.aggregator_agent = self.aggregator_template.prototype
         self.conversation = Conversation()
 
     def reliability_check(self):
@@ -329,19 +339,19 @@ class CouncilAsAJudge:
             maxsize=cache_size
         )(aggregator_system_prompt.__wrapped__)
 
-    def _create_judges(self) -> Dict[str, Agent]:
+    def _create_judges(self) -> Dict[str, AgentTemplate]:
         """
-        Create judge agents for each evaluation dimension.
+        Create judge agent templates for each evaluation dimension.
 
         Returns:
-            Dict[str, Agent]: Dictionary mapping dimension names to judge agents
+            Dict[str, AgentTemplate]: Dictionary mapping dimension names to judge templates
 
         Raises:
             RuntimeError: If agent creation fails
         """
         try:
             return {
-                dim: Agent(
+                dim: AgentTemplate(
                     agent_name=f"{dim}_judge",
                     system_prompt=judge_system_prompt(),
                     model_name=self.judge_agent_model_name,
@@ -356,18 +366,18 @@ class CouncilAsAJudge:
                 f"Failed to create judge agents: {str(e)}"
             )
 
-    def _create_aggregator(self) -> Agent:
+    def _create_aggregator(self) -> AgentTemplate:
         """
-        Create the aggregator agent.
+        Create the aggregator agent template.
 
         Returns:
-            Agent: The aggregator agent
+            AgentTemplate: The aggregator template
 
         Raises:
             RuntimeError: If agent creation fails
         """
         try:
-            return Agent(
+            return AgentTemplate(
                 agent_name="aggregator_agent",
                 system_prompt=aggregator_system_prompt(),
                 model_name=self.aggregation_model_name,
@@ -417,6 +427,26 @@ class CouncilAsAJudge:
                 f"Failed to evaluate dimension {dim}: {str(e)}"
             )
 
+    def _evaluate_with_template(
+        self,
+        dim: str,
+        template: AgentTemplate,
+        task: str,
+    ) -> Tuple[str, str]:
+        """
+        Evaluate a dimension on a judge leased from its template.
+
+        Args:
+            dim (str): Dimension to evaluate
+            template (AgentTemplate): Judge template for this dimension
+            task (str): Task containing the response to evaluate
+
+        Returns:
+            Tuple[str, str]: Tuple of (dimension name, evaluation result)
+        """
+        with template.lease() as agent:
+            return self._evaluate_dimension(dim, agent, task)
+
     def run(self, task: str) -> None:
         """
         Run the evaluation process using ThreadPoolExecutor.
@@ -437,8 +467,8 @@ class CouncilAsAJudge:
 
             # Create tasks for all dimensions
             tasks = [
-                (dim, agent, task)
-                for dim, agent in self.judge_agents.items()
+                (dim, template, task)
+                for dim, template in self.judge_templates.items()
             ]
 
             # Run evaluations in parallel using ThreadPoolExecutor
@@ -448,12 +478,12 @@ class CouncilAsAJudge:
                 # Submit all tasks
                 future_to_dim = {
                     executor.submit(
-                        self._evaluate_dimension,
+                        self._evaluate_with_template,
                         dim,
-                        agent,
+                        template,
                         task,
                     ): dim
-                    for dim, agent, _ in tasks
+                    for dim, template, _ in tasks
                 }
 
                 # Collect results as they complete
@@ -475,7 +505,7 @@ class CouncilAsAJudge:
             aggregation_prompt = build_aggregation_prompt(
                 all_rationales
             )
-            final_report = self.aggregator_agent.run(
+            final_report = self.aggregator_template.run(
                 aggregation_prompt
             )
 
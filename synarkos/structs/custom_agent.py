@@ -1,10 +1,27 @@
+import asyncio
+import importlib.util
 import json
+import random
+import threading
+import time
+import weakref
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Union
 
 import httpx
 from loguru import logger
 
+# Statuses worth retrying: rate limits and transient gateway errors
+RETRY_STATUSES = (408, 429, 500, 502, 503, 504)
+
+# Errors raised before the request reached the server, safe to retry
+RETRY_ERRORS = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.PoolTimeout,
+    httpx.RemoteProtocolError,
+)
+
 
 @dataclass
 class AgentResponse:
@@ -25,6 +42,10 @@ class CustomAgent:
     Features:
     - Configurable headers and payload
     - Both sync and async execution
+    - Persistent, connection-pooled clients with optional HTTP/2
+    - Retries with exponential backoff on connection errors and
+      retryable status codes
+    - Batch execution over the pooled connections
     - Built-in error handling and logging
     - Flexible response handling
     - Name and description
@@ -39,6 +60,13 @@ class CustomAgent:
         headers: Optional[Dict[str, str]] = None,
         timeout: float = 30.0,
         verify_ssl: bool = True,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        retry_statuses: Sequence[int] = RETRY_STATUSES,
         *args,
         **kwargs,
     ):
@@ -51,12 +79,45 @@ class CustomAgent:
             headers: Default headers to include in requests
             timeout: Request timeout in seconds
             verify_ssl: Whether to verify SSL certificates
+            max_connections: Maximum open connections in the pool
+            max_keepalive_connections: Idle connections kept alive
+            keepalive_expiry: Seconds an idle connection is kept
+            http2: Whether to negotiate HTTP/2 (needs the ``h2`` package)
+            max_retries: Retries after the first attempt
+            retry_backoff: Base delay in seconds, doubled on each retry
+            retry_statuses: HTTP status codes that are retried
+            **kwargs: Additional httpx client options, such as ``proxy``
+                or ``transport``
         """
+        self.name = name
+        self.description = description
         self.base_url = base_url.rstrip("/")
         self.endpoint = endpoint.lstrip("/")
         self.default_headers = headers or {}
         self.timeout = timeout
         self.verify_ssl = verify_ssl
+        self.max_retries = max(0, max_retries)
+        self.retry_backoff = retry_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2
+        if self.http2 and importlib.util.find_spec("h2") is None:
+            logger.warning(
+                "h2 not available, falling back to HTTP/1.1. "
+                "Install it with: pip install 'httpx[http2]'"
+            )
+            self.http2 = False
+        self.client_kwargs = kwargs
+
+        self._client: Optional[httpx.Client] = None
+        # One async client per event loop; a loop's client is dropped
+        # together with the loop
+        self._async_clients = weakref.WeakKeyDictionary()
+        self._client_lock = threading.Lock()
 
         # Default headers
         if "Content-Type" not in self.default_headers:
@@ -66,6 +127,84 @@ class CustomAgent:
             f"CustomAgent initialized for {self.base_url}/{self.endpoint}"
         )
 
+    @property
+    def url(self) -> str:
+        """Full URL requests are posted to."""
+        return f"{self.base_url}/{self.endpoint}"
+
+    def _client_options(self) -> Dict[str, Any]:
+        return {
+            "timeout": self.timeout,
+            "verify": self.verify_ssl,
+            "limits": self.limits,
+            "http2": self.http2,
+            **self.client_kwargs,
+        }
+
+    @property
+    def client(self) -> httpx.Client:
+        """The pooled sync client, created on first use."""
+        if self._client is None or self._client.is_closed:
+            with self._client_lock:
+                if self._client is None or self._client.is_closed:
+                    self._client = httpx.Client(
+                        **self._client_options()
+                    )
+        return self._client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """
+        The pooled async client of the running event loop.
+
+        Connections belong to the loop that opened them, so each event
+        loop gets its own client. Clients of other loops are left alone,
+        so loops running in other threads keep their connections.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None or client.is_closed:
+            with self._client_lock:
+                client = self._async_clients.get(loop)
+                if client is None or client.is_closed:
+                    client = httpx.AsyncClient(
+                        **self._client_options()
+                    )
+                    self._async_clients[loop] = client
+        return client
+
+    async def _aclose_loop_client(self) -> None:
+        """Close the async client of the running event loop."""
+        client = self._async_clients.pop(
+            asyncio.get_running_loop(), None
+        )
+        if client is not None:
+            await client.aclose()
+
+    def close(self) -> None:
+        """Close the pooled sync client."""
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    async def aclose(self) -> None:
+        """Close the sync client and the running loop's async client."""
+        self.close()
+        await self._aclose_loop_client()
+
+    def __enter__(self) -> "CustomAgent":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "CustomAgent":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
     def _prepare_headers(
         self, additional_headers: Optional[Dict[str, str]] = None
     ) -> Dict[str, str]:
@@ -83,6 +222,90 @@ class CustomAgent:
             return json.dumps(payload)
         return payload
 
+    def _retry_delay(
+        self, attempt: int, response: Optional[httpx.Response] = None
+    ) -> float:
+        """Backoff before retry ``attempt``, honouring Retry-After."""
+        if response is not None:
+            retry_after = response.headers.get("retry-after")
+            if retry_after is not None:
+                try:
+                    return max(0.0, float(retry_after))
+                except ValueError:
+                    pass
+        delay = self.retry_backoff * (2**attempt)
+        return delay + random.uniform(0, delay / 2)
+
+    def _should_retry(self, attempt: int, status_code: int) -> bool:
+        return (
+            attempt < self.max_retries
+            and status_code in self.retry_statuses
+        )
+
+    def _post(
+        self,
+        client: httpx.Client,
+        content: Union[str, bytes],
+        headers: Dict[str, str],
+    ) -> httpx.Response:
+        """POST with retries on connection errors and retryable statuses."""
+        attempt = 0
+        while True:
+            try:
+                response = client.post(
+                    self.url, content=content, headers=headers
+                )
+            except RETRY_ERRORS as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._retry_delay(attempt)
+                logger.warning(
+                    f"Request error: {e}, retrying in {delay:.2f}s"
+                )
+            else:
+                if not self._should_retry(
+                    attempt, response.status_code
+                ):
+                    return response
+                delay = self._retry_delay(attempt, response)
+                logger.warning(
+                    f"Request failed: {response.status_code}, retrying in {delay:.2f}s"
+                )
+            time.sleep(delay)
+            attempt += 1
+
+    async def _post_async(
+        self,
+        client: httpx.AsyncClient,
+        content: Union[str, bytes],
+        headers: Dict[str, str],
+    ) -> httpx.Response:
+        """Async POST with retries on connection errors and retryable statuses."""
+        attempt = 0
+        while True:
+            try:
+                response = await client.post(
+                    self.url, content=content, headers=headers
+                )
+            except RETRY_ERRORS as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._retry_delay(attempt)
+                logger.warning(
+                    f"Async request error: {e}, retrying in {delay:.2f}s"
+                )
+            else:
+                if not self._should_retry(
+                    attempt, response.status_code
+                ):
+                    return response
+                delay = self._retry_delay(attempt, response)
+                logger.warning(
+                    f"Async request failed: {response.status_code}, retrying in {delay:.2f}s"
+                )
+            await asyncio.sleep(delay)
+            attempt += 1
+
     def _parse_response(
         self, response: httpx.Response
     ) -> AgentResponse:
@@ -120,6 +343,28 @@ class CustomAgent:
                 error_message=str(e),
             )
 
+    def _response_content(
+        self, response: httpx.Response, prefix: str = ""
+    ) -> str:
+        """Extract the content of a response, or describe its error."""
+        if 200 <= response.status_code < 300:
+            logger.info(
+                f"{prefix}Request successful: {response.status_code}"
+            )
+            try:
+                response_data = response.json()
+                return self._extract_content(response_data)
+            except json.JSONDecodeError:
+                logger.warning(
+                    f"{prefix}Response is not JSON, returning raw text"
+                )
+                return response.text
+
+        logger.warning(
+            f"{prefix}Request failed: {response.status_code}"
+        )
+        return f"Error: HTTP {response.status_code} - {response.text}"
+
     def _extract_content(self, response_data: Dict[str, Any]) -> str:
         """
         Extract message content from API response, supporting multiple formats.
@@ -190,49 +435,36 @@ class CustomAgent:
         **kwargs,
     ) -> str:
         """
-        Execute a synchronous POST request.
+        Execute a synchronous POST request on the pooled client.
 
         Args:
             payload: Request body/payload
             additional_headers: Additional headers for this request
-            **kwargs: Additional httpx client options
+            **kwargs: Additional httpx client options; when given, the
+                request uses a one-off client with these options instead
+                of the pool
 
         Returns:
             str: Extracted message content from response
         """
-        url = f"{self.base_url}/{self.endpoint}"
         request_headers = self._prepare_headers(additional_headers)
         request_payload = self._prepare_payload(payload)
 
-        logger.info(f"Making POST request to: {url}")
+        logger.info(f"Making POST request to: {self.url}")
 
         try:
-            with httpx.Client(
-                timeout=self.timeout, verify=self.verify_ssl, **kwargs
-            ) as client:
-                response = client.post(
-                    url,
-                    content=request_payload,
-                    headers=request_headers,
-                )
-
-                if 200 <= response.status_code < 300:
-                    logger.info(
-                        f"Request successful: {response.status_code}"
-                    )
-                    try:
-                        response_data = response.json()
-                        return self._extract_content(response_data)
-                    except json.JSONDecodeError:
-                        logger.warning(
-                            "Response is not JSON, returning raw text"
-                        )
-                        return response.text
-                else:
-                    logger.warning(
-                        f"Request failed: {response.status_code}"
+            if kwargs:
+                with httpx.Client(
+                    **{**self._client_options(), **kwargs}
+                ) as client:
+                    response = self._post(
+                        client, request_payload, request_headers
                     )
-                    return f"Error: HTTP {response.status_code} - {response.text}"
+            else:
+                response = self._post(
+                    self.client, request_payload, request_headers
+                )
+            return self._response_content(response)
 
         except httpx.RequestError as e:
             logger.error(f"Request error: {e}")
@@ -248,49 +480,38 @@ class CustomAgent:
         **kwargs,
     ) -> str:
         """
-        Execute an asynchronous POST request.
+        Execute an asynchronous POST request on the pooled client.
 
         Args:
             payload: Request body/payload
             additional_headers: Additional headers for this request
-            **kwargs: Additional httpx client options
+            **kwargs: Additional httpx client options; when given, the
+                request uses a one-off client with these options instead
+                of the pool
 
         Returns:
             str: Extracted message content from response
         """
-        url = f"{self.base_url}/{self.endpoint}"
         request_headers = self._prepare_headers(additional_headers)
         request_payload = self._prepare_payload(payload)
 
-        logger.info(f"Making async POST request to: {url}")
+        logger.info(f"Making async POST request to: {self.url}")
 
         try:
-            async with httpx.AsyncClient(
-                timeout=self.timeout, verify=self.verify_ssl, **kwargs
-            ) as client:
-                response = await client.post(
-                    url,
-                    content=request_payload,
-                    headers=request_headers,
-                )
-
-                if 200 <= response.status_code < 300:
-                    logger.info(
-                        f"Async request successful: {response.status_code}"
-                    )
-                    try:
-                        response_data = response.json()
-                        return self._extract_content(response_data)
-                    except json.JSONDecodeError:
-                        logger.warning(
-                            "Async response is not JSON, returning raw text"
-                        )
-                        return response.text
-                else:
-                    logger.warning(
-                        f"Async request failed: {response.status_code}"
+            if kwargs:
+                async with httpx.AsyncClient(
+                    **{**self._client_options(), **kwargs}
+                ) as client:
+                    response = await self._post_async(
+                        client, request_payload, request_headers
                     )
-                    return f"Error: HTTP {response.status_code} - {response.text}"
+            else:
+                response = await self._post_async(
+                    self.async_client,
+                    request_payload,
+                    request_headers,
+                )
+            return self._response_content(response, prefix="Async ")
 
         except httpx.RequestError as e:
             logger.error(f"Async request error: {e}")
@@ -299,6 +520,72 @@ class CustomAgent:
             logger.error(f"Unexpected async error: {e}")
             return f"Unexpected error: {str(e)}"
 
+    async def run_batch_async(
+        self,
+        payloads: List[Union[Dict[str, Any], str, bytes]],
+        additional_headers: Optional[Dict[str, str]] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Send many payloads concurrently over the pooled async client.
+
+        Args:
+            payloads: Request bodies
+            additional_headers: Additional headers for every request
+            max_concurrency: Maximum requests in flight; defaults to the
+                pool's ``max_connections``
+
+        Returns:
+            List[str]: Extracted content per payload, in input order
+        """
+        semaphore = asyncio.Semaphore(
+            max_concurrency or self.limits.max_connections or 100
+        )
+
+        async def send(payload):
+            async with semaphore:
+                return await self.run_async(
+                    payload, additional_headers
+                )
+
+        return list(
+            await asyncio.gather(*(send(p) for p in payloads))
+        )
+
+    def run_batch(
+        self,
+        payloads: List[Union[Dict[str, Any], str, bytes]],
+        additional_headers: Optional[Dict[str, str]] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Send many payloads concurrently over the pooled connections.
+
+        Runs ``run_batch_async`` on a private event loop, so it must not be
+        called from a running event loop; await ``run_batch_async`` there.
+
+        Args:
+            payloads: Request bodies
+            additional_headers: Additional headers for every request
+            max_concurrency: Maximum requests in flight; defaults to the
+                pool's ``max_connections``
+
+        Returns:
+            List[str]: Extracted content per payload, in input order
+        """
+
+        async def batch():
+            try:
+                return await self.run_batch_async(
+                    payloads, additional_headers, max_concurrency
+                )
+            finally:
+                # The loop closes with this call; its connections cannot
+                # be reused
+                await self._aclose_loop_client()
+
+        return asyncio.run(batch())
+
 
 # # Example usage with Anthropic API
 # if __name__ == "__main__":
@@ -2,6 +2,7 @@ import json
 import asyncio
 import concurrent.futures
 import time
+from collections import deque
 from enum import Enum
 from typing import Any, Dict, List, Optional
 import uuid
@@ -18,7 +19,11 @@ except ImportError:
 
 from synarkos.structs.agent import Agent  # noqa: F401
 from synarkos.structs.conversation import Conversation
-from synarkos.utils.get_cpu_cores import get_cpu_cores
+from synarkos.telemetry.tracing import traced
+from synarkos.utils.execution_service import (
+    ExecutionService,
+    get_execution_service,
+)
 from synarkos.utils.loguru_logger import initialize_logger
 
 logger = initialize_logger(log_folder="graph_workflow")
@@ -155,7 +160,8 @@ class GraphWorkflow:
         task (str): The task to be executed by the workflow.
         _compiled (bool): Whether the graph has been compiled for optimization.
         _sorted_layers (List[List[str]]): Pre-computed topological layers for faster execution.
-        _max_workers (int): Pre-computed max workers for thread pool.
+        _node_layers (Dict[str, int]): Topological layer index of each node.
+        _max_workers (Optional[int]): Maximum number of agents of this workflow running concurrently; None leaves it to the shared ExecutionService.
         verbose (bool): Whether to enable verbose logging.
     """
 
@@ -174,6 +180,7 @@ class GraphWorkflow:
         task: Optional[str] = None,
         auto_compile: bool = True,
         verbose: bool = False,
+        max_workers: Optional[int] = None,
     ):
         self.id = id
         self.verbose = verbose
@@ -198,7 +205,8 @@ class GraphWorkflow:
         # Private optimization attributes
         self._compiled = False
         self._sorted_layers = []
-        self._max_workers = max(1, int(get_cpu_cores() * 0.95))
+        self._node_layers = {}
+        self._max_workers = max_workers
         self._compilation_timestamp = None
 
         if self.verbose:
@@ -282,6 +290,7 @@ class GraphWorkflow:
 
         self._compiled = False
         self._sorted_layers = []
+        self._node_layers = {}
         self._compilation_timestamp = None
 
         # Clear predecessors cache when graph structure changes
@@ -332,6 +341,11 @@ class GraphWorkflow:
                 nx.topological_generations(self.graph)
             )
             self._sorted_layers = sorted_layers
+            self._node_layers = {
+                node_id: layer_idx
+                for layer_idx, layer in enumerate(sorted_layers)
+                for node_id in layer
+            }
 
             # Cache compilation timestamp for debugging
             self._compilation_timestamp = time.time()
@@ -1028,6 +1042,7 @@ class GraphWorkflow:
             logger.exception(f"Error in GraphWorkflow.arun: {e}")
             raise e
 
+    @traced("graph_workflow.run")
     def run(
         self,
         task: str = None,
@@ -1075,192 +1090,234 @@ class GraphWorkflow:
                 f"Using cached compilation for {self.max_loops} loops (compiled at {getattr(self, '_compilation_timestamp', 'unknown time')})"
             )
 
-        try:
-            loop = 0
-            while loop < self.max_loops:
-                loop_start_time = time.time()
+        # Nodes run on the shared ExecutionService and are dispatched as
+        # soon as their predecessors finish rather than layer by layer.
+        executor = get_execution_service()
 
-                if self.verbose:
-                    cache_status = (
-                        " (using cached structure)"
-                        if loop > 0 or not compilation_needed
-                        else ""
-                    )
-                    logger.info(
-                        f"Starting execution loop {loop + 1}/{self.max_loops}{cache_status}"
-                    )
+        try:
+            return self._run_loops(
+                executor,
+                task,
+                img,
+                run_start_time,
+                compilation_needed,
+                *args,
+                **kwargs,
+            )
 
-                execution_results = {}
-                prev_outputs = {}
+        except Exception as e:
+            total_time = time.time() - run_start_time
+            logger.exception(
+                f"Error in GraphWorkflow.run after {total_time:.3f}s: {e}"
+            )
+            raise e
 
-                for layer_idx, layer in enumerate(
-                    self._sorted_layers
-                ):
-                    layer_start_time = time.time()
+    def _run_loops(
+        self,
+        executor: ExecutionService,
+        task: str,
+        img: Optional[str],
+        run_start_time: float,
+        compilation_needed: bool,
+        *args,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Execute the workflow loops on a shared executor.
 
-                    if self.verbose:
-                        logger.info(
-                            f"Executing layer {layer_idx + 1}/{len(self._sorted_layers)} with {len(layer)} nodes: {layer}"
-                        )
+        Args:
+            executor (ExecutionService): Service shared by every node of the run.
+            task (str): The main task.
+            img (Optional[str]): Optional image passed to every agent.
+            run_start_time (float): Timestamp at which the run started.
+            compilation_needed (bool): Whether the graph was compiled for this run.
+            *args: Additional positional arguments.
+            **kwargs: Additional keyword arguments.
 
-                    # Pre-build all prompts for this layer
-                    layer_data = []
-                    for node_id in layer:
-                        try:
-                            prompt = self._build_prompt(
-                                node_id, task, prev_outputs, layer_idx
-                            )
-                            layer_data.append(
-                                (
-                                    node_id,
-                                    self.nodes[node_id].agent,
-                                    prompt,
-                                )
-                            )
-                        except Exception as e:
-                            logger.exception(
-                                f"Error building prompt for node {node_id}: {e}"
-                            )
-                            # Continue with empty prompt as fallback
-                            layer_data.append(
-                                (
-                                    node_id,
-                                    self.nodes[node_id].agent,
-                                    f"Error building prompt: {e}",
-                                )
-                            )
+        Returns:
+            Dict[str, Any]: Execution results from all nodes.
+        """
+        loop = 0
+        while loop < self.max_loops:
+            loop_start_time = time.time()
 
-                    # Execute all agents in this layer in parallel
-                    with concurrent.futures.ThreadPoolExecutor(
-                        max_workers=min(self._max_workers, len(layer))
-                    ) as executor:
+            if self.verbose:
+                cache_status = (
+                    " (using cached structure)"
+                    if loop > 0 or not compilation_needed
+                    else ""
+                )
+                logger.info(
+                    f"Starting execution loop {loop + 1}/{self.max_loops}{cache_status}"
+                )
 
-                        if self.verbose:
-                            logger.debug(
-                                f"Created thread pool with {min(self._max_workers, len(layer))} workers for layer {layer_idx + 1}"
-                            )
+            execution_results = self._execute_ready_queue(
+                executor, task, img, *args, **kwargs
+            )
 
-                        future_to_data = {}
-
-                        # Submit all tasks
-                        for node_id, agent, prompt in layer_data:
-                            try:
-                                future = executor.submit(
-                                    agent.run,
-                                    prompt,
-                                    img,
-                                    *args,
-                                    **kwargs,
-                                )
-                                future_to_data[future] = (
-                                    node_id,
-                                    agent,
-                                )
+            loop_execution_time = time.time() - loop_start_time
+            loop += 1
 
-                                if self.verbose:
-                                    logger.debug(
-                                        f"Submitted execution task for agent: {getattr(agent, 'agent_name', node_id)}"
-                                    )
+            if self.verbose:
+                logger.success(
+                    f"Loop {loop}/{self.max_loops} completed in {loop_execution_time:.3f}s"
+                )
 
-                            except Exception as e:
-                                logger.exception(
-                                    f"Error submitting task for agent {getattr(agent, 'agent_name', node_id)}: {e}"
-                                )
-                                # Add error result directly
-                                error_output = f"[ERROR] Failed to submit task: {e}"
-                                prev_outputs[node_id] = error_output
-                                execution_results[node_id] = (
-                                    error_output
-                                )
+            # For now, we still return after the first loop
+            # This maintains backward compatibility
+            total_execution_time = time.time() - run_start_time
 
-                        # Collect results as they complete
-                        completed_count = 0
-                        for future in concurrent.futures.as_completed(
-                            future_to_data
-                        ):
-                            node_id, agent = future_to_data[future]
-                            agent_name = getattr(
-                                agent, "agent_name", node_id
-                            )
+            logger.info(
+                f"GraphWorkflow execution completed: {len(execution_results)} agents executed in {total_execution_time:.3f}s"
+            )
 
-                            try:
-                                agent_start_time = time.time()
-                                output = future.result()
-                                agent_execution_time = (
-                                    time.time() - agent_start_time
-                                )
+            if self.verbose:
+                logger.debug(
+                    f"Final execution results: {list(execution_results.keys())}"
+                )
 
-                                completed_count += 1
+            return execution_results
 
-                                if self.verbose:
-                                    logger.success(
-                                        f"Agent {agent_name} completed successfully ({completed_count}/{len(layer_data)}) in {agent_execution_time:.3f}s"
-                                    )
+        return {}
 
-                            except Exception as e:
-                                output = f"[ERROR] Agent {agent_name} failed: {e}"
-                                logger.exception(
-                                    f"Error in GraphWorkflow agent execution for {agent_name}: {e}"
-                                )
+    def _execute_ready_queue(
+        self,
+        executor: ExecutionService,
+        task: str,
+        img: Optional[str] = None,
+        *args,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Run every node once, dispatching each node as soon as all of its
+        predecessors have produced an output.
 
-                            prev_outputs[node_id] = output
-                            execution_results[node_id] = output
+        Args:
+            executor (ExecutionService): Service the agents run on.
+            task (str): The main task.
+            img (Optional[str]): Optional image passed to every agent.
+            *args: Additional positional arguments.
+            **kwargs: Additional keyword arguments.
 
-                            # Add to conversation (this could be optimized further by batching)
-                            try:
-                                self.conversation.add(
-                                    role=agent_name,
-                                    content=output,
-                                )
+        Returns:
+            Dict[str, Any]: Execution results keyed by node ID.
+        """
+        execution_results = {}
+        prev_outputs = {}
+        remaining = {
+            node_id: len(self._get_predecessors(node_id))
+            for node_id in self.graph.nodes
+        }
+        running = {}
+        waiting = deque()
+
+        def record(node_id: str, output: Any):
+            prev_outputs[node_id] = output
+            execution_results[node_id] = output
+
+            for successor in self.graph.successors(node_id):
+                remaining[successor] -= 1
+                if remaining[successor] == 0:
+                    dispatch(successor)
+
+        def dispatch(node_id: str):
+            if (
+                self._max_workers
+                and len(running) >= self._max_workers
+            ):
+                waiting.append(node_id)
+                return
 
-                                if self.verbose:
-                                    logger.debug(
-                                        f"Added output to conversation for agent: {agent_name}"
-                                    )
+            agent = self.nodes[node_id].agent
+            try:
+                prompt = self._build_prompt(
+                    node_id,
+                    task,
+                    prev_outputs,
+                    self._node_layers.get(node_id, 0),
+                )
+            except Exception as e:
+                logger.exception(
+                    f"Error building prompt for node {node_id}: {e}"
+                )
+                # Continue with empty prompt as fallback
+                prompt = f"Error building prompt: {e}"
 
-                            except Exception as e:
-                                logger.exception(
-                                    f"Error adding output to conversation for agent {agent_name}: {e}"
-                                )
+            try:
+                future = executor.submit_agent(
+                    agent,
+                    prompt,
+                    img,
+                    *args,
+                    **kwargs,
+                )
+                running[future] = node_id
 
-                    layer_execution_time = (
-                        time.time() - layer_start_time
+                if self.verbose:
+                    logger.debug(
+                        f"Submitted execution task for agent: {getattr(agent, 'agent_name', node_id)}"
                     )
 
+            except Exception as e:
+                logger.exception(
+                    f"Error submitting task for agent {getattr(agent, 'agent_name', node_id)}: {e}"
+                )
+                record(node_id, f"[ERROR] Failed to submit task: {e}")
+
+        for node_id, count in list(remaining.items()):
+            if count == 0:
+                dispatch(node_id)
+
+        while running:
+            done, _ = concurrent.futures.wait(
+                running,
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+
+            for future in done:
+                node_id = running.pop(future)
+                agent = self.nodes[node_id].agent
+                agent_name = getattr(agent, "agent_name", node_id)
+
+                try:
+                    output = future.result()
+
                     if self.verbose:
                         logger.success(
-                            f"Layer {layer_idx + 1} completed in {layer_execution_time:.3f}s"
+                            f"Agent {agent_name} completed successfully ({len(execution_results) + 1}/{len(self.nodes)})"
                         )
 
-                loop_execution_time = time.time() - loop_start_time
-                loop += 1
-
-                if self.verbose:
-                    logger.success(
-                        f"Loop {loop}/{self.max_loops} completed in {loop_execution_time:.3f}s"
+                except Exception as e:
+                    output = f"[ERROR] Agent {agent_name} failed: {e}"
+                    logger.exception(
+                        f"Error in GraphWorkflow agent execution for {agent_name}: {e}"
                     )
 
-                # For now, we still return after the first loop
-                # This maintains backward compatibility
-                total_execution_time = time.time() - run_start_time
+                try:
+                    self.conversation.add(
+                        role=agent_name,
+                        content=output,
+                    )
 
-                logger.info(
-                    f"GraphWorkflow execution completed: {len(execution_results)} agents executed in {total_execution_time:.3f}s"
-                )
+                    if self.verbose:
+                        logger.debug(
+                            f"Added output to conversation for agent: {agent_name}"
+                        )
 
-                if self.verbose:
-                    logger.debug(
-                        f"Final execution results: {list(execution_results.keys())}"
+                except Exception as e:
+                    logger.exception(
+                        f"Error adding output to conversation for agent {agent_name}: {e}"
                     )
 
-                return execution_results
+                record(node_id, output)
 
-        except Exception as e:
-            total_time = time.time() - run_start_time
-            logger.exception(
-                f"Error in GraphWorkflow.run after {total_time:.3f}s: {e}"
-            )
-            raise e
+            while waiting and (
+                not self._max_workers
+                or len(running) < self._max_workers
+            ):
+                dispatch(waiting.popleft())
+
+        return execution_results
 
     def visualize(
         self,
@@ -1987,6 +2044,13 @@ class GraphWorkflow:
                         result._sorted_layers = runtime_state.get(
                             "sorted_layers", []
                         )
+                        result._node_layers = {
+                            node_id: layer_idx
+                            for layer_idx, layer in enumerate(
+                                result._sorted_layers
+                            )
+                            for node_id in layer
+                        }
 
                         if result.verbose:
                             logger.info(
@@ -19,6 +19,7 @@ from rich.progress import (
 from rich.table import Table
 
 from synarkos.structs.agent import Agent
+from synarkos.structs.agent_template import AgentTemplate
 from synarkos.structs.conversation import Conversation
 from synarkos.tools.tool_type import tool_type
 from synarkos.utils.formatter import formatter
@@ -428,6 +429,10 @@ class HeavySwarm:
         self.console = Console()
 
         self.agents = self.create_agents()
+        # Every synthesis leases a copy with fresh memory
+        self.synthesis_template = AgentTemplate.from_agent(
+            self.agents["synthesis"]
+        )
 
         if self.show_dashboard:
             self.show_swarm_info()
@@ -1432,10 +1437,6 @@ class HeavySwarm:
         Returns:
             str: Comprehensive synthesized analysis
         """
-        # Get the cached agents
-        agents = self.create_agents()
-        synthesis_agent = agents["synthesis"]
-
         agents_names = [
             "Research Agent",
             "Analysis Agent",
@@ -1478,7 +1479,7 @@ class HeavySwarm:
         Be thorough, objective, and ensure your synthesis is easy to follow for a non-technical audience.
         """
 
-        return synthesis_agent.run(synthesis_prompt)
+        return self.synthesis_template.run(synthesis_prompt)
 
     def _parse_tool_calls(self, tool_calls: List) -> Dict[str, any]:
         """
@@ -23,14 +23,15 @@ Todo
 - Use agent rearrange to orchestrate the agents
 
 Classes:
-    HierarchicalOrder: Represents a single task assignment to a specific agent
+    HierarchicalOrder: Represents a single task assignment to a specific agent,
+        optionally with dependencies or a phase
     SwarmSpec: Contains the overall plan and list of orders for the swarm
     HierarchicalSwarm: Main swarm orchestrator that manages director and worker agents
 """
 
 import time
 import traceback
-from typing import Any, Callable, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from loguru import logger
 from pydantic import BaseModel, Field
@@ -49,10 +50,15 @@ from synarkos.prompts.multi_agent_collab_prompt import (
 )
 from synarkos.prompts.reasoning_prompt import INTERNAL_MONOLGUE_PROMPT
 from synarkos.structs.agent import Agent
+from synarkos.structs.agent_template import AgentTemplate
 from synarkos.structs.conversation import Conversation
 from synarkos.structs.ma_utils import list_all_agents
 from synarkos.structs.omni_agent_types import AgentListType
 from synarkos.tools.base_tool import BaseTool
+from synarkos.utils.execution_service import (
+    get_execution_service,
+    model_key,
+)
 from synarkos.utils.history_output_formatter import (
     history_output_formatter,
 )
@@ -572,6 +578,10 @@ class HierarchicalOrder(BaseModel):
                          Must match an existing agent in the swarm.
         task (str): The specific task description to be executed by the assigned agent.
                    Should be clear and actionable.
+        depends_on (List[str]): Names of agents whose orders must finish before
+                               this one starts.
+        phase (int): Execution phase; every order of a lower phase finishes
+                    before any order of a higher phase starts.
     """
 
     agent_name: str = Field(
@@ -582,6 +592,86 @@ class HierarchicalOrder(BaseModel):
         ...,
         description="Defines the specific task to be executed by the assigned agent. This task is a key component of the swarm's plan and is essential for achieving the swarm's goals.",
     )
+    depends_on: List[str] = Field(
+        default_factory=list,
+        description="Names of the agents whose orders must be completed before this order starts, because this task needs their output. Leave empty for independent orders, which run in parallel.",
+    )
+    phase: int = Field(
+        default=0,
+        description="Execution phase of the order. All orders of a lower phase finish before any order of a higher phase starts; orders in the same phase run in parallel unless depends_on says otherwise.",
+    )
+
+
+def schedule_order_waves(
+    orders: List[HierarchicalOrder],
+) -> List[List[int]]:
+    """
+    Group orders into waves that can run concurrently.
+
+    Order j runs after order i when i's agent is listed in j's
+    ``depends_on`` (earlier orders of that agent take precedence), when i
+    has a lower ``phase``, or when both target the same agent and i comes
+    first, so each agent handles one order at a time.
+
+    Args:
+        orders (List[HierarchicalOrder]): The director's orders.
+
+    Returns:
+        List[List[int]]: Order indices per wave, in execution order; indices
+        within a wave are ascending. If the dependencies form a cycle, every
+        order gets its own wave in list order.
+    """
+    count = len(orders)
+    predecessors: List[List[int]] = [[] for _ in range(count)]
+    for j, later in enumerate(orders):
+        # A dependency means the agent's earlier orders, or all of its
+        # orders when the director listed the dependent order first
+        needs = set()
+        for name in getattr(later, "depends_on", None) or []:
+            targets = [
+                i
+                for i, earlier in enumerate(orders)
+                if earlier.agent_name == name and i != j
+            ]
+            earlier_targets = [i for i in targets if i < j]
+            needs.update(earlier_targets or targets)
+
+        for i, earlier in enumerate(orders):
+            if i == j:
+                continue
+            if (
+                i in needs
+                or getattr(earlier, "phase", 0)
+                < getattr(later, "phase", 0)
+                or (earlier.agent_name == later.agent_name and i < j)
+            ):
+                predecessors[j].append(i)
+
+    levels: Dict[int, int] = {}
+    pending = list(range(count))
+    while pending:
+        ready = [
+            j
+            for j in pending
+            if all(i in levels for i in predecessors[j])
+        ]
+        if not ready:
+            logger.warning(
+                "[SCHEDULE] Order dependencies form a cycle; executing orders sequentially"
+            )
+            return [[j] for j in range(count)]
+        for j in ready:
+            levels[j] = 1 + max(
+                (levels[i] for i in predecessors[j]), default=-1
+            )
+        pending = [j for j in pending if j not in levels]
+
+    waves: List[List[int]] = [
+        [] for _ in range(max(levels.values(), default=-1) + 1)
+    ]
+    for j in range(count):
+        waves[levels[j]].append(j)
+    return waves
 
 
 class HierarchicalOrderRearrange(BaseModel):
@@ -666,6 +756,8 @@ class HierarchicalSwarm:
         planning_director_agent (Optional[Union[Agent, Callable, Any]]): Optional
                                                                         planning agent.
         director_feedback_on (bool): Whether director feedback is enabled.
+        max_parallel_orders (int): Maximum number of independent orders
+                                  executed concurrently.
     """
 
     def __init__(
@@ -690,6 +782,7 @@ class HierarchicalSwarm:
         director_reasoning_model_name: str = "o3-mini",
         director_reasoning_enabled: bool = False,
         multi_agent_prompt_improvements: bool = False,
+        max_parallel_orders: int = 8,
         *args,
         **kwargs,
     ):
@@ -713,6 +806,9 @@ class HierarchicalSwarm:
             planning_director_agent (Optional[Union[Agent, Callable, Any]]):
                 Optional planning agent for enhanced planning capabilities.
             director_feedback_on (bool): Whether director feedback is enabled.
+            max_parallel_orders (int): Maximum number of independent orders
+                                       executed concurrently. 1 executes
+                                       orders one at a time.
             *args: Additional positional arguments.
             **kwargs: Additional keyword arguments.
 
@@ -743,6 +839,10 @@ class HierarchicalSwarm:
         self.multi_agent_prompt_improvements = (
             multi_agent_prompt_improvements
         )
+        self.max_parallel_orders = max(1, max_parallel_orders)
+        self._feedback_director_template: Optional[AgentTemplate] = (
+            None
+        )
 
         self.initialize_swarm()
 
@@ -1293,8 +1393,9 @@ class HierarchicalSwarm:
         """
         Generate feedback from the director based on agent outputs.
 
-        This method creates a feedback director agent that analyzes the results
-        from worker agents and provides specific, actionable feedback for improvement.
+        This method leases a feedback director agent, built once per swarm from an
+        AgentTemplate, that analyzes the results from worker agents and provides
+        specific, actionable feedback for improvement.
         The feedback is added to the conversation history and can be used in
         subsequent iterations.
 
@@ -1313,15 +1414,16 @@ class HierarchicalSwarm:
 
             task = f"History: {self.conversation.get_str()} \n\n"
 
-            feedback_director = Agent(
-                agent_name="Director",
-                agent_description="Director module that provides feedback to the worker agents",
-                model_name=self.director_model_name,
-                max_loops=1,
-                system_prompt=HIEARCHICAL_SWARM_SYSTEM_PROMPT,
-            )
+            if self._feedback_director_template is None:
+                self._feedback_director_template = AgentTemplate(
+                    agent_name="Director",
+                    agent_description="Director module that provides feedback to the worker agents",
+                    model_name=self.director_model_name,
+                    max_loops=1,
+                    system_prompt=HIEARCHICAL_SWARM_SYSTEM_PROMPT,
+                )
 
-            output = feedback_director.run(
+            output = self._feedback_director_template.run(
                 task=(
                     "You are the Director. Carefully review the outputs generated by all the worker agents in the previous step. "
                     "Provide specific, actionable feedback for each agent, highlighting strengths, weaknesses, and concrete suggestions for improvement. "
@@ -1353,6 +1455,8 @@ class HierarchicalSwarm:
             Callable[[str, str, bool], None]
         ] = None,
         *args,
+        history: Optional[str] = None,
+        record: bool = True,
         **kwargs,
     ):
         """
@@ -1369,6 +1473,10 @@ class HierarchicalSwarm:
                 Callback function for streaming agent outputs. Parameters are
                 (agent_name, chunk, is_final) where is_final indicates completion.
             *args: Additional positional arguments for the agent.
+            history (Optional[str]): Conversation snapshot given to the agent.
+                Defaults to the current conversation.
+            record (bool): Whether to add the output to the conversation.
+                execute_orders disables it to merge parallel outputs in order.
             **kwargs: Additional keyword arguments for the agent.
 
         Returns:
@@ -1408,6 +1516,9 @@ class HierarchicalSwarm:
                     agent_name, "RUNNING", task, "Executing task..."
                 )
 
+            if history is None:
+                history = self.conversation.get_str()
+
             # Handle streaming callback if provided
             if streaming_callback is not None:
 
@@ -1425,7 +1536,7 @@ class HierarchicalSwarm:
                             )
 
                 output = agent.run(
-                    task=f"History: {self.conversation.get_str()} \n\n Task: {task}",
+                    task=f"History: {history} \n\n Task: {task}",
                     streaming_callback=agent_streaming_callback,
                     *args,
                     **kwargs,
@@ -1441,11 +1552,12 @@ class HierarchicalSwarm:
                         )
             else:
                 output = agent.run(
-                    task=f"History: {self.conversation.get_str()} \n\n Task: {task}",
+                    task=f"History: {history} \n\n Task: {task}",
                     *args,
                     **kwargs,
                 )
-            self.conversation.add(role=agent_name, content=output)
+            if record:
+                self.conversation.add(role=agent_name, content=output)
 
             if self.verbose:
                 logger.success(
@@ -1619,9 +1731,14 @@ class HierarchicalSwarm:
         """
         Execute all orders from the director's output.
 
-        This method iterates through all hierarchical orders and calls the
-        appropriate agents to execute their assigned tasks. Each agent's
-        output is collected and returned as a list.
+        Orders are grouped into waves with ``schedule_order_waves``: an order
+        waits for the orders it depends on, for lower phases and for earlier
+        orders of the same agent. The orders of a wave run concurrently, at
+        most ``max_parallel_orders`` at a time, on the shared
+        ExecutionService, all seeing the conversation as it was when the
+        wave started. Their outputs are then added to the conversation in
+        the director's order, so the history does not depend on which agent
+        finished first.
 
         Args:
             orders (list): List of HierarchicalOrder objects to execute.
@@ -1630,7 +1747,8 @@ class HierarchicalSwarm:
                 (agent_name, chunk, is_final) where is_final indicates completion.
 
         Returns:
-            list: List of outputs from all executed orders.
+            list: List of outputs from all executed orders, in the order of
+                  ``orders``.
 
         Raises:
             Exception: If order execution fails.
@@ -1639,42 +1757,23 @@ class HierarchicalSwarm:
             if self.verbose:
                 logger.info(f"[EXEC] Executing {len(orders)} orders")
 
-            outputs = []
-            for i, order in enumerate(orders):
-                if self.verbose:
-                    logger.info(
-                        f"[ORDER] Executing order {i+1}/{len(orders)}: {order.agent_name}"
-                    )
-
-                # Update dashboard for agent execution
-                if self.interactive and self.dashboard:
-                    self.dashboard.update_agent_status(
-                        order.agent_name,
-                        "RUNNING",
-                        order.task,
-                        "Processing...",
-                    )
+            waves = schedule_order_waves(orders)
 
-                output = self.call_single_agent(
-                    order.agent_name,
-                    order.task,
-                    streaming_callback=streaming_callback,
+            if self.verbose:
+                logger.info(
+                    f"[SCHEDULE] {len(orders)} orders in {len(waves)} waves"
                 )
 
-                # Update dashboard with completed status
-                if self.interactive and self.dashboard:
-                    # Always show full output without truncation
-                    output_display = str(output)
-
-                    self.dashboard.update_agent_status(
-                        order.agent_name,
-                        "COMPLETED",
-                        order.task,
-                        output_display,
+            outputs = [None] * len(orders)
+            for wave in waves:
+                for start in range(
+                    0, len(wave), self.max_parallel_orders
+                ):
+                    batch = wave[start : start + self.max_parallel_orders]
+                    self._execute_order_batch(
+                        orders, batch, outputs, streaming_callback
                     )
 
-                outputs.append(output)
-
             if self.verbose:
                 logger.success(
                     f"[SUCCESS] All {len(orders)} orders executed successfully"
@@ -1686,6 +1785,99 @@ class HierarchicalSwarm:
             error_msg = f"[ERROR] Failed to setup director: {str(e)}\n[TRACE] Traceback: {traceback.format_exc()}\n[BUG] If this issue persists, please report it at: https://github.com/synarkos/synarkos/issues"
             logger.error(error_msg)
 
+    def _execute_order_batch(
+        self,
+        orders: list,
+        batch: List[int],
+        outputs: list,
+        streaming_callback: Optional[
+            Callable[[str, str, bool], None]
+        ] = None,
+    ):
+        """
+        Execute independent orders concurrently and record their outputs
+        in order.
+
+        Args:
+            orders (list): All orders of the step.
+            batch (List[int]): Indices of the orders to execute.
+            outputs (list): Outputs of the step, filled in place.
+            streaming_callback (Callable[[str, str, bool], None], optional):
+                Callback function for streaming agent outputs.
+        """
+        for i in batch:
+            order = orders[i]
+            if self.verbose:
+                logger.info(
+                    f"[ORDER] Executing order {i+1}/{len(orders)}: {order.agent_name}"
+                )
+
+            # Update dashboard for agent execution
+            if self.interactive and self.dashboard:
+                self.dashboard.update_agent_status(
+                    order.agent_name,
+                    "RUNNING",
+                    order.task,
+                    "Processing...",
+                )
+
+        history = self.conversation.get_str()
+        if len(batch) == 1:
+            order = orders[batch[0]]
+            results = {
+                batch[0]: self.call_single_agent(
+                    order.agent_name,
+                    order.task,
+                    streaming_callback=streaming_callback,
+                    history=history,
+                    record=False,
+                )
+            }
+        else:
+            agents = {
+                getattr(agent, "agent_name", None): agent
+                for agent in self.agents
+            }
+            executor = get_execution_service()
+            futures = {
+                i: executor.submit_model(
+                    model_key(agents.get(orders[i].agent_name)),
+                    self.call_single_agent,
+                    orders[i].agent_name,
+                    orders[i].task,
+                    streaming_callback=streaming_callback,
+                    history=history,
+                    record=False,
+                )
+                for i in batch
+            }
+            results = {
+                i: future.result() for i, future in futures.items()
+            }
+
+        for i in batch:
+            order = orders[i]
+            output = results[i]
+            outputs[i] = output
+
+            # Failed orders are logged by call_single_agent and not recorded
+            if output is not None:
+                self.conversation.add(
+                    role=order.agent_name, content=output
+                )
+
+            # Update dashboard with completed status
+            if self.interactive and self.dashboard:
+                # Always show full output without truncation
+                output_display = str(output)
+
+                self.dashboard.update_agent_status(
+                    order.agent_name,
+                    "COMPLETED",
+                    order.task,
+                    output_display,
+                )
+
     def batched_run(
         self,
         tasks: List[str],
@@ -4,6 +4,7 @@ from concurrent.futures import ThreadPoolExecutor
 from typing import Any, List
 
 from synarkos.structs.agent import Agent
+from synarkos.structs.agent_template import AgentTemplate
 from synarkos.structs.conversation import Conversation
 from synarkos.structs.multi_agent_exec import run_agents_concurrently
 from synarkos.structs.agent_group_id import agent_group_id
@@ -146,6 +147,11 @@ class MajorityVoting:
             model_name=consensus_agent_model_name,
             **additional_consensus_agent_kwargs,
         )
+        # Each consensus round leases a copy with fresh memory; the
+        # conversation already carries the history
+        self.consensus_template = AgentTemplate.from_agent(
+            self.consensus_agent
+        )
 
         self.reliability_check()
 
@@ -209,13 +215,15 @@ class MajorityVoting:
                     content=output,
                 )
 
+            consensus_agent = self.consensus_template.acquire()
+
             # Set streaming_on for the consensus agent based on the provided streaming_callback
-            self.consensus_agent.streaming_on = (
+            consensus_agent.streaming_on = (
                 streaming_callback is not None
             )
 
             # Instead of a simple passthrough wrapper, match the callback invocation pattern from the provided reference for the consensus agent:
-            consensus_agent_name = self.consensus_agent.agent_name
+            consensus_agent_name = consensus_agent.agent_name
 
             if streaming_callback is not None:
 
@@ -236,13 +244,16 @@ class MajorityVoting:
                 consensus_streaming_callback = None
 
             # Run the consensus agent with the streaming callback, if any
-            consensus_output = self.consensus_agent.run(
-                task=(f"History: {self.conversation.get_str()}"),
-                streaming_callback=consensus_streaming_callback,
-            )
+            try:
+                consensus_output = consensus_agent.run(
+                    task=(f"History: {self.conversation.get_str()}"),
+                    streaming_callback=consensus_streaming_callback,
+                )
+            finally:
+                self.consensus_template.release(consensus_agent)
 
             self.conversation.add(
-                role=self.consensus_agent.agent_name,
+                role=consensus_agent_name,
                 content=consensus_output,
             )
 
@@ -11,6 +11,8 @@ from loguru import logger
 
 from synarkos.structs.agent import Agent
 from synarkos.structs.omni_agent_types import AgentType
+from synarkos.telemetry.tracing import bind_trace_context
+from synarkos.utils.execution_service import get_execution_service
 
 
 def run_single_agent(
@@ -44,9 +46,9 @@ async def run_agent_async(agent: AgentType, task: str) -> Any:
     """
     Run an agent asynchronously using asyncio event loop.
 
-    This function executes a single agent asynchronously by running it in a
-    thread executor to avoid blocking the event loop. It's designed to be
-    used within async contexts for concurrent execution.
+    Agents with a native ``arun`` coroutine (such as ``Agent``) are awaited
+    directly on the event loop. Other agents are run in a thread executor to
+    avoid blocking the event loop.
 
     Args:
         agent (AgentType): The agent instance to execute asynchronously
@@ -61,6 +63,9 @@ async def run_agent_async(agent: AgentType, task: str) -> Any:
         ...     result = await run_agent_async(agent, "Process data")
         ...     return result
     """
+    if asyncio.iscoroutinefunction(getattr(agent, "arun", None)):
+        return await agent.arun(task=task)
+
     loop = asyncio.get_event_loop()
     return await loop.run_in_executor(
         None, run_single_agent, agent, task
@@ -105,17 +110,17 @@ def run_agents_concurrently(
     return_agent_output_dict: bool = False,
 ) -> Any:
     """
-    Execute multiple agents concurrently using a ThreadPoolExecutor.
+    Execute multiple agents concurrently on the shared ExecutionService.
 
     This function runs agent tasks in parallel threads, benefitting I/O-bound or mixed-load scenarios.
     Each agent receives the same 'task' (and optional 'img' argument) and runs its .run() method.
-    The number of worker threads defaults to 95% of the available CPU cores, unless otherwise specified.
+    Agents share the process-wide worker pool and per-model limits, unless max_workers asks for a dedicated pool.
 
     Args:
         agents (List[AgentType]): List of agent instances to execute concurrently.
         task (str): Task string to pass to all agent run() methods.
         img (Optional[str]): Optional image data to pass to agent run() if supported.
-        max_workers (Optional[int]): Maximum threads for the executor (default: 95% of CPU cores).
+        max_workers (Optional[int]): Size of a dedicated pool for this call (default: the shared ExecutionService).
         return_agent_output_dict (bool): If True, returns a dict mapping agent names to outputs.
                                          Otherwise returns a list of results in completion order.
 
@@ -126,8 +131,8 @@ def run_agents_concurrently(
                                      If an agent fails, the corresponding result is the Exception.
 
     Notes:
-        - ThreadPoolExecutor is used for efficient, parallel execution.
-        - By default, utilizes nearly all available CPU cores for optimal performance.
+        - Threads are sized for I/O-bound LLM calls, not CPU cores.
+        - Per-model limits from SYNARKOS_MODEL_CONCURRENCY apply by default.
         - Any Exception during agent execution is caught and included in the results.
         - If return_agent_output_dict is True, the results dict preserves agent input order.
         - Otherwise, the results list is in order of completion (not input order).
@@ -143,26 +148,31 @@ def run_agents_concurrently(
         ...     print(f"Result from {name}: {val}")
     """
     try:
-        if max_workers is None:
-            num_cores = os.cpu_count()
-            max_workers = int(num_cores * 0.95) if num_cores else 1
+        # A dedicated pool only when the caller asks for a specific
+        # size; otherwise agents share the process-wide service.
+        pool = (
+            ThreadPoolExecutor(max_workers=max_workers)
+            if max_workers is not None
+            else None
+        )
+        executor = pool or get_execution_service()
 
         futures = []
-        agent_id_map = {}
-
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=max_workers
-        ) as executor:
-            for agent in agents:
-                agent_kwargs = {}
-                if task is not None:
-                    agent_kwargs["task"] = task
-                if img is not None:
-                    agent_kwargs["img"] = img
-                future = executor.submit(agent.run, **agent_kwargs)
-                futures.append(future)
-                agent_id_map[future] = agent
+        for agent in agents:
+            agent_kwargs = {}
+            if task is not None:
+                agent_kwargs["task"] = task
+            if img is not None:
+                agent_kwargs["img"] = img
+            if pool is not None:
+                future = pool.submit(
+                    bind_trace_context(agent.run), **agent_kwargs
+                )
+            else:
+                future = executor.submit_agent(agent, **agent_kwargs)
+            futures.append(future)
 
+        try:
             if return_agent_output_dict:
                 # Use agent name as key, preserve input order
                 output_dict = {}
@@ -190,6 +200,9 @@ def run_agents_concurrently(
                     except Exception as e:
                         results.append(e)
                 return results
+        finally:
+            if pool is not None:
+                pool.shutdown()
 
     except Exception as e:
         logger.error(
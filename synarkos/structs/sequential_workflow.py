@@ -1,5 +1,4 @@
-import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import as_completed
 from typing import Callable, List, Optional, Union
 
 from synarkos.prompts.multi_agent_collab_prompt import (
@@ -7,6 +6,9 @@ from synarkos.prompts.multi_agent_collab_prompt import (
 )
 from synarkos.structs.agent import Agent
 from synarkos.structs.agent_rearrange import AgentRearrange
+from synarkos.structs.context_handoff import HandoffConfig
+from synarkos.telemetry.tracing import traced
+from synarkos.utils.execution_service import get_execution_service
 from synarkos.utils.loguru_logger import initialize_logger
 from synarkos.utils.output_types import OutputType
 
@@ -32,6 +34,7 @@ class SequentialWorkflow:
         shared_memory_system (callable): Optional callable for managing shared memory between agents.
         multi_agent_collab_prompt (bool): Whether to append a collaborative prompt to each agent.
         flow (str): String representation of the agent execution order.
+        context_mode (str): Context each agent receives, "full" or "delta".
         agent_rearrange (AgentRearrange): Internal helper for managing agent execution.
 
     Raises:
@@ -49,6 +52,8 @@ class SequentialWorkflow:
         shared_memory_system: callable = None,
         multi_agent_collab_prompt: bool = False,
         team_awareness: bool = False,
+        context_mode: str = "full",
+        handoff_config: Optional[HandoffConfig] = None,
         *args,
         **kwargs,
     ):
@@ -64,6 +69,11 @@ class SequentialWorkflow:
             output_type (OutputType, optional): Output format for the workflow. Defaults to "dict".
             shared_memory_system (callable, optional): Callable for shared memory management. Defaults to None.
             multi_agent_collab_prompt (bool, optional): If True, appends a collaborative prompt to each agent.
+            team_awareness (bool, optional): If True, agents are told their position in the flow.
+            context_mode (str, optional): "full" gives each agent the whole conversation; "delta" gives it
+                the task, a rolling summary and the previous agent's output, so long chains stay bounded.
+                Defaults to "full".
+            handoff_config (HandoffConfig, optional): Size limits of the "delta" handoff.
             *args: Additional positional arguments.
             **kwargs: Additional keyword arguments.
 
@@ -79,6 +89,7 @@ class SequentialWorkflow:
         self.shared_memory_system = shared_memory_system
         self.multi_agent_collab_prompt = multi_agent_collab_prompt
         self.team_awareness = team_awareness
+        self.context_mode = context_mode
 
         self.reliability_check()
         self.flow = self.sequential_flow()
@@ -91,6 +102,8 @@ class SequentialWorkflow:
             max_loops=self.max_loops,
             output_type=self.output_type,
             team_awareness=self.team_awareness,
+            context_mode=self.context_mode,
+            handoff_config=handoff_config,
         )
 
     def reliability_check(self):
@@ -158,6 +171,7 @@ class SequentialWorkflow:
 
         return flow
 
+    @traced("sequential_workflow.run")
     def run(
         self,
         task: str,
@@ -286,17 +300,14 @@ class SequentialWorkflow:
             )
 
         try:
-            with ThreadPoolExecutor(
-                max_workers=os.cpu_count()
-            ) as executor:
-                results = [
-                    executor.submit(self.agent_rearrange.run, task)
-                    for task in tasks
-                ]
-                return [
-                    result.result()
-                    for result in as_completed(results)
-                ]
+            executor = get_execution_service()
+            results = [
+                executor.submit(self.agent_rearrange.run, task)
+                for task in tasks
+            ]
+            return [
+                result.result() for result in as_completed(results)
+            ]
         except Exception as e:
             logger.error(
                 f"An error occurred while executing the batch of tasks concurrently: {e}"
@@ -0,0 +1,271 @@
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from synarkos.structs.safe_loading import SafeLoaderUtils
+
+CHECKPOINT_VERSION = 1
+
+
+class StateCheckpoint:
+    """
+    Incremental JSON-lines checkpoint of an object's state.
+
+    ``SafeStateManager`` rewrites every attribute on each save. A
+    checkpoint instead starts with one ``snapshot`` record holding the
+    safe attributes and the conversation messages, then appends a
+    ``delta`` record per save with only the attributes whose serialized
+    value changed and the messages added since the last save. A save
+    therefore costs the size of the change, plus re-encoding the small
+    configuration attributes to detect changes.
+
+    The file is compacted into a fresh snapshot, with an atomic replace,
+    every ``compact_interval`` deltas and whenever the conversation
+    changed in a way that is not a pure append (delete, update, clear,
+    truncation). ``load`` replays the snapshot and its deltas.
+
+    Attributes:
+        filepath (str): Path of the ``.jsonl`` checkpoint file.
+        memory_attr (str): Attribute holding the ``Conversation`` whose
+            messages are checkpointed.
+        compact_interval (int): Deltas appended before compacting.
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        memory_attr: str = "short_memory",
+        compact_interval: int = 50,
+    ):
+        self.filepath = filepath
+        self.memory_attr = memory_attr
+        self.compact_interval = max(1, int(compact_interval))
+
+        self._lock = threading.Lock()
+        self._fields: Dict[str, str] = {}
+        self._persisted = 0
+        self._history_id: Optional[int] = None
+        self._revision: Optional[int] = None
+        self._deltas = 0
+        self._dirty = True
+
+    def _memory(self, obj: Any) -> Any:
+        return getattr(obj, self.memory_attr, None)
+
+    def _history(self, obj: Any) -> List[Dict[str, Any]]:
+        memory = self._memory(obj)
+        return getattr(memory, "conversation_history", None) or []
+
+    def _encode_fields(self, obj: Any) -> Dict[str, str]:
+        """Serialize the safe public instance attributes of ``obj``."""
+        fields = {}
+        for name, value in list(vars(obj).items()):
+            if name.startswith("_") or name == self.memory_attr:
+                continue
+            # Class instances are runtime components, never state
+            if SafeLoaderUtils.is_class_instance(value):
+                continue
+            if not SafeLoaderUtils.is_safe_type(value):
+                continue
+            fields[name] = json.dumps(value, default=str)
+        return fields
+
+    def save(self, obj: Any) -> None:
+        """
+        Checkpoint ``obj``, appending only what changed since the last
+        save.
+
+        Args:
+            obj (Any): Object to checkpoint, usually an ``Agent``.
+        """
+        with self._lock:
+            fields = self._encode_fields(obj)
+            memory = self._memory(obj)
+            history = self._history(obj)
+            revision = getattr(memory, "_history_revision", None)
+
+            if (
+                self._dirty
+                or self._deltas >= self.compact_interval
+                or self._history_id != id(history)
+                or self._revision != revision
+                or len(history) < self._persisted
+            ):
+                self._compact(fields, history, revision)
+                return
+
+            changed = [
+                (name, encoded)
+                for name, encoded in fields.items()
+                if self._fields.get(name) != encoded
+            ]
+            removed = [
+                name for name in self._fields if name not in fields
+            ]
+            messages = history[self._persisted :]
+            if not (changed or removed or messages):
+                return
+
+            # Reuse the encoded values instead of serializing them again
+            record = (
+                '{"type": "delta", "set": {'
+                + ", ".join(
+                    f"{json.dumps(name)}: {encoded}"
+                    for name, encoded in changed
+                )
+                + "}, "
+                + f'"unset": {json.dumps(removed)}, '
+                + f'"messages": {json.dumps(messages, default=str)}'
+                + "}\n"
+            )
+            with open(self.filepath, "a", encoding="utf-8") as f:
+                f.write(record)
+                f.flush()
+                os.fsync(f.fileno())
+
+            self._fields = fields
+            self._persisted = len(history)
+            self._deltas += 1
+
+    def compact(self, obj: Any) -> None:
+        """
+        Rewrite the checkpoint as a single snapshot of ``obj``.
+
+        Args:
+            obj (Any): Object to checkpoint.
+        """
+        with self._lock:
+            memory = self._memory(obj)
+            self._compact(
+                self._encode_fields(obj),
+                self._history(obj),
+                getattr(memory, "_history_revision", None),
+            )
+
+    def _compact(
+        self,
+        fields: Dict[str, str],
+        history: List[Dict[str, Any]],
+        revision: Optional[int],
+    ) -> None:
+        directory = os.path.dirname(self.filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        record = (
+            f'{{"type": "snapshot", "version": {CHECKPOINT_VERSION}, '
+            + '"state": {'
+            + ", ".join(
+                f"{json.dumps(name)}: {encoded}"
+                for name, encoded in fields.items()
+            )
+            + "}, "
+            + f'"messages": {json.dumps(history, default=str)}'
+            + "}\n"
+        )
+        temp_path = f"{self.filepath}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(record)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.filepath)
+
+        self._fields = fields
+        self._persisted = len(history)
+        self._history_id = id(history)
+        self._revision = revision
+        self._deltas = 0
+        self._dirty = False
+        logger.debug(
+            f"Compacted state checkpoint {self.filepath} ({len(fields)} fields, {len(history)} messages)"
+        )
+
+    def read(self) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Replay the checkpoint file.
+
+        A partially written trailing record (e.g. after a crash) is
+        skipped, and the next save compacts the file.
+
+        Returns:
+            Tuple[Dict[str, Any], List[Dict[str, Any]]]: The state and the
+            conversation messages.
+
+        Raises:
+            FileNotFoundError: If the checkpoint file does not exist.
+        """
+        if not os.path.exists(self.filepath):
+            raise FileNotFoundError(
+                f"State file not found: {self.filepath}"
+            )
+
+        state: Dict[str, Any] = {}
+        messages: List[Dict[str, Any]] = []
+        deltas = 0
+        with open(self.filepath, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    self._dirty = True
+                    logger.warning(
+                        f"Skipping corrupted checkpoint line {line_number} in {self.filepath}"
+                    )
+                    continue
+
+                if record.get("type") == "snapshot":
+                    state = record.get("state", {})
+                    messages = record.get("messages", [])
+                    deltas = 0
+                else:
+                    state.update(record.get("set", {}))
+                    for name in record.get("unset", []):
+                        state.pop(name, None)
+                    messages.extend(record.get("messages", []))
+                    deltas += 1
+
+        self._deltas = deltas
+        return state, messages
+
+    def load(self, obj: Any) -> None:
+        """
+        Restore ``obj`` from the checkpoint, keeping its class instances.
+
+        Later saves append to the loaded checkpoint instead of rewriting it.
+
+        Args:
+            obj (Any): Object to load state into.
+
+        Raises:
+            FileNotFoundError: If the checkpoint file does not exist.
+        """
+        with self._lock:
+            self._dirty = False
+            state, messages = self.read()
+
+            preserved = SafeLoaderUtils.preserve_instances(obj)
+            for name, value in state.items():
+                if not name.startswith("_") and name not in preserved:
+                    setattr(obj, name, value)
+
+            memory = self._memory(obj)
+            if memory is not None:
+                memory.restore(messages, copy_messages=False)
+
+            self._fields = self._encode_fields(obj)
+            history = self._history(obj)
+            self._persisted = len(history)
+            self._history_id = id(history)
+            self._revision = getattr(
+                memory, "_history_revision", None
+            )
+
+        logger.info(
+            f"Successfully loaded state from: {self.filepath}"
+        )
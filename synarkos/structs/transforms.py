@@ -4,7 +4,7 @@ from typing import Any, Dict, List, Optional
 from loguru import logger
 
 from synarkos.structs.conversation import Conversation
-from synarkos.utils.litellm_tokenizer import count_tokens
+from synarkos.utils.litellm_tokenizer import count_tokens_batch
 
 
 @dataclass
@@ -331,19 +331,15 @@ class MessageTransforms:
         self, messages: List[Dict[str, Any]]
     ) -> int:
         """Count total tokens in a list of messages."""
-        total_tokens = 0
+        texts = []
         for message in messages:
             content = message.get("content", "")
             if isinstance(content, str):
-                total_tokens += count_tokens(
-                    content, self.config.model_name
-                )
+                texts.append(content)
             elif isinstance(content, (list, dict)):
                 # Handle structured content
-                total_tokens += count_tokens(
-                    str(content), self.config.model_name
-                )
-        return total_tokens
+                texts.append(str(content))
+        return sum(count_tokens_batch(texts, self.config.model_name))
 
     def _get_model_context_limit(
         self, model_name: str
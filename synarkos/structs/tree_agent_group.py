@@ -3,11 +3,18 @@ from collections import Counter
 from datetime import datetime, timezone
 from typing import Any, List, Optional
 
-from litellm import embedding
 from pydantic import BaseModel, Field
 
 from synarkos.structs.agent import Agent
 from synarkos.structs.conversation import Conversation
+from synarkos.utils.embedding_cache import get_embedding_cache
+from synarkos.utils.embedding_index import (
+    EmbeddingIndex,
+    embed_texts,
+)
+from synarkos.utils.embedding_index import (
+    cosine_similarity as _cosine_similarity,
+)
 from synarkos.utils.loguru_logger import initialize_logger
 
 logger = initialize_logger(log_folder="tree_swarm")
@@ -39,19 +46,11 @@ def cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
         vec2 (List[float]): Second vector
 
     Returns:
-        float: Cosine similarity score between 0 and 1
+        float: Cosine similarity score, 0.0 if the vectors have different lengths
     """
-    # Calculate dot product
-    dot_product = sum(a * b for a, b in zip(vec1, vec2))
-
-    # Calculate norms
-    norm1 = sum(a * a for a in vec1) ** 0.5
-    norm2 = sum(b * b for b in vec2) ** 0.5
-
-    if norm1 == 0 or norm2 == 0:
+    if len(vec1) != len(vec2):
         return 0.0
-
-    return dot_product / (norm1 * norm2)
+    return _cosine_similarity(vec1, vec2)
 
 
 # Pydantic Models for Logging
@@ -137,6 +136,7 @@ class TreeAgent(Agent):
         agent_name: Optional[str] = None,
         embedding_model_name: str = "text-embedding-ada-002",
         verbose: bool = False,
+        cache_embeddings: bool = False,
         *args,
         **kwargs,
     ):
@@ -151,6 +151,7 @@ class TreeAgent(Agent):
             agent_name (Optional[str]): Alternative name for the agent
             embedding_model_name (str): Name of the embedding model to use
             verbose (bool): Whether to enable verbose logging
+            cache_embeddings (bool): Reuse embeddings from the persistent on-disk cache (off by default)
             *args: Additional positional arguments
             **kwargs: Additional keyword arguments
         """
@@ -166,6 +167,9 @@ class TreeAgent(Agent):
         )
         self.embedding_model_name = embedding_model_name
         self.verbose = verbose
+        self.embedding_cache = (
+            get_embedding_cache() if cache_embeddings else None
+        )
 
         # Generate system prompt embedding using litellm
         if system_prompt:
@@ -194,33 +198,11 @@ class TreeAgent(Agent):
             List[float]: Embedding vector
         """
         try:
-            response = embedding(
-                model=self.embedding_model_name, input=[text]
-            )
-            if self.verbose:
-                logger.info(f"Embedding type: {type(response)}")
-            # print(response)
-            # Handle different response structures from litellm
-            if hasattr(response, "data") and response.data:
-                if hasattr(response.data[0], "embedding"):
-                    return response.data[0].embedding
-                elif (
-                    isinstance(response.data[0], dict)
-                    and "embedding" in response.data[0]
-                ):
-                    return response.data[0]["embedding"]
-                else:
-                    if self.verbose:
-                        logger.error(
-                            f"Unexpected response structure: {response.data[0]}"
-                        )
-                    return [0.0] * 1536
-            else:
-                if self.verbose:
-                    logger.error(
-                        f"Unexpected response structure: {response}"
-                    )
-                return [0.0] * 1536
+            return embed_texts(
+                [text],
+                model=self.embedding_model_name,
+                cache=self.embedding_cache,
+            )[0]
         except Exception as e:
             if self.verbose:
                 logger.error(f"Error getting embedding: {e}")
@@ -292,7 +274,10 @@ class TreeAgent(Agent):
         return result
 
     def is_relevant_for_task(
-        self, task: str, threshold: float = 0.7
+        self,
+        task: str,
+        threshold: float = 0.7,
+        similarity: Optional[float] = None,
     ) -> bool:
         """
         Checks if the agent is relevant for the given task using both keyword matching and embedding similarity.
@@ -300,6 +285,7 @@ class TreeAgent(Agent):
         Args:
             task (str): The task or query for which we need to find a relevant agent.
             threshold (float): The cosine similarity threshold for embedding-based matching.
+            similarity (Optional[float]): Precomputed task similarity, skips embedding the task.
 
         Returns:
             bool: True if the agent is relevant, False otherwise.
@@ -312,10 +298,11 @@ class TreeAgent(Agent):
 
         # Perform embedding similarity match if keyword match is not found
         if not keyword_match and self.system_prompt_embedding:
-            task_embedding = self._get_embedding(task)
-            similarity = cosine_similarity(
-                self.system_prompt_embedding, task_embedding
-            )
+            if similarity is None:
+                task_embedding = self._get_embedding(task)
+                similarity = cosine_similarity(
+                    self.system_prompt_embedding, task_embedding
+                )
             if self.verbose:
                 logger.info(
                     f"Semantic similarity between task and {self.agent_name}: {similarity:.2f}"
@@ -369,6 +356,75 @@ class Tree:
 
         # Sort agents by distance after calculation
         self.agents.sort(key=lambda agent: agent.distance)
+        self._build_embedding_index()
+
+    def _build_embedding_index(self):
+        """
+        Stack the agents' system prompt embeddings into one normalized matrix
+        so a task is scored against every agent with a single product.
+        """
+        self._embedding_rows = {}
+        self._embedding_index = None
+        self._indexed_agent_ids = [id(agent) for agent in self.agents]
+
+        embedded = [
+            (i, agent.system_prompt_embedding)
+            for i, agent in enumerate(self.agents)
+            if agent.system_prompt_embedding
+        ]
+        models = {
+            self.agents[i].embedding_model_name for i, _ in embedded
+        }
+        if not embedded or len(models) > 1:
+            return
+
+        try:
+            index = EmbeddingIndex()
+            rows = index.add_batch([vector for _, vector in embedded])
+        except ValueError as e:
+            # Mixed embedding sizes; score agents one by one
+            if self.verbose:
+                logger.warning(
+                    f"Tree '{self.tree_name}' falls back to per-agent similarity: {e}"
+                )
+            return
+
+        self._embedding_rows = {
+            position: row
+            for (position, _), row in zip(embedded, rows)
+        }
+        self._embedding_index = index
+
+    def _task_similarities(self, task: str) -> Optional[List[float]]:
+        """
+        Score a task against every agent with one embedding call.
+
+        Args:
+            task (str): The task to score.
+
+        Returns:
+            Optional[List[float]]: Similarity per agent (None where an agent has
+            no embedding), or None when the index is unavailable.
+        """
+        if self._indexed_agent_ids != [id(a) for a in self.agents]:
+            self._build_embedding_index()
+        if self._embedding_index is None:
+            return None
+
+        embedder = self.agents[next(iter(self._embedding_rows))]
+        task_embedding = embedder._get_embedding(task)
+        if len(task_embedding) != self._embedding_index.dimension:
+            return None
+
+        scores = self._embedding_index.scores(task_embedding)
+        return [
+            (
+                float(scores[self._embedding_rows[i]])
+                if i in self._embedding_rows
+                else None
+            )
+            for i in range(len(self.agents))
+        ]
 
     def find_relevant_agent(self, task: str) -> Optional[TreeAgent]:
         """
@@ -385,8 +441,26 @@ class Tree:
             logger.info(
                 f"Searching relevant agent in tree '{self.tree_name}' for task: {task}"
             )
-        for agent in self.agents:
-            if agent.is_relevant_for_task(task):
+        similarities = None
+        for i, agent in enumerate(self.agents):
+            keyword_match = any(
+                keyword.lower() in task.lower()
+                for keyword in agent.relevant_keywords
+            )
+            if (
+                not keyword_match
+                and agent.system_prompt_embedding
+                and similarities is None
+            ):
+                # Embed the task once, lazily, for the whole tree
+                similarities = self._task_similarities(task) or [
+                    None
+                ] * len(self.agents)
+
+            similarity = similarities[i] if similarities else None
+            if agent.is_relevant_for_task(
+                task, similarity=similarity
+            ):
                 return agent
         if self.verbose:
             logger.warning(
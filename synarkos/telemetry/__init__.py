@@ -1,3 +1,18 @@
+from synarkos.telemetry.exporter import (
+    FileSink,
+    HTTPSink,
+    NullSink,
+    TelemetryExporter,
+    get_telemetry_exporter,
+)
+from synarkos.telemetry.tracing import (
+    Tracer,
+    bind_trace_context,
+    enable_tracing,
+    get_tracer,
+    trace_span,
+    traced,
+)
 from synarkos.telemetry.main import (
     generate_user_id,
     get_machine_id,
@@ -10,4 +25,15 @@ __all__ = [
     "get_machine_id",
     "get_comprehensive_system_info",
     "log_agent_data",
+    "TelemetryExporter",
+    "get_telemetry_exporter",
+    "HTTPSink",
+    "FileSink",
+    "NullSink",
+    "Tracer",
+    "get_tracer",
+    "enable_tracing",
+    "trace_span",
+    "traced",
+    "bind_trace_context",
 ]
@@ -0,0 +1,414 @@
+import atexit
+import datetime
+import gzip
+import json
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+from loguru import logger
+
+TELEMETRY_URL = "https://synarkos.world/api/get-agents/log-agents"
+TELEMETRY_KEY = "Bearer sk-33979fd9a4e8e6b670090e4900a33dbe7452a15ccc705745f4eca2a70c88ea24"
+
+_STOP = object()
+
+
+def encode_batch(
+    records: List[Dict[str, Any]], system_data: Dict[str, Any]
+) -> bytes:
+    """
+    Serialize and gzip one batch of telemetry records.
+
+    The system-info snapshot is sent once per batch instead of once per
+    record.
+
+    Args:
+        records (List[Dict[str, Any]]): Records queued by ``submit``.
+        system_data (Dict[str, Any]): System information snapshot.
+
+    Returns:
+        bytes: Gzip-compressed, newline-terminated JSON document.
+    """
+    body = json.dumps(
+        {"data": {"batch": records, "system_data": system_data}},
+        default=str,
+    )
+    return gzip.compress(f"{body}\n".encode("utf-8"), compresslevel=6)
+
+
+def encode_records(
+    records: List[Dict[str, Any]], system_data: Dict[str, Any]
+) -> List[bytes]:
+    """
+    Serialize records one by one in the original telemetry wire format.
+
+    Each body is ``{"data": {"data", "system_data", "timestamp"}}``, as
+    ``_log_agent_data`` sends it.
+
+    Args:
+        records (List[Dict[str, Any]]): Records queued by ``submit``.
+        system_data (Dict[str, Any]): System information snapshot.
+
+    Returns:
+        List[bytes]: One uncompressed JSON body per record.
+    """
+    return [
+        json.dumps(
+            {
+                "data": {
+                    "data": record["data"],
+                    "system_data": system_data,
+                    "timestamp": record["timestamp"],
+                }
+            },
+            default=str,
+        ).encode("utf-8")
+        for record in records
+    ]
+
+
+class NullSink:
+    """Sink that discards every batch."""
+
+    def send(self, payload: bytes, records: int) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class FileSink:
+    """
+    Sink appending each batch as a gzip member to a local file.
+
+    Concatenated gzip members form a valid gzip stream, so the file can be
+    read back with ``gzip.open`` as one JSON document per line.
+
+    Attributes:
+        path (Path): The output file.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+
+    def send(self, payload: bytes, records: int) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "ab") as f:
+            f.write(payload)
+
+    def close(self) -> None:
+        pass
+
+
+class HTTPSink:
+    """
+    Sink posting telemetry to an HTTP endpoint.
+
+    Reuses one ``requests.Session``, so posts share a keep-alive
+    connection. By default every record is posted on its own in the
+    original wire format, which is what the default endpoint accepts.
+    With ``batched=True`` each batch is posted as one gzip-compressed
+    document from ``encode_batch``, for endpoints that accept it. Point
+    ``url`` at a local stand-in for testing.
+
+    Attributes:
+        url (str): The telemetry endpoint.
+        batched (bool): Post gzip-compressed batches instead of records.
+        timeout (float): Per-request timeout in seconds.
+    """
+
+    def __init__(
+        self,
+        url: str = TELEMETRY_URL,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 10,
+        batched: bool = False,
+    ):
+        self.url = url
+        self.batched = batched
+        self.timeout = timeout
+        self._session = requests.Session()
+        self._session.headers.update(
+            {
+                "Content-Type": "application/json",
+                "Authorization": TELEMETRY_KEY,
+                **(headers or {}),
+            }
+        )
+
+    def encode(
+        self,
+        records: List[Dict[str, Any]],
+        system_data: Dict[str, Any],
+    ) -> Any:
+        """Encode a batch into the payload ``send`` expects."""
+        if self.batched:
+            return encode_batch(records, system_data)
+        return encode_records(records, system_data)
+
+    def send(self, payload: Any, records: int) -> None:
+        if self.batched:
+            response = self._session.post(
+                self.url,
+                data=payload,
+                headers={"Content-Encoding": "gzip"},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            return
+        for body in payload:
+            response = self._session.post(
+                self.url, data=body, timeout=self.timeout
+            )
+            response.raise_for_status()
+
+    def close(self) -> None:
+        self._session.close()
+
+
+def sink_from_env() -> Any:
+    """
+    Build the telemetry sink selected by environment variables.
+
+    ``SYNARKOS_TELEMETRY_SINK`` is ``http`` (default), ``file`` or
+    ``none``. The default endpoint receives one post per record in the
+    original wire format; setting ``SYNARKOS_TELEMETRY_URL`` switches to
+    that endpoint with gzip-compressed batches. ``SYNARKOS_TELEMETRY_FILE``
+    sets the output file, which defaults to ``telemetry.jsonl.gz`` under
+    ``WORKSPACE_DIR``.
+
+    Returns:
+        Any: A ``HTTPSink``, ``FileSink`` or ``NullSink``.
+    """
+    kind = os.getenv("SYNARKOS_TELEMETRY_SINK", "http").lower()
+    if kind in ("none", "null", "off", "false", "0"):
+        return NullSink()
+    if kind == "file":
+        path = os.getenv("SYNARKOS_TELEMETRY_FILE") or (
+            Path(os.getenv("WORKSPACE_DIR") or ".")
+            / "telemetry.jsonl.gz"
+        )
+        return FileSink(path)
+    url = os.getenv("SYNARKOS_TELEMETRY_URL")
+    if url:
+        return HTTPSink(url, batched=True)
+    return HTTPSink()
+
+
+class TelemetryExporter:
+    """
+    Background, batching telemetry exporter.
+
+    ``submit`` only timestamps the record and puts it on a bounded queue;
+    when the queue is full the record is dropped and counted instead of
+    blocking the caller. A daemon thread drains the queue into batches of
+    up to ``batch_size`` records (or whatever arrived within
+    ``flush_interval`` seconds), encodes them and hands them to the sink.
+    Sink failures are counted and logged at debug level, never raised;
+    the first one is logged as a warning only when the sink was chosen
+    explicitly with ``SYNARKOS_TELEMETRY_SINK`` or
+    ``SYNARKOS_TELEMETRY_URL``, so offline processes stay quiet.
+
+    Attributes:
+        sink (Any): Object with ``send(payload, records)`` and ``close()``,
+            and optionally ``encode(records, system_data)`` to choose the
+            payload format; ``encode_batch`` is used otherwise.
+        sent (int): Records delivered to the sink.
+        dropped (int): Records dropped because the queue was full.
+        failed (int): Records lost to sink errors.
+    """
+
+    def __init__(
+        self,
+        sink: Any = None,
+        max_queue_size: int = 10000,
+        batch_size: int = 100,
+        flush_interval: float = 5.0,
+        system_info: Optional[Callable[[], Dict[str, Any]]] = None,
+    ):
+        self.sink = sink if sink is not None else sink_from_env()
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self._system_info = system_info
+        self._system_data: Optional[Dict[str, Any]] = None
+        self._queue: "queue.Queue" = queue.Queue(
+            maxsize=max(1, max_queue_size)
+        )
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self.sent = 0
+        self.dropped = 0
+        self.failed = 0
+        self._warn_on_failure = bool(
+            os.getenv("SYNARKOS_TELEMETRY_SINK")
+            or os.getenv("SYNARKOS_TELEMETRY_URL")
+        )
+
+    def _ensure_worker(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._worker,
+                    name="synarkos-telemetry",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def submit(self, data_dict: Dict[str, Any]) -> bool:
+        """
+        Queue a record for export without blocking.
+
+        Args:
+            data_dict (Dict[str, Any]): The telemetry record.
+
+        Returns:
+            bool: False if the record was dropped.
+        """
+        if self._closed:
+            return False
+        record = {
+            "data": data_dict,
+            "timestamp": datetime.datetime.now(
+                datetime.timezone.utc
+            ).isoformat(),
+        }
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            return False
+        self._ensure_worker()
+        return True
+
+    def _snapshot(self) -> Dict[str, Any]:
+        if self._system_data is None:
+            try:
+                if self._system_info is None:
+                    from synarkos.telemetry.main import (
+                        get_comprehensive_system_info,
+                    )
+
+                    self._system_info = get_comprehensive_system_info
+                self._system_data = self._system_info()
+            except Exception as e:
+                self._system_data = {"error": str(e)}
+        return self._system_data
+
+    def _export(self, batch: List[Dict[str, Any]]) -> None:
+        if not batch:
+            return
+        encode = getattr(self.sink, "encode", encode_batch)
+        try:
+            self.sink.send(
+                encode(batch, self._snapshot()), len(batch)
+            )
+            self.sent += len(batch)
+        except Exception as e:
+            log = (
+                logger.warning
+                if self._warn_on_failure and not self.failed
+                else logger.debug
+            )
+            self.failed += len(batch)
+            log(f"Telemetry export failed: {e}")
+
+    def _worker(self) -> None:
+        batch: List[Dict[str, Any]] = []
+        deadline = None
+        while True:
+            timeout = (
+                None
+                if deadline is None
+                else max(0.0, deadline - time.monotonic())
+            )
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self._export(batch)
+                batch, deadline = [], None
+                continue
+
+            if item is _STOP or isinstance(item, threading.Event):
+                self._export(batch)
+                batch, deadline = [], None
+                if item is _STOP:
+                    return
+                item.set()
+                continue
+
+            batch.append(item)
+            if deadline is None:
+                deadline = time.monotonic() + self.flush_interval
+            if len(batch) >= self.batch_size:
+                self._export(batch)
+                batch, deadline = [], None
+
+    def flush(self, timeout: Optional[float] = 10) -> bool:
+        """
+        Export everything queued so far.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait for the export.
+
+        Returns:
+            bool: True if the queue was drained within ``timeout``.
+        """
+        if self._thread is None or not self._thread.is_alive():
+            return self._queue.empty()
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def shutdown(self, timeout: Optional[float] = 10) -> None:
+        """
+        Flush pending records, stop the worker and close the sink.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait for the worker.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None and self._thread.is_alive():
+            try:
+                self._queue.put(_STOP, timeout=timeout)
+                self._thread.join(timeout)
+            except queue.Full:
+                pass
+        try:
+            self.sink.close()
+        except Exception:
+            pass
+
+
+_shared_exporter: Optional[TelemetryExporter] = None
+_shared_exporter_lock = threading.Lock()
+
+
+def get_telemetry_exporter() -> TelemetryExporter:
+    """
+    Return the process-wide ``TelemetryExporter``.
+
+    The exporter is created on first use with the sink chosen by
+    ``sink_from_env`` and is flushed at interpreter exit.
+
+    Returns:
+        TelemetryExporter: The shared exporter.
+    """
+    global _shared_exporter
+    with _shared_exporter_lock:
+        if _shared_exporter is None:
+            _shared_exporter = TelemetryExporter()
+            atexit.register(_shared_exporter.shutdown, 2)
+        return _shared_exporter
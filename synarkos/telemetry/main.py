@@ -9,6 +9,12 @@ import psutil
 import requests
 from functools import lru_cache
 
+from synarkos.telemetry.exporter import (
+    TELEMETRY_KEY,
+    TELEMETRY_URL,
+    get_telemetry_exporter,
+)
+
 
 # Helper functions
 def generate_user_id():
@@ -93,9 +99,9 @@ def get_comprehensive_system_info() -> Dict[str, Any]:
 
 
 def _log_agent_data(data_dict: dict):
-    """Simple function to log agent data using requests library"""
+    """Send one record synchronously, bypassing the background exporter"""
 
-    url = "https://synarkos.world/api/get-agents/log-agents"
+    url = TELEMETRY_URL
 
     log = {
         "data": data_dict,
@@ -109,7 +115,7 @@ def _log_agent_data(data_dict: dict):
         "data": log,
     }
 
-    key = "Bearer sk-33979fd9a4e8e6b670090e4900a33dbe7452a15ccc705745f4eca2a70c88ea24"
+    key = TELEMETRY_KEY
 
     headers = {
         "Content-Type": "application/json",
@@ -128,7 +134,11 @@ def _log_agent_data(data_dict: dict):
 
 
 def log_agent_data(data_dict: dict):
+    """Queue agent data for the background telemetry exporter.
+
+    Never blocks: the record is dropped if the exporter queue is full.
+    """
     try:
-        _log_agent_data(data_dict)
+        get_telemetry_exporter().submit(data_dict)
     except Exception:
         pass
@@ -0,0 +1,306 @@
+import atexit
+import contextvars
+import functools
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+_NULL_SPAN = nullcontext()
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = (
+    contextvars.ContextVar("synarkos_current_span", default=None)
+)
+
+
+class Span:
+    """
+    One timed phase, recorded when the ``with`` block exits.
+
+    Spans nest through a context variable, so child spans started in the
+    same thread, in awaited coroutines, or in functions wrapped with
+    ``bind_trace_context`` record their parent's id.
+
+    Attributes:
+        name (str): Phase name, e.g. ``agent.call_llm``.
+        attrs (Dict[str, Any]): Extra attributes exported as trace args.
+    """
+
+    __slots__ = (
+        "tracer",
+        "name",
+        "attrs",
+        "span_id",
+        "parent_id",
+        "start",
+        "_token",
+    )
+
+    def __init__(
+        self, tracer: "Tracer", name: str, attrs: Dict[str, Any]
+    ):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        self.span_id = tracer._next_id()
+        self.parent_id = None
+        self.start = 0
+        self._token = None
+
+    def __enter__(self) -> "Span":
+        parent = _current_span.get()
+        self.parent_id = (
+            parent.span_id if parent is not None else None
+        )
+        self._token = _current_span.set(self)
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        end = time.perf_counter_ns()
+        _current_span.reset(self._token)
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+        self.tracer._record(self, end)
+
+
+class Tracer:
+    """
+    In-process span recorder exporting Chrome trace files.
+
+    Finished spans are kept as Chrome trace "complete" events in a bounded
+    ring buffer, so tracing can stay on in long-running processes. While
+    disabled, ``span`` returns a shared no-op context manager.
+
+    Attributes:
+        enabled (bool): Whether spans are recorded.
+        max_events (int): Capacity of the event buffer.
+    """
+
+    def __init__(
+        self, enabled: bool = False, max_events: int = 100000
+    ):
+        self.enabled = enabled
+        self.max_events = max_events
+        self._events: deque = deque(maxlen=max_events)
+        self._ids = itertools.count(1)
+        self._epoch = time.perf_counter_ns()
+        self._pid = os.getpid()
+
+    def _next_id(self) -> int:
+        # next() on itertools.count is atomic under the GIL
+        return next(self._ids)
+
+    def _record(self, span: Span, end: int) -> None:
+        args = dict(span.attrs)
+        args["span_id"] = span.span_id
+        if span.parent_id is not None:
+            args["parent_id"] = span.parent_id
+        self._events.append(
+            {
+                "name": span.name,
+                "cat": span.name.split(".", 1)[0],
+                "ph": "X",
+                "ts": (span.start - self._epoch) / 1000,
+                "dur": (end - span.start) / 1000,
+                "pid": self._pid,
+                "tid": threading.get_ident(),
+                "args": args,
+            }
+        )
+
+    def span(self, name: str, **attrs: Any):
+        """
+        Start a span for a ``with`` block.
+
+        Args:
+            name (str): Phase name.
+            **attrs (Any): Attributes recorded with the span.
+
+        Returns:
+            A context manager; a shared no-op one while disabled.
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return Span(self, name, attrs)
+
+    def events(self) -> List[Dict[str, Any]]:
+        """Copy of the recorded Chrome trace events."""
+        return list(self._events)
+
+    def clear(self) -> None:
+        """Drop every recorded event."""
+        self._events.clear()
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Per-phase latency statistics in milliseconds.
+
+        Returns:
+            Dict[str, Dict[str, float]]: ``count``, ``total_ms``,
+            ``mean_ms``, ``p50_ms``, ``p99_ms`` and ``max_ms`` per span name.
+        """
+        durations: Dict[str, List[float]] = {}
+        for event in self.events():
+            durations.setdefault(event["name"], []).append(
+                event["dur"] / 1000
+            )
+
+        stats = {}
+        for name, values in sorted(durations.items()):
+            array = np.asarray(values)
+            stats[name] = {
+                "count": len(values),
+                "total_ms": float(array.sum()),
+                "mean_ms": float(array.mean()),
+                "p50_ms": float(np.percentile(array, 50)),
+                "p99_ms": float(np.percentile(array, 99)),
+                "max_ms": float(array.max()),
+            }
+        return stats
+
+    def export_chrome_trace(self, path: str) -> str:
+        """
+        Write recorded spans as a Chrome trace (``chrome://tracing``,
+        Perfetto) JSON file.
+
+        Args:
+            path (str): Output file.
+
+        Returns:
+            str: The path written.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "traceEvents": self.events(),
+                    "displayTimeUnit": "ms",
+                    "otherData": {"summary": self.summary()},
+                },
+                f,
+                default=str,
+            )
+        return str(path)
+
+
+def _tracer_from_env() -> Tracer:
+    trace_file = os.getenv("SYNARKOS_TRACE_FILE")
+    enabled = bool(trace_file) or os.getenv(
+        "SYNARKOS_TRACE", "false"
+    ).lower() in ("1", "true", "yes")
+    tracer = Tracer(enabled=enabled)
+    if trace_file:
+        atexit.register(tracer.export_chrome_trace, trace_file)
+    return tracer
+
+
+_tracer = _tracer_from_env()
+
+
+def get_tracer() -> Tracer:
+    """
+    Return the process-wide ``Tracer``.
+
+    It starts enabled when ``SYNARKOS_TRACE`` is true or
+    ``SYNARKOS_TRACE_FILE`` is set; the latter also exports a Chrome
+    trace to that file at interpreter exit.
+
+    Returns:
+        Tracer: The shared tracer.
+    """
+    return _tracer
+
+
+def enable_tracing(enabled: bool = True) -> Tracer:
+    """
+    Turn span recording on or off for the process.
+
+    Args:
+        enabled (bool): Whether to record spans.
+
+    Returns:
+        Tracer: The shared tracer.
+    """
+    _tracer.enabled = enabled
+    return _tracer
+
+
+def trace_span(name: str, **attrs: Any):
+    """
+    Start a span on the shared tracer.
+
+    Args:
+        name (str): Phase name.
+        **attrs (Any): Attributes recorded with the span.
+
+    Returns:
+        A context manager; a shared no-op one while tracing is disabled.
+    """
+    if not _tracer.enabled:
+        return _NULL_SPAN
+    return Span(_tracer, name, attrs)
+
+
+def traced(
+    name: str, attrs: Optional[Callable[..., Dict[str, Any]]] = None
+):
+    """
+    Decorator recording each call of a function as a span.
+
+    Args:
+        name (str): Phase name.
+        attrs (Optional[Callable[..., Dict[str, Any]]]): Called with the
+            function's arguments to build span attributes, only while
+            tracing is enabled.
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _tracer.enabled:
+                return func(*args, **kwargs)
+            span_attrs = attrs(*args, **kwargs) if attrs else {}
+            with Span(_tracer, name, span_attrs):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def bind_trace_context(func: Callable) -> Callable:
+    """
+    Carry the current span into a function run on another thread.
+
+    Call this at submission time, e.g.
+    ``executor.submit(bind_trace_context(agent.run), task)``, so spans
+    opened by the worker nest under the submitting span.
+
+    Args:
+        func (Callable): The function to run elsewhere.
+
+    Returns:
+        Callable: ``func`` itself while tracing is disabled, otherwise a
+        wrapper running it in a copy of the current context.
+    """
+    if not _tracer.enabled:
+        return func
+    context = contextvars.copy_context()
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return context.run(func, *args, **kwargs)
+
+    return wrapper
@@ -1,40 +1,99 @@
-from synarkos.tools.base_tool import BaseTool
-from synarkos.tools.json_utils import base_model_to_json
-from synarkos.tools.mcp_client_tools import (
-    _create_server_tool_mapping,
-    _create_server_tool_mapping_async,
-    _execute_tool_call_simple,
-    _execute_tool_on_server,
-    aget_mcp_tools,
-    execute_multiple_tools_on_multiple_mcp_servers,
-    execute_multiple_tools_on_multiple_mcp_servers_sync,
-    execute_tool_call_simple,
-    get_mcp_tools_sync,
-    get_tools_for_multiple_mcp_servers,
-)
-from synarkos.tools.openai_func_calling_schema_pydantic import (
-    OpenAIFunctionCallSchema as OpenAIFunctionCallSchemaBaseModel,
-)
-from synarkos.tools.openai_tool_creator_decorator import tool
-from synarkos.tools.py_func_to_openai_func_str import (
-    Function,
-    ToolFunction,
-    get_load_param_if_needed_function,
-    get_openai_function_schema_from_func,
-    get_parameters,
-    get_required_params,
-    load_basemodels_if_needed,
-)
-from synarkos.tools.pydantic_to_json import (
-    _remove_a_key,
-    base_model_to_openai_function,
-    multi_base_model_to_openai_function,
-)
-from synarkos.tools.tool_registry import ToolStorage, tool_registry
-from synarkos.tools.tool_utils import (
-    scrape_tool_func_docs,
-    tool_find_by_name,
-)
+from typing import TYPE_CHECKING
+
+from synarkos.utils.lazy_loader import attach_lazy_exports
+
+if TYPE_CHECKING:
+    from synarkos.tools.base_tool import BaseTool
+    from synarkos.tools.json_utils import base_model_to_json
+    from synarkos.tools.mcp_client_tools import (
+        MCPSessionPool,
+        MCPToolCatalog,
+        _create_server_tool_mapping,
+        _create_server_tool_mapping_async,
+        _execute_tool_call_simple,
+        _execute_tool_on_server,
+        aget_mcp_tools,
+        close_mcp_session_pool,
+        execute_multiple_tools_on_multiple_mcp_servers,
+        execute_multiple_tools_on_multiple_mcp_servers_sync,
+        execute_tool_call_simple,
+        get_mcp_session_pool,
+        get_mcp_tool_catalog,
+        get_mcp_tools_sync,
+        get_tools_for_multiple_mcp_servers,
+    )
+    from synarkos.tools.openai_func_calling_schema_pydantic import (
+        OpenAIFunctionCallSchema as OpenAIFunctionCallSchemaBaseModel,
+    )
+    from synarkos.tools.openai_tool_creator_decorator import tool
+    from synarkos.tools.py_func_to_openai_func_str import (
+        Function,
+        ToolFunction,
+        get_load_param_if_needed_function,
+        get_openai_function_schema_from_func,
+        get_parameters,
+        get_required_params,
+        load_basemodels_if_needed,
+    )
+    from synarkos.tools.pydantic_to_json import (
+        _remove_a_key,
+        base_model_to_openai_function,
+        multi_base_model_to_openai_function,
+    )
+    from synarkos.tools.schema_cache import (
+        ToolSchemaCache,
+        get_tool_schema_cache,
+    )
+    from synarkos.tools.tool_registry import (
+        ToolStorage,
+        tool_registry,
+    )
+    from synarkos.tools.tool_utils import (
+        scrape_tool_func_docs,
+        tool_find_by_name,
+    )
+
+# Exports are imported from their submodules on first access, so
+# importing the package does not pull in every dependency.
+_LAZY_EXPORTS = {
+    "BaseTool": "base_tool",
+    "base_model_to_json": "json_utils",
+    "MCPSessionPool": "mcp_client_tools",
+    "MCPToolCatalog": "mcp_client_tools",
+    "_create_server_tool_mapping": "mcp_client_tools",
+    "_create_server_tool_mapping_async": "mcp_client_tools",
+    "_execute_tool_call_simple": "mcp_client_tools",
+    "_execute_tool_on_server": "mcp_client_tools",
+    "aget_mcp_tools": "mcp_client_tools",
+    "close_mcp_session_pool": "mcp_client_tools",
+    "execute_multiple_tools_on_multiple_mcp_servers": "mcp_client_tools",
+    "execute_multiple_tools_on_multiple_mcp_servers_sync": "mcp_client_tools",
+    "execute_tool_call_simple": "mcp_client_tools",
+    "get_mcp_session_pool": "mcp_client_tools",
+    "get_mcp_tool_catalog": "mcp_client_tools",
+    "get_mcp_tools_sync": "mcp_client_tools",
+    "get_tools_for_multiple_mcp_servers": "mcp_client_tools",
+    "OpenAIFunctionCallSchemaBaseModel": "openai_func_calling_schema_pydantic:OpenAIFunctionCallSchema",
+    "tool": "openai_tool_creator_decorator",
+    "Function": "py_func_to_openai_func_str",
+    "ToolFunction": "py_func_to_openai_func_str",
+    "get_load_param_if_needed_function": "py_func_to_openai_func_str",
+    "get_openai_function_schema_from_func": "py_func_to_openai_func_str",
+    "get_parameters": "py_func_to_openai_func_str",
+    "get_required_params": "py_func_to_openai_func_str",
+    "load_basemodels_if_needed": "py_func_to_openai_func_str",
+    "_remove_a_key": "pydantic_to_json",
+    "base_model_to_openai_function": "pydantic_to_json",
+    "multi_base_model_to_openai_function": "pydantic_to_json",
+    "ToolSchemaCache": "schema_cache",
+    "get_tool_schema_cache": "schema_cache",
+    "ToolStorage": "tool_registry",
+    "tool_registry": "tool_registry",
+    "scrape_tool_func_docs": "tool_utils",
+    "tool_find_by_name": "tool_utils",
+}
+
+__getattr__, __dir__ = attach_lazy_exports(__name__, _LAZY_EXPORTS)
 
 __all__ = [
     "scrape_tool_func_docs",
@@ -65,4 +124,11 @@ __all__ = [
     "_create_server_tool_mapping",
     "_create_server_tool_mapping_async",
     "_execute_tool_on_server",
+    "MCPSessionPool",
+    "get_mcp_session_pool",
+    "close_mcp_session_pool",
+    "MCPToolCatalog",
+    "get_mcp_tool_catalog",
+    "ToolSchemaCache",
+    "get_tool_schema_cache",
 ]
@@ -104,6 +104,21 @@ class BaseTool(BaseModel):
     function_map: Optional[Dict[str, Callable]] = None
     list_of_dicts: Optional[List[Dict[str, Any]]] = None
 
+    def model_post_init(self, __context: Any) -> None:
+        # Prebuild the name -> callable dispatch table once
+        if self.function_map is None and self.tools:
+            self.function_map = self._build_function_map(self.tools)
+
+    @staticmethod
+    def _build_function_map(
+        tools: List[Callable[..., Any]],
+    ) -> Dict[str, Callable]:
+        return {
+            tool.__name__: tool
+            for tool in tools
+            if hasattr(tool, "__name__")
+        }
+
     def _log_if_verbose(
         self, level: str, message: str, *args, **kwargs
     ) -> None:
@@ -1018,9 +1033,7 @@ class BaseTool(BaseModel):
                 )
 
             # Create function calling map for all tools
-            self.function_map = {
-                tool.__name__: tool for tool in self.tools
-            }
+            self.function_map = self._build_function_map(self.tools)
 
             self._log_if_verbose(
                 "info",
@@ -1266,11 +1279,18 @@ class BaseTool(BaseModel):
             "debug", f"Searching for function: {func_name}"
         )
 
+        if self.function_map and func_name in self.function_map:
+            return self.function_map[func_name]
+
+        # Tools appended after construction are not in the map yet
         for func in self.tools:
-            if func.__name__ == func_name:
+            if getattr(func, "__name__", None) == func_name:
                 self._log_if_verbose(
                     "debug", f"Found function: {func_name}"
                 )
+                if self.function_map is None:
+                    self.function_map = {}
+                self.function_map[func_name] = func
                 return func
 
         self._log_if_verbose(
@@ -2313,9 +2333,9 @@ class BaseTool(BaseModel):
 
             # Ensure function_map is available
             if self.function_map is None and self.tools is not None:
-                self.function_map = {
-                    tool.__name__: tool for tool in self.tools
-                }
+                self.function_map = self._build_function_map(
+                    self.tools
+                )
 
             # Execute function calls
             if sequential:
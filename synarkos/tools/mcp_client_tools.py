@@ -1,23 +1,49 @@
 import asyncio
+import atexit
 import contextlib
+import copy
+import hashlib
 import json
 import os
 import random
+import threading
+import time
 import traceback
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from dataclasses import dataclass
 from functools import wraps
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
 from urllib.parse import urlparse
 
+import anyio
+import httpx
 from litellm.types.utils import ChatCompletionMessageToolCall
 from loguru import logger
 from mcp import ClientSession
 from mcp.client.streamable_http import streamablehttp_client
+from mcp.shared.exceptions import McpError
 from mcp.types import (
     CallToolRequestParams as MCPCallToolRequestParams,
 )
 from mcp.types import CallToolResult as MCPCallToolResult
+from mcp.types import ServerNotification as MCPServerNotification
 from mcp.types import Tool as MCPTool
+from mcp.types import (
+    ToolListChangedNotification as MCPToolListChangedNotification,
+)
 from openai.types.chat import ChatCompletionToolParam
 from openai.types.shared_params.function_definition import (
     FunctionDefinition,
@@ -343,6 +369,684 @@ def auto_detect_transport(url: str) -> str:
         return "streamable-http"
 
 
+########################################################
+# MCP session pool
+########################################################
+def _normalize_transport(transport: Optional[str]) -> str:
+    return (transport or "streamable_http").replace("-", "_")
+
+
+class _PooledSession:
+    """
+    A single long-lived ``ClientSession`` owned by a background task.
+
+    The transport and session contexts are entered and exited inside the
+    same task, as anyio requires, while callers borrow ``session`` under
+    the per-server semaphore.
+    """
+
+    def __init__(
+        self,
+        key: tuple,
+        client_factory: Callable[[], Any],
+        max_concurrent: int,
+    ):
+        self.key = key
+        self.client_factory = client_factory
+        self.on_tools_changed: Optional[Callable[[tuple], None]] = (
+            None
+        )
+        self.semaphore = asyncio.Semaphore(max_concurrent)
+        self.session: Optional[ClientSession] = None
+        self.in_use = 0
+        self.last_used = time.monotonic()
+        self.last_checked = self.last_used
+        self.closed = False
+        self._ready: asyncio.Future = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._closing = asyncio.Event()
+        self._task = asyncio.create_task(self._serve())
+
+    async def _serve(self):
+        try:
+            async with contextlib.AsyncExitStack() as stack:
+                ctx = await stack.enter_async_context(
+                    self.client_factory()
+                )
+                read, write = ctx[0], ctx[1]
+                session = await stack.enter_async_context(
+                    ClientSession(
+                        read,
+                        write,
+                        message_handler=self._handle_message,
+                    )
+                )
+                await session.initialize()
+                self.session = session
+                self._ready.set_result(session)
+                await self._closing.wait()
+        except Exception as e:
+            if not self._ready.done():
+                self._ready.set_exception(e)
+            else:
+                logger.warning(
+                    f"Pooled MCP session for {self.key[0]} closed: {e}"
+                )
+        finally:
+            self.closed = True
+            if not self._ready.done():
+                self._ready.set_exception(
+                    MCPConnectionError(
+                        f"MCP session for {self.key[0]} closed during setup"
+                    )
+                )
+
+    async def _handle_message(self, message: Any):
+        if (
+            isinstance(message, MCPServerNotification)
+            and isinstance(
+                message.root, MCPToolListChangedNotification
+            )
+            and self.on_tools_changed is not None
+        ):
+            self.on_tools_changed(self.key)
+
+    async def wait_ready(self) -> ClientSession:
+        return await asyncio.shield(self._ready)
+
+    async def aclose(self, timeout: float = 5.0):
+        self.closed = True
+        self._closing.set()
+        try:
+            await asyncio.wait_for(self._task, timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            self._task.cancel()
+        except Exception:
+            pass
+
+
+# Failures of the connection itself; only these retire a pooled session
+SESSION_TRANSPORT_ERRORS = (
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    anyio.EndOfStream,
+    OSError,
+    httpx.TransportError,
+    asyncio.TimeoutError,
+)
+
+
+class MCPSessionPool:
+    """
+    Process-wide pool of initialized MCP client sessions.
+
+    Sessions are keyed by ``(url, transport, headers)`` and live on a
+    dedicated event loop thread, so they survive across ``asyncio.run``
+    calls made by synchronous callers. A session that has been idle for
+    ``health_check_interval`` seconds is pinged before reuse and
+    reconnected if the ping fails; sessions idle for longer than
+    ``idle_timeout`` are closed by a background sweep.
+
+    Args:
+        max_concurrent_per_server (int): Maximum in-flight requests per
+            server session.
+        idle_timeout (float): Seconds after which an unused session is closed.
+        health_check_interval (float): Idle seconds after which a session is
+            pinged before being handed out.
+        health_check_timeout (float): Seconds to wait for a ping reply.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_per_server: int = 16,
+        idle_timeout: float = 300.0,
+        health_check_interval: float = 30.0,
+        health_check_timeout: float = 5.0,
+    ):
+        self.max_concurrent_per_server = max(
+            1, max_concurrent_per_server
+        )
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+
+        self._sessions: Dict[tuple, _PooledSession] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._sweeper: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def make_key(
+        url: str,
+        transport: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> tuple:
+        """Pool key for a server connection."""
+        return (
+            url,
+            _normalize_transport(transport),
+            tuple(sorted((headers or {}).items())),
+        )
+
+    def __len__(self) -> int:
+        return sum(
+            not pooled.closed for pooled in self._sessions.values()
+        )
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._start_lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="mcp-session-pool",
+                    daemon=True,
+                )
+                self._thread.start()
+                self._loop = loop
+            return self._loop
+
+    async def _is_healthy(self, pooled: _PooledSession) -> bool:
+        try:
+            await asyncio.wait_for(
+                pooled.session.send_ping(),
+                self.health_check_timeout,
+            )
+            pooled.last_checked = time.monotonic()
+            return True
+        except Exception as e:
+            logger.warning(
+                f"MCP session health check failed for {pooled.key[0]}: {e}"
+            )
+            return False
+
+    async def _acquire(
+        self, key: tuple, client_factory: Callable[[], Any]
+    ) -> _PooledSession:
+        pooled = self._sessions.get(key)
+        if pooled is not None and not pooled.closed:
+            try:
+                await pooled.wait_ready()
+            except Exception:
+                pooled = None
+            else:
+                stale = (
+                    time.monotonic() - pooled.last_checked
+                    > self.health_check_interval
+                )
+                if (
+                    stale
+                    and pooled.in_use == 0
+                    and not await self._is_healthy(pooled)
+                ):
+                    await pooled.aclose()
+                    pooled = None
+        else:
+            pooled = None
+
+        if pooled is None or pooled.closed:
+            pooled = _PooledSession(
+                key, client_factory, self.max_concurrent_per_server
+            )
+            pooled.on_tools_changed = _invalidate_tool_catalog
+            self._sessions[key] = pooled
+            self._start_sweeper()
+            try:
+                await pooled.wait_ready()
+            except Exception:
+                if self._sessions.get(key) is pooled:
+                    del self._sessions[key]
+                raise
+        return pooled
+
+    async def _run(
+        self,
+        key: tuple,
+        client_factory: Callable[[], Any],
+        operation: Callable[[ClientSession], Awaitable[Any]],
+    ):
+        pooled = await self._acquire(key, client_factory)
+        async with pooled.semaphore:
+            pooled.in_use += 1
+            try:
+                return await operation(pooled.session)
+            except SESSION_TRANSPORT_ERRORS:
+                # Other errors (server replies, bad tool-call arguments)
+                # leave the shared session usable for concurrent calls
+                await self._discard(pooled)
+                raise
+            finally:
+                pooled.in_use -= 1
+                pooled.last_used = time.monotonic()
+
+    def submit(
+        self,
+        url: str,
+        operation: Callable[[ClientSession], Awaitable[Any]],
+        transport: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 5,
+        client_factory: Optional[Callable[[], Any]] = None,
+    ) -> Future:
+        """
+        Schedule ``operation(session)`` on a pooled session for a server.
+
+        Args:
+            url (str): The server URL.
+            operation (Callable): Coroutine function receiving the
+                initialized ``ClientSession``.
+            transport (Optional[str]): Transport type.
+            headers (Optional[Dict[str, str]]): Request headers.
+            timeout (float): Connection timeout used when a new session
+                has to be opened.
+            client_factory (Optional[Callable]): Returns the transport
+                context manager; defaults to ``get_mcp_client``.
+
+        Returns:
+            Future: Resolves to whatever ``operation`` returns.
+        """
+        key = self.make_key(url, transport, headers)
+        if client_factory is None:
+
+            def client_factory():
+                return get_mcp_client(
+                    transport,
+                    url=url,
+                    headers=headers,
+                    timeout=timeout,
+                )
+
+        return asyncio.run_coroutine_threadsafe(
+            self._run(key, client_factory, operation),
+            self._ensure_loop(),
+        )
+
+    async def run(
+        self,
+        url: str,
+        operation: Callable[[ClientSession], Awaitable[Any]],
+        *args,
+        **kwargs,
+    ):
+        """
+        Run ``operation(session)`` on a pooled session and await the result
+        from any event loop. Accepts the same arguments as ``submit``.
+        """
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is not None and running is self._loop:
+            raise MCPExecutionError(
+                "MCPSessionPool cannot be awaited from its own loop"
+            )
+        return await asyncio.wrap_future(
+            self.submit(url, operation, *args, **kwargs)
+        )
+
+    async def _discard(self, pooled: _PooledSession):
+        if self._sessions.get(pooled.key) is pooled:
+            del self._sessions[pooled.key]
+        await pooled.aclose()
+
+    def _start_sweeper(self):
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.create_task(self._sweep())
+
+    async def _sweep(self):
+        while self._sessions:
+            await asyncio.sleep(max(1.0, self.idle_timeout / 4))
+            now = time.monotonic()
+            for pooled in list(self._sessions.values()):
+                if pooled.closed or (
+                    pooled.in_use == 0
+                    and now - pooled.last_used > self.idle_timeout
+                ):
+                    logger.debug(
+                        f"Evicting idle MCP session for {pooled.key[0]}"
+                    )
+                    await self._discard(pooled)
+
+    async def _aclose_all(self):
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        await asyncio.gather(
+            *(pooled.aclose() for pooled in sessions),
+            return_exceptions=True,
+        )
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+
+    def close_all(self, timeout: float = 10.0):
+        """Close every pooled session and stop the pool loop thread."""
+        with self._start_lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or loop.is_closed():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(
+                self._aclose_all(), loop
+            ).result(timeout)
+        except Exception as e:
+            logger.warning(f"Error closing MCP session pool: {e}")
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            if thread is not None:
+                thread.join(timeout)
+            if not loop.is_running():
+                loop.close()
+
+
+_session_pool: Optional[MCPSessionPool] = None
+_session_pool_lock = threading.Lock()
+
+
+def get_mcp_session_pool() -> MCPSessionPool:
+    """
+    Return the process-wide MCP session pool, creating it on first use.
+
+    Returns:
+        MCPSessionPool: The shared pool.
+    """
+    global _session_pool
+    with _session_pool_lock:
+        if _session_pool is None:
+            _session_pool = MCPSessionPool()
+            atexit.register(_session_pool.close_all)
+        return _session_pool
+
+
+def close_mcp_session_pool():
+    """Close all pooled MCP sessions held by this process."""
+    global _session_pool
+    with _session_pool_lock:
+        pool, _session_pool = _session_pool, None
+    if pool is not None:
+        pool.close_all()
+
+
+########################################################
+# MCP tool catalog cache
+########################################################
+@dataclass
+class MCPToolCatalogEntry:
+    """
+    Cached tool listing of one MCP server.
+
+    Attributes:
+        mcp_tools (List[MCPTool]): Tools as returned by the server.
+        openai_tools (List[ChatCompletionToolParam]): The same tools,
+            converted once with ``transform_mcp_tool_to_openai_tool``.
+        digest (str): Content hash of the listing.
+        version (int): Incremented whenever the listing changes.
+        fetched_at (float): ``time.monotonic()`` of the last refresh.
+    """
+
+    mcp_tools: List[MCPTool]
+    openai_tools: List[ChatCompletionToolParam]
+    digest: str
+    version: int
+    fetched_at: float
+
+
+class MCPToolCatalog:
+    """
+    Shared, TTL-based cache of MCP server tool listings.
+
+    Listings are keyed like pooled sessions, by ``(url, transport,
+    headers)``. A fresh entry is served from memory; an expired one is
+    still served while a single background refresh runs on the session
+    pool, and only a server that has never been listed blocks the caller.
+    Concurrent misses for the same server share one listing request. A
+    ``tools/list_changed`` notification drops the server's entry, and
+    every refresh whose content differs bumps the entry's ``version``.
+
+    Args:
+        ttl (float): Seconds a listing is considered fresh.
+        pool (Optional[MCPSessionPool]): Session pool used for listings;
+            defaults to the process-wide pool.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        pool: Optional[MCPSessionPool] = None,
+    ):
+        self.ttl = ttl
+        self.pool = pool
+        self._entries: Dict[tuple, MCPToolCatalogEntry] = {}
+        self._refreshing: Dict[tuple, Future] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def entry(
+        self,
+        url: str,
+        transport: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Optional[MCPToolCatalogEntry]:
+        """Cached entry for a server, fresh or not."""
+        return self._entries.get(
+            MCPSessionPool.make_key(url, transport, headers)
+        )
+
+    def version(
+        self,
+        url: str,
+        transport: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> int:
+        """Listing version of a server, 0 if it has not been listed."""
+        entry = self.entry(url, transport, headers)
+        return entry.version if entry is not None else 0
+
+    def invalidate(self, key: Optional[tuple] = None):
+        """
+        Drop the cached listing for ``key``, or every listing.
+
+        Args:
+            key (Optional[tuple]): Key from ``MCPSessionPool.make_key``.
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def _store(
+        self, key: tuple, mcp_tools: List[MCPTool]
+    ) -> MCPToolCatalogEntry:
+        digest = hashlib.blake2b(
+            json.dumps(
+                [tool.model_dump(mode="json") for tool in mcp_tools],
+                sort_keys=True,
+            ).encode("utf-8"),
+            digest_size=16,
+        ).hexdigest()
+        with self._lock:
+            previous = self._entries.get(key)
+            if previous is not None and previous.digest == digest:
+                previous.fetched_at = time.monotonic()
+                return previous
+            entry = MCPToolCatalogEntry(
+                mcp_tools=list(mcp_tools),
+                openai_tools=[
+                    transform_mcp_tool_to_openai_tool(mcp_tool=tool)
+                    for tool in mcp_tools
+                ],
+                digest=digest,
+                version=(previous.version + 1 if previous else 1),
+                fetched_at=time.monotonic(),
+            )
+            self._entries[key] = entry
+            return entry
+
+    def _refresh(
+        self,
+        key: tuple,
+        url: str,
+        transport: Optional[str],
+        headers: Optional[Dict[str, str]],
+        timeout: float,
+        client_factory: Optional[Callable[[], Any]],
+    ) -> Future:
+        with self._lock:
+            future = self._refreshing.get(key)
+            if future is not None:
+                return future
+
+            async def list_and_store(session: ClientSession):
+                listing = await session.list_tools()
+                return self._store(key, listing.tools)
+
+            pool = self.pool or get_mcp_session_pool()
+            future = pool.submit(
+                url,
+                list_and_store,
+                transport=transport,
+                headers=headers,
+                timeout=timeout,
+                client_factory=client_factory,
+            )
+            self._refreshing[key] = future
+
+        def done(finished: Future):
+            with self._lock:
+                if self._refreshing.get(key) is finished:
+                    del self._refreshing[key]
+            if not finished.cancelled() and finished.exception():
+                logger.warning(
+                    f"Refreshing MCP tools for {url} failed: {finished.exception()}"
+                )
+
+        future.add_done_callback(done)
+        return future
+
+    async def get(
+        self,
+        url: str,
+        transport: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 5,
+        format: Literal["mcp", "openai"] = "openai",
+        client_factory: Optional[Callable[[], Any]] = None,
+    ) -> Union[List[MCPTool], List[ChatCompletionToolParam]]:
+        """
+        Return a server's tools, listing the server only when needed.
+
+        Args:
+            url (str): The server URL.
+            transport (Optional[str]): Transport type.
+            headers (Optional[Dict[str, str]]): Request headers.
+            timeout (float): Connection timeout.
+            format (Literal["mcp", "openai"]): Format of the returned tools.
+            client_factory (Optional[Callable]): See ``MCPSessionPool.submit``.
+
+        Returns:
+            List of tools in the requested format. OpenAI tools are
+            copies, so callers may modify them freely.
+        """
+        key = MCPSessionPool.make_key(url, transport, headers)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            entry = await asyncio.wrap_future(
+                self._refresh(
+                    key,
+                    url,
+                    transport,
+                    headers,
+                    timeout,
+                    client_factory,
+                )
+            )
+        else:
+            self.hits += 1
+            if time.monotonic() - entry.fetched_at > self.ttl:
+                self._refresh(
+                    key,
+                    url,
+                    transport,
+                    headers,
+                    timeout,
+                    client_factory,
+                )
+
+        if format == "openai":
+            return copy.deepcopy(entry.openai_tools)
+        return list(entry.mcp_tools)
+
+
+_tool_catalog: Optional[MCPToolCatalog] = None
+
+
+def get_mcp_tool_catalog() -> MCPToolCatalog:
+    """
+    Return the process-wide MCP tool catalog, creating it on first use.
+
+    Returns:
+        MCPToolCatalog: The shared catalog.
+    """
+    global _tool_catalog
+    with _session_pool_lock:
+        if _tool_catalog is None:
+            _tool_catalog = MCPToolCatalog()
+        return _tool_catalog
+
+
+def _invalidate_tool_catalog(key: tuple):
+    if _tool_catalog is not None:
+        logger.info(f"MCP tool list changed on {key[0]}")
+        _tool_catalog.invalidate(key)
+
+
+async def _run_with_mcp_session(
+    operation: Callable[[ClientSession], Awaitable[Any]],
+    transport: Optional[str],
+    url: str,
+    headers: Optional[Dict[str, str]],
+    timeout: float,
+    *args,
+    **kwargs,
+):
+    """
+    Run ``operation`` against an initialized session for ``url``.
+
+    Uses the shared session pool unless extra client arguments were given
+    (they cannot be part of the pool key) or ``use_pool=False`` is passed,
+    in which case a one-off connection is opened as before.
+    """
+    use_pool = kwargs.pop("use_pool", True)
+    if use_pool and not args and not kwargs:
+        return await get_mcp_session_pool().run(
+            url,
+            operation,
+            transport=transport,
+            headers=headers,
+            timeout=timeout,
+        )
+
+    async with get_mcp_client(
+        transport,
+        url=url,
+        headers=headers,
+        timeout=timeout,
+        *args,
+        **kwargs,
+    ) as ctx:
+        read, write = ctx[0], ctx[1]
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            return await operation(session)
+
+
 @retry_with_backoff(retries=3)
 async def aget_mcp_tools(
     server_path: Optional[str] = None,
@@ -361,6 +1065,8 @@ async def aget_mcp_tools(
         connection (Optional[MCPConnection]): Optional connection object.
         transport (Optional[str]): Transport type. If None, auto-detects.
         verbose (bool): Enable verbose logging. Defaults to True.
+        use_cache (bool): Keyword only. Serve the listing from the shared
+            ``MCPToolCatalog``. Defaults to True.
     Returns:
         List[Dict[str, Any]]: List of available MCP tools in OpenAI format.
     Raises:
@@ -391,29 +1097,42 @@ async def aget_mcp_tools(
         logger.info(
             f"Fetching MCP tools from server: {server_path} using transport: {transport}"
         )
+    # Cached listings need the pooled path and no per-call client options
+    use_cache = kwargs.pop("use_cache", True) and kwargs.get(
+        "use_pool", True
+    )
     try:
-        async with get_mcp_client(
-            transport,
-            url=url,
-            headers=headers,
-            timeout=timeout,
-            *args,
-            **kwargs,
-        ) as ctx:
-            if len(ctx) == 2:
-                read, write = ctx
-            else:
-                read, write, *_ = ctx
-            async with ClientSession(read, write) as session:
-                await session.initialize()
-                tools = await load_mcp_tools(
+        if (
+            use_cache
+            and not args
+            and not kwargs.keys() - {"use_pool"}
+        ):
+            tools = await get_mcp_tool_catalog().get(
+                url,
+                transport=transport,
+                headers=headers,
+                timeout=timeout,
+                format=format,
+            )
+        else:
+
+            async def list_tools(session: ClientSession):
+                return await load_mcp_tools(
                     session=session, format=format
                 )
-                if verbose:
-                    logger.info(
-                        f"Successfully fetched {len(tools)} tools"
-                    )
-                return tools
+
+            tools = await _run_with_mcp_session(
+                list_tools,
+                transport,
+                url,
+                headers,
+                timeout,
+                *args,
+                **kwargs,
+            )
+        if verbose:
+            logger.info(f"Successfully fetched {len(tools)} tools")
+        return tools
     except Exception as e:
         logger.error(
             f"Error fetching MCP tools: {str(e)}\n{traceback.format_exc()}"
@@ -625,58 +1344,28 @@ async def _execute_tool_call_simple(
             server_path,
         )
     try:
-        async with get_mcp_client(
+
+        async def call_tool(session: ClientSession):
+            return await call_openai_tool(
+                session=session, openai_tool=response
+            )
+
+        call_result = await _run_with_mcp_session(
+            call_tool,
             transport,
-            url=url,
-            headers=headers,
-            timeout=timeout,
+            url,
+            headers,
+            timeout,
             *args,
             **kwargs,
-        ) as ctx:
-            if len(ctx) == 2:
-                read, write = ctx
-            else:
-                read, write, *_ = ctx
-            async with ClientSession(read, write) as session:
-                try:
-                    await session.initialize()
-                    call_result = await call_openai_tool(
-                        session=session, openai_tool=response
-                    )
-                    if output_type == "json":
-                        out = call_result.model_dump_json(indent=4)
-                    elif output_type == "dict":
-                        out = call_result.model_dump()
-                    elif output_type == "str":
-                        data = call_result.model_dump()
-                        formatted_lines = []
-                        for key, value in data.items():
-                            if isinstance(value, list):
-                                for item in value:
-                                    if isinstance(item, dict):
-                                        for k, v in item.items():
-                                            formatted_lines.append(
-                                                f"{k}: {v}"
-                                            )
-                            else:
-                                formatted_lines.append(
-                                    f"{key}: {value}"
-                                )
-                        out = "\n".join(formatted_lines)
-                    else:
-                        out = call_result.model_dump()
-                    if verbose:
-                        logger.info(
-                            f"Tool call executed successfully for {server_path}"
-                        )
-                    return out
-                except Exception as e:
-                    logger.error(
-                        f"Error in tool execution: {str(e)}\n{traceback.format_exc()}"
-                    )
-                    raise MCPExecutionError(
-                        f"Tool execution failed for tool '{getattr(response, 'function', {}).get('name', 'unknown')}' on server '{url}': {str(e)}"
-                    )
+        )
+    except McpError as e:
+        logger.error(
+            f"Error in tool execution: {str(e)}\n{traceback.format_exc()}"
+        )
+        raise MCPExecutionError(
+            f"Tool execution failed for tool '{getattr(response, 'function', {}).get('name', 'unknown')}' on server '{url}': {str(e)}"
+        )
     except Exception as e:
         logger.error(
             f"Error in MCP client connection: {str(e)}\n{traceback.format_exc()}"
@@ -685,6 +1374,30 @@ async def _execute_tool_call_simple(
             f"Failed to connect to MCP server '{url}' using transport '{transport}': {str(e)}"
         )
 
+    if output_type == "json":
+        out = call_result.model_dump_json(indent=4)
+    elif output_type == "dict":
+        out = call_result.model_dump()
+    elif output_type == "str":
+        data = call_result.model_dump()
+        formatted_lines = []
+        for key, value in data.items():
+            if isinstance(value, list):
+                for item in value:
+                    if isinstance(item, dict):
+                        for k, v in item.items():
+                            formatted_lines.append(f"{k}: {v}")
+            else:
+                formatted_lines.append(f"{key}: {value}")
+        out = "\n".join(formatted_lines)
+    else:
+        out = call_result.model_dump()
+    if verbose:
+        logger.info(
+            f"Tool call executed successfully for {server_path}"
+        )
+    return out
+
 
 async def execute_tool_call_simple(
     response: any = None,
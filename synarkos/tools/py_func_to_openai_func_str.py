@@ -23,6 +23,11 @@ from pydantic import BaseModel, Field
 from pydantic.version import VERSION as PYDANTIC_VERSION
 from typing_extensions import Annotated, Literal, get_args, get_origin
 
+from synarkos.tools.schema_cache import (
+    function_fingerprint,
+    get_tool_schema_cache,
+)
+
 T = TypeVar("T")
 
 __all__ = (
@@ -421,7 +426,41 @@ def get_openai_function_schema_from_func(
     #           'required': ['a']}}}
     ```
 
+    Compiled schemas are cached process-wide (and on disk when
+    ``SYNARKOS_TOOL_SCHEMA_CACHE_DIR`` is set), keyed by a hash of the
+    function's qualified name, source and the overrides.
+
     """
+    cache = get_tool_schema_cache()
+    key = _schema_cache_key(function, name, description)
+    schema = cache.get(key)
+    if schema is None:
+        schema = _compile_openai_function_schema(
+            function, name=name, description=description
+        )
+        cache.put(key, schema)
+    return schema
+
+
+def _schema_cache_key(
+    function: Callable[..., Any],
+    name: Optional[str] = None,
+    description: Optional[str] = None,
+) -> Optional[str]:
+    # Overrides equal to the defaults compile to the same schema
+    return function_fingerprint(
+        function,
+        name or getattr(function, "__name__", None),
+        description or getattr(function, "__doc__", None),
+    )
+
+
+def _compile_openai_function_schema(
+    function: Callable[..., Any],
+    *,
+    name: Optional[str] = None,
+    description: Optional[str] = None,
+) -> Dict[str, Any]:
     typed_signature = get_typed_signature(function)
     required = get_required_params(typed_signature)
     default_values = get_default_values(typed_signature)
@@ -487,22 +526,33 @@ def convert_multiple_functions_to_openai_function_schema(
     functions: List[Callable[..., Any]],
 ) -> List[Dict[str, Any]]:
     """Convert a list of functions to a list of OpenAI function schemas"""
-    # return [
-    #     get_openai_function_schema_from_func(function) for function in functions
-    # ]
-    # Use 40% of cpu cores
-    max_workers = int(os.cpu_count() * 0.8)
+    cache = get_tool_schema_cache()
+    keys = [_schema_cache_key(function) for function in functions]
+    schemas = [cache.get(key) for key in keys]
+    missing = [
+        i for i, schema in enumerate(schemas) if schema is None
+    ]
+    if not missing:
+        return schemas
+
+    # Use 80% of cpu cores, only for the functions not compiled yet
+    max_workers = max(
+        1, min(len(missing), int((os.cpu_count() or 1) * 0.8))
+    )
 
     with concurrent.futures.ThreadPoolExecutor(
         max_workers=max_workers
     ) as executor:
-        futures = [
-            executor.submit(
-                get_openai_function_schema_from_func, function
+        futures = {
+            i: executor.submit(
+                _compile_openai_function_schema, functions[i]
             )
-            for function in functions
-        ]
-        return [future.result() for future in futures]
+            for i in missing
+        }
+        for i, future in futures.items():
+            schemas[i] = future.result()
+            cache.put(keys[i], schemas[i])
+    return schemas
 
 
 #
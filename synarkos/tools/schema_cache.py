@@ -0,0 +1,224 @@
+import copy
+import hashlib
+import inspect
+import json
+import os
+import threading
+import typing
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from loguru import logger
+from pydantic import BaseModel
+
+
+def default_tool_schema_cache_dir() -> Optional[Path]:
+    """
+    Resolve the on-disk tool schema cache directory.
+
+    The disk tier is opt-in: it is only used when
+    ``SYNARKOS_TOOL_SCHEMA_CACHE_DIR`` is set.
+
+    Returns:
+        Optional[Path]: The cache directory, or None for memory only.
+    """
+    cache_dir = os.getenv("SYNARKOS_TOOL_SCHEMA_CACHE_DIR")
+    return Path(cache_dir) if cache_dir else None
+
+
+def _annotation_parts(function: Callable[..., Any]) -> List[Any]:
+    """
+    Resolved type hints of a function, with the JSON schema of every
+    pydantic model they reference.
+
+    Closures from the same factory share their source, and a pydantic
+    model can change without the tool's source changing, so both must be
+    part of the key.
+    """
+    try:
+        hints = typing.get_type_hints(function, include_extras=True)
+    except Exception:
+        # Unresolvable forward references: fall back to the raw values
+        hints = dict(getattr(function, "__annotations__", {}))
+
+    parts: List[Any] = []
+    for name, hint in sorted(hints.items()):
+        parts.append((name, hint))
+        pending = [hint]
+        while pending:
+            current = pending.pop()
+            pending.extend(typing.get_args(current))
+            if inspect.isclass(current) and issubclass(
+                current, BaseModel
+            ):
+                try:
+                    parts.append(
+                        json.dumps(
+                            current.model_json_schema(),
+                            sort_keys=True,
+                        )
+                    )
+                except Exception:
+                    parts.append(current)
+    return parts
+
+
+def function_fingerprint(
+    function: Callable[..., Any], *parts: Any
+) -> Optional[str]:
+    """
+    Content hash identifying the schema a function compiles to.
+
+    Covers the qualified name, source code, docstring, default values and
+    resolved type hints (including the schema of referenced pydantic
+    models), plus any extra ``parts`` (such as name or description
+    overrides), so editing a tool or a model it uses yields a new key
+    across restarts.
+
+    Args:
+        function (Callable[..., Any]): The function to fingerprint.
+        *parts (Any): Extra values the compiled schema depends on.
+
+    Returns:
+        Optional[str]: Hex digest, or None when the callable has no
+        retrievable source (builtins, partials, callable instances).
+    """
+    if not inspect.isfunction(function) and not inspect.ismethod(
+        function
+    ):
+        return None
+    try:
+        source = inspect.getsource(function)
+    except (OSError, TypeError):
+        return None
+
+    func = getattr(function, "__func__", function)
+    digest = hashlib.blake2b(digest_size=20)
+    for part in (
+        func.__module__,
+        func.__qualname__,
+        source,
+        func.__doc__,
+        func.__defaults__,
+        func.__kwdefaults__,
+        *_annotation_parts(func),
+        *parts,
+    ):
+        digest.update(repr(part).encode("utf-8", "surrogatepass"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class ToolSchemaCache:
+    """
+    Process-wide cache of compiled tool schemas.
+
+    Schemas are stored under the fingerprint of the function they were
+    compiled from, in memory and optionally as JSON files in
+    ``cache_dir`` so that later processes skip signature inspection and
+    pydantic schema generation too. Lookups return deep copies, so callers
+    can modify the schemas they get back.
+
+    Attributes:
+        cache_dir (Optional[Path]): Directory of the disk tier, if any.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._schemas: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._schemas)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Look up a compiled schema.
+
+        Args:
+            key (Optional[str]): Fingerprint from ``function_fingerprint``.
+
+        Returns:
+            Optional[Dict[str, Any]]: A copy of the schema, or None.
+        """
+        if key is None:
+            return None
+
+        schema = self._schemas.get(key)
+        if schema is None and self.cache_dir is not None:
+            try:
+                with open(
+                    self._path(key), "r", encoding="utf-8"
+                ) as f:
+                    schema = json.load(f)
+                with self._lock:
+                    self._schemas[key] = schema
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as e:
+                logger.warning(f"Tool schema cache read failed: {e}")
+
+        if schema is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return copy.deepcopy(schema)
+
+    def put(self, key: Optional[str], schema: Dict[str, Any]) -> None:
+        """
+        Store a compiled schema.
+
+        Args:
+            key (Optional[str]): Fingerprint from ``function_fingerprint``.
+            schema (Dict[str, Any]): The compiled schema.
+        """
+        if key is None:
+            return
+
+        schema = copy.deepcopy(schema)
+        with self._lock:
+            self._schemas[key] = schema
+
+        if self.cache_dir is None:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._path(key).with_suffix(
+                f".{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(schema, f)
+            os.replace(tmp_path, self._path(key))
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Tool schema cache write failed: {e}")
+
+    def clear(self) -> None:
+        """Drop every schema held in memory."""
+        with self._lock:
+            self._schemas.clear()
+
+
+_shared_cache: Optional[ToolSchemaCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_tool_schema_cache() -> ToolSchemaCache:
+    """
+    Return the process-wide ``ToolSchemaCache``.
+
+    Returns:
+        ToolSchemaCache: The shared cache, backed by
+        ``default_tool_schema_cache_dir`` when it is configured.
+    """
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = ToolSchemaCache(
+                default_tool_schema_cache_dir()
+            )
+        return _shared_cache
@@ -1,40 +1,91 @@
-from synarkos.utils.agent_loader_markdown import (
-    load_agent_from_markdown,
-    load_agents_from_markdown,
-    MarkdownAgentLoader,
-)
-from synarkos.utils.check_all_model_max_tokens import (
-    check_all_model_max_tokens,
-)
-from synarkos.utils.data_to_text import (
-    csv_to_text,
-    data_to_text,
-    json_to_text,
-    txt_to_text,
-)
-from synarkos.utils.dynamic_context_window import (
-    dynamic_auto_chunking,
-)
-from synarkos.utils.file_processing import (
-    create_file_in_folder,
-    load_json,
-    sanitize_file_path,
-    zip_folders,
-    zip_workspace,
-)
-from synarkos.utils.history_output_formatter import (
-    history_output_formatter,
-)
-from synarkos.utils.litellm_tokenizer import count_tokens
-from synarkos.utils.litellm_wrapper import (
-    LiteLLM,
-    NetworkConnectionError,
-    LiteLLMException,
-)
-from synarkos.utils.output_types import HistoryOutputType
-from synarkos.utils.parse_code import extract_code_from_markdown
-from synarkos.utils.pdf_to_text import pdf_to_text
-from synarkos.utils.try_except_wrapper import try_except_wrapper
+from typing import TYPE_CHECKING
+
+from synarkos.utils.lazy_loader import attach_lazy_exports
+
+if TYPE_CHECKING:
+    from synarkos.utils.agent_loader_markdown import (
+        load_agent_from_markdown,
+        load_agents_from_markdown,
+        MarkdownAgentLoader,
+    )
+    from synarkos.utils.check_all_model_max_tokens import (
+        check_all_model_max_tokens,
+    )
+    from synarkos.utils.data_to_text import (
+        csv_to_text,
+        data_to_text,
+        json_to_text,
+        txt_to_text,
+    )
+    from synarkos.utils.dynamic_context_window import (
+        dynamic_auto_chunking,
+    )
+    from synarkos.utils.execution_service import (
+        ExecutionService,
+        get_execution_service,
+    )
+    from synarkos.utils.file_processing import (
+        create_file_in_folder,
+        load_json,
+        sanitize_file_path,
+        zip_folders,
+        zip_workspace,
+    )
+    from synarkos.utils.history_output_formatter import (
+        history_output_formatter,
+    )
+    from synarkos.utils.litellm_tokenizer import (
+        count_tokens,
+        count_tokens_batch,
+    )
+    from synarkos.utils.litellm_wrapper import (
+        LiteLLM,
+        NetworkConnectionError,
+        LiteLLMException,
+    )
+    from synarkos.utils.llm_response_cache import (
+        LLMResponseCache,
+        get_llm_response_cache,
+    )
+    from synarkos.utils.output_types import HistoryOutputType
+    from synarkos.utils.parse_code import extract_code_from_markdown
+    from synarkos.utils.pdf_to_text import pdf_to_text
+    from synarkos.utils.try_except_wrapper import try_except_wrapper
+
+# Exports are imported from their submodules on first access, so
+# importing the package does not pull in every dependency.
+_LAZY_EXPORTS = {
+    "load_agent_from_markdown": "agent_loader_markdown",
+    "load_agents_from_markdown": "agent_loader_markdown",
+    "MarkdownAgentLoader": "agent_loader_markdown",
+    "check_all_model_max_tokens": "check_all_model_max_tokens",
+    "csv_to_text": "data_to_text",
+    "data_to_text": "data_to_text",
+    "json_to_text": "data_to_text",
+    "txt_to_text": "data_to_text",
+    "dynamic_auto_chunking": "dynamic_context_window",
+    "ExecutionService": "execution_service",
+    "get_execution_service": "execution_service",
+    "create_file_in_folder": "file_processing",
+    "load_json": "file_processing",
+    "sanitize_file_path": "file_processing",
+    "zip_folders": "file_processing",
+    "zip_workspace": "file_processing",
+    "history_output_formatter": "history_output_formatter",
+    "count_tokens": "litellm_tokenizer",
+    "count_tokens_batch": "litellm_tokenizer",
+    "LiteLLM": "litellm_wrapper",
+    "NetworkConnectionError": "litellm_wrapper",
+    "LiteLLMException": "litellm_wrapper",
+    "LLMResponseCache": "llm_response_cache",
+    "get_llm_response_cache": "llm_response_cache",
+    "HistoryOutputType": "output_types",
+    "extract_code_from_markdown": "parse_code",
+    "pdf_to_text": "pdf_to_text",
+    "try_except_wrapper": "try_except_wrapper",
+}
+
+__getattr__, __dir__ = attach_lazy_exports(__name__, _LAZY_EXPORTS)
 
 __all__ = [
     "csv_to_text",
@@ -50,6 +101,7 @@ __all__ = [
     "pdf_to_text",
     "try_except_wrapper",
     "count_tokens",
+    "count_tokens_batch",
     "HistoryOutputType",
     "history_output_formatter",
     "check_all_model_max_tokens",
@@ -60,4 +112,8 @@ __all__ = [
     "LiteLLM",
     "NetworkConnectionError",
     "LiteLLMException",
+    "LLMResponseCache",
+    "get_llm_response_cache",
+    "ExecutionService",
+    "get_execution_service",
 ]
@@ -2,7 +2,7 @@ import traceback
 
 from loguru import logger
 
-from synarkos.utils.litellm_tokenizer import count_tokens
+from synarkos.utils.litellm_tokenizer import truncate_to_token_limit
 from typing import Optional
 
 
@@ -22,42 +22,15 @@ def dynamic_auto_chunking_(
     Returns:
         str: The chunked conversation history as a string that fits within context_length tokens.
     """
-    total_tokens = count_tokens(
-        text=content, model=tokenizer_model_name
+    # Encode once and keep the most recent tokens instead of
+    # re-tokenizing candidate suffixes in a binary search
+    return truncate_to_token_limit(
+        text=content,
+        max_tokens=context_length,
+        model=tokenizer_model_name,
+        keep="end",
     )
 
-    if total_tokens <= context_length:
-        return content
-
-    # We need to remove characters from the beginning until we're under the limit
-    # Start by removing a percentage of characters and adjust iteratively
-    target_tokens = context_length
-    current_string = content
-
-    # Binary search approach to find the right cutoff point
-    left, right = 0, len(content)
-
-    while left < right:
-        mid = (left + right) // 2
-        test_string = content[mid:]
-
-        if not test_string:
-            break
-
-        test_tokens = count_tokens(
-            text=test_string, model=tokenizer_model_name
-        )
-
-        if test_tokens <= target_tokens:
-            # We can remove more from the beginning
-            right = mid
-            current_string = test_string
-        else:
-            # We need to keep more from the beginning
-            left = mid + 1
-
-    return current_string
-
 
 def dynamic_auto_chunking(
     content: str,
@@ -0,0 +1,320 @@
+import hashlib
+import json
+import os
+import re
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from loguru import logger
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+KEY_SIZE = 16
+
+
+def default_embedding_cache_dir() -> Path:
+    """
+    Resolve the directory used for the shared embedding cache.
+
+    ``SYNARKOS_EMBEDDING_CACHE_DIR`` wins; otherwise the cache lives in
+    the user cache directory (``$XDG_CACHE_HOME`` or ``~/.cache``) under
+    ``synarkos/embeddings``, never in the current working directory.
+
+    Returns:
+        Path: The cache directory.
+    """
+    cache_dir = os.getenv("SYNARKOS_EMBEDDING_CACHE_DIR")
+    if cache_dir:
+        return Path(cache_dir)
+    cache_home = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "synarkos" / "embeddings"
+
+
+def text_digest(text: str) -> bytes:
+    """Content hash used as the on-disk key of an embedding."""
+    return hashlib.blake2b(
+        text.encode("utf-8", "surrogatepass"), digest_size=KEY_SIZE
+    ).digest()
+
+
+class _ModelStore:
+    """
+    Append-only embedding store for a single model.
+
+    ``vectors.bin`` holds float32 rows and is memory-mapped for reads;
+    ``keys.bin`` holds the 16-byte digest of row ``i`` at offset
+    ``16 * i``. Vectors are flushed before their keys, so a key is only
+    ever visible once its row is complete on disk.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.keys_path = directory / "keys.bin"
+        self.vectors_path = directory / "vectors.bin"
+        self.meta_path = directory / "meta.json"
+        self.lock_path = directory / ".lock"
+
+        self._lock = threading.Lock()
+        self._rows: Dict[bytes, int] = {}
+        self._keys_read = 0
+        self._dimension: Optional[int] = None
+        self._vectors: Optional[np.memmap] = None
+
+    @contextmanager
+    def _file_lock(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_path, "a+b") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _load_dimension(self) -> Optional[int]:
+        if self._dimension is None and self.meta_path.exists():
+            with open(self.meta_path, "r", encoding="utf-8") as f:
+                self._dimension = int(json.load(f)["dimension"])
+        return self._dimension
+
+    def _refresh(self):
+        """Pick up rows appended by this or any other process."""
+        if self._load_dimension() is None:
+            return
+
+        try:
+            keys_size = os.path.getsize(self.keys_path)
+            vectors_size = os.path.getsize(self.vectors_path)
+        except OSError:
+            return
+
+        row_bytes = self._dimension * 4
+        rows = min(keys_size // KEY_SIZE, vectors_size // row_bytes)
+        if rows <= self._keys_read:
+            return
+
+        with open(self.keys_path, "rb") as f:
+            f.seek(self._keys_read * KEY_SIZE)
+            data = f.read((rows - self._keys_read) * KEY_SIZE)
+        for offset in range(0, len(data), KEY_SIZE):
+            self._rows.setdefault(
+                data[offset : offset + KEY_SIZE],
+                self._keys_read + offset // KEY_SIZE,
+            )
+
+        self._keys_read = rows
+        self._vectors = np.memmap(
+            self.vectors_path,
+            dtype=np.float32,
+            mode="r",
+            shape=(rows, self._dimension),
+        )
+
+    def get_many(
+        self, digests: Sequence[bytes]
+    ) -> List[Optional[np.ndarray]]:
+        with self._lock:
+            if any(d not in self._rows for d in digests):
+                self._refresh()
+            return [
+                (
+                    np.array(self._vectors[self._rows[d]])
+                    if d in self._rows
+                    else None
+                )
+                for d in digests
+            ]
+
+    def put_many(
+        self, digests: Sequence[bytes], vectors: np.ndarray
+    ) -> None:
+        with self._lock, self._file_lock():
+            dimension = self._load_dimension()
+            if dimension is None:
+                dimension = vectors.shape[1]
+                with open(self.meta_path, "w", encoding="utf-8") as f:
+                    json.dump({"dimension": dimension}, f)
+                self._dimension = dimension
+            elif vectors.shape[1] != dimension:
+                logger.warning(
+                    f"Not caching embeddings of dimension {vectors.shape[1]} in {self.directory} (expected {dimension})"
+                )
+                return
+
+            self._refresh()
+            rows = self._keys_read
+
+            # Drop a torn tail left by a crashed writer
+            for path, size in (
+                (self.keys_path, rows * KEY_SIZE),
+                (self.vectors_path, rows * dimension * 4),
+            ):
+                if path.exists() and os.path.getsize(path) != size:
+                    os.truncate(path, size)
+
+            new_digests = []
+            new_rows = []
+            for digest, vector in zip(digests, vectors):
+                if digest in self._rows or digest in new_digests:
+                    continue
+                new_digests.append(digest)
+                new_rows.append(vector)
+            if not new_digests:
+                return
+
+            with open(self.vectors_path, "ab") as f:
+                f.write(
+                    np.asarray(new_rows, dtype=np.float32).tobytes()
+                )
+                f.flush()
+            with open(self.keys_path, "ab") as f:
+                f.write(b"".join(new_digests))
+                f.flush()
+
+            self._refresh()
+
+
+class EmbeddingCache:
+    """
+    Content-addressed, on-disk embedding cache shared across processes.
+
+    Embeddings are keyed by ``(model, api_base, blake2b(text))``, so
+    endpoints serving the same model name never share vectors. Each
+    model and endpoint gets an append-only directory whose vector file is
+    memory-mapped, so lookups
+    after a restart cost a dictionary probe and a page read instead of an
+    embedding API round-trip. Appends take an exclusive file lock, which
+    makes concurrent writers from several processes safe. Stores are
+    never evicted; delete the directory to reclaim space.
+
+    Attributes:
+        cache_dir (Path): Root directory of the cache.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = Path(
+            cache_dir or default_embedding_cache_dir()
+        )
+        self._stores: Dict[Tuple[str, Optional[str]], _ModelStore] = (
+            {}
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _store(
+        self, model: str, api_base: Optional[str] = None
+    ) -> _ModelStore:
+        key = (model, api_base)
+        with self._lock:
+            store = self._stores.get(key)
+            if store is None:
+                slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", model)[:64]
+                # The default endpoint keeps the model-only directory
+                identity = (
+                    model
+                    if api_base is None
+                    else f"{model}\0{api_base}"
+                )
+                suffix = hashlib.blake2b(
+                    identity.encode("utf-8"), digest_size=4
+                ).hexdigest()
+                store = _ModelStore(
+                    self.cache_dir / f"{slug}-{suffix}"
+                )
+                self._stores[key] = store
+            return store
+
+    def get_many(
+        self,
+        model: str,
+        texts: Sequence[str],
+        api_base: Optional[str] = None,
+    ) -> List[Optional[List[float]]]:
+        """
+        Look up cached embeddings.
+
+        Args:
+            model (str): The embedding model name.
+            texts (Sequence[str]): The texts to look up.
+            api_base (Optional[str]): Endpoint serving the model, if not
+                the provider default.
+
+        Returns:
+            List[Optional[List[float]]]: The cached vector per text, or None
+            for texts that are not cached yet.
+        """
+        try:
+            vectors = self._store(model, api_base).get_many(
+                [text_digest(text) for text in texts]
+            )
+        except (OSError, ValueError) as e:
+            logger.warning(f"Embedding cache read failed: {e}")
+            vectors = [None] * len(texts)
+
+        found = sum(vector is not None for vector in vectors)
+        self.hits += found
+        self.misses += len(texts) - found
+        return [
+            vector.tolist() if vector is not None else None
+            for vector in vectors
+        ]
+
+    def put_many(
+        self,
+        model: str,
+        texts: Sequence[str],
+        vectors: Sequence[Sequence[float]],
+        api_base: Optional[str] = None,
+    ) -> None:
+        """
+        Store embeddings, skipping texts that are already cached.
+
+        Args:
+            model (str): The embedding model name.
+            texts (Sequence[str]): The embedded texts.
+            vectors (Sequence[Sequence[float]]): One embedding per text.
+            api_base (Optional[str]): Endpoint serving the model, if not
+                the provider default.
+        """
+        if not texts:
+            return
+        try:
+            self._store(model, api_base).put_many(
+                [text_digest(text) for text in texts],
+                np.asarray(vectors, dtype=np.float32),
+            )
+        except (OSError, ValueError) as e:
+            logger.warning(f"Embedding cache write failed: {e}")
+
+
+_shared_caches: Dict[Path, EmbeddingCache] = {}
+_shared_caches_lock = threading.Lock()
+
+
+def get_embedding_cache(
+    cache_dir: Optional[str] = None,
+) -> EmbeddingCache:
+    """
+    Return the process-wide ``EmbeddingCache`` for a directory.
+
+    Args:
+        cache_dir (Optional[str]): Cache directory, see ``default_embedding_cache_dir``.
+
+    Returns:
+        EmbeddingCache: The shared cache instance.
+    """
+    path = Path(cache_dir or default_embedding_cache_dir()).resolve()
+    with _shared_caches_lock:
+        cache = _shared_caches.get(path)
+        if cache is None:
+            cache = EmbeddingCache(path)
+            _shared_caches[path] = cache
+        return cache
@@ -0,0 +1,318 @@
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+from litellm import embedding
+from loguru import logger
+
+from synarkos.utils.embedding_cache import EmbeddingCache
+
+EMBEDDING_BATCH_SIZE = 256
+
+
+def _response_vectors(response: Any) -> List[List[float]]:
+    """
+    Extract embedding vectors from a litellm embedding response.
+
+    Args:
+        response (Any): The response returned by ``litellm.embedding``.
+
+    Returns:
+        List[List[float]]: One vector per input, in input order.
+
+    Raises:
+        ValueError: If the response does not contain embeddings.
+    """
+    if not hasattr(response, "data") or not response.data:
+        logger.error(f"Unexpected response structure: {response}")
+        raise ValueError(
+            f"Unexpected embedding response structure: {type(response)}"
+        )
+
+    items = []
+    for position, item in enumerate(response.data):
+        if hasattr(item, "embedding"):
+            vector = item.embedding
+            index = getattr(item, "index", position)
+        elif isinstance(item, dict) and "embedding" in item:
+            vector = item["embedding"]
+            index = item.get("index", position)
+        else:
+            logger.error(f"Unexpected response structure: {item}")
+            raise ValueError(
+                f"Unexpected embedding response structure: {type(item)}"
+            )
+        items.append(
+            (index if index is not None else position, vector)
+        )
+
+    items.sort(key=lambda pair: pair[0])
+    return [vector for _, vector in items]
+
+
+def embed_texts(
+    texts: Sequence[str],
+    model: str,
+    api_key: Optional[str] = None,
+    api_base: Optional[str] = None,
+    batch_size: int = EMBEDDING_BATCH_SIZE,
+    cache: Optional[EmbeddingCache] = None,
+) -> List[List[float]]:
+    """
+    Embed many texts with as few embedding API calls as possible.
+
+    Args:
+        texts (Sequence[str]): The texts to embed.
+        model (str): The litellm embedding model name.
+        api_key (Optional[str]): API key for the embedding service.
+        api_base (Optional[str]): Custom API base URL.
+        batch_size (int): Maximum number of texts sent per request.
+        cache (Optional[EmbeddingCache]): Persistent cache consulted before,
+            and filled after, calling the embedding API.
+
+    Returns:
+        List[List[float]]: One embedding per text, in input order.
+    """
+    if cache is None:
+        return _embed_uncached(
+            texts, model, api_key, api_base, batch_size
+        )
+
+    vectors = cache.get_many(model, texts, api_base=api_base)
+    missing = list(
+        dict.fromkeys(
+            text
+            for text, vector in zip(texts, vectors)
+            if vector is None
+        )
+    )
+    if missing:
+        fresh = _embed_uncached(
+            missing, model, api_key, api_base, batch_size
+        )
+        cache.put_many(model, missing, fresh, api_base=api_base)
+        by_text = dict(zip(missing, fresh))
+        vectors = [
+            vector if vector is not None else by_text[text]
+            for text, vector in zip(texts, vectors)
+        ]
+    return vectors
+
+
+def _embed_uncached(
+    texts: Sequence[str],
+    model: str,
+    api_key: Optional[str],
+    api_base: Optional[str],
+    batch_size: int,
+) -> List[List[float]]:
+    vectors = []
+    for start in range(0, len(texts), max(1, batch_size)):
+        params = {
+            "model": model,
+            "input": list(texts[start : start + batch_size]),
+        }
+        if api_key:
+            params["api_key"] = api_key
+        if api_base:
+            params["api_base"] = api_base
+
+        vectors.extend(_response_vectors(embedding(**params)))
+
+    if len(vectors) != len(texts):
+        raise ValueError(
+            f"Expected {len(texts)} embeddings, received {len(vectors)}"
+        )
+    return vectors
+
+
+def cosine_similarity(
+    vec1: Sequence[float], vec2: Sequence[float]
+) -> float:
+    """
+    Calculate cosine similarity between two vectors.
+
+    Args:
+        vec1 (Sequence[float]): First vector.
+        vec2 (Sequence[float]): Second vector.
+
+    Returns:
+        float: Cosine similarity, or 0.0 if either vector is all zeros.
+
+    Raises:
+        ValueError: If the vectors have different lengths.
+    """
+    a = np.asarray(vec1, dtype=np.float64)
+    b = np.asarray(vec2, dtype=np.float64)
+    if a.shape != b.shape:
+        raise ValueError("Vectors must have the same length")
+
+    norm = np.linalg.norm(a) * np.linalg.norm(b)
+    if norm == 0:
+        return 0.0
+    return float(np.dot(a, b) / norm)
+
+
+class EmbeddingIndex:
+    """
+    In-memory cosine-similarity index over a contiguous NumPy matrix.
+
+    Rows are L2-normalized on insertion, so scoring every stored vector
+    against a query is a single matrix-vector product. Storage grows
+    geometrically, making appends amortized O(d).
+
+    Attributes:
+        dtype (np.dtype): Floating point type of the stored matrix.
+    """
+
+    def __init__(
+        self,
+        dimension: Optional[int] = None,
+        dtype: Any = np.float32,
+    ):
+        self.dtype = np.dtype(dtype)
+        self._dimension = dimension
+        self._matrix = np.empty((0, dimension or 0), dtype=self.dtype)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def dimension(self) -> Optional[int]:
+        """Length of the stored vectors, or None while the index is empty."""
+        return self._dimension
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """View of the normalized vectors currently stored."""
+        return self._matrix[: self._size]
+
+    def _normalize(self, vectors: Any) -> np.ndarray:
+        # Always copy: rows are normalized in place below
+        matrix = np.atleast_2d(np.array(vectors, dtype=self.dtype))
+        if matrix.ndim != 2:
+            raise ValueError(
+                "Embeddings must be one or two dimensional"
+            )
+
+        if self._dimension is None:
+            self._dimension = matrix.shape[1]
+        elif matrix.shape[1] != self._dimension:
+            raise ValueError(
+                f"Embedding dimension {matrix.shape[1]} does not match index dimension {self._dimension}"
+            )
+
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        # Zero vectors stay zero and therefore score 0 against anything
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix
+
+    def _reserve(self, rows: int):
+        capacity = self._matrix.shape[0]
+        if (
+            self._size + rows <= capacity
+            and self._matrix.shape[1] == self._dimension
+        ):
+            return
+
+        new_capacity = max(16, capacity * 2, self._size + rows)
+        matrix = np.empty(
+            (new_capacity, self._dimension), dtype=self.dtype
+        )
+        if self._size:
+            matrix[: self._size] = self._matrix[: self._size]
+        self._matrix = matrix
+
+    def add(self, vector: Sequence[float]) -> int:
+        """
+        Add a single vector to the index.
+
+        Args:
+            vector (Sequence[float]): The embedding to store.
+
+        Returns:
+            int: Row position of the stored vector.
+        """
+        return self.add_batch([vector])[0]
+
+    def add_batch(
+        self, vectors: Sequence[Sequence[float]]
+    ) -> List[int]:
+        """
+        Add several vectors to the index at once.
+
+        Args:
+            vectors (Sequence[Sequence[float]]): The embeddings to store.
+
+        Returns:
+            List[int]: Row positions of the stored vectors.
+        """
+        if len(vectors) == 0:
+            return []
+
+        matrix = self._normalize(vectors)
+        self._reserve(len(matrix))
+
+        start = self._size
+        self._matrix[start : start + len(matrix)] = matrix
+        self._size += len(matrix)
+        return list(range(start, self._size))
+
+    def update(self, position: int, vector: Sequence[float]) -> None:
+        """
+        Replace the vector stored at ``position``.
+
+        Args:
+            position (int): Row position returned by ``add``.
+            vector (Sequence[float]): The new embedding.
+        """
+        if not 0 <= position < self._size:
+            raise IndexError(
+                f"Index position {position} out of range"
+            )
+        self._matrix[position] = self._normalize(vector)[0]
+
+    def clear(self) -> None:
+        """Remove every vector while keeping the dimension."""
+        self._size = 0
+
+    def scores(self, query: Sequence[float]) -> np.ndarray:
+        """
+        Cosine similarity between ``query`` and every stored vector.
+
+        Args:
+            query (Sequence[float]): The query embedding.
+
+        Returns:
+            np.ndarray: One score per stored vector, in insertion order.
+        """
+        if self._size == 0:
+            return np.empty(0, dtype=self.dtype)
+        return self.vectors @ self._normalize(query)[0]
+
+    def search(
+        self, query: Sequence[float], k: int = 1
+    ) -> List[Tuple[int, float]]:
+        """
+        Find the ``k`` stored vectors most similar to ``query``.
+
+        Args:
+            query (Sequence[float]): The query embedding.
+            k (int): Number of results to return.
+
+        Returns:
+            List[Tuple[int, float]]: ``(position, score)`` pairs sorted by
+            descending score.
+        """
+        scores = self.scores(query)
+        k = min(max(k, 0), len(scores))
+        if k == 0:
+            return []
+
+        if k < len(scores):
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(len(scores))
+        # Stable sort keeps insertion order among equal scores
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(int(i), float(scores[i])) for i in top]
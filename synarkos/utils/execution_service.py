@@ -0,0 +1,308 @@
+import atexit
+import concurrent.futures
+import os
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from loguru import logger
+
+from synarkos.telemetry.tracing import bind_trace_context
+
+# Agent work is dominated by waiting on LLM providers, so the pool is
+# sized for I/O concurrency rather than CPU cores.
+DEFAULT_MAX_WORKERS = 64
+
+
+def parse_model_limits(spec: Optional[str]) -> Dict[str, int]:
+    """
+    Parse per-model concurrency limits.
+
+    Args:
+        spec (Optional[str]): Comma-separated ``model=limit`` pairs, e.g.
+            ``"gpt-4o=8,claude-3-5-sonnet=4,*=16"``; ``*`` sets the
+            default for every other model.
+
+    Returns:
+        Dict[str, int]: Limit per model name.
+    """
+    limits = {}
+    for item in (spec or "").split(","):
+        model, sep, limit = item.strip().rpartition("=")
+        if not sep or not model:
+            continue
+        try:
+            limits[model.strip()] = max(1, int(limit))
+        except ValueError:
+            logger.warning(f"Ignoring invalid model limit: {item!r}")
+    return limits
+
+
+def model_key(agent: Any) -> Optional[str]:
+    """
+    Name of the model an agent calls, used to pick its semaphore.
+
+    Args:
+        agent (Any): An ``Agent`` or any callable worker.
+
+    Returns:
+        Optional[str]: The model name, or None if unknown.
+    """
+    model = getattr(agent, "model_name", None)
+    return model if isinstance(model, str) and model else None
+
+
+class ExecutionService(concurrent.futures.Executor):
+    """
+    Long-lived executor shared by the swarm structures.
+
+    Work runs on one persistent thread pool sized for network-bound LLM
+    calls, so repeated ``run`` and ``batch_run`` calls reuse threads
+    instead of creating a pool each time. On top of the global worker
+    limit:
+
+    - Per-model limits cap concurrent calls to a model, so they can
+      follow provider rate limits. Work beyond a model's limit waits in
+      a per-model queue and does not hold a worker thread.
+    - Backpressure makes ``submit`` block once ``max_pending`` tasks are
+      queued or running.
+    - When a task running on the service submits nested work that cannot
+      start right away, the nested work runs inline on the submitting
+      thread. Nested swarms therefore never deadlock waiting for a
+      worker.
+
+    Futures carry the submitter's tracing context.
+
+    Attributes:
+        max_workers (int): Size of the thread pool.
+        max_pending (int): Tasks accepted before ``submit`` blocks.
+        model_limits (Dict[str, int]): Concurrency limit per model.
+        default_model_limit (Optional[int]): Limit for unlisted models.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        model_limits: Optional[Dict[str, int]] = None,
+        default_model_limit: Optional[int] = None,
+    ):
+        self.max_workers = max(
+            1,
+            max_workers
+            or int(
+                os.getenv(
+                    "SYNARKOS_MAX_CONCURRENCY", DEFAULT_MAX_WORKERS
+                )
+            ),
+        )
+        self.max_pending = max(
+            self.max_workers, max_pending or self.max_workers * 4
+        )
+
+        limits = parse_model_limits(
+            os.getenv("SYNARKOS_MODEL_CONCURRENCY")
+        )
+        limits.update(model_limits or {})
+        self.default_model_limit = default_model_limit or limits.pop(
+            "*", None
+        )
+        self.model_limits = limits
+
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="synarkos-exec",
+            initializer=self._mark_worker,
+        )
+        self._cond = threading.Condition()
+        self._local = threading.local()
+        self._pending = 0
+        self._busy = 0
+        self._active: Dict[Optional[str], int] = {}
+        self._parked: Dict[Optional[str], Deque[Tuple]] = {}
+        self._shutdown = False
+
+    def _mark_worker(self) -> None:
+        self._local.worker = True
+
+    def limit_for(self, model: Optional[str]) -> Optional[int]:
+        """Concurrency limit applied to ``model``, or None for none."""
+        if model is None:
+            return None
+        return self.model_limits.get(model, self.default_model_limit)
+
+    def set_model_limit(self, model: str, limit: int) -> None:
+        """
+        Set the concurrency limit of a model.
+
+        Args:
+            model (str): The model name.
+            limit (int): Maximum concurrent calls to the model.
+        """
+        with self._cond:
+            self.model_limits[model] = max(1, limit)
+
+    def _slot_free(self, model: Optional[str]) -> bool:
+        limit = self.limit_for(model)
+        return limit is None or self._active.get(model, 0) < limit
+
+    def submit_model(
+        self, model: Optional[str], fn: Callable, /, *args, **kwargs
+    ) -> concurrent.futures.Future:
+        """
+        Schedule ``fn(*args, **kwargs)`` under a model's concurrency limit.
+
+        Args:
+            model (Optional[str]): Model the call uses; None for no limit.
+            fn (Callable): The function to run.
+            *args: Positional arguments for ``fn``.
+            **kwargs: Keyword arguments for ``fn``.
+
+        Returns:
+            concurrent.futures.Future: The pending result.
+        """
+        future = concurrent.futures.Future()
+        task = (model, future, bind_trace_context(fn), args, kwargs)
+        in_worker = getattr(self._local, "worker", False)
+
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError(
+                    "cannot schedule new futures after shutdown"
+                )
+
+            if in_worker:
+                inline = (
+                    self._pending >= self.max_pending
+                    or self._busy >= self.max_workers
+                    or not self._slot_free(model)
+                )
+            else:
+                while self._pending >= self.max_pending:
+                    self._cond.wait()
+                    if self._shutdown:
+                        raise RuntimeError(
+                            "cannot schedule new futures after shutdown"
+                        )
+                inline = False
+
+            start = False
+            if not inline:
+                self._pending += 1
+                if self._slot_free(model):
+                    self._active[model] = (
+                        self._active.get(model, 0) + 1
+                    )
+                    self._busy += 1
+                    start = True
+                else:
+                    self._parked.setdefault(model, deque()).append(
+                        task
+                    )
+
+        if inline:
+            self._execute(future, task[2], args, kwargs)
+        elif start:
+            self._pool.submit(self._run, task)
+        return future
+
+    def submit(
+        self, fn: Callable, /, *args, **kwargs
+    ) -> concurrent.futures.Future:
+        """Schedule ``fn(*args, **kwargs)`` without a model limit."""
+        return self.submit_model(None, fn, *args, **kwargs)
+
+    def submit_agent(
+        self, agent: Any, *args, **kwargs
+    ) -> concurrent.futures.Future:
+        """
+        Schedule ``agent.run(*args, **kwargs)`` under the agent's model limit.
+
+        Args:
+            agent (Any): The agent to run.
+            *args: Positional arguments for ``agent.run``.
+            **kwargs: Keyword arguments for ``agent.run``.
+
+        Returns:
+            concurrent.futures.Future: The agent's output.
+        """
+        return self.submit_model(
+            model_key(agent), agent.run, *args, **kwargs
+        )
+
+    @staticmethod
+    def _execute(future, fn, args, kwargs) -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+    def _run(self, task: Tuple) -> None:
+        model, future, fn, args, kwargs = task
+        try:
+            self._execute(future, fn, args, kwargs)
+        finally:
+            with self._cond:
+                self._pending -= 1
+                parked = self._parked.get(model)
+                if parked and not self._shutdown:
+                    # Hand the model slot and worker to the next waiter
+                    next_task = parked.popleft()
+                else:
+                    next_task = None
+                    self._busy -= 1
+                    self._active[model] -= 1
+                self._cond.notify_all()
+            if next_task is not None:
+                self._pool.submit(self._run, next_task)
+
+    def shutdown(
+        self, wait: bool = True, *, cancel_futures: bool = False
+    ) -> None:
+        """
+        Stop accepting work; tasks still waiting for a model slot are
+        cancelled.
+
+        Args:
+            wait (bool): Block until running tasks finish.
+            cancel_futures (bool): Also cancel tasks queued in the pool.
+        """
+        with self._cond:
+            self._shutdown = True
+            parked = [
+                task
+                for queue in self._parked.values()
+                for task in queue
+            ]
+            self._parked.clear()
+            self._pending -= len(parked)
+            self._cond.notify_all()
+        for task in parked:
+            task[1].cancel()
+        self._pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+_shared_service: Optional[ExecutionService] = None
+_shared_service_lock = threading.Lock()
+
+
+def get_execution_service() -> ExecutionService:
+    """
+    Return the process-wide ``ExecutionService``.
+
+    Sized by ``SYNARKOS_MAX_CONCURRENCY`` (default 64 workers) with
+    per-model limits from ``SYNARKOS_MODEL_CONCURRENCY``.
+
+    Returns:
+        ExecutionService: The shared service.
+    """
+    global _shared_service
+    with _shared_service_lock:
+        if _shared_service is None:
+            _shared_service = ExecutionService()
+            atexit.register(_shared_service.shutdown, False)
+        return _shared_service
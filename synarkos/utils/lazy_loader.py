@@ -0,0 +1,78 @@
+import importlib
+import sys
+import types
+from typing import Any, Callable, Dict, List, Tuple
+
+
+class _LazyPackage(types.ModuleType):
+    """
+    Module type for packages using ``attach_lazy_exports``.
+
+    Importing a submodule binds it as an attribute of its package. When an
+    export shares its name with the submodule defining it (say
+    ``pdf_to_text`` from ``synarkos.utils.pdf_to_text``), that binding would
+    shadow the export, so the export is bound instead, as the eager
+    ``from .pdf_to_text import pdf_to_text`` used to do.
+    """
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        target = self.__dict__.get("_lazy_exports", {}).get(name)
+        if (
+            target is not None
+            and isinstance(value, types.ModuleType)
+            and value.__name__ == target[0]
+        ):
+            value = getattr(value, target[1])
+        super().__setattr__(name, value)
+
+
+def attach_lazy_exports(
+    package_name: str, exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build PEP 562 ``__getattr__`` and ``__dir__`` for a package.
+
+    Each export is imported from its submodule on first attribute access
+    and then cached in the package namespace, so importing the package
+    itself costs nothing beyond this helper.
+
+    Args:
+        package_name (str): ``__name__`` of the package.
+        exports (Dict[str, str]): Public name to ``"submodule"`` or
+            ``"submodule:attribute"``, relative to the package.
+
+    Returns:
+        Tuple[Callable[[str], Any], Callable[[], List[str]]]: The
+        ``__getattr__`` and ``__dir__`` functions for the package.
+
+    Example:
+        >>> __getattr__, __dir__ = attach_lazy_exports(
+        ...     __name__, {"Agent": "agent"}
+        ... )
+    """
+    targets = {}
+    for name, spec in exports.items():
+        module, _, attribute = spec.partition(":")
+        targets[name] = (
+            f"{package_name}.{module}",
+            attribute or name,
+        )
+
+    package = sys.modules[package_name]
+    package.__dict__["_lazy_exports"] = targets
+    package.__class__ = _LazyPackage
+
+    def __getattr__(name: str) -> Any:
+        target = targets.get(name)
+        if target is None:
+            raise AttributeError(
+                f"module {package_name!r} has no attribute {name!r}"
+            )
+        value = getattr(importlib.import_module(target[0]), target[1])
+        setattr(package, name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(package.__dict__) | set(targets))
+
+    return __getattr__, __dir__
@@ -1,58 +1,137 @@
-from litellm import encode, model_list
-from loguru import logger
-from typing import Optional
+import hashlib
+import threading
+from collections import OrderedDict
 from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from litellm import decode, encode, model_list
+from loguru import logger
+
+try:
+    from litellm.utils import _select_tokenizer
+except ImportError:  # pragma: no cover - older/newer litellm layouts
+    _select_tokenizer = None
 
 # Use consistent default model
 DEFAULT_MODEL = "gpt-4o-mini"
 
+# Maximum number of memoized (model, text) token counts
+TOKEN_COUNT_CACHE_SIZE = 8192
 
-def count_tokens(
-    text: str,
-    model: str = DEFAULT_MODEL,
-    default_encoder: Optional[str] = DEFAULT_MODEL,
-) -> int:
+
+class TokenCountCache:
     """
-    Count the number of tokens in the given text using the specified model.
+    Thread-safe bounded LRU of token counts keyed by (model, content hash).
 
-    Args:
-        text: The text to tokenize
-        model: The model to use for tokenization (defaults to gpt-4o-mini)
-        default_encoder: Fallback encoder if the primary model fails (defaults to DEFAULT_MODEL)
+    Attributes:
+        maxsize (int): Maximum number of entries kept in the cache.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups that required encoding.
+    """
 
-    Returns:
-        int: Number of tokens in the text
+    def __init__(self, maxsize: int = TOKEN_COUNT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, bytes], int]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
 
-    Raises:
-        ValueError: If text is empty or if both primary and fallback models fail
-    """
-    if not text or not text.strip():
-        logger.warning("Empty or whitespace-only text provided")
-        return 0
+    @staticmethod
+    def make_key(text: str, model: str) -> Tuple[str, bytes]:
+        digest = hashlib.blake2b(
+            text.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+        return (model, digest)
+
+    def get(self, key: Tuple[str, bytes]) -> Optional[int]:
+        with self._lock:
+            count = self._entries.get(key)
+            if count is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return count
+
+    def set(self, key: Tuple[str, bytes], count: int):
+        with self._lock:
+            self._entries[key] = count
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
 
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_token_count_cache = TokenCountCache()
+
+
+@lru_cache(maxsize=64)
+def _get_tokenizer(model: str) -> Optional[dict]:
+    """Resolve and cache the litellm tokenizer for a model."""
+    if _select_tokenizer is None:
+        return None
+    return _select_tokenizer(model=model)
+
+
+def _encode(text: str, model: str) -> List[int]:
+    tokenizer = _get_tokenizer(model)
+    if tokenizer is None:
+        return encode(model=model, text=text)
+    return encode(model=model, text=text, custom_tokenizer=tokenizer)
+
+
+def _encode_lengths(texts: List[str], model: str) -> List[int]:
+    """Encode many texts with one tokenizer call where the backend supports it."""
+    tokenizer = _get_tokenizer(model)
+    backend = tokenizer["tokenizer"] if tokenizer else None
+
+    if tokenizer and tokenizer.get("type") == "openai_tokenizer":
+        return [
+            len(tokens)
+            for tokens in backend.encode_batch(
+                texts, disallowed_special=()
+            )
+        ]
+    if backend is not None and hasattr(backend, "encode_batch"):
+        return [
+            len(getattr(encoded, "ids", encoded))
+            for encoded in backend.encode_batch(texts)
+        ]
+    return [len(_encode(text, model)) for text in texts]
+
+
+def _count_uncached(
+    text: str, model: str, default_encoder: Optional[str]
+) -> int:
     # Set fallback encoder
     fallback_model = default_encoder or DEFAULT_MODEL
 
     # First attempt with the requested model
     try:
-        tokens = encode(model=model, text=text)
-        return len(tokens)
+        return len(_encode(text, model))
 
     except Exception as e:
         logger.warning(
             f"Failed to tokenize with model '{model}': {e} using fallback model '{fallback_model}'"
         )
 
-        logger.info(f"Using fallback model '{fallback_model}'")
-
         # Only try fallback if it's different from the original model
         if fallback_model != model:
             try:
                 logger.info(
                     f"Falling back to default encoder: {fallback_model}"
                 )
-                tokens = encode(model=fallback_model, text=text)
-                return len(tokens)
+                return len(_encode(text, fallback_model))
 
             except Exception as fallback_error:
                 logger.error(
@@ -70,6 +149,137 @@ def count_tokens(
             )
 
 
+def count_tokens(
+    text: str,
+    model: str = DEFAULT_MODEL,
+    default_encoder: Optional[str] = DEFAULT_MODEL,
+) -> int:
+    """
+    Count the number of tokens in the given text using the specified model.
+
+    Counts are memoized by content hash, so repeated text is only encoded once.
+
+    Args:
+        text: The text to tokenize
+        model: The model to use for tokenization (defaults to gpt-4o-mini)
+        default_encoder: Fallback encoder if the primary model fails (defaults to DEFAULT_MODEL)
+
+    Returns:
+        int: Number of tokens in the text, 0 for empty or whitespace-only text
+
+    Raises:
+        ValueError: If both primary and fallback models fail
+    """
+    if not text or not text.strip():
+        return 0
+
+    key = TokenCountCache.make_key(text, model)
+    count = _token_count_cache.get(key)
+    if count is None:
+        count = _count_uncached(text, model, default_encoder)
+        _token_count_cache.set(key, count)
+    return count
+
+
+def count_tokens_batch(
+    texts: List[str],
+    model: str = DEFAULT_MODEL,
+    default_encoder: Optional[str] = DEFAULT_MODEL,
+) -> List[int]:
+    """
+    Count tokens for many texts, encoding all cache misses in one tokenizer call.
+
+    Args:
+        texts: The texts to tokenize
+        model: The model to use for tokenization (defaults to gpt-4o-mini)
+        default_encoder: Fallback encoder if the primary model fails (defaults to DEFAULT_MODEL)
+
+    Returns:
+        List[int]: Token counts in the same order as ``texts``
+    """
+    counts: List[Optional[int]] = [0] * len(texts)
+    pending = {}
+
+    for index, text in enumerate(texts):
+        if not text or not text.strip():
+            continue
+        key = TokenCountCache.make_key(text, model)
+        count = _token_count_cache.get(key)
+        if count is None:
+            pending.setdefault(key, (text, []))[1].append(index)
+        else:
+            counts[index] = count
+
+    if not pending:
+        return counts
+
+    keys = list(pending)
+    misses = [pending[key][0] for key in keys]
+    try:
+        lengths = _encode_lengths(misses, model)
+    except Exception:
+        # Fall back to per-text counting, which handles the fallback encoder
+        lengths = [
+            _count_uncached(text, model, default_encoder)
+            for text in misses
+        ]
+
+    for key, length in zip(keys, lengths):
+        _token_count_cache.set(key, length)
+        for index in pending[key][1]:
+            counts[index] = length
+
+    return counts
+
+
+def clear_token_count_cache():
+    """Clear memoized token counts and the resolved tokenizers."""
+    _token_count_cache.clear()
+    _get_tokenizer.cache_clear()
+
+
+def truncate_to_token_limit(
+    text: str,
+    max_tokens: int,
+    model: str = DEFAULT_MODEL,
+    keep: str = "start",
+) -> str:
+    """
+    Truncate text to at most ``max_tokens`` tokens with a single encode.
+
+    Args:
+        text: The text to truncate
+        max_tokens: Maximum number of tokens to keep
+        model: The model to use for tokenization (defaults to gpt-4o-mini)
+        keep: "start" keeps the beginning of the text, "end" keeps the tail
+
+    Returns:
+        str: The truncated text
+    """
+    if not text or max_tokens <= 0:
+        return ""
+
+    tokens = _encode(text, model)
+    if len(tokens) <= max_tokens:
+        return text
+
+    if keep == "end":
+        kept = tokens[-max_tokens:]
+    else:
+        kept = tokens[:max_tokens]
+
+    tokenizer = _get_tokenizer(model)
+    if tokenizer is None:
+        text = decode(model=model, tokens=kept)
+    else:
+        text = decode(
+            model=model, tokens=kept, custom_tokenizer=tokenizer
+        )
+
+    # Slicing can split a multi-byte character at the cut point
+    return text.strip("\ufffd")
+
+
 @lru_cache(maxsize=100)
 def get_supported_models() -> list:
     """Get list of supported models from litellm."""
@@ -3,15 +3,29 @@ import base64
 import traceback
 import uuid
 from pathlib import Path
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Union
 import socket
 
 import litellm
 from pydantic import BaseModel
 import requests
-from litellm import completion, supports_vision
+from litellm import (
+    acompletion,
+    completion,
+    stream_chunk_builder,
+    supports_vision,
+)
 from loguru import logger
 
+from synarkos.utils.llm_response_cache import (
+    LLMResponseCache,
+    areplay_stream,
+    canonical_request_key,
+    get_llm_response_cache,
+    replay_stream,
+    response_from_cache,
+)
+
 
 class LiteLLMException(Exception):
     """
@@ -243,6 +257,9 @@ class LiteLLM:
         thinking_tokens: int = None,
         reasoning_enabled: bool = False,
         response_format: any = None,
+        response_cache: Optional[
+            Union[bool, LLMResponseCache]
+        ] = None,
         *args,
         **kwargs,
     ):
@@ -271,6 +288,8 @@ class LiteLLM:
             base_url (str, optional): Base URL for the API. Defaults to None.
             api_key (str, optional): API key. Defaults to None.
             api_version (str, optional): API version. Defaults to None.
+            response_cache (Union[bool, LLMResponseCache], optional): Serve identical
+                requests from a response cache. True uses the process-wide cache. Defaults to None.
             *args: Additional positional arguments that will be stored and used in run method.
                   If a single dictionary is passed, it will be merged into completion parameters.
             **kwargs: Additional keyword arguments that will be stored and used in run method.
@@ -301,6 +320,11 @@ class LiteLLM:
         self.reasoning_enabled = reasoning_enabled
         self.verbose = verbose
         self.response_format = response_format
+        self.response_cache = (
+            get_llm_response_cache()
+            if response_cache is True
+            else response_cache or None
+        )
         self.modalities = []
         self.messages = []  # Initialize messages list
 
@@ -945,6 +969,276 @@ class LiteLLM:
 
         return is_local_model or is_local_url
 
+    def _build_completion_params(
+        self,
+        task: str,
+        img: Optional[str] = None,
+        args: tuple = (),
+        kwargs: Optional[dict] = None,
+    ) -> dict:
+        """
+        Build the litellm completion parameters shared by run, arun and astream.
+
+        Args:
+            task (str): The task to run the model for.
+            img (str, optional): Image input if any. Defaults to None.
+            args (tuple): Runtime positional arguments passed to the caller.
+            kwargs (dict, optional): Runtime keyword arguments passed to the caller.
+
+        Returns:
+            dict: The completion parameters.
+        """
+        # Prepare messages properly - this handles both task and image together
+        messages = self._prepare_messages(task=task, img=img)
+
+        # Base completion parameters
+        completion_params = {
+            "model": self.model_name,
+            "messages": messages,
+            "stream": self.stream,
+            "max_tokens": self.max_tokens,
+            "caching": self.caching,
+            "temperature": self.temperature,
+            "top_p": self.top_p,
+        }
+
+        # Merge initialization kwargs first (lower priority)
+        if self.init_kwargs:
+            completion_params.update(self.init_kwargs)
+
+        # Merge runtime kwargs (higher priority - overrides init kwargs)
+        if kwargs:
+            completion_params.update(kwargs)
+
+        if self.api_version is not None:
+            completion_params["api_version"] = self.api_version
+
+        # Add temperature for non-o4/o3 models
+        if self.model_name not in [
+            "openai/o4-mini",
+            "openai/o3-2025-04-16",
+        ]:
+            completion_params["temperature"] = self.temperature
+
+        # Add tools if specified
+        if self.tools_list_dictionary is not None:
+            completion_params.update(
+                {
+                    "tools": self.tools_list_dictionary,
+                    "tool_choice": self.tool_choice,
+                    "parallel_tool_calls": self.parallel_tool_calls,
+                }
+            )
+
+        if self.functions is not None:
+            completion_params.update({"functions": self.functions})
+
+        if self.base_url is not None:
+            completion_params["base_url"] = self.base_url
+
+        if self.response_format is not None:
+            completion_params["response_format"] = (
+                self.response_format
+            )
+
+        # Add modalities if needed
+        if self.modalities and len(self.modalities) >= 2:
+            completion_params["modalities"] = self.modalities
+
+        if (
+            self.reasoning_effort is not None
+            and litellm.supports_reasoning(model=self.model_name)
+            is True
+        ):
+            completion_params["reasoning_effort"] = (
+                self.reasoning_effort
+            )
+
+        if (
+            self.reasoning_enabled is True
+            and self.thinking_tokens is not None
+        ):
+            thinking = {
+                "type": "enabled",
+                "budget_tokens": self.thinking_tokens,
+            }
+            completion_params["thinking"] = thinking
+
+        # Process additional args if any
+        self._process_additional_args(completion_params, args)
+
+        return completion_params
+
+    def _response_cache_key(
+        self, completion_params: dict
+    ) -> Optional[str]:
+        """Cache key of a request, or None when caching is disabled."""
+        if self.response_cache is None:
+            return None
+        return canonical_request_key(completion_params)
+
+    def _cached_response(self, cached: dict, completion_params: dict):
+        """Rebuild a cached response, as a replayed stream if one was requested."""
+        if completion_params.get("stream"):
+            return replay_stream(cached)
+        return response_from_cache(cached)
+
+    def _cache_response(
+        self, key: str, response: any, completion_params: dict
+    ):
+        """
+        Store a fresh response under ``key``.
+
+        Streams are passed through unchanged and stored once fully consumed.
+
+        Args:
+            key (str): The request cache key.
+            response (any): The litellm response or stream.
+            completion_params (dict): The request parameters.
+
+        Returns:
+            any: The response to hand on to the caller.
+        """
+        if not completion_params.get("stream"):
+            self.response_cache.set(key, response.model_dump())
+            return response
+
+        def record():
+            chunks = []
+            for chunk in response:
+                chunks.append(chunk)
+                yield chunk
+            self._store_stream(key, chunks, completion_params)
+
+        return record()
+
+    def _acache_response(
+        self, key: str, response: any, completion_params: dict
+    ):
+        """Async counterpart of _cache_response for acompletion results."""
+        if not completion_params.get("stream"):
+            self.response_cache.set(key, response.model_dump())
+            return response
+
+        async def record():
+            chunks = []
+            async for chunk in response:
+                chunks.append(chunk)
+                yield chunk
+            self._store_stream(key, chunks, completion_params)
+
+        return record()
+
+    def _store_stream(
+        self, key: str, chunks: list, completion_params: dict
+    ):
+        """Assemble a consumed stream into one response and cache it."""
+        if not chunks:
+            return
+        try:
+            assembled = stream_chunk_builder(
+                chunks, messages=completion_params.get("messages")
+            )
+            if assembled is not None:
+                self.response_cache.set(key, assembled.model_dump())
+        except Exception as error:
+            logger.warning(
+                f"Could not cache streamed response: {error}"
+            )
+
+    def _handle_response(self, response: any):
+        """
+        Convert a non-streaming completion response into the configured output.
+
+        Args:
+            response (any): The litellm completion response.
+
+        Returns:
+            any: The processed output, or the raw stream when streaming.
+        """
+        # Validate response
+        if not response:
+            logger.error(
+                "Received empty response from completion call"
+            )
+            return None
+
+        # Handle streaming response
+        if self.stream:
+            return response  # Return the streaming generator directly
+
+        # Handle reasoning model output
+        elif (
+            self.reasoning_enabled
+            and self.reasoning_effort is not None
+        ):
+            return self.output_for_reasoning(response)
+
+        # Handle tool-based response
+        elif self.tools_list_dictionary is not None:
+            result = self.output_for_tools(response)
+            return result
+        elif self.return_all is True:
+            return response.model_dump()
+        elif "gemini" in self.model_name.lower():
+            return gemini_output_img_handler(response)
+        else:
+            return response.choices[0].message.content
+
+    def _raise_network_error(self, network_error: Exception):
+        """
+        Raise a NetworkConnectionError with troubleshooting guidance.
+
+        Args:
+            network_error (Exception): The underlying connection error.
+
+        Raises:
+            NetworkConnectionError: Always.
+        """
+        # Check if this is a local model
+        if self.is_local_model(self.model_name, self.base_url):
+            error_msg = (
+                f"Network error connecting to local model '{self.model_name}': {str(network_error)}\n\n"
+                "Troubleshooting steps:\n"
+                "1. Ensure your local model server (e.g., Ollama, LlamaCPP) is running\n"
+                "2. Verify the base_url is correct and accessible\n"
+                "3. Check that the model is properly loaded and available\n"
+            )
+            logger.error(error_msg)
+            raise NetworkConnectionError(error_msg) from network_error
+
+        # Check internet connectivity
+        has_internet = self.check_internet_connection()
+
+        if not has_internet:
+            error_msg = (
+                f"No internet connection detected while trying to use model '{self.model_name}'.\n\n"
+                "Possible solutions:\n"
+                "1. Check your internet connection and try again\n"
+                "2. Reconnect to your network\n"
+                "3. Use a local model instead (e.g., Ollama):\n"
+                "   - Install Ollama from https://ollama.ai\n"
+                "   - Run: ollama pull llama2\n"
+                "   - Use model_name='ollama/llama2' in your LiteLLM configuration\n"
+                "\nExample:\n"
+                "  model = LiteLLM(model_name='ollama/llama2')\n"
+            )
+            logger.error(error_msg)
+            raise NetworkConnectionError(error_msg) from network_error
+        else:
+            # Internet is available but request failed
+            error_msg = (
+                f"Network error occurred while connecting to '{self.model_name}': {str(network_error)}\n\n"
+                "Possible causes:\n"
+                "1. The API endpoint may be temporarily unavailable\n"
+                "2. Connection timeout or slow network\n"
+                "3. Firewall or proxy blocking the connection\n"
+                "\nConsider using a local model as a fallback:\n"
+                "  model = LiteLLM(model_name='ollama/llama2')\n"
+            )
+            logger.error(error_msg)
+            raise NetworkConnectionError(error_msg) from network_error
+
     def run(
         self,
         task: str,
@@ -980,119 +1274,102 @@ class LiteLLM:
             5. Default parameters
         """
         try:
-            # Prepare messages properly - this handles both task and image together
-            messages = self._prepare_messages(task=task, img=img)
-
-            # Base completion parameters
-            completion_params = {
-                "model": self.model_name,
-                "messages": messages,
-                "stream": self.stream,
-                "max_tokens": self.max_tokens,
-                "caching": self.caching,
-                "temperature": self.temperature,
-                "top_p": self.top_p,
-            }
+            completion_params = self._build_completion_params(
+                task=task, img=img, args=args, kwargs=kwargs
+            )
 
-            # Merge initialization kwargs first (lower priority)
-            if self.init_kwargs:
-                completion_params.update(self.init_kwargs)
+            cache_key = self._response_cache_key(completion_params)
+            if cache_key is not None:
+                cached = self.response_cache.get(cache_key)
+                if cached is not None:
+                    return self._handle_response(
+                        self._cached_response(
+                            cached, completion_params
+                        )
+                    )
 
-            # Merge runtime kwargs (higher priority - overrides init kwargs)
-            if kwargs:
-                completion_params.update(kwargs)
+            # Make the completion call
+            response = completion(**completion_params)
 
-            if self.api_version is not None:
-                completion_params["api_version"] = self.api_version
+            if cache_key is not None:
+                response = self._cache_response(
+                    cache_key, response, completion_params
+                )
 
-            # Add temperature for non-o4/o3 models
-            if self.model_name not in [
-                "openai/o4-mini",
-                "openai/o3-2025-04-16",
-            ]:
-                completion_params["temperature"] = self.temperature
+            return self._handle_response(response)
 
-            # Add tools if specified
-            if self.tools_list_dictionary is not None:
-                completion_params.update(
-                    {
-                        "tools": self.tools_list_dictionary,
-                        "tool_choice": self.tool_choice,
-                        "parallel_tool_calls": self.parallel_tool_calls,
-                    }
-                )
+        except (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+            requests.exceptions.RequestException,
+            ConnectionError,
+            TimeoutError,
+        ) as network_error:
+            self._raise_network_error(network_error)
 
-            if self.functions is not None:
-                completion_params.update(
-                    {"functions": self.functions}
-                )
+        except LiteLLMException as error:
+            logger.error(
+                f"Error in LiteLLM run: {str(error)} Traceback: {traceback.format_exc()}"
+            )
+            raise
 
-            if self.base_url is not None:
-                completion_params["base_url"] = self.base_url
+        except Exception as error:
+            logger.error(
+                f"Unexpected error in LiteLLM run: {str(error)} Traceback: {traceback.format_exc()}"
+            )
+            raise
 
-            if self.response_format is not None:
-                completion_params["response_format"] = (
-                    self.response_format
-                )
+    async def arun(
+        self,
+        task: str,
+        audio: Optional[str] = None,
+        img: Optional[str] = None,
+        *args,
+        **kwargs,
+    ):
+        """
+        Run the LLM model for the given task on the event loop using litellm's acompletion.
 
-            # Add modalities if needed
-            if self.modalities and len(self.modalities) >= 2:
-                completion_params["modalities"] = self.modalities
+        Accepts the same arguments and follows the same parameter priority as run().
+        When streaming is enabled the async stream is returned directly, see astream().
 
-            if (
-                self.reasoning_effort is not None
-                and litellm.supports_reasoning(model=self.model_name)
-                is True
-            ):
-                completion_params["reasoning_effort"] = (
-                    self.reasoning_effort
-                )
+        Args:
+            task (str): The task to run the model for.
+            audio (str, optional): Audio input if any. Defaults to None.
+            img (str, optional): Image input if any. Defaults to None.
+            *args: Additional positional arguments, see run().
+            **kwargs: Additional keyword arguments, see run().
 
-            if (
-                self.reasoning_enabled is True
-                and self.thinking_tokens is not None
-            ):
-                thinking = {
-                    "type": "enabled",
-                    "budget_tokens": self.thinking_tokens,
-                }
-                completion_params["thinking"] = thinking
+        Returns:
+            str: The content of the response from the model.
 
-            # Process additional args if any
-            self._process_additional_args(completion_params, args)
+        Raises:
+            Exception: If there is an error in processing the request.
+        """
+        try:
+            completion_params = self._build_completion_params(
+                task=task, img=img, args=args, kwargs=kwargs
+            )
 
-            # Make the completion call
-            response = completion(**completion_params)
-            # print(response)
+            cache_key = self._response_cache_key(completion_params)
+            if cache_key is not None:
+                cached = self.response_cache.get(cache_key)
+                if cached is not None:
+                    if completion_params.get("stream"):
+                        return areplay_stream(cached)
+                    return self._handle_response(
+                        response_from_cache(cached)
+                    )
 
-            # Validate response
-            if not response:
-                logger.error(
-                    "Received empty response from completion call"
-                )
-                return None
+            # Make the completion call without blocking the event loop
+            response = await acompletion(**completion_params)
 
-            # Handle streaming response
-            if self.stream:
-                return response  # Return the streaming generator directly
+            if cache_key is not None:
+                response = self._acache_response(
+                    cache_key, response, completion_params
+                )
 
-            # Handle reasoning model output
-            elif (
-                self.reasoning_enabled
-                and self.reasoning_effort is not None
-            ):
-                return self.output_for_reasoning(response)
-
-            # Handle tool-based response
-            elif self.tools_list_dictionary is not None:
-                result = self.output_for_tools(response)
-                return result
-            elif self.return_all is True:
-                return response.model_dump()
-            elif "gemini" in self.model_name.lower():
-                return gemini_output_img_handler(response)
-            else:
-                return response.choices[0].message.content
+            return self._handle_response(response)
 
         except (
             requests.exceptions.ConnectionError,
@@ -1101,65 +1378,85 @@ class LiteLLM:
             ConnectionError,
             TimeoutError,
         ) as network_error:
-            # Check if this is a local model
-            if self.is_local_model(self.model_name, self.base_url):
-                error_msg = (
-                    f"Network error connecting to local model '{self.model_name}': {str(network_error)}\n\n"
-                    "Troubleshooting steps:\n"
-                    "1. Ensure your local model server (e.g., Ollama, LlamaCPP) is running\n"
-                    "2. Verify the base_url is correct and accessible\n"
-                    "3. Check that the model is properly loaded and available\n"
-                )
-                logger.error(error_msg)
-                raise NetworkConnectionError(
-                    error_msg
-                ) from network_error
-
-            # Check internet connectivity
-            has_internet = self.check_internet_connection()
-
-            if not has_internet:
-                error_msg = (
-                    f"No internet connection detected while trying to use model '{self.model_name}'.\n\n"
-                    "Possible solutions:\n"
-                    "1. Check your internet connection and try again\n"
-                    "2. Reconnect to your network\n"
-                    "3. Use a local model instead (e.g., Ollama):\n"
-                    "   - Install Ollama from https://ollama.ai\n"
-                    "   - Run: ollama pull llama2\n"
-                    "   - Use model_name='ollama/llama2' in your LiteLLM configuration\n"
-                    "\nExample:\n"
-                    "  model = LiteLLM(model_name='ollama/llama2')\n"
-                )
-                logger.error(error_msg)
-                raise NetworkConnectionError(
-                    error_msg
-                ) from network_error
-            else:
-                # Internet is available but request failed
-                error_msg = (
-                    f"Network error occurred while connecting to '{self.model_name}': {str(network_error)}\n\n"
-                    "Possible causes:\n"
-                    "1. The API endpoint may be temporarily unavailable\n"
-                    "2. Connection timeout or slow network\n"
-                    "3. Firewall or proxy blocking the connection\n"
-                    "\nConsider using a local model as a fallback:\n"
-                    "  model = LiteLLM(model_name='ollama/llama2')\n"
-                )
-                logger.error(error_msg)
-                raise NetworkConnectionError(
-                    error_msg
-                ) from network_error
+            # The connectivity probe is blocking, keep it off the event loop
+            await asyncio.to_thread(
+                self._raise_network_error, network_error
+            )
 
         except LiteLLMException as error:
             logger.error(
-                f"Error in LiteLLM run: {str(error)} Traceback: {traceback.format_exc()}"
+                f"Error in LiteLLM arun: {str(error)} Traceback: {traceback.format_exc()}"
             )
             raise
 
         except Exception as error:
             logger.error(
-                f"Unexpected error in LiteLLM run: {str(error)} Traceback: {traceback.format_exc()}"
+                f"Unexpected error in LiteLLM arun: {str(error)} Traceback: {traceback.format_exc()}"
+            )
+            raise
+
+    async def astream(
+        self,
+        task: str,
+        img: Optional[str] = None,
+        *args,
+        **kwargs,
+    ) -> AsyncIterator[str]:
+        """
+        Stream the response content for the given task as it is generated.
+
+        Args:
+            task (str): The task to run the model for.
+            img (str, optional): Image input if any. Defaults to None.
+            *args: Additional positional arguments, see run().
+            **kwargs: Additional keyword arguments, see run().
+
+        Yields:
+            str: Content deltas from the model.
+        """
+        completion_params = self._build_completion_params(
+            task=task, img=img, args=args, kwargs=kwargs
+        )
+        completion_params["stream"] = True
+
+        try:
+            cache_key = self._response_cache_key(completion_params)
+            cached = (
+                self.response_cache.get(cache_key)
+                if cache_key is not None
+                else None
+            )
+            if cached is not None:
+                response = areplay_stream(cached)
+            else:
+                response = await acompletion(**completion_params)
+                if cache_key is not None:
+                    response = self._acache_response(
+                        cache_key, response, completion_params
+                    )
+
+            async for chunk in response:
+                if (
+                    hasattr(chunk, "choices")
+                    and chunk.choices
+                    and chunk.choices[0].delta.content
+                ):
+                    yield chunk.choices[0].delta.content
+
+        except (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+            requests.exceptions.RequestException,
+            ConnectionError,
+            TimeoutError,
+        ) as network_error:
+            await asyncio.to_thread(
+                self._raise_network_error, network_error
+            )
+
+        except Exception as error:
+            logger.error(
+                f"Unexpected error in LiteLLM astream: {str(error)} Traceback: {traceback.format_exc()}"
             )
             raise
 
@@ -1192,3 +1489,26 @@ class LiteLLM:
             f"Running {len(tasks)} tasks in batches of {batch_size}"
         )
         return asyncio.run(self._process_batch(tasks, batch_size))
+
+    async def _process_batch(
+        self, tasks: List[str], batch_size: int = 10
+    ) -> List[str]:
+        """
+        Run tasks through arun, at most batch_size requests in flight at a time.
+
+        Args:
+            tasks (List[str]): List of tasks to process.
+            batch_size (int): Maximum number of concurrent requests.
+
+        Returns:
+            List[str]: List of responses in task order.
+        """
+        semaphore = asyncio.Semaphore(max(1, batch_size))
+
+        async def process(task: str):
+            async with semaphore:
+                return await self.arun(task)
+
+        return await asyncio.gather(
+            *(process(task) for task in tasks)
+        )
@@ -0,0 +1,469 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
+
+from litellm import ModelResponse, ModelResponseStream
+from litellm.types.utils import Delta, StreamingChoices
+from loguru import logger
+from pydantic import BaseModel
+
+# Completion parameters that do not change what the model returns
+NON_SEMANTIC_PARAMS = frozenset(
+    {
+        "stream",
+        "caching",
+        "api_key",
+        "timeout",
+        "num_retries",
+        "metadata",
+        "stream_options",
+    }
+)
+
+REPLAY_CHUNK_SIZE = 16
+
+
+def _canonical_default(value: Any) -> Any:
+    if isinstance(value, type) and issubclass(value, BaseModel):
+        return {
+            "__model__": value.__name__,
+            "schema": value.model_json_schema(),
+        }
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    if isinstance(value, bytes):
+        return hashlib.blake2b(value, digest_size=16).hexdigest()
+    return repr(value)
+
+
+def canonical_request_key(params: Dict[str, Any]) -> str:
+    """
+    Hash a completion request into a stable cache key.
+
+    Parameters that do not affect the response (``stream``, ``api_key``,
+    timeouts, ...) and ``None`` values are dropped, and the remainder is
+    serialized as sorted, compact JSON, so equal requests always hash the
+    same regardless of dict ordering or transport options.
+
+    Args:
+        params (Dict[str, Any]): The litellm completion parameters.
+
+    Returns:
+        str: Hex digest identifying the request.
+    """
+    semantic = {
+        key: value
+        for key, value in params.items()
+        if key not in NON_SEMANTIC_PARAMS and value is not None
+    }
+    payload = json.dumps(
+        semantic,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=_canonical_default,
+    )
+    return hashlib.blake2b(
+        payload.encode("utf-8", "surrogatepass"), digest_size=20
+    ).hexdigest()
+
+
+class MemoryResponseCache:
+    """
+    Thread-safe in-memory LRU tier.
+
+    Args:
+        max_entries (int): Entries kept before the least recently used
+            one is evicted.
+        ttl (Optional[float]): Seconds an entry stays valid, None for ever.
+    """
+
+    def __init__(
+        self, max_entries: int = 1024, ttl: Optional[float] = None
+    ):
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(
+        self,
+        key: str,
+        value: Dict[str, Any],
+        expires_at: Optional[float] = None,
+    ) -> None:
+        if expires_at is None and self.ttl is not None:
+            expires_at = time.time() + self.ttl
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteResponseCache:
+    """
+    Persistent SQLite tier shared by every process using the same file.
+
+    Entries older than ``ttl`` are ignored and purged; once the table
+    holds more than ``max_entries`` rows the least recently used ones are
+    deleted.
+
+    Args:
+        path (Union[str, Path]): Database file.
+        max_entries (int): Maximum rows kept.
+        ttl (Optional[float]): Seconds an entry stays valid, None for ever.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_entries: int = 100_000,
+        ttl: Optional[float] = None,
+    ):
+        self.path = Path(path)
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._writes = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.path), check_same_thread=False, timeout=30
+        )
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expires_at REAL, accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed "
+                "ON responses (accessed_at)"
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()[0]
+
+    def get_entry(self, key: str) -> Optional[tuple]:
+        """Return ``(value, expires_at)`` for a live entry, or None."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            with self._conn:
+                if expires_at is not None and expires_at < now:
+                    self._conn.execute(
+                        "DELETE FROM responses WHERE key = ?", (key,)
+                    )
+                    return None
+                self._conn.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                    (now, key),
+                )
+        return json.loads(value), expires_at
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self.get_entry(key)
+        return entry[0] if entry is not None else None
+
+    def set(
+        self,
+        key: str,
+        value: Dict[str, Any],
+        expires_at: Optional[float] = None,
+    ) -> None:
+        now = time.time()
+        if expires_at is None and self.ttl is not None:
+            expires_at = now + self.ttl
+        payload = json.dumps(value, default=_canonical_default)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, payload, expires_at, now),
+            )
+            self._writes += 1
+            # Amortize eviction over many writes
+            if self._writes % 64 == 0:
+                self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        self._conn.execute(
+            "DELETE FROM responses WHERE expires_at IS NOT NULL "
+            "AND expires_at < ?",
+            (now,),
+        )
+        excess = (
+            self._conn.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()[0]
+            - self.max_entries
+        )
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN (SELECT key FROM "
+                "responses ORDER BY accessed_at LIMIT ?)",
+                (excess,),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class LLMResponseCache:
+    """
+    Two-tier cache of completion responses keyed by request content.
+
+    Lookups check the in-memory LRU first and then the optional SQLite
+    tier, promoting disk hits into memory. Responses are stored as plain
+    ``ModelResponse`` dumps, so a request that streamed on a miss can be
+    replayed as a stream or returned whole on a later hit.
+
+    Args:
+        max_entries (int): Capacity of the memory tier.
+        ttl (Optional[float]): Seconds an entry stays valid, None for ever.
+        path (Optional[Union[str, Path]]): SQLite file for the persistent
+            tier. Defaults to ``SYNARKOS_LLM_CACHE_PATH``; memory only when
+            neither is set.
+        max_disk_entries (int): Capacity of the SQLite tier.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: Optional[float] = None,
+        path: Optional[Union[str, Path]] = None,
+        max_disk_entries: int = 100_000,
+    ):
+        self.ttl = ttl
+        self.memory = MemoryResponseCache(max_entries, ttl)
+        path = path or os.getenv("SYNARKOS_LLM_CACHE_PATH")
+        self.disk = (
+            SQLiteResponseCache(path, max_disk_entries, ttl)
+            if path
+            else None
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.stores = 0
+
+    def _count(self, **increments: int) -> None:
+        with self._lock:
+            for name, amount in increments.items():
+                setattr(self, name, getattr(self, name) + amount)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response dump.
+
+        Args:
+            key (str): Key from ``canonical_request_key``.
+
+        Returns:
+            Optional[Dict[str, Any]]: The stored response, or None.
+        """
+        value = self.memory.get(key)
+        if value is not None:
+            self._count(hits=1, memory_hits=1)
+            return value
+
+        if self.disk is not None:
+            try:
+                found = self.disk.get_entry(key)
+            except sqlite3.Error as e:
+                logger.warning(f"LLM response cache read failed: {e}")
+                found = None
+            if found is not None:
+                value, expires_at = found
+                self.memory.set(key, value, expires_at)
+                self._count(hits=1, disk_hits=1)
+                return value
+
+        self._count(misses=1)
+        return None
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Store a response dump in every tier.
+
+        Args:
+            key (str): Key from ``canonical_request_key``.
+            value (Dict[str, Any]): ``ModelResponse.model_dump()`` output.
+        """
+        self.memory.set(key, value)
+        if self.disk is not None:
+            try:
+                self.disk.set(key, value)
+            except sqlite3.Error as e:
+                logger.warning(
+                    f"LLM response cache write failed: {e}"
+                )
+        self._count(stores=1)
+
+    def clear(self) -> None:
+        """Remove every entry from both tiers."""
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Hit/miss counters of this cache.
+
+        Returns:
+            Dict[str, Any]: Counters plus the overall hit rate.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "stores": self.stores,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "memory_entries": len(self.memory),
+        }
+
+
+_shared_cache: Optional[LLMResponseCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_llm_response_cache() -> LLMResponseCache:
+    """
+    Return the process-wide ``LLMResponseCache``.
+
+    Returns:
+        LLMResponseCache: The shared cache.
+    """
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = LLMResponseCache()
+        return _shared_cache
+
+
+def response_from_cache(value: Dict[str, Any]) -> ModelResponse:
+    """Rebuild a ``ModelResponse`` from its cached dump."""
+    return ModelResponse(**value)
+
+
+def _replay_chunks(
+    value: Dict[str, Any],
+) -> List[ModelResponseStream]:
+    choice = (value.get("choices") or [{}])[0]
+    message = choice.get("message") or {}
+    content = message.get("content") or ""
+    tool_calls = message.get("tool_calls")
+
+    def chunk(**delta_fields) -> ModelResponseStream:
+        finish_reason = delta_fields.pop("finish_reason", None)
+        return ModelResponseStream(
+            id=value.get("id"),
+            model=value.get("model"),
+            created=value.get("created"),
+            choices=[
+                StreamingChoices(
+                    index=0,
+                    finish_reason=finish_reason,
+                    delta=Delta(**delta_fields),
+                )
+            ],
+        )
+
+    chunks = [
+        chunk(
+            role="assistant",
+            content=content[start : start + REPLAY_CHUNK_SIZE],
+        )
+        for start in range(0, len(content), REPLAY_CHUNK_SIZE)
+    ]
+    if tool_calls:
+        chunks.append(
+            chunk(
+                tool_calls=[
+                    {**tool_call, "index": index}
+                    for index, tool_call in enumerate(tool_calls)
+                ]
+            )
+        )
+    chunks.append(
+        chunk(finish_reason=choice.get("finish_reason") or "stop")
+    )
+    return chunks
+
+
+def replay_stream(
+    value: Dict[str, Any],
+) -> Iterator[ModelResponseStream]:
+    """
+    Replay a cached response as a synchronous chunk stream.
+
+    Args:
+        value (Dict[str, Any]): The cached response dump.
+
+    Yields:
+        ModelResponseStream: Chunks shaped like a live litellm stream.
+    """
+    yield from _replay_chunks(value)
+
+
+async def areplay_stream(
+    value: Dict[str, Any],
+) -> AsyncIterator[ModelResponseStream]:
+    """Asynchronous counterpart of ``replay_stream``."""
+    for chunk in _replay_chunks(value):
+        yield chunk
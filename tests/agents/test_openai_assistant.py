@@ -0,0 +1,227 @@
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import openai
+import pytest
+
+from synarkos.agents.openai_assistant import OpenAIAssistant
+
+
+class StubAssistantsAPI(BaseHTTPRequestHandler):
+    """
+    Minimal Assistants API: runs finish after ``polls_until_done``
+    retrieves, or immediately when streamed. A task starting with
+    "add" makes the run call the ``add`` function first.
+    """
+
+    polls_until_done = 3
+    state = {}
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def _body(self):
+        length = int(self.headers.get("content-length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def _json(self, data):
+        payload = json.dumps(data).encode()
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _events(self, events):
+        self.send_response(200)
+        self.send_header("content-type", "text/event-stream")
+        self.end_headers()
+        for event, data in events:
+            self.wfile.write(
+                f"event: {event}\ndata: {json.dumps(data)}\n\n".encode()
+            )
+        self.wfile.write(b"event: done\ndata: [DONE]\n\n")
+
+    def _run(self, thread_id, status):
+        run = {
+            "id": f"run_{thread_id}",
+            "object": "thread.run",
+            "thread_id": thread_id,
+            "assistant_id": "asst_1",
+            "status": status,
+        }
+        if status == "requires_action":
+            run["required_action"] = {
+                "type": "submit_tool_outputs",
+                "submit_tool_outputs": {
+                    "tool_calls": [
+                        {
+                            "id": "call_1",
+                            "type": "function",
+                            "function": {
+                                "name": "add",
+                                "arguments": '{"a": 2, "b": 3}',
+                            },
+                        }
+                    ]
+                },
+            }
+        return run
+
+    def _record(self, kind):
+        with self.lock:
+            self.state.setdefault(kind, 0)
+            self.state[kind] += 1
+
+    def do_POST(self):
+        body = self._body()
+        path = self.path.split("?")[0]
+        with self.lock:
+            threads = self.state.setdefault("threads", {})
+            if path.endswith("/assistants"):
+                return self._json(
+                    {"id": "asst_1", "object": "assistant"}
+                )
+            if path.endswith("/threads"):
+                thread_id = f"thread_{len(threads)}"
+                threads[thread_id] = {"task": None, "polls": 0}
+                return self._json(
+                    {"id": thread_id, "object": "thread"}
+                )
+            thread_id = re.search(r"/threads/([^/]+)", path).group(1)
+            thread = threads[thread_id]
+
+        if path.endswith("/messages"):
+            thread["task"] = body["content"]
+            return self._json(
+                {"id": "msg_1", "object": "thread.message"}
+            )
+
+        if path.endswith("/submit_tool_outputs"):
+            thread["answer"] = body["tool_outputs"][0]["output"]
+            status = "completed"
+        else:
+            thread["answer"] = f"answer: {thread['task']}"
+            status = (
+                "requires_action"
+                if thread["task"].startswith("add")
+                else "completed"
+            )
+
+        if body.get("stream"):
+            self._record("streams")
+            return self._events(
+                [
+                    (
+                        "thread.run.in_progress",
+                        self._run(thread_id, "in_progress"),
+                    ),
+                    (
+                        f"thread.run.{status}",
+                        self._run(thread_id, status),
+                    ),
+                ]
+            )
+        thread["polls"] = 0
+        thread["status"] = status
+        return self._json(self._run(thread_id, "queued"))
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        thread_id = re.search(r"/threads/([^/]+)", path).group(1)
+        thread = self.state["threads"][thread_id]
+
+        if path.endswith("/messages"):
+            return self._json(
+                {
+                    "object": "list",
+                    "data": [
+                        {
+                            "id": "msg_2",
+                            "object": "thread.message",
+                            "role": "assistant",
+                            "content": [
+                                {
+                                    "type": "text",
+                                    "text": {
+                                        "value": thread["answer"],
+                                        "annotations": [],
+                                    },
+                                }
+                            ],
+                        }
+                    ],
+                }
+            )
+
+        self._record("retrieves")
+        thread["polls"] += 1
+        status = (
+            thread["status"]
+            if thread["polls"] >= self.polls_until_done
+            else "in_progress"
+        )
+        return self._json(self._run(thread_id, status))
+
+
+@pytest.fixture
+def api():
+    StubAssistantsAPI.state = {}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubAssistantsAPI)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield openai.OpenAI(
+        api_key="test",
+        base_url=f"http://127.0.0.1:{server.server_port}/v1",
+    )
+    server.shutdown()
+    server.server_close()
+
+
+def create_assistant(client, **kwargs):
+    assistant = OpenAIAssistant(
+        name="Stub",
+        instructions="Answer.",
+        client=client,
+        print_on=False,
+        **kwargs,
+    )
+    assistant.available_functions["add"] = lambda a, b: a + b
+    return assistant
+
+
+def test_streamed_run_answers_tool_calls_without_polling(api):
+    assistant = create_assistant(api)
+
+    assert assistant.run("hello") == "answer: hello"
+    assert assistant.run("add 2 and 3") == "5"
+    assert StubAssistantsAPI.state["streams"] == 3
+    assert "retrieves" not in StubAssistantsAPI.state
+
+
+def test_polling_backs_off_from_short_interval(api):
+    assistant = create_assistant(
+        api, stream_runs=False, poll_interval=0.01
+    )
+
+    start = time.perf_counter()
+    assert assistant.run("hello") == "answer: hello"
+    assert assistant.run("add 2 and 3") == "5"
+    elapsed = time.perf_counter() - start
+
+    # Three polls per wait, sleeping 10 and 20 ms between them; the
+    # tool call run waits twice
+    assert elapsed < 1.0
+    assert StubAssistantsAPI.state["retrieves"] == 9
+
+
+def test_run_concurrently_uses_separate_threads(api):
+    assistant = create_assistant(api)
+    tasks = [f"task {i}" for i in range(8)]
+
+    assert assistant.run_concurrently(tasks) == [
+        f"answer: {task}" for task in tasks
+    ]
@@ -0,0 +1,107 @@
+import asyncio
+import copy
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+
+class MockLLM:
+    """
+    Deterministic stand-in for ``LiteLLM`` used by the offline benchmarks.
+
+    Implements the ``run``/``arun`` contract the agents rely on: a string
+    completion, or the tool call list ``LiteLLM`` returns when tools are
+    configured. Latency is sampled from a seeded distribution and slept
+    for, so framework overhead can be measured in isolation (``latency_ms=0``)
+    or under realistic provider behaviour.
+
+    Attributes:
+        model_name (str): Reported model name.
+        calls (int): Number of completions served.
+        simulated_latency_s (float): Total latency slept for.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "mock-llm",
+        latency: str = "fixed",
+        latency_ms: float = 0.0,
+        latency_jitter_ms: float = 0.0,
+        output_tokens: int = 64,
+        tool_calls: Optional[List[Dict[str, Any]]] = None,
+        seed: int = 0,
+    ):
+        if latency not in ("fixed", "uniform", "lognormal"):
+            raise ValueError(
+                f"Unknown latency distribution: {latency}"
+            )
+        self.model_name = model_name
+        self.latency = latency
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.output_tokens = output_tokens
+        self.tool_calls = tool_calls
+        self.stream = False
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.simulated_latency_s = 0.0
+
+    def _sample_latency(self) -> float:
+        with self._lock:
+            if self.latency == "uniform":
+                ms = self._random.uniform(
+                    self.latency_ms - self.latency_jitter_ms,
+                    self.latency_ms + self.latency_jitter_ms,
+                )
+            elif self.latency == "lognormal" and self.latency_ms > 0:
+                ms = (
+                    self._random.lognormvariate(
+                        0, max(self.latency_jitter_ms, 1e-9) / 100
+                    )
+                    * self.latency_ms
+                )
+            else:
+                ms = self.latency_ms
+            seconds = max(0.0, ms) / 1000
+            self.calls += 1
+            self.simulated_latency_s += seconds
+            return seconds
+
+    def _completion(self, task: Optional[str]) -> Any:
+        if self.tool_calls is not None:
+            return copy.deepcopy(self.tool_calls)
+        prefix = f"[{self.model_name}] " if task is not None else ""
+        return prefix + " ".join(
+            f"token{i}" for i in range(self.output_tokens)
+        )
+
+    def run(
+        self,
+        task: Optional[str] = None,
+        img: Optional[str] = None,
+        *args,
+        **kwargs,
+    ) -> Any:
+        seconds = self._sample_latency()
+        if seconds:
+            time.sleep(seconds)
+        return self._completion(task)
+
+    async def arun(
+        self,
+        task: Optional[str] = None,
+        img: Optional[str] = None,
+        *args,
+        **kwargs,
+    ) -> Any:
+        seconds = self._sample_latency()
+        if seconds:
+            await asyncio.sleep(seconds)
+        return self._completion(task)
+
+    def __call__(
+        self, task: Optional[str] = None, *args, **kwargs
+    ) -> Any:
+        return self.run(task, *args, **kwargs)
@@ -0,0 +1,597 @@
+"""
+Offline, deterministic benchmarks of SynarkOS framework overhead.
+
+Every LLM call is served by ``MockLLM``, so no provider keys or network
+access are needed and results are not dominated by provider variance.
+With the default zero latency, timings measure the framework alone.
+
+Usage:
+    python tests/benchmarks/offline_benchmark.py --output results.json
+    python tests/benchmarks/offline_benchmark.py --baseline results.json
+
+With ``--baseline`` the run is compared against a previous results file
+and the process exits with status 1 if any scenario regressed by more
+than ``--threshold``.
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mock_llm import MockLLM  # noqa: E402
+
+from synarkos.structs.agent import Agent  # noqa: E402
+from synarkos.structs.conversation import Conversation  # noqa: E402
+
+# A scenario builds its fixtures once and returns (operation, cleanup,
+# llms); the operation is timed per call.
+Scenario = Callable[
+    [Dict[str, Any]],
+    Tuple[Callable[[int], Any], Callable[[], None], List[MockLLM]],
+]
+
+
+def make_llm(config: Dict[str, Any], **overrides) -> MockLLM:
+    """Build a ``MockLLM`` from the benchmark configuration."""
+    params = {
+        "latency": config["latency"],
+        "latency_ms": config["latency_ms"],
+        "latency_jitter_ms": config["latency_jitter_ms"],
+        "output_tokens": config["output_tokens"],
+        "seed": config["seed"],
+    }
+    params.update(overrides)
+    return MockLLM(**params)
+
+
+def make_agent(
+    name: str, config: Dict[str, Any], **llm_overrides
+) -> Agent:
+    """Build a quiet single-loop agent backed by a ``MockLLM``."""
+    return Agent(
+        agent_name=name,
+        agent_description=f"Benchmark agent {name}",
+        system_prompt="You are a benchmark agent.",
+        llm=make_llm(config, **llm_overrides),
+        max_loops=1,
+        print_on=False,
+        autosave=False,
+    )
+
+
+def _noop() -> None:
+    pass
+
+
+def memory_resetter(*agents: Agent) -> Callable[[], None]:
+    """
+    Snapshot the agents' initial short memory (the system prompt) and
+    return a function restoring it, so repeated runs don't grow history.
+    """
+    snapshots = [
+        (agent, list(agent.short_memory.conversation_history))
+        for agent in agents
+    ]
+
+    def reset():
+        for agent, messages in snapshots:
+            agent.short_memory.clear()
+            for message in messages:
+                agent.short_memory.add(
+                    message["role"], message["content"]
+                )
+
+    return reset
+
+
+def scenario_agent_init(config):
+    agents = []
+
+    def operation(i):
+        agents.append(make_agent(f"init-{i}", config))
+
+    return operation, agents.clear, []
+
+
+def scenario_agent_run(config):
+    agent = make_agent("runner", config)
+    reset = memory_resetter(agent)
+
+    def operation(i):
+        reset()
+        return agent.run(f"Task {i}")
+
+    return operation, _noop, [agent.llm]
+
+
+def scenario_agent_tool_call(config):
+    def add(a: int, b: int) -> int:
+        """
+        Add two integers.
+
+        Args:
+            a (int): First operand.
+            b (int): Second operand.
+
+        Returns:
+            int: The sum.
+        """
+        return a + b
+
+    tool_calls = [
+        {
+            "type": "function",
+            "id": "call_0",
+            "function": {
+                "name": "add",
+                "arguments": json.dumps({"a": 1, "b": 2}),
+            },
+        }
+    ]
+    agent = Agent(
+        agent_name="tool-runner",
+        system_prompt="You are a benchmark agent.",
+        llm=make_llm(config, tool_calls=tool_calls),
+        tools=[add],
+        max_loops=1,
+        print_on=False,
+        autosave=False,
+    )
+    reset = memory_resetter(agent)
+
+    def operation(i):
+        reset()
+        return agent.run(f"Add numbers {i}")
+
+    return operation, _noop, [agent.llm]
+
+
+def scenario_conversation(config):
+    messages = config["conversation_messages"]
+    content = " ".join(
+        f"word{i}" for i in range(config["output_tokens"])
+    )
+
+    def operation(i):
+        conversation = Conversation(
+            time_enabled=False, autosave=False
+        )
+        for n in range(messages):
+            conversation.add(
+                "User" if n % 2 == 0 else "Assistant", content
+            )
+        return conversation.return_history_as_string()
+
+    return operation, _noop, []
+
+
+def scenario_concurrent_workflow(config):
+    from synarkos.structs.concurrent_workflow import (
+        ConcurrentWorkflow,
+    )
+
+    agents = [
+        make_agent(f"concurrent-{i}", config)
+        for i in range(config["agents"])
+    ]
+
+    reset = memory_resetter(*agents)
+
+    def operation(i):
+        reset()
+        workflow = ConcurrentWorkflow(
+            agents=agents, auto_save=False, output_type="final"
+        )
+        return workflow.run(f"Task {i}")
+
+    return operation, _noop, [agent.llm for agent in agents]
+
+
+def scenario_graph_workflow(config):
+    from synarkos.structs.graph_workflow import GraphWorkflow
+
+    agents = [
+        make_agent(f"graph-{i}", config)
+        for i in range(config["agents"])
+    ]
+    # Fan-out from the first agent, fan-in to the last one
+    workflow = GraphWorkflow(name="benchmark-graph", verbose=False)
+    for agent in agents:
+        workflow.add_node(agent)
+    head, *middle, tail = [agent.agent_name for agent in agents]
+    if middle:
+        workflow.add_edges_from_source(head, middle)
+        workflow.add_edges_to_target(middle, tail)
+    else:
+        workflow.add_edge(head, tail)
+    workflow.compile()
+    reset = memory_resetter(*agents)
+
+    def operation(i):
+        reset()
+        return workflow.run(f"Task {i}")
+
+    return operation, _noop, [agent.llm for agent in agents]
+
+
+def scenario_hierarchical_swarm(config):
+    from synarkos.structs.hiearchical_agent_group import (
+        HierarchicalSwarm,
+    )
+
+    workers = [
+        make_agent(f"worker-{i}", config)
+        for i in range(config["agents"])
+    ]
+    spec = {
+        "plan": "Split the task between every worker.",
+        "orders": [
+            {"agent_name": worker.agent_name, "task": "Do your part"}
+            for worker in workers
+        ],
+    }
+    director = Agent(
+        agent_name="Director",
+        system_prompt="You are a benchmark director.",
+        llm=make_llm(
+            config,
+            tool_calls=[
+                {
+                    "function": {
+                        "name": "SwarmSpec",
+                        "arguments": json.dumps(spec),
+                    }
+                }
+            ],
+        ),
+        max_loops=1,
+        print_on=False,
+        autosave=False,
+        output_type="dict-all-except-first",
+    )
+
+    reset = memory_resetter(director, *workers)
+
+    def operation(i):
+        reset()
+        swarm = HierarchicalSwarm(
+            director=director,
+            agents=workers,
+            max_loops=1,
+            director_feedback_on=False,
+        )
+        return swarm.run(f"Task {i}")
+
+    llms = [director.llm] + [worker.llm for worker in workers]
+    return operation, _noop, llms
+
+
+def scenario_aop(config):
+    from synarkos.structs.aop import AOP
+
+    agents = [
+        make_agent(f"aop-{i}", config)
+        for i in range(config["agents"])
+    ]
+    aop = AOP(
+        server_name="benchmark-aop",
+        verbose=False,
+        network_monitoring=False,
+        log_level="ERROR",
+    )
+    tool_names = [aop.add_agent(agent) for agent in agents]
+    reset = memory_resetter(*agents)
+
+    async def call_all(i):
+        return await asyncio.gather(
+            *(
+                aop.mcp_server.call_tool(name, {"task": f"Task {i}"})
+                for name in tool_names
+            )
+        )
+
+    def operation(i):
+        reset()
+        return asyncio.run(call_all(i))
+
+    def cleanup():
+        for name in tool_names:
+            aop.remove_agent(name)
+
+    return operation, cleanup, [agent.llm for agent in agents]
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "agent_init": scenario_agent_init,
+    "agent_run": scenario_agent_run,
+    "agent_tool_call": scenario_agent_tool_call,
+    "conversation": scenario_conversation,
+    "concurrent_workflow": scenario_concurrent_workflow,
+    "graph_workflow": scenario_graph_workflow,
+    "hierarchical_swarm": scenario_hierarchical_swarm,
+    "aop": scenario_aop,
+}
+
+
+class _ThreadSampler:
+    """Samples ``threading.active_count()`` in the background."""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.peak = threading.active_count()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._sample, daemon=True
+        )
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, threading.active_count())
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(
+        len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1)))
+    )
+    return ordered[index]
+
+
+def run_scenario(name: str, config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Time one scenario, then measure its memory growth separately.
+
+    Args:
+        name (str): Key in ``SCENARIOS``.
+        config (Dict[str, Any]): Benchmark configuration.
+
+    Returns:
+        Dict[str, Any]: Machine-readable metrics, or an ``error`` entry.
+    """
+    threads_before = threading.active_count()
+    try:
+        operation, cleanup, llms = SCENARIOS[name](config)
+    except Exception as e:
+        return {"error": f"setup: {type(e).__name__}: {e}"}
+
+    try:
+        for i in range(config["warmup"]):
+            operation(i)
+
+        calls_before = sum(llm.calls for llm in llms)
+        simulated_before = sum(
+            llm.simulated_latency_s for llm in llms
+        )
+        durations = []
+        gc.collect()
+        with _ThreadSampler() as sampler:
+            start = time.perf_counter()
+            for i in range(config["iterations"]):
+                op_start = time.perf_counter()
+                operation(i)
+                durations.append(time.perf_counter() - op_start)
+            elapsed = time.perf_counter() - start
+        llm_calls = sum(llm.calls for llm in llms) - calls_before
+        simulated = (
+            sum(llm.simulated_latency_s for llm in llms)
+            - simulated_before
+        )
+
+        # Memory is measured in its own pass: tracemalloc skews timings
+        gc.collect()
+        tracemalloc.start()
+        baseline_bytes = tracemalloc.get_traced_memory()[0]
+        for i in range(config["iterations"]):
+            operation(i)
+        gc.collect()
+        retained_bytes, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    except Exception as e:
+        return {"error": f"run: {type(e).__name__}: {e}"}
+    finally:
+        try:
+            cleanup()
+        except Exception as e:
+            logger.warning(f"Cleanup of {name} failed: {e}")
+
+    durations_ms = [d * 1000 for d in durations]
+    return {
+        "iterations": config["iterations"],
+        "elapsed_s": elapsed,
+        "throughput_ops_s": config["iterations"] / elapsed,
+        "op_mean_ms": statistics.fmean(durations_ms),
+        "op_p50_ms": _percentile(durations_ms, 50),
+        "op_p99_ms": _percentile(durations_ms, 99),
+        "llm_calls": llm_calls,
+        "simulated_llm_latency_s": simulated,
+        "overhead_per_llm_call_ms": (
+            (elapsed - simulated) * 1000 / llm_calls
+            if llm_calls
+            else None
+        ),
+        "memory_retained_kb": (retained_bytes - baseline_bytes)
+        / 1024,
+        "memory_peak_kb": (peak_bytes - baseline_bytes) / 1024,
+        "threads_peak": sampler.peak,
+        "threads_leaked": threading.active_count() - threads_before,
+    }
+
+
+def compare(
+    results: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float,
+) -> List[str]:
+    """
+    List scenarios whose throughput or p50 latency regressed.
+
+    Args:
+        results (Dict[str, Any]): Output of this run.
+        baseline (Dict[str, Any]): Output of a previous run.
+        threshold (float): Allowed relative slowdown, e.g. 0.1.
+
+    Returns:
+        List[str]: Human-readable regression descriptions.
+    """
+    regressions = []
+    for name, current in results["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous or "error" in previous:
+            continue
+        if "error" in current:
+            regressions.append(f"{name}: {current['error']}")
+            continue
+        if current["throughput_ops_s"] < previous[
+            "throughput_ops_s"
+        ] * (1 - threshold):
+            regressions.append(
+                f"{name}: throughput {previous['throughput_ops_s']:.1f} -> {current['throughput_ops_s']:.1f} ops/s"
+            )
+        if current["op_p50_ms"] > previous["op_p50_ms"] * (
+            1 + threshold
+        ):
+            regressions.append(
+                f"{name}: p50 {previous['op_p50_ms']:.3f} -> {current['op_p50_ms']:.3f} ms"
+            )
+    return regressions
+
+
+def _version() -> str:
+    try:
+        from importlib.metadata import version
+
+        return version("synarkos")
+    except Exception:
+        return "unknown"
+
+
+def run_benchmarks(
+    config: Dict[str, Any], scenarios: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Run the selected scenarios.
+
+    Args:
+        config (Dict[str, Any]): Benchmark configuration.
+        scenarios (Optional[List[str]]): Scenario names; all by default.
+
+    Returns:
+        Dict[str, Any]: ``meta`` and per-scenario ``results``.
+    """
+    results = {}
+    for name in scenarios or list(SCENARIOS):
+        results[name] = run_scenario(name, config)
+        print(f"{name}: {json.dumps(results[name])}", file=sys.stderr)
+
+    return {
+        "meta": {
+            "synarkos_version": _version(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "config": config,
+        },
+        "results": results,
+    }
+
+
+def parse_args(
+    argv: Optional[List[str]] = None,
+) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n")[1]
+    )
+    parser.add_argument(
+        "--scenarios",
+        nargs="+",
+        choices=list(SCENARIOS),
+        help="Scenarios to run (default: all)",
+    )
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--agents", type=int, default=3)
+    parser.add_argument(
+        "--latency",
+        choices=["fixed", "uniform", "lognormal"],
+        default="fixed",
+    )
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument(
+        "--latency-jitter-ms", type=float, default=0.0
+    )
+    parser.add_argument("--output-tokens", type=int, default=64)
+    parser.add_argument(
+        "--conversation-messages", type=int, default=200
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--output", help="Write results JSON here (default: stdout)"
+    )
+    parser.add_argument(
+        "--baseline", help="Previous results JSON to compare against"
+    )
+    parser.add_argument("--threshold", type=float, default=0.1)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    logger.disable("synarkos")
+
+    config = {
+        "iterations": args.iterations,
+        "warmup": args.warmup,
+        "agents": max(2, args.agents),
+        "latency": args.latency,
+        "latency_ms": args.latency_ms,
+        "latency_jitter_ms": args.latency_jitter_ms,
+        "output_tokens": args.output_tokens,
+        "conversation_messages": args.conversation_messages,
+        "seed": args.seed,
+    }
+    results = run_benchmarks(config, args.scenarios)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    else:
+        print(output)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
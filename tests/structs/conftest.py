@@ -0,0 +1,101 @@
+import asyncio
+import copy
+import threading
+import time
+
+import pytest
+
+from synarkos.structs.agent import Agent
+
+
+class StubLLM:
+    """
+    Scripted LLM implementing the ``run``/``arun`` contract of agents.
+
+    Replies with ``responses`` in call order, repeating the last one, or
+    with ``reply(task)`` when a callable is given, and echoes the task
+    otherwise. When ``delay`` is set every call sleeps for it, so tests
+    can observe how many calls overlap.
+
+    Attributes:
+        prompts (list): Tasks received, in call order.
+        loops (set): Ids of the event loops ``arun`` was awaited on.
+        running (int): Calls in progress.
+        peak (int): Most calls that were in progress at once.
+    """
+
+    def __init__(self, responses=None, delay: float = 0.0):
+        self.responses = responses
+        self.delay = delay
+        self.prompts = []
+        self.loops = set()
+        self.running = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _reply(self, task):
+        with self._lock:
+            self.prompts.append(task)
+            calls = len(self.prompts)
+        if callable(self.responses):
+            return self.responses(task)
+        if not self.responses:
+            return f"echo: {task}"
+        index = min(calls, len(self.responses)) - 1
+        return copy.deepcopy(self.responses[index])
+
+    def _enter(self):
+        with self._lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+
+    def _exit(self):
+        with self._lock:
+            self.running -= 1
+
+    def run(self, task: str = None, *args, **kwargs):
+        self._enter()
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+            return self._reply(task)
+        finally:
+            self._exit()
+
+    async def arun(self, task: str = None, *args, **kwargs):
+        self.loops.add(id(asyncio.get_running_loop()))
+        self._enter()
+        try:
+            await asyncio.sleep(self.delay)
+            return self._reply(task)
+        finally:
+            self._exit()
+
+
+@pytest.fixture
+def stub_llm():
+    """Factory for ``StubLLM`` instances."""
+    return StubLLM
+
+
+@pytest.fixture
+def make_agent(tmp_path):
+    """
+    Factory for quiet single-loop agents backed by a ``StubLLM`` and
+    working in ``tmp_path``. Keyword arguments override the defaults;
+    ``cls`` builds another agent-like class from the same arguments.
+    """
+
+    def make(cls=Agent, **kwargs):
+        options = {
+            "agent_name": "Stub",
+            "system_prompt": "Echo the task.",
+            "llm": StubLLM(),
+            "max_loops": 1,
+            "print_on": False,
+            "workspace_dir": str(tmp_path),
+        }
+        options.update(kwargs)
+        return cls(**options)
+
+    return make
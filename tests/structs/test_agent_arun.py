@@ -0,0 +1,67 @@
+import asyncio
+import json
+
+
+def add(a: int, b: int) -> int:
+    """
+    Add two numbers.
+
+    Args:
+        a (int): First number.
+        b (int): Second number.
+
+    Returns:
+        int: The sum.
+    """
+    return a + b
+
+
+def test_arun_executes_tool_calls_across_loops(stub_llm, make_agent):
+    # Ask for the add tool first, then answer
+    llm = stub_llm(
+        responses=[
+            [
+                {
+                    "id": "call_1",
+                    "type": "function",
+                    "function": {
+                        "name": "add",
+                        "arguments": json.dumps({"a": 2, "b": 3}),
+                    },
+                }
+            ],
+            "The sum is 5.",
+        ]
+    )
+    agent = make_agent(
+        agent_name="Async-Tool-Agent",
+        system_prompt="Use the tools to answer.",
+        llm=llm,
+        tools=[add],
+        tool_call_summary=False,
+        max_loops=2,
+        output_type="dict",
+    )
+
+    output = asyncio.run(agent.arun("What is 2 + 3?"))
+
+    assert len(llm.prompts) == 2
+    # Both LLM calls were awaited on the caller's event loop
+    assert len(llm.loops) == 1
+
+    history = agent.short_memory.conversation_history
+    tool_outputs = [
+        message["content"]
+        for message in history
+        if message["role"] == "Tool Executor"
+    ]
+    assert "Function 'add' result:\n5" in tool_outputs
+    # The second loop saw the tool output in its prompt
+    assert "Function 'add' result:\n5" in llm.prompts[1]
+    assert {
+        "role": "Async-Tool-Agent",
+        "content": "The sum is 5.",
+    } in [
+        {"role": m["role"], "content": m["content"]} for m in history
+    ]
+    assert output
@@ -0,0 +1,74 @@
+from synarkos.structs.agent import Agent
+from synarkos.structs.agent_template import AgentTemplate
+
+
+def create_template(make_agent, **kwargs):
+    return make_agent(
+        AgentTemplate,
+        agent_name="Judge",
+        system_prompt="Score the answer.",
+        **kwargs,
+    )
+
+
+def test_spawned_agents_share_llm_and_isolate_memory(make_agent):
+    template = create_template(make_agent)
+    first = template.spawn()
+    second = template.spawn()
+
+    first.run("task one")
+
+    assert first.llm is second.llm is template.prototype.llm
+    assert first.system_prompt == second.system_prompt
+    assert len(first.short_memory.conversation_history) > len(
+        second.short_memory.conversation_history
+    )
+    assert (
+        second.short_memory.conversation_history
+        == template.prototype.short_memory.conversation_history
+    )
+
+
+def test_lease_reuses_and_resets_instances(make_agent):
+    template = create_template(make_agent)
+    initial = len(
+        template.prototype.short_memory.conversation_history
+    )
+
+    with template.lease() as agent:
+        agent.run("task one")
+        assert len(agent.short_memory.conversation_history) > initial
+
+    with template.lease() as reused:
+        assert reused is agent
+        assert (
+            len(reused.short_memory.conversation_history) == initial
+        )
+
+    assert "task two" in template.run("task two")
+    assert template.config["agent_name"] == "Judge"
+
+
+def test_spawn_skips_agent_construction(make_agent, monkeypatch):
+    template = create_template(make_agent)
+    prototype = template.prototype
+
+    inits = []
+    original_init = Agent.__init__
+
+    def counting_init(self, *args, **kwargs):
+        inits.append(self)
+        original_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(Agent, "__init__", counting_init)
+
+    spawned = [template.spawn() for _ in range(5)]
+    with template.lease() as leased:
+        spawned.append(leased)
+
+    assert inits == []
+    for agent in spawned:
+        assert agent is not prototype
+        assert agent.llm is prototype.llm
+        assert agent.tool_struct is prototype.tool_struct
+        assert agent.short_memory is not prototype.short_memory
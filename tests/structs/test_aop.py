@@ -8,6 +8,7 @@ from synarkos.structs.aop import (
     AOP,
     AOPCluster,
     QueueStatus,
+    TaskQueue,
     TaskStatus,
 )
 
@@ -1358,3 +1359,50 @@ def test_get_queue_stats_all_agents_comprehensive(
         assert "second_agent" in result["stats"]
         assert result["stats"]["test_agent"]["total_tasks"] == 10
         assert result["stats"]["second_agent"]["total_tasks"] == 5
+
+
+class _EchoAgent:
+    """Minimal agent that records the order in which tasks run."""
+
+    def __init__(self):
+        self.order = []
+
+    def run(self, task, **kwargs):
+        self.order.append(task)
+        return task.upper()
+
+
+def test_task_queue_priority_and_fifo_order():
+    """Test higher priorities run first and ties keep insertion order."""
+    agent = _EchoAgent()
+    queue = TaskQueue("echo", agent)
+
+    task_ids = [
+        queue.add_task(f"task-{i}", priority=i % 2) for i in range(4)
+    ]
+    queue.start_workers()
+    try:
+        for task_id in task_ids:
+            task = queue.wait_for_task(task_id, timeout=5)
+            assert task.status == TaskStatus.COMPLETED
+    finally:
+        queue.stop_workers()
+
+    assert agent.order == ["task-1", "task-3", "task-0", "task-2"]
+
+
+def test_task_queue_future_resolves_on_cancel():
+    """Test a cancelled task resolves its future and is never run."""
+    agent = _EchoAgent()
+    queue = TaskQueue("echo", agent)
+
+    task_id = queue.add_task("cancel me")
+    assert queue.cancel_task(task_id) is True
+
+    task = queue.wait_for_task(task_id, timeout=1)
+    assert task.status == TaskStatus.CANCELLED
+    assert queue.get_stats().pending_tasks == 0
+
+    queue.start_workers()
+    queue.stop_workers()
+    assert agent.order == []
@@ -0,0 +1,80 @@
+from synarkos.structs.agent_rearrange import AgentRearrange
+from synarkos.structs.context_handoff import (
+    ContextHandoff,
+    HandoffConfig,
+    clip_middle,
+)
+
+
+def create_chain(make_agent, stub_llm, length, context_mode):
+    # Every agent answers at length, so full context grows quickly
+    llms = [
+        stub_llm(responses=[f"agent{i} says " + "x" * 3000])
+        for i in range(length)
+    ]
+    agents = [
+        make_agent(agent_name=f"agent{i}", llm=llm)
+        for i, llm in enumerate(llms)
+    ]
+    flow = " -> ".join(agent.agent_name for agent in agents)
+    rearrange = AgentRearrange(
+        agents=agents,
+        flow=flow,
+        output_type="final",
+        autosave=False,
+        verbose=False,
+        context_mode=context_mode,
+        handoff_config=HandoffConfig(
+            max_output_chars=500,
+            summary_entry_chars=60,
+            max_summary_chars=200,
+        ),
+    )
+    return rearrange, llms
+
+
+def test_clip_middle_keeps_head_and_tail():
+    text = "a" * 50 + "b" * 50
+    clipped = clip_middle(text, 20)
+
+    assert clipped.startswith("a" * 10)
+    assert clipped.endswith("b" * 10)
+    assert "80 characters omitted" in clipped
+    assert clip_middle("short", 20) == "short"
+
+
+def test_handoff_passes_predecessors_and_summarizes_the_rest():
+    handoff = ContextHandoff(instructions=["Be brief", None])
+    handoff.start("Write a report")
+    for name in ("a", "b", "c"):
+        handoff.record(name, f"output of {name}")
+        handoff.end_step()
+
+    prompt = handoff.build(notes="Agent ahead: c")
+
+    assert prompt.startswith("Task:\nWrite a report")
+    assert "Be brief\nAgent ahead: c" in prompt
+    assert "- a: output of a\n- b: output of b" in prompt
+    assert "Output of c:\noutput of c" in prompt
+    assert "Output of b" not in prompt
+
+
+def test_delta_mode_bounds_prompts_on_long_chains(
+    make_agent, stub_llm
+):
+    full, full_llms = create_chain(make_agent, stub_llm, 6, "full")
+    delta, delta_llms = create_chain(make_agent, stub_llm, 6, "delta")
+
+    full.run("Summarize the findings")
+    result = delta.run("Summarize the findings")
+
+    full_sizes = [len(llm.prompts[0]) for llm in full_llms]
+    delta_sizes = [len(llm.prompts[0]) for llm in delta_llms]
+
+    assert full_sizes[-1] > 5 * 3000
+    # Only the agent's own system prompt and a bounded handoff
+    assert max(delta_sizes) - delta_sizes[0] < 1000
+    assert delta_sizes[-1] * 5 < full_sizes[-1]
+    assert "Summarize the findings" in delta_llms[-1].prompts[0]
+    assert "agent4 says" in delta_llms[-1].prompts[0]
+    assert "agent5 says" in result
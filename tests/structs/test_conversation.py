@@ -1,3 +1,4 @@
+import json
 import shutil
 from datetime import datetime
 from pathlib import Path
@@ -5,6 +6,7 @@ from pathlib import Path
 from loguru import logger
 
 from synarkos.structs.conversation import Conversation
+from synarkos.utils.litellm_tokenizer import count_tokens
 
 
 def setup_temp_conversations_dir():
@@ -575,6 +577,128 @@ def test_save_and_load_json():
         shutil.rmtree(temp_dir)
 
 
+def test_jsonl_journal_autosave_and_load():
+    logger.info("Running test_jsonl_journal_autosave_and_load")
+    temp_dir = setup_temp_conversations_dir()
+    try:
+        file_path = temp_dir / "journal.jsonl"
+        conv = Conversation(
+            autosave=True,
+            export_method="jsonl",
+            save_filepath=str(file_path),
+            conversations_dir=str(temp_dir),
+        )
+        conv.add("user", "Hello")
+        conv.add("assistant", "Hi there")
+        conv.add("user", "Bye")
+        conv.delete(1)
+        conv.add("assistant", "Welcome back")
+
+        conv2 = Conversation(
+            export_method="jsonl",
+            save_filepath=str(file_path),
+            conversations_dir=str(temp_dir),
+        )
+
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                assert len(f.readlines()) == 3
+            assert len(conv2.conversation_history) == 3
+            assert conv2.conversation_history[1]["content"] == "Bye"
+            assert (
+                conv2.conversation_history[2]["content"]
+                == "Welcome back"
+            )
+            logger.success(
+                "test_jsonl_journal_autosave_and_load passed"
+            )
+            return True
+        except AssertionError as e:
+            logger.error(
+                f"test_jsonl_journal_autosave_and_load failed: {str(e)}"
+            )
+            return False
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_load_marks_history_changed_and_close_flushes():
+    logger.info(
+        "Running test_load_marks_history_changed_and_close_flushes"
+    )
+    temp_dir = setup_temp_conversations_dir()
+    try:
+        json_path = temp_dir / "saved.json"
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "metadata": {},
+                    "conversation_history": [
+                        {"role": "user", "content": "Hello"}
+                    ],
+                },
+                f,
+            )
+
+        journal_path = temp_dir / "journal.jsonl"
+        conv = Conversation(
+            autosave=True,
+            export_method="jsonl",
+            save_filepath=str(journal_path),
+            conversations_dir=str(temp_dir),
+            journal_fsync_interval=100,
+        )
+        conv.add("user", "Unsynced")
+        revision = conv._history_revision
+        conv.load_from_json(str(json_path))
+
+        try:
+            # Loading replaces the history, so checkpoints and the
+            # journal must not treat it as an append
+            assert conv._history_revision > revision
+            assert conv._journal._dirty
+            conv.add("assistant", "Hi")
+            conv.close()
+            assert conv._journal._unsynced == 0
+            with open(journal_path, "r", encoding="utf-8") as f:
+                assert len(f.readlines()) == 2
+            logger.success(
+                "test_load_marks_history_changed_and_close_flushes passed"
+            )
+            return True
+        except AssertionError as e:
+            logger.error(
+                f"test_load_marks_history_changed_and_close_flushes failed: {str(e)}"
+            )
+            return False
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def test_dynamic_context_window_message_boundaries():
+    logger.info(
+        "Running test_dynamic_context_window_message_boundaries"
+    )
+    conv = Conversation(context_length=40)
+    for i in range(20):
+        conv.add("user", f"message number {i} with some words")
+    try:
+        output = conv.get_str()
+        assert output.startswith("user: message number")
+        assert output.endswith("message number 19 with some words")
+        assert count_tokens(output, conv.tokenizer_model_name) <= 40
+        assert conv.get_total_tokens() > 40
+        logger.success(
+            "test_dynamic_context_window_message_boundaries passed"
+        )
+        return True
+    except AssertionError as e:
+        logger.error(
+            f"test_dynamic_context_window_message_boundaries failed: {str(e)}"
+        )
+        return False
+
+
 def run_all_tests():
     """Run all test functions and return results."""
     logger.info("Starting test suite execution")
@@ -611,6 +735,9 @@ def run_all_tests():
         test_list_cached_conversations,
         test_clear,
         test_save_and_load_json,
+        test_jsonl_journal_autosave_and_load,
+        test_load_marks_history_changed_and_close_flushes,
+        test_dynamic_context_window_message_boundaries,
     ]
 
     for test_func in test_functions:
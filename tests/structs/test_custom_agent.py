@@ -0,0 +1,122 @@
+import asyncio
+import json
+import threading
+
+import httpx
+
+from synarkos.structs.custom_agent import CustomAgent
+
+
+def create_agent(handler, **kwargs):
+    return CustomAgent(
+        name="Echo",
+        description="Echo endpoint",
+        base_url="https://api.example.com",
+        endpoint="v1/echo",
+        retry_backoff=0,
+        transport=httpx.MockTransport(handler),
+        **kwargs,
+    )
+
+
+def echo(request: httpx.Request) -> httpx.Response:
+    body = json.loads(request.content)
+    return httpx.Response(
+        200, json={"choices": [{"message": {"content": body["q"]}}]}
+    )
+
+
+def test_run_reuses_pooled_client():
+    agent = create_agent(echo)
+
+    assert agent.run({"q": "one"}) == "one"
+    client = agent.client
+    assert agent.run({"q": "two"}) == "two"
+    assert agent.client is client
+
+    agent.close()
+    assert agent._client is None
+
+
+def test_run_retries_retryable_statuses():
+    calls = []
+
+    def flaky(request):
+        calls.append(request)
+        if len(calls) < 3:
+            return httpx.Response(503, text="busy")
+        return echo(request)
+
+    agent = create_agent(flaky, max_retries=2)
+    assert agent.run({"q": "ok"}) == "ok"
+    assert len(calls) == 3
+
+    calls.clear()
+    agent = create_agent(flaky, max_retries=1)
+    assert agent.run({"q": "ok"}).startswith("Error: HTTP 503")
+    assert len(calls) == 2
+
+
+def test_batch_runs_concurrently_in_order():
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    async def slow_echo(request):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        await asyncio.sleep(0.05)
+        with lock:
+            in_flight -= 1
+        return echo(request)
+
+    agent = create_agent(slow_echo)
+    payloads = [{"q": str(i)} for i in range(10)]
+
+    assert agent.run_batch(payloads, max_concurrency=4) == [
+        str(i) for i in range(10)
+    ]
+    assert peak == 4
+    assert len(agent._async_clients) == 0
+
+
+def test_async_client_per_event_loop():
+    agent = create_agent(echo)
+    ready = threading.Event()
+    release = threading.Event()
+    seen = {}
+
+    async def call(name):
+        seen[name] = agent.async_client
+        assert await agent.run_async({"q": name}) == name
+        assert agent.async_client is seen[name]
+
+    async def in_thread():
+        await call("thread")
+        ready.set()
+        await asyncio.get_running_loop().run_in_executor(
+            None, release.wait
+        )
+        # Another loop ran meanwhile; this loop's client is untouched
+        assert not seen["thread"].is_closed
+        await call("thread-again")
+        await agent.aclose()
+
+    thread = threading.Thread(target=asyncio.run, args=(in_thread(),))
+    thread.start()
+    ready.wait(5)
+
+    async def main():
+        await call("main")
+        assert seen["main"] is not seen["thread"]
+        await agent.aclose()
+        assert seen["main"].is_closed
+
+    asyncio.run(main())
+    release.set()
+    thread.join(5)
+    assert seen["thread-again"] is seen["thread"]
+    assert seen["thread"].is_closed
+    assert len(agent._async_clients) == 0
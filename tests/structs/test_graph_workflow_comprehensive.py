@@ -1,3 +1,5 @@
+import time
+
 import pytest
 from synarkos.structs.graph_workflow import (
     GraphWorkflow,
@@ -221,5 +223,45 @@ def test_graph_workflow_node_metadata():
     assert result is not None
 
 
+class TimedAgent:
+    """Offline agent that sleeps and records when it ran"""
+
+    def __init__(self, agent_name: str, delay: float):
+        self.agent_name = agent_name
+        self.delay = delay
+        self.started_at = None
+        self.finished_at = None
+        self.last_prompt = None
+
+    def run(self, task, img=None, *args, **kwargs):
+        self.last_prompt = task
+        self.started_at = time.perf_counter()
+        time.sleep(self.delay)
+        self.finished_at = time.perf_counter()
+        return f"{self.agent_name} done"
+
+
+def test_graph_workflow_dispatches_without_layer_barrier():
+    """Test a node starts as soon as its own predecessors finish"""
+    fast = TimedAgent("Fast", 0.05)
+    fast_child = TimedAgent("Fast-Child", 0.05)
+    slow = TimedAgent("Slow", 0.5)
+
+    workflow = GraphWorkflow(
+        name="Ready-Queue-Workflow", max_workers=3
+    )
+    workflow.add_node(fast)
+    workflow.add_node(fast_child)
+    workflow.add_node(slow)
+    workflow.add_edge("Fast", "Fast-Child")
+
+    result = workflow.run("Run the uneven graph")
+
+    assert set(result) == {"Fast", "Fast-Child", "Slow"}
+    assert "Output from Fast" in fast_child.last_prompt
+    # With a per-layer barrier Fast-Child would wait for Slow
+    assert fast_child.started_at < slow.finished_at
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,89 @@
+import re
+import time
+
+from synarkos.structs.hiearchical_agent_group import (
+    HierarchicalOrder,
+    HierarchicalSwarm,
+    schedule_order_waves,
+)
+
+
+def order(agent_name, depends_on=None, phase=0):
+    return HierarchicalOrder(
+        agent_name=agent_name,
+        task=f"task for {agent_name}",
+        depends_on=depends_on or [],
+        phase=phase,
+    )
+
+
+def test_schedule_order_waves():
+    orders = [
+        order("a"),
+        order("b"),
+        order("c", depends_on=["a"]),
+        order("a"),
+        order("d", phase=1),
+    ]
+
+    assert schedule_order_waves(orders) == [[0, 1], [2, 3], [4]]
+
+
+def test_schedule_order_waves_falls_back_on_cycles():
+    orders = [
+        order("a", depends_on=["b"]),
+        order("b", depends_on=["a"]),
+    ]
+
+    assert schedule_order_waves(orders) == [[0], [1]]
+
+
+def test_execute_orders_runs_independent_orders_concurrently(
+    make_agent, stub_llm
+):
+    def reply(task):
+        # Answer for the worker named in the latest order
+        worker = re.findall(r"task for (worker\d)", task)[-1]
+        return f"{worker} done"
+
+    llm = stub_llm(responses=reply, delay=0.1)
+    agents = [
+        make_agent(
+            agent_name=f"worker{i}", llm=llm, output_type="final"
+        )
+        for i in range(4)
+    ]
+    swarm = HierarchicalSwarm(
+        director=make_agent(agent_name="director"),
+        agents=agents,
+        director_feedback_on=False,
+        add_collaboration_prompt=False,
+        max_parallel_orders=4,
+    )
+    orders = [order(agent.agent_name) for agent in agents] + [
+        order("worker0", depends_on=["worker3"])
+    ]
+    # Warm up the shared executor and logging before timing
+    swarm.execute_orders(orders[:1])
+    llm.peak = 0
+
+    start = time.perf_counter()
+    outputs = swarm.execute_orders(orders)
+    elapsed = time.perf_counter() - start
+
+    assert outputs == [f"worker{i} done" for i in (0, 1, 2, 3, 0)]
+    assert llm.peak == 4
+    assert elapsed < 0.4
+    roles = [
+        message["role"]
+        for message in swarm.conversation.conversation_history
+    ]
+    assert roles[-5:] == [
+        "worker0",
+        "worker1",
+        "worker2",
+        "worker3",
+        "worker0",
+    ]
+    # The dependent order saw the output it waited for
+    assert "worker3 done" in llm.prompts[-1]
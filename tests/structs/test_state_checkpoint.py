@@ -0,0 +1,117 @@
+import json
+
+from synarkos.structs.state_checkpoint import StateCheckpoint
+
+
+def read_records(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_saves_append_only_changes(tmp_path, make_agent):
+    agent = make_agent(state_format="jsonl")
+    path = tmp_path / "checkpointed_state.jsonl"
+
+    agent.save("checkpointed_state.json")
+    agent.short_memory.add("user", "x" * 10000)
+    agent.save("checkpointed_state.json")
+    size = path.stat().st_size
+
+    agent.agent_description = "changed"
+    agent.short_memory.add("user", "second")
+    agent.save("checkpointed_state.json")
+    agent.save("checkpointed_state.json")
+
+    records = read_records(path)
+    assert [r["type"] for r in records] == [
+        "snapshot",
+        "delta",
+        "delta",
+    ]
+    assert records[2]["set"] == {"agent_description": "changed"}
+    assert [m["content"] for m in records[2]["messages"]] == [
+        "second"
+    ]
+    assert path.stat().st_size - size < 500
+
+
+def test_load_replays_checkpoint(tmp_path, make_agent):
+    agent = make_agent(state_format="jsonl")
+    agent.save("checkpointed_state.json")
+    agent.agent_description = "changed"
+    agent.short_memory.add("user", "hello")
+    agent.save("checkpointed_state.json")
+
+    path = str(tmp_path / "checkpointed_state.jsonl")
+    restored = make_agent(
+        state_format="jsonl", agent_description="other"
+    )
+    restored.load(path)
+
+    assert restored.agent_description == "changed"
+    assert (
+        restored.short_memory.conversation_history
+        == agent.short_memory.conversation_history
+    )
+
+    # Saving the loaded agent keeps appending to the same file
+    restored.short_memory.add("user", "again")
+    restored.save(path)
+    assert [r["type"] for r in read_records(path)] == [
+        "snapshot",
+        "delta",
+        "delta",
+    ]
+
+
+def test_save_and_load_round_trip_default_path(tmp_path, make_agent):
+    agent = make_agent(state_format="jsonl")
+    agent.short_memory.add("user", "hello")
+    agent.save()
+    agent.agent_description = "changed"
+    agent.short_memory.add("user", "again")
+    agent.save()
+
+    path = tmp_path / agent.saved_state_path.replace(
+        ".json", ".jsonl"
+    )
+    assert [r["type"] for r in read_records(path)] == [
+        "snapshot",
+        "delta",
+    ]
+
+    restored = make_agent(
+        state_format="jsonl", agent_description="other"
+    )
+    restored.saved_state_path = agent.saved_state_path
+    restored.load()
+
+    assert restored.agent_description == "changed"
+    assert (
+        restored.short_memory.conversation_history
+        == agent.short_memory.conversation_history
+    )
+
+
+def test_compacts_on_rewrites_and_interval(tmp_path, make_agent):
+    agent = make_agent(state_format="jsonl")
+    path = str(tmp_path / "state.jsonl")
+    checkpoint = StateCheckpoint(path, compact_interval=2)
+
+    checkpoint.save(agent)
+    agent.short_memory.add("user", "one")
+    checkpoint.save(agent)
+    agent.short_memory.delete(0)
+    checkpoint.save(agent)
+    assert [r["type"] for r in read_records(path)] == ["snapshot"]
+
+    # Two deltas, a compaction, then a delta on the new snapshot
+    for i in range(4):
+        agent.short_memory.add("user", str(i))
+        checkpoint.save(agent)
+    assert [r["type"] for r in read_records(path)] == [
+        "snapshot",
+        "delta",
+    ]
+    state, messages = checkpoint.read()
+    assert messages == agent.short_memory.conversation_history
@@ -0,0 +1,167 @@
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from synarkos.telemetry.exporter import (
+    TELEMETRY_URL,
+    FileSink,
+    HTTPSink,
+    NullSink,
+    TelemetryExporter,
+    sink_from_env,
+)
+
+
+def test_file_sink_batches_records(tmp_path):
+    path = tmp_path / "telemetry.jsonl.gz"
+    calls = []
+
+    def system_info():
+        calls.append(1)
+        return {"platform": "test"}
+
+    exporter = TelemetryExporter(
+        sink=FileSink(path), batch_size=4, system_info=system_info
+    )
+    for i in range(10):
+        assert exporter.submit({"agent": i})
+    assert exporter.flush()
+    exporter.shutdown()
+
+    with gzip.open(path, "rt") as f:
+        documents = [json.loads(line) for line in f]
+    records = [
+        record["data"]["agent"]
+        for document in documents
+        for record in document["data"]["batch"]
+    ]
+    assert records == list(range(10))
+    assert all(
+        document["data"]["system_data"] == {"platform": "test"}
+        for document in documents
+    )
+    assert len(calls) == 1
+    assert exporter.sent == 10
+
+
+def test_full_queue_drops_instead_of_blocking():
+    release = threading.Event()
+
+    class BlockingSink(NullSink):
+        def send(self, payload, records):
+            release.wait(5)
+
+    exporter = TelemetryExporter(
+        sink=BlockingSink(),
+        max_queue_size=2,
+        batch_size=1,
+        system_info=dict,
+    )
+    results = [exporter.submit({"i": i}) for i in range(20)]
+    assert not all(results)
+    assert exporter.dropped == results.count(False)
+
+    release.set()
+    exporter.shutdown()
+    assert not exporter.submit({"late": True})
+
+
+def test_sink_errors_are_counted(monkeypatch):
+    class FailingSink(NullSink):
+        def send(self, payload, records):
+            raise ConnectionError("down")
+
+    warnings = []
+    monkeypatch.setattr(
+        "synarkos.telemetry.exporter.logger.warning", warnings.append
+    )
+    monkeypatch.delenv("SYNARKOS_TELEMETRY_SINK", raising=False)
+    monkeypatch.delenv("SYNARKOS_TELEMETRY_URL", raising=False)
+
+    exporter = TelemetryExporter(sink=FailingSink(), system_info=dict)
+    exporter.submit({"a": 1})
+    assert exporter.flush()
+    assert exporter.failed == 1
+    exporter.shutdown()
+    # The default sink fails silently when offline
+    assert warnings == []
+
+    monkeypatch.setenv("SYNARKOS_TELEMETRY_SINK", "http")
+    exporter = TelemetryExporter(sink=FailingSink(), system_info=dict)
+    exporter.submit({"a": 1})
+    exporter.submit({"b": 2})
+    assert exporter.flush()
+    exporter.shutdown()
+    assert len(warnings) == 1
+
+
+def serve_posts():
+    posts = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_POST(self):
+            body = self.rfile.read(
+                int(self.headers["content-length"])
+            )
+            posts.append((self.headers.get("content-encoding"), body))
+            self.send_response(200)
+            self.send_header("content-length", "0")
+            self.end_headers()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}/log", posts
+
+
+def test_http_sink_keeps_per_record_wire_format():
+    server, url, posts = serve_posts()
+    try:
+        exporter = TelemetryExporter(
+            sink=HTTPSink(url), system_info=lambda: {"os": "test"}
+        )
+        exporter.submit({"agent": 1})
+        exporter.submit({"agent": 2})
+        assert exporter.flush()
+        exporter.shutdown()
+
+        assert [encoding for encoding, _ in posts] == [None, None]
+        bodies = [json.loads(body) for _, body in posts]
+        assert [b["data"]["data"] for b in bodies] == [
+            {"agent": 1},
+            {"agent": 2},
+        ]
+        assert all(
+            set(b["data"]) == {"data", "system_data", "timestamp"}
+            and b["data"]["system_data"] == {"os": "test"}
+            for b in bodies
+        )
+
+        exporter = TelemetryExporter(
+            sink=HTTPSink(url, batched=True), system_info=dict
+        )
+        posts.clear()
+        exporter.submit({"agent": 3})
+        assert exporter.flush()
+        exporter.shutdown()
+        encoding, body = posts[0]
+        assert encoding == "gzip"
+        batch = json.loads(gzip.decompress(body))["data"]["batch"]
+        assert [record["data"] for record in batch] == [{"agent": 3}]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_batched_format_is_opt_in(monkeypatch):
+    monkeypatch.delenv("SYNARKOS_TELEMETRY_SINK", raising=False)
+    monkeypatch.delenv("SYNARKOS_TELEMETRY_URL", raising=False)
+    sink = sink_from_env()
+    assert sink.url == TELEMETRY_URL and not sink.batched
+
+    monkeypatch.setenv("SYNARKOS_TELEMETRY_URL", "http://collector")
+    sink = sink_from_env()
+    assert sink.url == "http://collector" and sink.batched
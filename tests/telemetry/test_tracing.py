@@ -0,0 +1,76 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from synarkos.telemetry.tracing import (
+    bind_trace_context,
+    enable_tracing,
+    get_tracer,
+    trace_span,
+    traced,
+)
+
+
+@pytest.fixture
+def tracer():
+    tracer = enable_tracing(True)
+    tracer.clear()
+    yield tracer
+    enable_tracing(False)
+    tracer.clear()
+
+
+def test_disabled_tracing_records_nothing():
+    enable_tracing(False)
+    get_tracer().clear()
+
+    @traced("test.disabled")
+    def work():
+        return 42
+
+    with trace_span("test.outer"):
+        assert work() == 42
+    assert get_tracer().events() == []
+
+
+def test_spans_nest_across_threads(tracer):
+    @traced("test.child", lambda value: {"value": value})
+    def child(value):
+        return value * 2
+
+    with trace_span("test.parent"):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(bind_trace_context(child), value)
+                for value in (1, 2)
+            ]
+            results = [future.result() for future in futures]
+    assert results == [2, 4]
+
+    events = {e["name"]: e for e in tracer.events()}
+    parent_id = events["test.parent"]["args"]["span_id"]
+    children = [
+        e for e in tracer.events() if e["name"] == "test.child"
+    ]
+    assert len(children) == 2
+    assert all(e["args"]["parent_id"] == parent_id for e in children)
+
+
+def test_export_chrome_trace_and_summary(tracer, tmp_path):
+    for _ in range(5):
+        with trace_span("test.phase"):
+            pass
+
+    summary = tracer.summary()
+    assert summary["test.phase"]["count"] == 5
+    assert (
+        summary["test.phase"]["p50_ms"]
+        <= summary["test.phase"]["p99_ms"]
+    )
+
+    path = tracer.export_chrome_trace(tmp_path / "trace.json")
+    with open(path) as f:
+        trace = json.load(f)
+    assert len(trace["traceEvents"]) == 5
+    assert all(e["ph"] == "X" for e in trace["traceEvents"])
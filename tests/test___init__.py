@@ -0,0 +1,86 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Generous enough for slow CI machines, far below the eager imports
+IMPORT_BUDGET_SECONDS = float(
+    os.getenv("SYNARKOS_IMPORT_BUDGET_SECONDS", "1.0")
+)
+HEAVY_MODULES = [
+    "litellm",
+    "networkx",
+    "rich",
+    "torch",
+    "transformers",
+]
+
+
+def _run(code: str) -> dict:
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        env=env,
+        timeout=300,
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_package_import_is_lazy():
+    code = f"""
+import json, sys, time
+start = time.perf_counter()
+import synarkos.structs, synarkos.tools, synarkos.utils, synarkos.agents
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "elapsed": elapsed,
+    "loaded": [m for m in {HEAVY_MODULES!r} if m in sys.modules],
+    "submodules": [m for m in sys.modules if m.startswith("synarkos.structs.")],
+}}))
+"""
+    result = _run(code)
+    assert result["loaded"] == []
+    assert result["submodules"] == []
+    assert result["elapsed"] < IMPORT_BUDGET_SECONDS
+
+
+@pytest.mark.parametrize(
+    "package, name",
+    [
+        ("synarkos.structs", "Conversation"),
+        ("synarkos.utils", "pdf_to_text"),
+        ("synarkos.tools", "OpenAIFunctionCallSchemaBaseModel"),
+    ],
+)
+def test_exports_resolve_on_first_access(package, name):
+    code = f"""
+import importlib, json
+package = importlib.import_module({package!r})
+value = getattr(package, {name!r})
+print(json.dumps({{
+    "cached": {name!r} in vars(package),
+    "listed": {name!r} in dir(package),
+    "is_module": type(value).__name__ == "module",
+}}))
+"""
+    result = _run(code)
+    assert result == {
+        "cached": True,
+        "listed": True,
+        "is_module": False,
+    }
+
+
+def test_unknown_attribute_raises():
+    import synarkos.structs
+
+    with pytest.raises(AttributeError):
+        synarkos.structs.DoesNotExist
@@ -0,0 +1,184 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+import anyio
+import pytest
+from mcp.server.fastmcp import FastMCP
+from mcp.shared.memory import create_client_server_memory_streams
+
+from synarkos.tools.mcp_client_tools import (
+    MCPSessionPool,
+    MCPToolCatalog,
+    load_mcp_tools,
+)
+
+
+def _in_memory_server():
+    server = FastMCP("pool-test")
+    connects = []
+
+    @server.tool()
+    def add(a: int, b: int) -> int:
+        """Add two numbers."""
+        return a + b
+
+    @asynccontextmanager
+    async def client_factory():
+        connects.append(1)
+        async with create_client_server_memory_streams() as (
+            client_streams,
+            server_streams,
+        ):
+            lowlevel = server._mcp_server
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(
+                    lambda: lowlevel.run(
+                        server_streams[0],
+                        server_streams[1],
+                        lowlevel.create_initialization_options(),
+                    )
+                )
+                try:
+                    yield client_streams
+                finally:
+                    tg.cancel_scope.cancel()
+
+    return client_factory, connects
+
+
+def test_session_pool_reuses_sessions_across_event_loops():
+    client_factory, connects = _in_memory_server()
+    pool = MCPSessionPool(max_concurrent_per_server=2)
+
+    async def list_tools(session):
+        return await load_mcp_tools(session=session, format="openai")
+
+    async def call_add(session):
+        result = await session.call_tool("add", {"a": 2, "b": 3})
+        return result.content[0].text
+
+    async def run(operation):
+        return await pool.run(
+            "memory://pool-test",
+            operation,
+            client_factory=client_factory,
+        )
+
+    async def many_calls():
+        return await asyncio.gather(
+            *(run(call_add) for _ in range(5))
+        )
+
+    try:
+        tools = asyncio.run(run(list_tools))
+        assert tools[0]["function"]["name"] == "add"
+        # A fresh event loop per call, as Agent.mcp_tool_handling does
+        assert asyncio.run(many_calls()) == ["5"] * 5
+        assert asyncio.run(run(call_add)) == "5"
+        assert len(connects) == 1
+        assert len(pool) == 1
+    finally:
+        pool.close_all()
+    assert len(pool) == 0
+
+
+def test_session_pool_reconnects_after_failed_health_check():
+    client_factory, connects = _in_memory_server()
+    pool = MCPSessionPool(health_check_interval=0)
+
+    async def call_add(session):
+        result = await session.call_tool("add", {"a": 1, "b": 1})
+        return result.content[0].text
+
+    async def run():
+        return await pool.run(
+            "memory://pool-test",
+            call_add,
+            client_factory=client_factory,
+        )
+
+    async def kill_sessions():
+        for pooled in list(pool._sessions.values()):
+            await pooled.aclose()
+
+    try:
+        assert asyncio.run(run()) == "2"
+        asyncio.run_coroutine_threadsafe(
+            kill_sessions(), pool._loop
+        ).result(5)
+        assert asyncio.run(run()) == "2"
+        assert len(connects) == 2
+    finally:
+        pool.close_all()
+
+
+def test_tool_catalog_serves_cached_listing_and_tracks_versions():
+    client_factory, connects = _in_memory_server()
+    pool = MCPSessionPool()
+    catalog = MCPToolCatalog(ttl=0, pool=pool)
+
+    async def get_tools():
+        return await catalog.get(
+            "memory://pool-test",
+            format="openai",
+            client_factory=client_factory,
+        )
+
+    try:
+        first = asyncio.run(get_tools())
+        assert [t["function"]["name"] for t in first] == ["add"]
+        assert catalog.version("memory://pool-test") == 1
+
+        # Callers get copies of the precomputed OpenAI schemas
+        first[0]["function"]["name"] = "mutated"
+        second = asyncio.run(get_tools())
+        assert second[0]["function"]["name"] == "add"
+        assert catalog.hits == 1 and catalog.misses == 1
+
+        # The expired entry was refreshed in the background
+        while catalog._refreshing:
+            time.sleep(0.01)
+        assert catalog.version("memory://pool-test") == 1
+        assert len(connects) == 1
+    finally:
+        pool.close_all()
+
+
+def test_session_pool_discards_only_on_transport_errors():
+    client_factory, connects = _in_memory_server()
+    pool = MCPSessionPool()
+
+    async def bad_arguments(session):
+        raise ValueError("malformed tool call")
+
+    async def broken_stream(session):
+        raise anyio.ClosedResourceError()
+
+    async def call_add(session):
+        result = await session.call_tool("add", {"a": 4, "b": 4})
+        return result.content[0].text
+
+    async def run(operation):
+        return await pool.run(
+            "memory://pool-test",
+            operation,
+            client_factory=client_factory,
+        )
+
+    try:
+        assert asyncio.run(run(call_add)) == "8"
+        # A client-side error leaves the shared session pooled
+        with pytest.raises(ValueError):
+            asyncio.run(run(bad_arguments))
+        assert len(pool) == 1
+        assert asyncio.run(run(call_add)) == "8"
+        assert len(connects) == 1
+
+        with pytest.raises(anyio.ClosedResourceError):
+            asyncio.run(run(broken_stream))
+        assert len(pool) == 0
+        assert asyncio.run(run(call_add)) == "8"
+        assert len(connects) == 2
+    finally:
+        pool.close_all()
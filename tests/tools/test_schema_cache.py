@@ -0,0 +1,135 @@
+from pydantic import BaseModel
+
+from synarkos.tools.base_tool import BaseTool
+from synarkos.tools.py_func_to_openai_func_str import (
+    convert_multiple_functions_to_openai_function_schema,
+    get_openai_function_schema_from_func,
+)
+from synarkos.tools.schema_cache import (
+    ToolSchemaCache,
+    function_fingerprint,
+    get_tool_schema_cache,
+)
+
+
+def multiply(x: int, y: int = 2) -> int:
+    """Multiply two numbers."""
+    return x * y
+
+
+def greet(name: str) -> str:
+    """Greet someone by name."""
+    return f"Hello, {name}"
+
+
+def test_schema_is_compiled_once_and_returned_as_copy():
+    cache = get_tool_schema_cache()
+    cache.clear()
+
+    first = get_openai_function_schema_from_func(multiply)
+    hits = cache.hits
+    first["function"]["name"] = "mutated"
+
+    second = get_openai_function_schema_from_func(
+        multiply, name="multiply"
+    )
+    assert cache.hits == hits + 1
+    assert second["function"]["name"] == "multiply"
+    assert second["function"]["parameters"]["required"] == ["x"]
+
+    schemas = convert_multiple_functions_to_openai_function_schema(
+        [multiply, greet]
+    )
+    assert [s["function"]["name"] for s in schemas] == [
+        "multiply",
+        "greet",
+    ]
+    assert len(cache) == 2
+
+
+def test_fingerprint_tracks_overrides_and_disk_tier(tmp_path):
+    assert function_fingerprint(multiply) == function_fingerprint(
+        multiply
+    )
+    assert function_fingerprint(
+        multiply, "a"
+    ) != function_fingerprint(multiply, "b")
+    assert function_fingerprint(len) is None
+
+    key = function_fingerprint(greet)
+    writer = ToolSchemaCache(tmp_path)
+    writer.put(
+        key, {"type": "function", "function": {"name": "greet"}}
+    )
+
+    reader = ToolSchemaCache(tmp_path)
+    assert reader.get(key)["function"]["name"] == "greet"
+    assert reader.hits == 1
+    assert list(tmp_path.iterdir()) == [tmp_path / f"{key}.json"]
+
+
+def make_tool(param_type):
+    def tool(x: param_type) -> str:
+        """Echo the value."""
+        return str(x)
+
+    return tool
+
+
+def make_model_tool(field_type):
+    class Params(BaseModel):
+        value: field_type
+
+    def tool(params: Params) -> str:
+        """Use the params."""
+        return str(params)
+
+    return tool
+
+
+def test_fingerprint_covers_resolved_annotations():
+    int_tool, str_tool = make_tool(int), make_tool(str)
+    assert function_fingerprint(int_tool) != function_fingerprint(
+        str_tool
+    )
+
+    get_tool_schema_cache().clear()
+    int_schema = get_openai_function_schema_from_func(int_tool)
+    str_schema = get_openai_function_schema_from_func(str_tool)
+    properties = str_schema["function"]["parameters"]["properties"]
+    assert properties["x"]["type"] == "string"
+    assert int_schema != str_schema
+
+    # Same source and qualname, different pydantic model fields
+    assert function_fingerprint(
+        make_model_tool(int)
+    ) != function_fingerprint(make_model_tool(str))
+
+
+def test_base_tool_prebuilds_dispatch_table():
+    tool = BaseTool(tools=[multiply, greet])
+    assert set(tool.function_map) == {"multiply", "greet"}
+    assert tool.find_function_name("greet") is greet
+
+    response = {
+        "choices": [
+            {
+                "message": {
+                    "tool_calls": [
+                        {
+                            "id": "call_1",
+                            "type": "function",
+                            "function": {
+                                "name": "multiply",
+                                "arguments": '{"x": 3, "y": 4}',
+                            },
+                        }
+                    ]
+                }
+            }
+        ]
+    }
+    results = tool.execute_function_calls_from_api_response(
+        response, return_as_string=False
+    )
+    assert results == [12]
@@ -0,0 +1,69 @@
+from synarkos.utils.embedding_cache import (
+    EmbeddingCache,
+    default_embedding_cache_dir,
+)
+
+
+class TestEmbeddingCache:
+    """Tests for the persistent, content-addressed embedding cache."""
+
+    def test_round_trip_across_instances(self, tmp_path):
+        """Vectors written by one cache instance are read by another."""
+        writer = EmbeddingCache(str(tmp_path))
+        writer.put_many(
+            "text-embedding-3-small",
+            ["alpha", "beta"],
+            [[1.0, 0.0, 0.5], [0.0, 1.0, 0.25]],
+        )
+
+        reader = EmbeddingCache(str(tmp_path))
+        vectors = reader.get_many(
+            "text-embedding-3-small", ["beta", "gamma", "alpha"]
+        )
+
+        assert vectors == [[0.0, 1.0, 0.25], None, [1.0, 0.0, 0.5]]
+        assert reader.hits == 2
+        assert reader.misses == 1
+
+    def test_models_are_isolated(self, tmp_path):
+        """The same text is cached separately per embedding model."""
+        cache = EmbeddingCache(str(tmp_path))
+        cache.put_many("model-a", ["text"], [[1.0, 2.0]])
+
+        assert cache.get_many("model-b", ["text"]) == [None]
+        assert cache.get_many("model-a", ["text"]) == [[1.0, 2.0]]
+
+    def test_duplicate_puts_are_ignored(self, tmp_path):
+        """Re-storing a cached text does not grow the store."""
+        cache = EmbeddingCache(str(tmp_path))
+        cache.put_many("model", ["text", "text"], [[1.0], [1.0]])
+        cache.put_many("model", ["text"], [[1.0]])
+
+        keys_file = next(tmp_path.glob("model-*")) / "keys.bin"
+        assert keys_file.stat().st_size == 16
+
+    def test_endpoints_are_isolated(self, tmp_path):
+        """The same model behind another api_base gets its own store."""
+        cache = EmbeddingCache(str(tmp_path))
+        cache.put_many("model", ["text"], [[1.0, 2.0]])
+        cache.put_many(
+            "model", ["text"], [[3.0, 4.0]], api_base="http://local"
+        )
+
+        assert cache.get_many("model", ["text"]) == [[1.0, 2.0]]
+        assert cache.get_many(
+            "model", ["text"], api_base="http://local"
+        ) == [[3.0, 4.0]]
+        assert cache.get_many(
+            "model", ["text"], api_base="http://other"
+        ) == [None]
+
+    def test_default_dir_is_user_cache(self, tmp_path, monkeypatch):
+        """Without overrides the cache never lands in the working directory."""
+        monkeypatch.delenv(
+            "SYNARKOS_EMBEDDING_CACHE_DIR", raising=False
+        )
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert default_embedding_cache_dir() == (
+            tmp_path / "synarkos" / "embeddings"
+        )
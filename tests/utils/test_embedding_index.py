@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from synarkos.utils.embedding_index import (
+    EmbeddingIndex,
+    cosine_similarity,
+)
+
+
+class TestEmbeddingIndex:
+    """Tests for the NumPy-backed embedding index."""
+
+    def test_search_returns_top_k_in_score_order(self):
+        """Top-k matches the brute-force cosine ranking."""
+        rng = np.random.default_rng(0)
+        vectors = rng.standard_normal((200, 32))
+        query = rng.standard_normal(32)
+
+        index = EmbeddingIndex()
+        index.add_batch(vectors.tolist())
+
+        expected = sorted(
+            range(len(vectors)),
+            key=lambda i: cosine_similarity(vectors[i], query),
+            reverse=True,
+        )[:5]
+        results = index.search(query, k=5)
+
+        assert [position for position, _ in results] == expected
+        assert results[0][1] == pytest.approx(
+            cosine_similarity(vectors[expected[0]], query), abs=1e-5
+        )
+
+    def test_update_and_zero_vectors(self):
+        """Zero vectors score 0 and updates replace the stored row."""
+        index = EmbeddingIndex()
+        index.add([0.0, 0.0, 0.0])
+        index.add([0.0, 1.0, 0.0])
+
+        assert index.scores([1.0, 0.0, 0.0]).tolist() == [0.0, 0.0]
+
+        index.update(0, [2.0, 0.0, 0.0])
+        assert index.search([1.0, 0.0, 0.0], k=1) == [(0, 1.0)]
+
+    def test_dimension_mismatch_raises(self):
+        """Vectors of a different size are rejected."""
+        index = EmbeddingIndex()
+        index.add([1.0, 0.0])
+
+        with pytest.raises(ValueError):
+            index.add([1.0, 0.0, 0.0])
+        with pytest.raises(ValueError):
+            cosine_similarity([1.0, 0.0], [1.0, 0.0, 0.0])
@@ -0,0 +1,114 @@
+import threading
+import time
+
+from synarkos.utils.execution_service import (
+    ExecutionService,
+    parse_model_limits,
+)
+
+
+class _SlowAgent:
+    """Agent stub tracking how many of its calls overlap."""
+
+    def __init__(self, model_name: str, delay: float = 0.05):
+        self.model_name = model_name
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def run(self, task: str) -> str:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return f"{self.model_name}:{task}"
+
+
+class TestExecutionService:
+    """Tests for the shared I/O-aware executor."""
+
+    def test_parse_model_limits(self):
+        """Model limits parse from the env var format."""
+        assert parse_model_limits("gpt-4o=2, *=8,bad=x,noeq") == {
+            "gpt-4o": 2,
+            "*": 8,
+        }
+
+    def test_model_limit_caps_concurrency(self):
+        """Calls to a limited model never exceed its limit."""
+        service = ExecutionService(
+            max_workers=8, model_limits={"slow-model": 2}
+        )
+        limited = _SlowAgent("slow-model")
+        free = _SlowAgent("free-model")
+        try:
+            futures = [
+                service.submit_agent(agent, str(i))
+                for i in range(6)
+                for agent in (limited, free)
+            ]
+            results = [future.result(timeout=5) for future in futures]
+        finally:
+            service.shutdown()
+
+        assert len(results) == 12
+        assert limited.peak == 2
+        assert free.peak > 2
+
+    def test_backpressure_bounds_pending_tasks(self):
+        """Submitters block once max_pending tasks are in flight."""
+        service = ExecutionService(max_workers=1, max_pending=2)
+        release = threading.Event()
+        peak = []
+        try:
+            futures = [service.submit(release.wait) for _ in range(2)]
+            blocked = threading.Thread(
+                target=lambda: futures.append(
+                    service.submit(release.wait)
+                )
+            )
+            blocked.start()
+            time.sleep(0.05)
+            peak.append(service._pending)
+            assert blocked.is_alive()
+
+            release.set()
+            blocked.join(timeout=5)
+            assert all(f.result(timeout=5) for f in futures)
+        finally:
+            service.shutdown()
+
+        assert peak == [2]
+        assert len(futures) == 3
+
+    def test_nested_submit_runs_inline_when_saturated(self):
+        """Work submitted from a busy worker cannot deadlock."""
+        service = ExecutionService(max_workers=1)
+
+        def outer():
+            inner = service.submit(threading.current_thread)
+            return inner.result(timeout=5), threading.current_thread()
+
+        try:
+            inner_thread, outer_thread = service.submit(outer).result(
+                timeout=5
+            )
+        finally:
+            service.shutdown()
+
+        assert inner_thread is outer_thread
+
+    def test_shutdown_rejects_new_work(self):
+        """A shut down service refuses submissions."""
+        service = ExecutionService(max_workers=1)
+        service.shutdown()
+
+        try:
+            service.submit(time.time)
+        except RuntimeError:
+            pass
+        else:
+            raise AssertionError("submit after shutdown succeeded")
@@ -0,0 +1,63 @@
+import pytest
+
+from loguru import logger
+from synarkos.utils.litellm_tokenizer import (
+    clear_token_count_cache,
+    count_tokens,
+    count_tokens_batch,
+    _token_count_cache,
+)
+
+
+class TestCountTokens:
+    """Test cases for the memoized token counting helpers."""
+
+    def setup_method(self):
+        clear_token_count_cache()
+
+    def test_empty_text(self):
+        """Empty and whitespace-only text counts as zero tokens."""
+        try:
+            assert count_tokens("") == 0
+            assert count_tokens("   ") == 0
+        except Exception as e:
+            logger.error(f"Error in test_empty_text: {e}")
+            pytest.fail(f"test_empty_text failed with error: {e}")
+
+    def test_repeated_text_is_memoized(self):
+        """Counting the same text twice hits the cache."""
+        try:
+            first = count_tokens("Hello, how are you?")
+            second = count_tokens("Hello, how are you?")
+            assert first == second
+            assert first > 0
+            assert _token_count_cache.hits == 1
+            assert _token_count_cache.misses == 1
+        except Exception as e:
+            logger.error(
+                f"Error in test_repeated_text_is_memoized: {e}"
+            )
+            pytest.fail(
+                f"test_repeated_text_is_memoized failed with error: {e}"
+            )
+
+    def test_batch_matches_single(self):
+        """Batch counts match individual counts and keep input order."""
+        try:
+            texts = [
+                "The quick brown fox",
+                "",
+                "jumps over the lazy dog",
+                "The quick brown fox",
+            ]
+            batch = count_tokens_batch(texts)
+            clear_token_count_cache()
+            single = [count_tokens(text) for text in texts]
+            assert batch == single
+            assert batch[1] == 0
+            assert batch[0] == batch[3]
+        except Exception as e:
+            logger.error(f"Error in test_batch_matches_single: {e}")
+            pytest.fail(
+                f"test_batch_matches_single failed with error: {e}"
+            )
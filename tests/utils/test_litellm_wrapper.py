@@ -177,6 +177,21 @@ def run_test_suite():
 
     asyncio.run(test_async())
 
+    # Test 6b: Async Streaming
+    async def test_async_stream():
+        try:
+            logger.info("Testing async streaming")
+            llm = LiteLLM(mock_response="Four")
+            chunks = [
+                chunk async for chunk in llm.astream("What is 2+2?")
+            ]
+            assert "".join(chunks) == "Four"
+            log_test_result("Async Streaming", True)
+        except Exception as e:
+            log_test_result("Async Streaming", False, str(e))
+
+    asyncio.run(test_async_stream())
+
     # Test 7: Batched Run
     try:
         logger.info("Testing batched run")
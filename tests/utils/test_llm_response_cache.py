@@ -0,0 +1,90 @@
+import time
+
+import synarkos.utils.litellm_wrapper as litellm_wrapper
+from synarkos.utils.litellm_wrapper import LiteLLM
+from synarkos.utils.llm_response_cache import (
+    LLMResponseCache,
+    MemoryResponseCache,
+    canonical_request_key,
+)
+
+
+class TestLLMResponseCache:
+    """Tests for the deterministic LLM response cache."""
+
+    def test_request_key_ignores_order_and_transport_params(self):
+        """Equal requests hash equally; content changes the key."""
+        messages = [{"role": "user", "content": "hi"}]
+        key = canonical_request_key(
+            {"model": "m", "messages": messages, "temperature": 0}
+        )
+
+        assert key == canonical_request_key(
+            {
+                "temperature": 0,
+                "messages": messages,
+                "model": "m",
+                "stream": True,
+                "api_key": "secret",
+            }
+        )
+        assert key != canonical_request_key(
+            {"model": "m", "messages": messages, "temperature": 1}
+        )
+
+    def test_memory_tier_evicts_lru_and_expires(self):
+        """The memory tier is bounded and honours its TTL."""
+        cache = MemoryResponseCache(max_entries=2, ttl=0.05)
+        cache.set("a", {"v": 1})
+        cache.set("b", {"v": 2})
+        cache.get("a")
+        cache.set("c", {"v": 3})
+
+        assert cache.get("b") is None
+        assert cache.get("a") == {"v": 1}
+        time.sleep(0.06)
+        assert cache.get("a") is None
+
+    def test_disk_tier_survives_new_instances(self, tmp_path):
+        """Entries written to SQLite are served by a fresh cache."""
+        path = tmp_path / "responses.db"
+        LLMResponseCache(path=path).set("key", {"id": "x"})
+
+        reader = LLMResponseCache(path=path)
+        assert reader.get("key") == {"id": "x"}
+        assert reader.get("key") == {"id": "x"}
+        stats = reader.stats()
+        assert stats["disk_hits"] == 1
+        assert stats["memory_hits"] == 1
+
+    def test_litellm_run_and_stream_replay(self, monkeypatch):
+        """Repeated calls hit the cache, including streamed replays."""
+        calls = []
+        completion = litellm_wrapper.completion
+
+        def counting_completion(**params):
+            calls.append(params)
+            return completion(**params)
+
+        monkeypatch.setattr(
+            litellm_wrapper, "completion", counting_completion
+        )
+        llm = LiteLLM(
+            model_name="gpt-4o-mini",
+            temperature=0,
+            response_cache=LLMResponseCache(),
+            mock_response="Four, as always.",
+        )
+
+        assert llm.run("What is 2+2?") == "Four, as always."
+        assert llm.run("What is 2+2?") == "Four, as always."
+
+        llm.stream = True
+        chunks = [
+            chunk.choices[0].delta.content or ""
+            for chunk in llm.run("What is 2+2?")
+        ]
+        assert "".join(chunks) == "Four, as always."
+        assert len(chunks) > 1
+        assert len(calls) == 1
+        assert llm.response_cache.stats()["hits"] == 2